@@ -3,10 +3,15 @@ import pandas as pd
 import requests
 import json
 import re
+import os
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from textblob import TextBlob
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 import yfinance as yf
 from scipy.optimize import minimize
+from scipy.linalg import cho_factor, cho_solve, LinAlgError
 from scipy.stats import norm, skew, kurtosis
 import matplotlib.pyplot as plt
 import seaborn as sns
@@ -203,11 +208,19 @@ class MarketPsychologyAnalyzer:
             'sharpe_ratio': mean_return / volatility if volatility > 0 else 0
         }
 
+# 이 종목 수 이상일 때만 효율적 프론티어를 여러 프로세스로 계산 (작으면 프로세스 시작 비용이 더 큼)
+FRONTIER_PARALLEL_MIN_ASSETS = 50
+
 class PortfolioOptimizer:
     """포트폴리오 최적화"""
     
-    def __init__(self, risk_free_rate: float = 0.02):
+    def __init__(self, risk_free_rate: float = 0.02, frontier_workers: int = None,
+                 frontier_cache_size: int = 32):
         self.risk_free_rate = risk_free_rate
+        self.frontier_workers = frontier_workers or os.cpu_count() or 1
+        self.frontier_cache_size = frontier_cache_size
+        # 효율적 프론티어 캐시 {수익률 구간 해시: DataFrame} (오래된 순)
+        self._frontier_cache: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
         
     def calculate_portfolio_metrics(self, returns: pd.DataFrame, weights: np.ndarray) -> Dict:
         """포트폴리오 지표 계산"""
@@ -222,10 +235,8 @@ class PortfolioOptimizer:
         }
     
     def optimize_portfolio(self, returns: pd.DataFrame, method: str = 'sharpe', 
-                          constraints: Dict = None) -> Dict:
-        """포트폴리오 최적화"""
-        n_assets = len(returns.columns)
-        
+                          constraints: Dict = None, initial_weights: np.ndarray = None) -> Dict:
+        """포트폴리오 최적화 (initial_weights: 수치 최적화 시작점, 없으면 등가중)"""
         # 기본 제약조건
         if constraints is None:
             constraints = {
@@ -234,80 +245,202 @@ class PortfolioOptimizer:
                 'target_return': None
             }
         
-        # 목적 함수 정의
-        def objective(weights):
-            if method == 'sharpe':
-                portfolio_return = np.sum(returns.mean() * weights) * 252
-                portfolio_volatility = np.sqrt(np.dot(weights.T, np.dot(returns.cov() * 252, weights)))
-                return -((portfolio_return - self.risk_free_rate) / portfolio_volatility)
-            elif method == 'min_variance':
-                return np.sqrt(np.dot(weights.T, np.dot(returns.cov() * 252, weights)))
+        # 연율화 평균/공분산은 목적 함수 밖에서 한 번만 계산
+        mean_returns = returns.mean().values * 252
+        cov_matrix = returns.cov().values * 252
+        
+        optimal_weights, success, message = self._solve_weights(
+            mean_returns, cov_matrix, method, constraints, initial_weights
+        )
+        
+        if success:
+            return {
+                'weights': optimal_weights,
+                'assets': returns.columns.tolist(),
+                'metrics': self._metrics(mean_returns, cov_matrix, optimal_weights),
+                'optimization_success': True
+            }
+        else:
+            return {
+                'optimization_success': False,
+                'error': message
+            }
+    
+    def _metrics(self, mean_returns: np.ndarray, cov_matrix: np.ndarray, weights: np.ndarray) -> Dict:
+        """연율화 평균/공분산으로 포트폴리오 지표 계산"""
+        portfolio_return = weights @ mean_returns
+        portfolio_volatility = np.sqrt(weights @ cov_matrix @ weights)
+        return {
+            'return': portfolio_return,
+            'volatility': portfolio_volatility,
+            'sharpe_ratio': (portfolio_return - self.risk_free_rate) / portfolio_volatility
+        }
+    
+    def _solve_weights(self, mean_returns: np.ndarray, cov_matrix: np.ndarray, method: str,
+                       constraints: Dict, initial_weights: np.ndarray = None,
+                       factor=None) -> Tuple[np.ndarray, bool, str]:
+        """가중치 최적화 (해석적 기울기 SLSQP, 최소분산은 닫힌 해 우선)
+        
+        factor: 공분산 행렬의 촐레스키 분해 (효율적 프론티어처럼 같은 공분산으로 여러 번 풀 때 재사용)
+        반환값: (가중치, 성공 여부, 메시지)
+        """
+        n_assets = len(mean_returns)
+        ones = np.ones(n_assets)
+        min_weight, max_weight = constraints['min_weight'], constraints['max_weight']
+        target_return = constraints.get('target_return')
+        
+        # 최소분산 + 등식 제약만 있는 경우의 닫힌 해가 경계 안에 있으면 그대로 사용
+        if method != 'sharpe' and factor is not None:
+            inv_ones = cho_solve(factor, ones)
+            weights = None
+            if target_return:
+                inv_returns = cho_solve(factor, mean_returns)
+                a, b, c = ones @ inv_ones, ones @ inv_returns, mean_returns @ inv_returns
+                det = a * c - b * b
+                if abs(det) > 1e-12:
+                    weights = ((c - b * target_return) * inv_ones + (a * target_return - b) * inv_returns) / det
             else:
-                return np.sqrt(np.dot(weights.T, np.dot(returns.cov() * 252, weights)))
+                weights = inv_ones / inv_ones.sum()
+            
+            if (weights is not None and np.all(np.isfinite(weights)) and
+                    np.all(weights >= min_weight - 1e-10) and np.all(weights <= max_weight + 1e-10)):
+                return weights, True, "closed form"
+        
+        # 목적 함수와 기울기
+        if method == 'sharpe':
+            def objective(weights):
+                portfolio_volatility = np.sqrt(weights @ cov_matrix @ weights)
+                return -((weights @ mean_returns - self.risk_free_rate) / portfolio_volatility)
+            
+            def gradient(weights):
+                cov_weights = cov_matrix @ weights
+                portfolio_volatility = np.sqrt(weights @ cov_weights)
+                excess_return = weights @ mean_returns - self.risk_free_rate
+                return -mean_returns / portfolio_volatility + excess_return * cov_weights / portfolio_volatility ** 3
+        else:
+            def objective(weights):
+                return np.sqrt(weights @ cov_matrix @ weights)
+            
+            def gradient(weights):
+                cov_weights = cov_matrix @ weights
+                return cov_weights / np.sqrt(weights @ cov_weights)
         
         # 제약조건 설정
         constraints_list = [
-            {'type': 'eq', 'fun': lambda x: np.sum(x) - 1}  # 가중치 합 = 1
+            {'type': 'eq', 'fun': lambda x: np.sum(x) - 1, 'jac': lambda x: ones}  # 가중치 합 = 1
         ]
         
-        if constraints.get('target_return'):
+        if target_return:
             constraints_list.append({
                 'type': 'eq',
-                'fun': lambda x: np.sum(returns.mean() * x) * 252 - constraints['target_return']
+                'fun': lambda x: x @ mean_returns - target_return,
+                'jac': lambda x: mean_returns
             })
         
         # 경계 조건
-        bounds = [(constraints['min_weight'], constraints['max_weight']) for _ in range(n_assets)]
+        bounds = [(min_weight, max_weight) for _ in range(n_assets)]
         
         # 최적화 실행
-        initial_weights = np.array([1/n_assets] * n_assets)
-        result = minimize(objective, initial_weights, method='SLSQP',
-                         bounds=bounds, constraints=constraints_list)
-        
-        if result.success:
-            optimal_weights = result.x
-            metrics = self.calculate_portfolio_metrics(returns, optimal_weights)
-            
-            return {
-                'weights': optimal_weights,
-                'assets': returns.columns.tolist(),
-                'metrics': metrics,
-                'optimization_success': True
-            }
-        else:
-            return {
-                'optimization_success': False,
-                'error': result.message
-            }
+        if initial_weights is None or len(initial_weights) != n_assets:
+            initial_weights = ones / n_assets
+        result = minimize(objective, initial_weights, method='SLSQP', jac=gradient,
+                          bounds=bounds, constraints=constraints_list)
+        return result.x, bool(result.success), result.message
     
-    def efficient_frontier(self, returns: pd.DataFrame, n_portfolios: int = 100) -> pd.DataFrame:
-        """효율적 프론티어 생성"""
-        n_assets = len(returns.columns)
+    def efficient_frontier(self, returns: pd.DataFrame, n_portfolios: int = 100,
+                           max_workers: int = None) -> pd.DataFrame:
+        """효율적 프론티어 생성
+        
+        평균/공분산과 촐레스키 분해를 한 번만 계산해 모든 목표 수익률에 재사용합니다.
+        목표 수익률 구간을 프로세스별로 나눠 계산하고(구간 안에서는 직전 점의 해에서 시작),
+        결과는 수익률 구간 해시로 캐시해 같은 구간을 다시 요청하면 바로 반환합니다.
+        
+        max_workers: 프로세스 수 (None이면 종목 수가 FRONTIER_PARALLEL_MIN_ASSETS 이상일 때 frontier_workers)
+        """
+        cache_key = self._frontier_key(returns, n_portfolios)
+        cached = self._frontier_cache.get(cache_key)
+        if cached is not None:
+            self._frontier_cache.move_to_end(cache_key)
+            return _copy_frontier(cached)
+        
+        mean_returns = returns.mean().values * 252
+        cov_matrix = returns.cov().values * 252
+        try:
+            factor = cho_factor(cov_matrix)
+        except (LinAlgError, ValueError):
+            factor = None
         
         # 목표 수익률 범위
-        min_return = returns.mean().min() * 252
-        max_return = returns.mean().max() * 252
+        min_return = mean_returns.min()
+        max_return = mean_returns.max()
         target_returns = np.linspace(min_return, max_return, n_portfolios)
         
-        efficient_portfolios = []
+        if max_workers is None:
+            max_workers = self.frontier_workers if len(mean_returns) >= FRONTIER_PARALLEL_MIN_ASSETS else 1
+        max_workers = max(1, min(max_workers, n_portfolios))
         
-        for target_return in target_returns:
-            result = self.optimize_portfolio(
-                returns, 
-                method='min_variance',
-                constraints={'target_return': target_return, 'min_weight': 0.0, 'max_weight': 1.0}
+        if max_workers == 1:
+            efficient_portfolios = _solve_frontier_chunk(
+                self.risk_free_rate, mean_returns, cov_matrix, factor, target_returns
             )
-            
-            if result['optimization_success']:
-                efficient_portfolios.append({
-                    'target_return': target_return,
-                    'actual_return': result['metrics']['return'],
-                    'volatility': result['metrics']['volatility'],
-                    'sharpe_ratio': result['metrics']['sharpe_ratio'],
-                    'weights': result['weights']
-                })
-        
-        return pd.DataFrame(efficient_portfolios)
+        else:
+            chunks = np.array_split(target_returns, max_workers)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(_solve_frontier_chunk, self.risk_free_rate,
+                                           mean_returns, cov_matrix, factor, chunk) for chunk in chunks]
+                efficient_portfolios = [point for future in futures for point in future.result()]
+        
+        frontier = pd.DataFrame(efficient_portfolios)
+        
+        self._frontier_cache[cache_key] = frontier
+        while len(self._frontier_cache) > self.frontier_cache_size:
+            self._frontier_cache.popitem(last=False)
+        
+        return _copy_frontier(frontier)
+    
+    def _frontier_key(self, returns: pd.DataFrame, n_portfolios: int) -> str:
+        """효율적 프론티어 캐시 키 (수익률 값/날짜/종목과 계산 설정의 해시)"""
+        digest = hashlib.sha1()
+        digest.update(pd.util.hash_pandas_object(returns, index=True).values.tobytes())
+        digest.update(json.dumps([list(map(str, returns.columns)), n_portfolios, self.risk_free_rate]).encode())
+        return digest.hexdigest()
+    
+    def clear_frontier_cache(self):
+        """효율적 프론티어 캐시 비우기"""
+        self._frontier_cache.clear()
+
+def _copy_frontier(frontier: pd.DataFrame) -> pd.DataFrame:
+    """캐시 항목과 공유하지 않는 프론티어 복사본 (object 열의 weights 배열까지 복사)"""
+    if 'weights' not in frontier:
+        return frontier.copy()
+    return frontier.assign(weights=[weights.copy() for weights in frontier['weights']])
+
+def _solve_frontier_chunk(risk_free_rate: float, mean_returns: np.ndarray, cov_matrix: np.ndarray,
+                          factor, target_returns: np.ndarray) -> List[Dict]:
+    """목표 수익률 구간의 효율적 포트폴리오 계산 (프로세스 풀 작업 단위)"""
+    optimizer = PortfolioOptimizer(risk_free_rate, frontier_workers=1)
+    efficient_portfolios = []
+    previous_weights = None
+    
+    for target_return in target_returns:
+        weights, success, _ = optimizer._solve_weights(
+            mean_returns, cov_matrix, 'min_variance',
+            {'target_return': target_return, 'min_weight': 0.0, 'max_weight': 1.0},
+            previous_weights, factor
+        )
+        
+        if success:
+            previous_weights = weights
+            metrics = optimizer._metrics(mean_returns, cov_matrix, weights)
+            efficient_portfolios.append({
+                'target_return': target_return,
+                'actual_return': metrics['return'],
+                'volatility': metrics['volatility'],
+                'sharpe_ratio': metrics['sharpe_ratio'],
+                'weights': weights
+            })
+    
+    return efficient_portfolios
 
 class RiskManager:
     """리스크 관리 시스템"""
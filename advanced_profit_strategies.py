@@ -20,8 +20,26 @@ from sklearn.preprocessing import StandardScaler
 # 프로젝트 모듈 import
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from backtesting_system import BacktestingEngine, BacktestConfig, BacktestMode
+from backtesting_system import BacktestConfig, BacktestMode
 from trading_strategy import create_default_strategies, StrategyConfig, StrategyType
+from backtest_sweep import SweepTask, compare_backtests, strategy_configs_from_manager
+
+def _run_single(task: SweepTask):
+    """작업 하나를 실행하고 성과 로그 (결과 행 반환)"""
+    table = compare_backtests([task])
+    if table.empty:
+        logger.error(f"{task.name} 테스트 실패")
+        return None
+    
+    result = table.iloc[0]
+    logger.info(f"=== {task.name} 성과 ===")
+    logger.info(f"총 거래 수: {result['total_trades']:.0f}회")
+    logger.info(f"승률: {result['win_rate']:.2f}%")
+    logger.info(f"총 수익률: {result['total_return']:.2f}%")
+    logger.info(f"연간 수익률: {result['annual_return']:.2f}%")
+    logger.info(f"최대 낙폭: {result['max_drawdown']:.2f}%")
+    logger.info(f"샤프 비율: {result['sharpe_ratio']:.2f}")
+    return result
 
 def create_momentum_strategy():
     """모멘텀 기반 전략 생성"""
@@ -101,10 +119,8 @@ def create_trend_following_strategy():
     
     return strategy_manager
 
-def test_momentum_strategy():
-    """모멘텀 전략 테스트"""
-    logger.info("=== 모멘텀 전략 테스트 ===")
-    
+def _momentum_strategy_task() -> SweepTask:
+    """모멘텀 전략 백테스트 작업"""
     momentum_strategies = create_momentum_strategy()
     
     # 모멘텀 전략에 최적화된 설정
@@ -122,34 +138,16 @@ def test_momentum_strategy():
         take_profit_rate=0.08        # 8% 익절
     )
     
-    engine = BacktestingEngine(config)
-    engine.add_strategy(momentum_strategies)
-    
-    success = engine.load_data(['005930.KS'], data_source="yahoo")
-    if not success:
-        logger.error("데이터 로드 실패")
-        return None
-    
-    result = engine.run_backtest()
-    
-    if result:
-        logger.info("=== 모멘텀 전략 성과 ===")
-        logger.info(f"총 거래 수: {result.total_trades}회")
-        logger.info(f"승률: {result.win_rate:.2f}%")
-        logger.info(f"총 수익률: {result.total_return:.2f}%")
-        logger.info(f"연간 수익률: {result.annual_return:.2f}%")
-        logger.info(f"최대 낙폭: {result.max_drawdown:.2f}%")
-        logger.info(f"샤프 비율: {result.sharpe_ratio:.2f}")
-        
-        return result
-    else:
-        logger.error("모멘텀 전략 테스트 실패")
-        return None
+    return SweepTask(config, strategy_configs_from_manager(momentum_strategies),
+                     ['005930.KS'], name='모멘텀 전략')
 
-def test_volatility_breakout_strategy():
-    """변동성 돌파 전략 테스트"""
-    logger.info("=== 변동성 돌파 전략 테스트 ===")
-    
+def test_momentum_strategy():
+    """모멘텀 전략 테스트"""
+    logger.info("=== 모멘텀 전략 테스트 ===")
+    return _run_single(_momentum_strategy_task())
+
+def _volatility_breakout_strategy_task() -> SweepTask:
+    """변동성 돌파 전략 백테스트 작업"""
     breakout_strategies = create_volatility_breakout_strategy()
     
     # 변동성 돌파에 최적화된 설정
@@ -167,34 +165,16 @@ def test_volatility_breakout_strategy():
         take_profit_rate=0.12        # 12% 익절
     )
     
-    engine = BacktestingEngine(config)
-    engine.add_strategy(breakout_strategies)
-    
-    success = engine.load_data(['005930.KS'], data_source="yahoo")
-    if not success:
-        logger.error("데이터 로드 실패")
-        return None
-    
-    result = engine.run_backtest()
-    
-    if result:
-        logger.info("=== 변동성 돌파 전략 성과 ===")
-        logger.info(f"총 거래 수: {result.total_trades}회")
-        logger.info(f"승률: {result.win_rate:.2f}%")
-        logger.info(f"총 수익률: {result.total_return:.2f}%")
-        logger.info(f"연간 수익률: {result.annual_return:.2f}%")
-        logger.info(f"최대 낙폭: {result.max_drawdown:.2f}%")
-        logger.info(f"샤프 비율: {result.sharpe_ratio:.2f}")
-        
-        return result
-    else:
-        logger.error("변동성 돌파 전략 테스트 실패")
-        return None
+    return SweepTask(config, strategy_configs_from_manager(breakout_strategies),
+                     ['005930.KS'], name='변동성 돌파 전략')
 
-def test_trend_following_strategy():
-    """트렌드 추종 전략 테스트"""
-    logger.info("=== 트렌드 추종 전략 테스트 ===")
-    
+def test_volatility_breakout_strategy():
+    """변동성 돌파 전략 테스트"""
+    logger.info("=== 변동성 돌파 전략 테스트 ===")
+    return _run_single(_volatility_breakout_strategy_task())
+
+def _trend_following_strategy_task() -> SweepTask:
+    """트렌드 추종 전략 백테스트 작업"""
     trend_strategies = create_trend_following_strategy()
     
     # 트렌드 추종에 최적화된 설정
@@ -212,34 +192,16 @@ def test_trend_following_strategy():
         take_profit_rate=0.15        # 15% 익절
     )
     
-    engine = BacktestingEngine(config)
-    engine.add_strategy(trend_strategies)
-    
-    success = engine.load_data(['005930.KS'], data_source="yahoo")
-    if not success:
-        logger.error("데이터 로드 실패")
-        return None
-    
-    result = engine.run_backtest()
-    
-    if result:
-        logger.info("=== 트렌드 추종 전략 성과 ===")
-        logger.info(f"총 거래 수: {result.total_trades}회")
-        logger.info(f"승률: {result.win_rate:.2f}%")
-        logger.info(f"총 수익률: {result.total_return:.2f}%")
-        logger.info(f"연간 수익률: {result.annual_return:.2f}%")
-        logger.info(f"최대 낙폭: {result.max_drawdown:.2f}%")
-        logger.info(f"샤프 비율: {result.sharpe_ratio:.2f}")
-        
-        return result
-    else:
-        logger.error("트렌드 추종 전략 테스트 실패")
-        return None
+    return SweepTask(config, strategy_configs_from_manager(trend_strategies),
+                     ['005930.KS'], name='트렌드 추종 전략')
 
-def test_portfolio_optimization():
-    """포트폴리오 최적화 테스트"""
-    logger.info("=== 포트폴리오 최적화 테스트 ===")
-    
+def test_trend_following_strategy():
+    """트렌드 추종 전략 테스트"""
+    logger.info("=== 트렌드 추종 전략 테스트 ===")
+    return _run_single(_trend_following_strategy_task())
+
+def _portfolio_optimization_task() -> SweepTask:
+    """포트폴리오 최적화 백테스트 작업"""
     # 다양한 종목으로 포트폴리오 구성
     portfolio_stocks = [
         '005930.KS',  # 삼성전자
@@ -268,29 +230,13 @@ def test_portfolio_optimization():
         position_size_ratio=0.04
     )
     
-    engine = BacktestingEngine(config)
-    engine.add_strategy(momentum_strategies)
-    
-    success = engine.load_data(portfolio_stocks, data_source="yahoo")
-    if not success:
-        logger.error("포트폴리오 데이터 로드 실패")
-        return None
-    
-    result = engine.run_backtest()
-    
-    if result:
-        logger.info("=== 포트폴리오 최적화 성과 ===")
-        logger.info(f"총 거래 수: {result.total_trades}회")
-        logger.info(f"승률: {result.win_rate:.2f}%")
-        logger.info(f"총 수익률: {result.total_return:.2f}%")
-        logger.info(f"연간 수익률: {result.annual_return:.2f}%")
-        logger.info(f"최대 낙폭: {result.max_drawdown:.2f}%")
-        logger.info(f"샤프 비율: {result.sharpe_ratio:.2f}")
-        
-        return result
-    else:
-        logger.error("포트폴리오 최적화 실패")
-        return None
+    return SweepTask(config, strategy_configs_from_manager(momentum_strategies),
+                     list(dict.fromkeys(portfolio_stocks)), name='포트폴리오 최적화')
+
+def test_portfolio_optimization():
+    """포트폴리오 최적화 테스트"""
+    logger.info("=== 포트폴리오 최적화 테스트 ===")
+    return _run_single(_portfolio_optimization_task())
 
 def create_hybrid_high_profit_strategy():
     """고수익 하이브리드 전략 생성"""
@@ -339,10 +285,8 @@ def create_hybrid_high_profit_strategy():
     
     return strategy_manager
 
-def test_hybrid_high_profit_strategy():
-    """고수익 하이브리드 전략 테스트"""
-    logger.info("=== 고수익 하이브리드 전략 테스트 ===")
-    
+def _hybrid_high_profit_strategy_task() -> SweepTask:
+    """고수익 하이브리드 전략 백테스트 작업"""
     hybrid_strategies = create_hybrid_high_profit_strategy()
     
     # 고수익을 위한 공격적 설정
@@ -360,83 +304,46 @@ def test_hybrid_high_profit_strategy():
         take_profit_rate=0.06        # 6% 익절
     )
     
-    engine = BacktestingEngine(config)
-    engine.add_strategy(hybrid_strategies)
-    
-    success = engine.load_data(['005930.KS'], data_source="yahoo")
-    if not success:
-        logger.error("데이터 로드 실패")
-        return None
-    
-    result = engine.run_backtest()
-    
-    if result:
-        logger.info("=== 고수익 하이브리드 전략 성과 ===")
-        logger.info(f"총 거래 수: {result.total_trades}회")
-        logger.info(f"승률: {result.win_rate:.2f}%")
-        logger.info(f"총 수익률: {result.total_return:.2f}%")
-        logger.info(f"연간 수익률: {result.annual_return:.2f}%")
-        logger.info(f"최대 낙폭: {result.max_drawdown:.2f}%")
-        logger.info(f"샤프 비율: {result.sharpe_ratio:.2f}")
-        
-        return result
-    else:
-        logger.error("고수익 하이브리드 전략 테스트 실패")
-        return None
+    return SweepTask(config, strategy_configs_from_manager(hybrid_strategies),
+                     ['005930.KS'], name='고수익 하이브리드 전략')
+
+def test_hybrid_high_profit_strategy():
+    """고수익 하이브리드 전략 테스트"""
+    logger.info("=== 고수익 하이브리드 전략 테스트 ===")
+    return _run_single(_hybrid_high_profit_strategy_task())
 
 def compare_all_high_profit_strategies():
-    """모든 고수익 전략 비교"""
+    """모든 고수익 전략 비교 (데이터 1회 로드 후 병렬 백테스트)"""
     logger.info("=== 모든 고수익 전략 비교 ===")
     
-    results = {}
-    
-    # 1. 모멘텀 전략
-    logger.info("1. 모멘텀 전략 테스트 중...")
-    momentum_result = test_momentum_strategy()
-    if momentum_result:
-        results['모멘텀 전략'] = momentum_result
-    
-    # 2. 변동성 돌파 전략
-    logger.info("2. 변동성 돌파 전략 테스트 중...")
-    breakout_result = test_volatility_breakout_strategy()
-    if breakout_result:
-        results['변동성 돌파 전략'] = breakout_result
-    
-    # 3. 트렌드 추종 전략
-    logger.info("3. 트렌드 추종 전략 테스트 중...")
-    trend_result = test_trend_following_strategy()
-    if trend_result:
-        results['트렌드 추종 전략'] = trend_result
-    
-    # 4. 고수익 하이브리드 전략
-    logger.info("4. 고수익 하이브리드 전략 테스트 중...")
-    hybrid_result = test_hybrid_high_profit_strategy()
-    if hybrid_result:
-        results['고수익 하이브리드 전략'] = hybrid_result
-    
-    # 5. 포트폴리오 최적화
-    logger.info("5. 포트폴리오 최적화 테스트 중...")
-    portfolio_result = test_portfolio_optimization()
-    if portfolio_result:
-        results['포트폴리오 최적화'] = portfolio_result
+    tasks = [
+        _momentum_strategy_task(),
+        _volatility_breakout_strategy_task(),
+        _trend_following_strategy_task(),
+        _hybrid_high_profit_strategy_task(),
+        _portfolio_optimization_task(),
+    ]
+    logger.info(f"{len(tasks)}개 전략 백테스트 중...")
+    table = compare_backtests(tasks)
+    results = {row['name']: row for _, row in table.iterrows()}
     
     # 결과 비교
     logger.info("\n=== 고수익 전략별 성과 비교 ===")
     for name, result in results.items():
         logger.info(f"\n{name}:")
-        logger.info(f"  거래 수: {result.total_trades}회")
-        logger.info(f"  승률: {result.win_rate:.2f}%")
-        logger.info(f"  수익률: {result.total_return:.2f}%")
-        logger.info(f"  샤프 비율: {result.sharpe_ratio:.2f}")
-        logger.info(f"  최대 낙폭: {result.max_drawdown:.2f}%")
+        logger.info(f"  거래 수: {result['total_trades']:.0f}회")
+        logger.info(f"  승률: {result['win_rate']:.2f}%")
+        logger.info(f"  수익률: {result['total_return']:.2f}%")
+        logger.info(f"  샤프 비율: {result['sharpe_ratio']:.2f}")
+        logger.info(f"  최대 낙폭: {result['max_drawdown']:.2f}%")
     
     # 최고 수익률 전략 찾기
     best_strategy = None
     best_return = -999
     
     for name, result in results.items():
-        if result.total_return > best_return:
-            best_return = result.total_return
+        if result['total_return'] > best_return:
+            best_return = result['total_return']
             best_strategy = name
     
     logger.info(f"\n🏆 최고 수익률 전략: {best_strategy}")
@@ -591,10 +498,8 @@ def create_scalping_strategy():
     
     return strategy_manager
 
-def test_ultra_aggressive_strategy():
-    """극도로 공격적인 전략 테스트"""
-    logger.info("=== 극도로 공격적인 전략 테스트 ===")
-    
+def _ultra_aggressive_strategy_task() -> SweepTask:
+    """극도로 공격적인 전략 백테스트 작업"""
     ultra_strategies = create_ultra_aggressive_strategy()
     
     # 극도로 공격적인 설정
@@ -612,34 +517,16 @@ def test_ultra_aggressive_strategy():
         take_profit_rate=0.015       # 1.5% 익절
     )
     
-    engine = BacktestingEngine(config)
-    engine.add_strategy(ultra_strategies)
-    
-    success = engine.load_data(['005930.KS'], data_source="yahoo")
-    if not success:
-        logger.error("데이터 로드 실패")
-        return None
-    
-    result = engine.run_backtest()
-    
-    if result:
-        logger.info("=== 극도로 공격적인 전략 성과 ===")
-        logger.info(f"총 거래 수: {result.total_trades}회")
-        logger.info(f"승률: {result.win_rate:.2f}%")
-        logger.info(f"총 수익률: {result.total_return:.2f}%")
-        logger.info(f"연간 수익률: {result.annual_return:.2f}%")
-        logger.info(f"최대 낙폭: {result.max_drawdown:.2f}%")
-        logger.info(f"샤프 비율: {result.sharpe_ratio:.2f}")
-        
-        return result
-    else:
-        logger.error("극도로 공격적인 전략 테스트 실패")
-        return None
+    return SweepTask(config, strategy_configs_from_manager(ultra_strategies),
+                     ['005930.KS'], name='극도로 공격적인 전략')
 
-def test_micro_trading_strategy():
-    """마이크로 트레이딩 전략 테스트"""
-    logger.info("=== 마이크로 트레이딩 전략 테스트 ===")
-    
+def test_ultra_aggressive_strategy():
+    """극도로 공격적인 전략 테스트"""
+    logger.info("=== 극도로 공격적인 전략 테스트 ===")
+    return _run_single(_ultra_aggressive_strategy_task())
+
+def _micro_trading_strategy_task() -> SweepTask:
+    """마이크로 트레이딩 전략 백테스트 작업"""
     micro_strategies = create_micro_trading_strategy()
     
     # 마이크로 트레이딩 설정
@@ -657,34 +544,16 @@ def test_micro_trading_strategy():
         take_profit_rate=0.008       # 0.8% 익절
     )
     
-    engine = BacktestingEngine(config)
-    engine.add_strategy(micro_strategies)
-    
-    success = engine.load_data(['005930.KS'], data_source="yahoo")
-    if not success:
-        logger.error("데이터 로드 실패")
-        return None
-    
-    result = engine.run_backtest()
-    
-    if result:
-        logger.info("=== 마이크로 트레이딩 전략 성과 ===")
-        logger.info(f"총 거래 수: {result.total_trades}회")
-        logger.info(f"승률: {result.win_rate:.2f}%")
-        logger.info(f"총 수익률: {result.total_return:.2f}%")
-        logger.info(f"연간 수익률: {result.annual_return:.2f}%")
-        logger.info(f"최대 낙폭: {result.max_drawdown:.2f}%")
-        logger.info(f"샤프 비율: {result.sharpe_ratio:.2f}")
-        
-        return result
-    else:
-        logger.error("마이크로 트레이딩 전략 테스트 실패")
-        return None
+    return SweepTask(config, strategy_configs_from_manager(micro_strategies),
+                     ['005930.KS'], name='마이크로 트레이딩 전략')
 
-def test_scalping_strategy():
-    """스캘핑 전략 테스트"""
-    logger.info("=== 스캘핑 전략 테스트 ===")
-    
+def test_micro_trading_strategy():
+    """마이크로 트레이딩 전략 테스트"""
+    logger.info("=== 마이크로 트레이딩 전략 테스트 ===")
+    return _run_single(_micro_trading_strategy_task())
+
+def _scalping_strategy_task() -> SweepTask:
+    """스캘핑 전략 백테스트 작업"""
     scalping_strategies = create_scalping_strategy()
     
     # 스캘핑 설정
@@ -702,34 +571,16 @@ def test_scalping_strategy():
         take_profit_rate=0.005       # 0.5% 익절
     )
     
-    engine = BacktestingEngine(config)
-    engine.add_strategy(scalping_strategies)
-    
-    success = engine.load_data(['005930.KS'], data_source="yahoo")
-    if not success:
-        logger.error("데이터 로드 실패")
-        return None
-    
-    result = engine.run_backtest()
-    
-    if result:
-        logger.info("=== 스캘핑 전략 성과 ===")
-        logger.info(f"총 거래 수: {result.total_trades}회")
-        logger.info(f"승률: {result.win_rate:.2f}%")
-        logger.info(f"총 수익률: {result.total_return:.2f}%")
-        logger.info(f"연간 수익률: {result.annual_return:.2f}%")
-        logger.info(f"최대 낙폭: {result.max_drawdown:.2f}%")
-        logger.info(f"샤프 비율: {result.sharpe_ratio:.2f}")
-        
-        return result
-    else:
-        logger.error("스캘핑 전략 테스트 실패")
-        return None
+    return SweepTask(config, strategy_configs_from_manager(scalping_strategies),
+                     ['005930.KS'], name='스캘핑 전략')
 
-def test_mega_portfolio_optimization():
-    """메가 포트폴리오 최적화 테스트"""
-    logger.info("=== 메가 포트폴리오 최적화 테스트 ===")
-    
+def test_scalping_strategy():
+    """스캘핑 전략 테스트"""
+    logger.info("=== 스캘핑 전략 테스트 ===")
+    return _run_single(_scalping_strategy_task())
+
+def _mega_portfolio_optimization_task() -> SweepTask:
+    """메가 포트폴리오 최적화 백테스트 작업"""
     # 매우 다양한 종목으로 포트폴리오 구성
     mega_portfolio_stocks = [
         '005930.KS',  # 삼성전자
@@ -772,29 +623,13 @@ def test_mega_portfolio_optimization():
         take_profit_rate=0.005
     )
     
-    engine = BacktestingEngine(config)
-    engine.add_strategy(ultra_strategies)
-    
-    success = engine.load_data(mega_portfolio_stocks, data_source="yahoo")
-    if not success:
-        logger.error("메가 포트폴리오 데이터 로드 실패")
-        return None
-    
-    result = engine.run_backtest()
-    
-    if result:
-        logger.info("=== 메가 포트폴리오 최적화 성과 ===")
-        logger.info(f"총 거래 수: {result.total_trades}회")
-        logger.info(f"승률: {result.win_rate:.2f}%")
-        logger.info(f"총 수익률: {result.total_return:.2f}%")
-        logger.info(f"연간 수익률: {result.annual_return:.2f}%")
-        logger.info(f"최대 낙폭: {result.max_drawdown:.2f}%")
-        logger.info(f"샤프 비율: {result.sharpe_ratio:.2f}")
-        
-        return result
-    else:
-        logger.error("메가 포트폴리오 최적화 실패")
-        return None
+    return SweepTask(config, strategy_configs_from_manager(ultra_strategies),
+                     list(dict.fromkeys(mega_portfolio_stocks)), name='메가 포트폴리오 최적화')
+
+def test_mega_portfolio_optimization():
+    """메가 포트폴리오 최적화 테스트"""
+    logger.info("=== 메가 포트폴리오 최적화 테스트 ===")
+    return _run_single(_mega_portfolio_optimization_task())
 
 def create_market_adaptive_strategy():
     """시장 상황 적응형 전략 생성"""
@@ -856,10 +691,8 @@ def create_realistic_profit_strategy():
     
     return strategy_manager
 
-def test_market_adaptive_strategy():
-    """시장 상황 적응형 전략 테스트"""
-    logger.info("=== 시장 상황 적응형 전략 테스트 ===")
-    
+def _market_adaptive_strategy_task() -> SweepTask:
+    """시장 상황 적응형 전략 백테스트 작업"""
     adaptive_strategies = create_market_adaptive_strategy()
     
     # 현실적인 설정
@@ -877,34 +710,16 @@ def test_market_adaptive_strategy():
         take_profit_rate=0.20        # 20% 익절
     )
     
-    engine = BacktestingEngine(config)
-    engine.add_strategy(adaptive_strategies)
-    
-    success = engine.load_data(['005930.KS'], data_source="yahoo")
-    if not success:
-        logger.error("데이터 로드 실패")
-        return None
-    
-    result = engine.run_backtest()
-    
-    if result:
-        logger.info("=== 시장 상황 적응형 전략 성과 ===")
-        logger.info(f"총 거래 수: {result.total_trades}회")
-        logger.info(f"승률: {result.win_rate:.2f}%")
-        logger.info(f"총 수익률: {result.total_return:.2f}%")
-        logger.info(f"연간 수익률: {result.annual_return:.2f}%")
-        logger.info(f"최대 낙폭: {result.max_drawdown:.2f}%")
-        logger.info(f"샤프 비율: {result.sharpe_ratio:.2f}")
-        
-        return result
-    else:
-        logger.error("시장 상황 적응형 전략 테스트 실패")
-        return None
+    return SweepTask(config, strategy_configs_from_manager(adaptive_strategies),
+                     ['005930.KS'], name='시장 상황 적응형 전략')
 
-def test_realistic_profit_strategy():
-    """현실적인 수익 전략 테스트"""
-    logger.info("=== 현실적인 수익 전략 테스트 ===")
-    
+def test_market_adaptive_strategy():
+    """시장 상황 적응형 전략 테스트"""
+    logger.info("=== 시장 상황 적응형 전략 테스트 ===")
+    return _run_single(_market_adaptive_strategy_task())
+
+def _realistic_profit_strategy_task() -> SweepTask:
+    """현실적인 수익 전략 백테스트 작업"""
     realistic_strategies = create_realistic_profit_strategy()
     
     # 현실적인 설정
@@ -922,34 +737,16 @@ def test_realistic_profit_strategy():
         take_profit_rate=0.25        # 25% 익절
     )
     
-    engine = BacktestingEngine(config)
-    engine.add_strategy(realistic_strategies)
-    
-    success = engine.load_data(['005930.KS'], data_source="yahoo")
-    if not success:
-        logger.error("데이터 로드 실패")
-        return None
-    
-    result = engine.run_backtest()
-    
-    if result:
-        logger.info("=== 현실적인 수익 전략 성과 ===")
-        logger.info(f"총 거래 수: {result.total_trades}회")
-        logger.info(f"승률: {result.win_rate:.2f}%")
-        logger.info(f"총 수익률: {result.total_return:.2f}%")
-        logger.info(f"연간 수익률: {result.annual_return:.2f}%")
-        logger.info(f"최대 낙폭: {result.max_drawdown:.2f}%")
-        logger.info(f"샤프 비율: {result.sharpe_ratio:.2f}")
-        
-        return result
-    else:
-        logger.error("현실적인 수익 전략 테스트 실패")
-        return None
+    return SweepTask(config, strategy_configs_from_manager(realistic_strategies),
+                     ['005930.KS'], name='현실적인 수익 전략')
 
-def test_optimized_portfolio_strategy():
-    """최적화된 포트폴리오 전략 테스트"""
-    logger.info("=== 최적화된 포트폴리오 전략 테스트 ===")
-    
+def test_realistic_profit_strategy():
+    """현실적인 수익 전략 테스트"""
+    logger.info("=== 현실적인 수익 전략 테스트 ===")
+    return _run_single(_realistic_profit_strategy_task())
+
+def _optimized_portfolio_strategy_task() -> SweepTask:
+    """최적화된 포트폴리오 전략 백테스트 작업"""
     # 선별된 우량 종목들
     optimized_stocks = [
         '005930.KS',  # 삼성전자
@@ -977,101 +774,49 @@ def test_optimized_portfolio_strategy():
         take_profit_rate=0.20
     )
     
-    engine = BacktestingEngine(config)
-    engine.add_strategy(realistic_strategies)
-    
-    success = engine.load_data(optimized_stocks, data_source="yahoo")
-    if not success:
-        logger.error("최적화된 포트폴리오 데이터 로드 실패")
-        return None
-    
-    result = engine.run_backtest()
-    
-    if result:
-        logger.info("=== 최적화된 포트폴리오 전략 성과 ===")
-        logger.info(f"총 거래 수: {result.total_trades}회")
-        logger.info(f"승률: {result.win_rate:.2f}%")
-        logger.info(f"총 수익률: {result.total_return:.2f}%")
-        logger.info(f"연간 수익률: {result.annual_return:.2f}%")
-        logger.info(f"최대 낙폭: {result.max_drawdown:.2f}%")
-        logger.info(f"샤프 비율: {result.sharpe_ratio:.2f}")
-        
-        return result
-    else:
-        logger.error("최적화된 포트폴리오 전략 실패")
-        return None
+    return SweepTask(config, strategy_configs_from_manager(realistic_strategies),
+                     list(dict.fromkeys(optimized_stocks)), name='최적화된 포트폴리오 전략')
+
+def test_optimized_portfolio_strategy():
+    """최적화된 포트폴리오 전략 테스트"""
+    logger.info("=== 최적화된 포트폴리오 전략 테스트 ===")
+    return _run_single(_optimized_portfolio_strategy_task())
 
 def compare_all_enhanced_strategies():
-    """모든 향상된 전략 비교"""
+    """모든 향상된 전략 비교 (데이터 1회 로드 후 병렬 백테스트)"""
     logger.info("=== 모든 향상된 전략 비교 ===")
     
-    results = {}
-    
-    # 1. 모멘텀 전략
-    logger.info("1. 모멘텀 전략 테스트 중...")
-    momentum_result = test_momentum_strategy()
-    if momentum_result:
-        results['모멘텀 전략'] = momentum_result
-    
-    # 2. 변동성 돌파 전략
-    logger.info("2. 변동성 돌파 전략 테스트 중...")
-    breakout_result = test_volatility_breakout_strategy()
-    if breakout_result:
-        results['변동성 돌파 전략'] = breakout_result
-    
-    # 3. 트렌드 추종 전략
-    logger.info("3. 트렌드 추종 전략 테스트 중...")
-    trend_result = test_trend_following_strategy()
-    if trend_result:
-        results['트렌드 추종 전략'] = trend_result
-    
-    # 4. 고수익 하이브리드 전략
-    logger.info("4. 고수익 하이브리드 전략 테스트 중...")
-    hybrid_result = test_hybrid_high_profit_strategy()
-    if hybrid_result:
-        results['고수익 하이브리드 전략'] = hybrid_result
-    
-    # 5. 포트폴리오 최적화
-    logger.info("5. 포트폴리오 최적화 테스트 중...")
-    portfolio_result = test_portfolio_optimization()
-    if portfolio_result:
-        results['포트폴리오 최적화'] = portfolio_result
-    
-    # 6. 시장 상황 적응형 전략
-    logger.info("6. 시장 상황 적응형 전략 테스트 중...")
-    adaptive_result = test_market_adaptive_strategy()
-    if adaptive_result:
-        results['시장 상황 적응형 전략'] = adaptive_result
-    
-    # 7. 현실적인 수익 전략
-    logger.info("7. 현실적인 수익 전략 테스트 중...")
-    realistic_result = test_realistic_profit_strategy()
-    if realistic_result:
-        results['현실적인 수익 전략'] = realistic_result
-    
-    # 8. 최적화된 포트폴리오 전략
-    logger.info("8. 최적화된 포트폴리오 전략 테스트 중...")
-    optimized_result = test_optimized_portfolio_strategy()
-    if optimized_result:
-        results['최적화된 포트폴리오 전략'] = optimized_result
+    tasks = [
+        _momentum_strategy_task(),
+        _volatility_breakout_strategy_task(),
+        _trend_following_strategy_task(),
+        _hybrid_high_profit_strategy_task(),
+        _portfolio_optimization_task(),
+        _market_adaptive_strategy_task(),
+        _realistic_profit_strategy_task(),
+        _optimized_portfolio_strategy_task(),
+    ]
+    logger.info(f"{len(tasks)}개 전략 백테스트 중...")
+    table = compare_backtests(tasks)
+    results = {row['name']: row for _, row in table.iterrows()}
     
     # 결과 비교
     logger.info("\n=== 향상된 전략별 성과 비교 ===")
     for name, result in results.items():
         logger.info(f"\n{name}:")
-        logger.info(f"  거래 수: {result.total_trades}회")
-        logger.info(f"  승률: {result.win_rate:.2f}%")
-        logger.info(f"  수익률: {result.total_return:.2f}%")
-        logger.info(f"  샤프 비율: {result.sharpe_ratio:.2f}")
-        logger.info(f"  최대 낙폭: {result.max_drawdown:.2f}%")
+        logger.info(f"  거래 수: {result['total_trades']:.0f}회")
+        logger.info(f"  승률: {result['win_rate']:.2f}%")
+        logger.info(f"  수익률: {result['total_return']:.2f}%")
+        logger.info(f"  샤프 비율: {result['sharpe_ratio']:.2f}")
+        logger.info(f"  최대 낙폭: {result['max_drawdown']:.2f}%")
     
     # 최고 수익률 전략 찾기
     best_strategy = None
     best_return = -999
     
     for name, result in results.items():
-        if result.total_return > best_return:
-            best_return = result.total_return
+        if result['total_return'] > best_return:
+            best_return = result['total_return']
             best_strategy = name
     
     logger.info(f"\n🏆 최고 수익률 전략: {best_strategy}")
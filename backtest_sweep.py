@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+병렬 백테스트 스윕 실행기
+BacktestConfig 조합과 전략 파라미터 조합을 프로세스 풀에 분산하여 실행하고
+결과를 하나의 비교 테이블로 모읍니다.
+
+- 가격 데이터는 작업마다 피클링하지 않고 워커 프로세스 초기화 시 한 번만 전달합니다.
+  (CachedDataSpec을 넘기면 각 워커가 로컬 캐시 파일을 직접 메모리 맵으로 열어 한 사본을 공유)
+- 완료된 작업은 체크포인트(JSONL) 파일에 즉시 기록되어, 중단된 스윕을 이어서 실행할 수 있습니다.
+  체크포인트 행에는 가격 데이터와 백테스트 코드의 지문(run_key)이 함께 기록되어 데이터나 코드가 바뀌면
+  재사용하지 않고, 스윕이 모두 끝나면 체크포인트를 삭제합니다.
+"""
+
+import os
+import sys
+import json
+import hashlib
+import importlib
+from dataclasses import dataclass, field, asdict, replace
+from datetime import datetime
+from enum import Enum
+from itertools import product
+from typing import Dict, List, Optional, Union
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from loguru import logger
+import pandas as pd
+
+from backtesting_system import BacktestingEngine, BacktestConfig
+from trading_strategy import StrategyConfig, StrategyManager, create_strategy_manager
+from ohlcv_cache import CachedDataSpec
+
+# 비교 테이블에 포함할 성과 지표
+RESULT_METRICS = [
+    'final_capital', 'total_return', 'annual_return', 'total_trades', 'win_rate',
+    'max_drawdown', 'volatility', 'sharpe_ratio', 'sortino_ratio', 'calmar_ratio'
+]
+
+# 백테스트 결과에 영향을 주는 모듈 (소스가 바뀌면 이전 체크포인트를 재사용하지 않음)
+# 전략이 사용하는 지표 모듈 포함
+FINGERPRINT_MODULES = ['backtesting_system', 'trading_strategy', 'technical_indicators',
+                       'streaming_indicators', 'backtest_sweep']
+
+# 워커 프로세스별 공유 가격 데이터 (초기화 시 한 번만 설정)
+_WORKER_DATA: Dict[str, pd.DataFrame] = {}
+
+@dataclass
+class SweepTask:
+    """스윕 작업 단위"""
+    config: BacktestConfig
+    strategy_configs: Dict[str, StrategyConfig] = field(default_factory=dict)
+    codes: Optional[List[str]] = None  # None이면 전체 종목
+    name: Optional[str] = None         # 비교 테이블에 표시할 이름
+
+    @property
+    def task_id(self) -> str:
+        """설정 내용으로부터 결정되는 작업 ID (재시작 시 동일)"""
+        payload = json.dumps(self.describe(), sort_keys=True, default=_json_default)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+    def describe(self) -> Dict:
+        """비교 테이블용 작업 설명"""
+        description = {'name': self.name} if self.name else {}
+        description.update({f"config.{key}": value for key, value in asdict(self.config).items()})
+        for name, strategy_config in self.strategy_configs.items():
+            description[f"{name}.type"] = strategy_config.strategy_type
+            for key, value in strategy_config.parameters.items():
+                description[f"{name}.{key}"] = value
+        description['codes'] = ",".join(self.codes) if self.codes else "ALL"
+        return description
+
+def _json_default(value):
+    """Enum/datetime 직렬화"""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+def data_fingerprint(data: Dict[str, pd.DataFrame]) -> str:
+    """가격 데이터 내용 지문 (종목 코드 + 인덱스/값 해시)"""
+    digest = hashlib.sha1()
+    for code in sorted(data):
+        digest.update(code.encode('utf-8'))
+        digest.update(pd.util.hash_pandas_object(data[code], index=True).values.tobytes())
+    return digest.hexdigest()[:16]
+
+def code_fingerprint() -> str:
+    """백테스트 관련 모듈 소스 지문"""
+    digest = hashlib.sha1()
+    for name in FINGERPRINT_MODULES:
+        module = sys.modules.get(name) or importlib.import_module(name)
+        with open(module.__file__, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+def strategy_configs_from_manager(manager: StrategyManager) -> Dict[str, StrategyConfig]:
+    """기존 StrategyManager의 전략 구성을 스윕 작업용 설정 딕셔너리로 변환"""
+    return {name: strategy.config for name, strategy in manager.strategies.items()}
+
+def build_sweep_tasks(configs: List[BacktestConfig],
+                      strategy_grid: List[Dict[str, StrategyConfig]] = None,
+                      codes_grid: List[Optional[List[str]]] = None) -> List[SweepTask]:
+    """설정 x 전략 파라미터 x 종목 조합으로 작업 목록 생성"""
+    strategy_grid = strategy_grid or [{}]
+    codes_grid = codes_grid or [None]
+
+    return [
+        SweepTask(config=config, strategy_configs=strategy_configs, codes=codes)
+        for config, strategy_configs, codes in product(configs, strategy_grid, codes_grid)
+    ]
+
+def _init_worker(data: Union[Dict[str, pd.DataFrame], CachedDataSpec], log_level: str):
+    """워커 프로세스 초기화: 공유 데이터 설정 및 로그 레벨 조정"""
+    global _WORKER_DATA
+    _WORKER_DATA = data.load() if isinstance(data, CachedDataSpec) else data
+
+    logger.remove()
+    logger.add(sys.stderr, level=log_level)
+
+def _run_sweep_task(task: SweepTask, data: Dict[str, pd.DataFrame] = None) -> Dict:
+    """단일 스윕 작업 실행 (워커 프로세스, data를 주면 해당 데이터 사용)"""
+    row = {'task_id': task.task_id, 'status': 'failed'}
+    data = _WORKER_DATA if data is None else data
+
+    try:
+        engine = BacktestingEngine(task.config)
+
+        codes = task.codes or list(data.keys())
+        engine.set_data({code: data[code] for code in codes if code in data})
+
+        # 전략 설정이 없으면 엔진 기본 전략 사용
+        if task.strategy_configs:
+            engine.add_strategy(create_strategy_manager(task.strategy_configs))
+
+        result = engine.run_backtest()
+        if result is None:
+            return row
+
+        for metric in RESULT_METRICS:
+            row[metric] = float(getattr(result, metric))
+        row['status'] = 'ok'
+
+    except Exception as e:
+        logger.error(f"스윕 작업 {task.task_id} 오류: {e}")
+        row['error'] = str(e)
+
+    return row
+
+class BacktestSweepRunner:
+    """프로세스 풀 기반 백테스트 스윕 실행기"""
+
+    def __init__(self, data: Union[Dict[str, pd.DataFrame], CachedDataSpec], max_workers: int = None,
+                 checkpoint_path: str = None, worker_log_level: str = "WARNING", keep_checkpoint: bool = False):
+        self.data = data
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.checkpoint_path = checkpoint_path
+        self.worker_log_level = worker_log_level
+        self.keep_checkpoint = keep_checkpoint  # True면 스윕이 끝나도 체크포인트 유지
+        self._run_key = None
+
+    @property
+    def run_key(self) -> str:
+        """가격 데이터 + 백테스트 코드 지문 (체크포인트 재사용 조건)"""
+        if self._run_key is None:
+            data = self.data.load() if isinstance(self.data, CachedDataSpec) else self.data
+            self._run_key = f"{data_fingerprint(data)}-{code_fingerprint()}"
+        return self._run_key
+
+    def load_checkpoint(self) -> Dict[str, Dict]:
+        """체크포인트에서 완료된 작업 결과 로드"""
+        completed = {}
+
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return completed
+
+        with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    # 강제 종료로 잘린 마지막 줄은 무시하고 다시 실행
+                    continue
+                # 다른 데이터/코드로 실행한 결과는 다시 계산
+                if row.get('status') == 'ok' and row.get('run_key') == self.run_key:
+                    completed[row['task_id']] = row
+
+        return completed
+
+    def _open_checkpoint(self):
+        """체크포인트 파일을 추가 모드로 열기 (잘린 마지막 줄은 줄바꿈으로 분리)"""
+        if not self.checkpoint_path:
+            return None
+
+        needs_newline = False
+        if os.path.exists(self.checkpoint_path) and os.path.getsize(self.checkpoint_path) > 0:
+            with open(self.checkpoint_path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                needs_newline = f.read(1) != b"\n"
+
+        checkpoint = open(self.checkpoint_path, 'a', encoding='utf-8')
+        if needs_newline:
+            checkpoint.write("\n")
+        return checkpoint
+
+    def run(self, tasks: List[SweepTask]) -> pd.DataFrame:
+        """스윕 실행 후 비교 테이블 반환"""
+        completed = self.load_checkpoint()
+        pending = [task for task in tasks if task.task_id not in completed]
+
+        logger.info(f"스윕 시작: 전체 {len(tasks)}개, 완료 {len(tasks) - len(pending)}개, "
+                    f"실행 {len(pending)}개 (워커 {self.max_workers}개)")
+
+        if pending:
+            checkpoint = self._open_checkpoint()
+            try:
+                for i, row in enumerate(self._execute(pending), 1):
+                    if row['status'] == 'ok':
+                        completed[row['task_id']] = row
+                    else:
+                        logger.warning(f"스윕 작업 실패: {row['task_id']} {row.get('error', '')}")
+
+                    if checkpoint:
+                        row['run_key'] = self.run_key
+                        checkpoint.write(json.dumps(row, ensure_ascii=False) + "\n")
+                        checkpoint.flush()
+
+                    logger.info(f"스윕 진행: {i}/{len(pending)}")
+            finally:
+                if checkpoint:
+                    checkpoint.close()
+
+        if all(task.task_id in completed for task in tasks):
+            self._remove_checkpoint()
+
+        return self._build_table(tasks, completed)
+
+    def _remove_checkpoint(self):
+        """모든 작업이 끝난 스윕의 체크포인트 삭제 (다음 실행은 처음부터 다시 계산)"""
+        if self.checkpoint_path and not self.keep_checkpoint and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+            logger.info(f"스윕 완료, 체크포인트 삭제: {self.checkpoint_path}")
+
+    def _execute(self, tasks: List[SweepTask]):
+        """작업 결과를 완료 순서대로 반환 (워커가 1개면 프로세스 풀 없이 현재 프로세스에서 순차 실행)"""
+        if self.max_workers == 1:
+            data = self.data.load() if isinstance(self.data, CachedDataSpec) else self.data
+            for task in tasks:
+                yield _run_sweep_task(task, data)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.max_workers,
+                                 initializer=_init_worker,
+                                 initargs=(self.data, self.worker_log_level)) as executor:
+            futures = [executor.submit(_run_sweep_task, task) for task in tasks]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def _build_table(self, tasks: List[SweepTask], completed: Dict[str, Dict]) -> pd.DataFrame:
+        """작업 설명과 결과를 하나의 비교 테이블로 결합"""
+        rows = []
+        for task in tasks:
+            result = completed.get(task.task_id)
+            if result is None:
+                continue
+            row = {'task_id': task.task_id}
+            row.update({key: _json_default(value) if isinstance(value, (Enum, datetime)) else value
+                        for key, value in task.describe().items()})
+            row.update({metric: result.get(metric) for metric in RESULT_METRICS})
+            rows.append(row)
+
+        table = pd.DataFrame(rows)
+        if not table.empty:
+            table = table.sort_values('sharpe_ratio', ascending=False).reset_index(drop=True)
+        return table
+
+def run_backtest_sweep(data: Union[Dict[str, pd.DataFrame], CachedDataSpec], tasks: List[SweepTask],
+                       max_workers: int = None, checkpoint_path: str = None) -> pd.DataFrame:
+    """백테스트 스윕 실행 (편의 함수)"""
+    runner = BacktestSweepRunner(data, max_workers=max_workers, checkpoint_path=checkpoint_path)
+    return runner.run(tasks)
+
+def load_sweep_data(tasks: List[SweepTask], data_source: str = "yahoo") -> Dict[str, pd.DataFrame]:
+    """작업들이 사용하는 종목을 한 번에 로드 (가장 넓은 기간 기준, 모든 작업이 공유)"""
+    codes = list(dict.fromkeys(code for task in tasks for code in (task.codes or [])))
+    config = replace(tasks[0].config,
+                     start_date=min(task.config.start_date for task in tasks),
+                     end_date=max(task.config.end_date for task in tasks))
+
+    engine = BacktestingEngine(config)
+    if not engine.load_data(codes or None, data_source=data_source):
+        return {}
+    return engine.data
+
+def compare_backtests(tasks: List[SweepTask], data_source: str = "yahoo", max_workers: int = None) -> pd.DataFrame:
+    """이름 붙인 백테스트 작업들을 데이터 1회 로드 후 병렬 실행, 비교 테이블(name 열 포함) 반환"""
+    data = load_sweep_data(tasks, data_source)
+    if not data:
+        logger.error("데이터 로드 실패")
+        return pd.DataFrame()
+    return run_backtest_sweep(data, tasks, max_workers=min(max_workers or os.cpu_count() or 1, len(tasks)))
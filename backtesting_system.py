@@ -10,9 +10,10 @@ import time
 import json
 import random
 import threading
+from collections import deque
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Callable
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 from enum import Enum
 from loguru import logger
 import pandas as pd
@@ -20,11 +21,10 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from scipy import stats
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # 트레이딩 시스템 모듈들
 from trading_strategy import (
-    StrategyManager, create_default_strategies, TradingSignal, 
+    StrategyManager, create_default_strategies, create_strategy_manager, TradingSignal, 
     SignalType, StrategyType, StrategyConfig
 )
 from technical_indicators import (
@@ -34,6 +34,7 @@ from technical_indicators import (
 
 # 실제 데이터 API 추가
 from real_stock_data_api import StockDataAPI, DataManager, StockData
+from ohlcv_cache import OHLCVCache, DEFAULT_CACHE_DIR
 
 class BacktestMode(Enum):
     """백테스트 모드"""
@@ -42,6 +43,27 @@ class BacktestMode(Enum):
     MONTE_CARLO = "몬테카를로"
     WALK_FORWARD = "워크포워드"
 
+class SignalFeedMode(Enum):
+    """전략 데이터 공급 방식"""
+    INCREMENTAL = "증분"   # 종목별 상태를 유지하며 새 봉만 공급
+    REPLAY = "전체재생"     # 매일 전체 이력을 다시 공급 (검증용 기준 모드)
+
+class ResamplingMethod(Enum):
+    """Monte Carlo 재표본 방식"""
+    PERMUTATION = "순열"            # 거래 순서 재배열 (비복원)
+    BOOTSTRAP = "부트스트랩"         # 거래 단위 복원 추출
+    BLOCK_BOOTSTRAP = "블록부트스트랩"  # 연속 구간 단위 복원 추출 (자기상관 보존)
+
+class LotMatching(Enum):
+    """매도 시 매수 로트 대응 방식"""
+    FIFO = "선입선출"
+    LIFO = "후입선출"
+
+class WalkForwardScheme(Enum):
+    """Walk Forward 학습 구간 방식"""
+    ROLLING = "롤링"     # 고정 길이 학습 구간이 검증 구간과 함께 이동
+    ANCHORED = "앵커드"  # 학습 구간 시작은 고정, 끝만 늘어남
+
 @dataclass
 class BacktestConfig:
     """백테스트 설정"""
@@ -68,6 +90,29 @@ class BacktestConfig:
     # 성과 분석
     benchmark: str = "KOSPI"          # 벤치마크
     risk_free_rate: float = 0.03      # 무위험 수익률 3%
+    
+    # 신호 생성
+    signal_feed_mode: SignalFeedMode = SignalFeedMode.INCREMENTAL
+    
+    # Monte Carlo 설정
+    monte_carlo_simulations: int = 1000
+    monte_carlo_method: ResamplingMethod = ResamplingMethod.PERMUTATION
+    monte_carlo_block_size: int = 5
+    monte_carlo_seed: Optional[int] = None
+    
+    # 거래 통계
+    lot_matching: LotMatching = LotMatching.FIFO
+    
+    # 가격 데이터 로컬 캐시 (None이면 매번 원본에서 조회)
+    data_cache_dir: Optional[str] = DEFAULT_CACHE_DIR
+    data_interval: str = "1d"
+    
+    # Walk Forward 설정 (구간 길이는 거래일 수)
+    walk_forward_scheme: WalkForwardScheme = WalkForwardScheme.ROLLING
+    walk_forward_train_bars: int = 60
+    walk_forward_test_bars: int = 20
+    walk_forward_metric: str = "sharpe_ratio"   # 학습 구간 최적화 기준 (클수록 좋은 지표)
+    walk_forward_workers: Optional[int] = None  # 학습 구간 최적화 프로세스 수 (None이면 CPU 수)
 
 @dataclass
 class Trade:
@@ -92,6 +137,119 @@ class Position:
     stop_loss_price: float
     take_profit_price: float
 
+@dataclass
+class RoundTrip:
+    """매수-매도 왕복 거래"""
+    code: str
+    quantity: int
+    entry_time: datetime
+    exit_time: datetime
+    entry_price: float
+    exit_price: float
+    
+    @property
+    def pnl(self) -> float:
+        return (self.exit_price - self.entry_price) * self.quantity
+    
+    @property
+    def return_rate(self) -> float:
+        return (self.exit_price - self.entry_price) / self.entry_price
+
+class TradeLedger:
+    """왕복 거래 원장
+    
+    거래 목록을 한 번 순회하며 종목별 미청산 로트를 FIFO/LIFO로 대응시킵니다.
+    결과 생성, Walk Forward 통합, Monte Carlo가 같은 배열을 재사용합니다.
+    """
+    
+    def __init__(self, trades: List['Trade'], matching: LotMatching = LotMatching.FIFO):
+        self.matching = matching
+        self.round_trips: List[RoundTrip] = []
+        self.unmatched_sells = 0
+        
+        open_lots: Dict[str, deque] = {}
+        
+        for trade in trades:
+            if trade.action == 'BUY':
+                # [남은 수량, 가격, 시각]
+                open_lots.setdefault(trade.code, deque()).append([trade.quantity, trade.price, trade.timestamp])
+            elif trade.action == 'SELL':
+                self._match_sell(trade, open_lots.get(trade.code))
+        
+        count = len(self.round_trips)
+        self.pnl = np.fromiter((rt.pnl for rt in self.round_trips), dtype=np.float64, count=count)
+        self.returns = np.fromiter((rt.return_rate for rt in self.round_trips), dtype=np.float64, count=count)
+        self.holding_days = np.fromiter(
+            ((rt.exit_time - rt.entry_time).total_seconds() / 86400 for rt in self.round_trips),
+            dtype=np.float64, count=count
+        )
+    
+    def _match_sell(self, trade: 'Trade', lots: Optional[deque]):
+        """매도 수량을 미청산 로트에 대응"""
+        remaining = trade.quantity
+        
+        while remaining > 0 and lots:
+            lot = lots[0] if self.matching == LotMatching.FIFO else lots[-1]
+            matched = min(remaining, lot[0])
+            
+            self.round_trips.append(RoundTrip(
+                code=trade.code,
+                quantity=matched,
+                entry_time=lot[2],
+                exit_time=trade.timestamp,
+                entry_price=lot[1],
+                exit_price=trade.price
+            ))
+            
+            lot[0] -= matched
+            remaining -= matched
+            if lot[0] == 0:
+                if self.matching == LotMatching.FIFO:
+                    lots.popleft()
+                else:
+                    lots.pop()
+        
+        if remaining > 0:
+            self.unmatched_sells += 1
+    
+    def summary(self) -> Dict:
+        """승리 거래 수 및 총 수익/손실"""
+        winning = self.pnl > 0
+        return {
+            'winning_trades': int(np.count_nonzero(winning)),
+            'total_profit': float(self.pnl[winning].sum()),
+            'total_loss': float(-self.pnl[~winning].sum())
+        }
+
+@dataclass
+class WalkForwardWindow:
+    """Walk Forward 구간 기록"""
+    index: int
+    train_start: datetime
+    train_end: datetime
+    test_start: datetime
+    test_end: datetime
+    strategy_configs: Optional[Dict[str, StrategyConfig]] = None  # 선택된 전략 설정 (최적화하지 않으면 None)
+    in_sample_score: Optional[float] = None
+    out_of_sample_return: Optional[float] = None
+
+def build_walk_forward_windows(num_bars: int, train_bars: int, test_bars: int,
+                               scheme: WalkForwardScheme = WalkForwardScheme.ROLLING) -> List[Tuple[int, int, int, int]]:
+    """Walk Forward 구간 위치 목록 [(학습 시작, 학습 끝, 검증 시작, 검증 끝)] (끝은 미포함)
+    
+    검증 구간은 겹치지 않게 test_bars씩 이동하며, 마지막 구간은 남은 봉 수만큼 짧을 수 있습니다.
+    """
+    if train_bars <= 0 or test_bars <= 0:
+        raise ValueError("학습/검증 구간 길이는 1 이상이어야 합니다")
+    
+    windows = []
+    test_start = train_bars
+    while test_start < num_bars:
+        train_start = 0 if scheme == WalkForwardScheme.ANCHORED else test_start - train_bars
+        windows.append((train_start, test_start, test_start, min(test_start + test_bars, num_bars)))
+        test_start += test_bars
+    return windows
+
 @dataclass
 class BacktestResult:
     """백테스트 결과"""
@@ -133,6 +291,72 @@ class BacktestResult:
     
     # Monte Carlo 통계 (선택적)
     monte_carlo_stats: Dict = None
+    
+    # 왕복 거래 원장 (선택적)
+    trade_ledger: TradeLedger = None
+    
+    # Walk Forward 구간 기록 (선택적)
+    walk_forward_windows: List[WalkForwardWindow] = None
+
+class AlignedMarketData:
+    """종목별 가격 데이터를 공통 거래일 캘린더에 정렬한 배열
+    
+    데이터 로드 시 한 번만 만들어 두고, 일별 루프에서는 날짜 -> 정수 위치 조회 후
+    배열 인덱싱만 사용합니다. (매일 종목마다 tz_localize, 라벨 조회를 반복하지 않음)
+    """
+    
+    def __init__(self, data: Dict[str, pd.DataFrame]):
+        self.frames = data
+        self.codes = list(data.keys())
+        self.code_positions = {code: j for j, code in enumerate(self.codes)}
+        self.source_ids = [id(df) for df in data.values()]
+        
+        # 종목별 시간대 제거 인덱스
+        self.naive_indexes: Dict[str, pd.DatetimeIndex] = {}
+        for code, df in data.items():
+            index = pd.DatetimeIndex(df.index)
+            if index.tz is not None:
+                index = index.tz_localize(None)
+            self.naive_indexes[code] = index
+        
+        # 공통 거래일 캘린더 (전 종목 날짜의 합집합)
+        calendar = pd.DatetimeIndex([])
+        for index in self.naive_indexes.values():
+            calendar = calendar.union(index)
+        self.calendar = calendar.unique().sort_values()
+        self.date_positions = {date: t for t, date in enumerate(self.calendar)}
+        
+        num_dates, num_codes = len(self.calendar), len(self.codes)
+        self.close = np.full((num_dates, num_codes), np.nan)
+        self.valid = np.zeros((num_dates, num_codes), dtype=bool)
+        # 해당 날짜까지(포함) 각 종목 DataFrame의 행 수 (df.iloc[:row_count]가 df.loc[:date]와 동일)
+        self.row_count = np.zeros((num_dates, num_codes), dtype=np.int64)
+        
+        for j, code in enumerate(self.codes):
+            df = data[code]
+            index = self.naive_indexes[code]
+            close_column = 'close' if 'close' in df.columns else 'Close'
+            
+            positions = self.calendar.get_indexer(index)
+            self.close[positions, j] = df[close_column].to_numpy(dtype=np.float64)
+            self.valid[positions, j] = True
+            self.row_count[:, j] = index.searchsorted(self.calendar, side='right')
+    
+    def matches(self, data: Dict[str, pd.DataFrame]) -> bool:
+        """현재 데이터 딕셔너리로부터 만들어진 배열인지 확인"""
+        return list(data.keys()) == self.codes and [id(df) for df in data.values()] == self.source_ids
+    
+    def position(self, date: datetime) -> Optional[int]:
+        """날짜의 캘린더 위치 (데이터가 없으면 None)"""
+        date_naive = date.replace(tzinfo=None) if date.tzinfo else date
+        return self.date_positions.get(date_naive)
+    
+    def price(self, code: str, t: Optional[int]) -> Optional[float]:
+        """캘린더 위치 t의 종가 (데이터가 없으면 None)"""
+        j = self.code_positions.get(code)
+        if t is None or j is None or not self.valid[t, j]:
+            return None
+        return self.close[t, j]
 
 class BacktestingEngine:
     """백테스팅 엔진"""
@@ -152,6 +376,16 @@ class BacktestingEngine:
         self.max_drawdown_start = None
         self.max_drawdown_end = None
         
+        # Walk Forward 학습 구간에서 비교할 전략 설정 후보 [{전략 이름: StrategyConfig}]
+        self.walk_forward_grid: List[Dict[str, StrategyConfig]] = []
+        
+        # 공통 캘린더에 정렬된 가격 배열 (load_data/set_data 시 생성)
+        self.market_data: Optional[AlignedMarketData] = None
+        
+        # 증분 신호 생성용 종목별 전략 상태 {code: {strategy_name: data_state}}
+        self._feed_states = {}
+        self._feed_positions = {}
+        
         logger.info("백테스팅 엔진 초기화 완료")
     
     def add_strategy(self, strategy_manager: StrategyManager):
@@ -159,6 +393,11 @@ class BacktestingEngine:
         self.strategy_manager = strategy_manager
         logger.info(f"전략 매니저 추가 완료: {len(strategy_manager.strategies)}개 전략")
     
+    def set_walk_forward_grid(self, strategy_grid: List[Dict[str, StrategyConfig]]):
+        """Walk Forward 학습 구간 최적화 후보 지정 (비어 있으면 현재 전략을 그대로 사용)"""
+        self.walk_forward_grid = list(strategy_grid)
+        logger.info(f"Walk Forward 후보 지정 완료: {len(self.walk_forward_grid)}개")
+    
     def load_data(self, codes: List[str] = None, data_source: str = "yahoo") -> bool:
         """과거 데이터 로드"""
         try:
@@ -175,6 +414,7 @@ class BacktestingEngine:
                 # 샘플 데이터 생성 (fallback)
                 self._generate_sample_data()
             
+            self._prepare_market_data()
             logger.info(f"데이터 로드 완료: {len(self.data)}개 종목")
             return True
             
@@ -182,6 +422,17 @@ class BacktestingEngine:
             logger.error(f"데이터 로드 오류: {e}")
             return False
     
+    def set_data(self, data: Dict[str, pd.DataFrame]):
+        """이미 로드된 가격 데이터 지정 (종목코드 -> OHLCV DataFrame)"""
+        self.data = dict(data)
+        self._prepare_market_data()
+        logger.info(f"데이터 지정 완료: {len(self.data)}개 종목")
+    
+    def _prepare_market_data(self):
+        """가격 데이터를 공통 캘린더 배열로 정렬 (데이터가 바뀐 경우에만 다시 생성)"""
+        if self.market_data is None or not self.market_data.matches(self.data):
+            self.market_data = AlignedMarketData(self.data)
+    
     def _load_real_data(self, codes: List[str], data_source: str):
         """실제 데이터 로드"""
         try:
@@ -189,19 +440,25 @@ class BacktestingEngine:
             api = StockDataAPI(data_source=data_source)
             manager = DataManager(api)
             
-            # 백테스트용 데이터 준비
-            stock_data = manager.get_backtest_data(
-                codes, 
-                self.config.start_date, 
-                self.config.end_date,
-                validate=True,
-                clean=True
-            )
-            
-            # 데이터 변환
-            for code, stock_data_obj in stock_data.items():
-                self.data[code] = stock_data_obj.data
+            if self.config.data_cache_dir:
+                self._load_cached_data(codes, data_source, manager)
+            else:
+                # 백테스트용 데이터 준비
+                stock_data = manager.get_backtest_data(
+                    codes, 
+                    self.config.start_date, 
+                    self.config.end_date,
+                    validate=True,
+                    clean=True
+                )
                 
+                # 데이터 변환
+                for code, stock_data_obj in stock_data.items():
+                    self.data[code] = stock_data_obj.data
+            
+            if not self.data:
+                raise ValueError("로드된 종목이 없습니다")
+            
             logger.info(f"실제 데이터 로드 완료: {len(self.data)}개 종목")
             
         except Exception as e:
@@ -209,6 +466,47 @@ class BacktestingEngine:
             # 실패시 샘플 데이터로 fallback
             self._generate_sample_data()
     
+    def _load_cached_data(self, codes: List[str], data_source: str, manager: DataManager):
+        """로컬 캐시 우선 데이터 로드 (캐시에 없는 구간만 원본에서 조회 후 추가)"""
+        cache = OHLCVCache(self.config.data_cache_dir)
+        interval = self.config.data_interval
+        adjusted = data_source == "yahoo"  # 야후는 수정주가(auto_adjust) 기준
+        start_date, end_date = self.config.start_date, self.config.end_date
+        
+        # 당일 봉은 장중에 바뀔 수 있으므로 캐시하지 않음
+        today = datetime.now().strftime("%Y-%m-%d")
+        
+        # 조회 구간이 같은 종목끼리 묶어 한 번에 요청 (다중 종목 조회는 동시 요청)
+        groups: Dict[Tuple[str, str, bool], List[str]] = {}
+        for code in codes:
+            missing = cache.missing_range(code, start_date, end_date, interval, adjusted)
+            if missing is not None:
+                groups.setdefault(missing, []).append(code)
+        
+        for (fetch_start, fetch_end, full_refresh), group in groups.items():
+            logger.info(f"캐시 미포함 구간 조회: {len(group)}개 종목 {fetch_start} ~ {fetch_end}")
+            
+            # 이어 받는 구간은 봉 수가 적어 최소 데이터 수 검증을 생략
+            stock_data = manager.get_backtest_data(group, fetch_start, fetch_end,
+                                                   validate=full_refresh, clean=True,
+                                                   interval=interval)
+            
+            for code in group:
+                if code not in stock_data:
+                    continue
+                
+                df = stock_data[code].data
+                df = df[df.index < pd.Timestamp(today)]
+                write = cache.replace if full_refresh else cache.append
+                write(code, df, interval, adjusted, covered_from=fetch_start, covered_to=min(fetch_end, today))
+        
+        for code in codes:
+            df = cache.read(code, start_date, end_date, interval, adjusted)
+            if df is not None and not df.empty:
+                self.data[code] = df
+        
+        logger.info(f"캐시 데이터 로드 완료: {len(self.data)}/{len(codes)}개 종목")
+    
     def _generate_sample_data(self):
         """샘플 데이터 생성 (fallback용)"""
         # 주요 종목들
@@ -269,8 +567,12 @@ class BacktestingEngine:
         try:
             logger.info("백테스트 시작")
             
-            # 전략 매니저 초기화
-            self.strategy_manager = create_default_strategies()
+            # data를 직접 지정한 경우에도 정렬 배열 준비
+            self._prepare_market_data()
+            
+            # 전략 매니저 초기화 (add_strategy로 지정하지 않은 경우 기본 전략 사용)
+            if self.strategy_manager is None:
+                self.strategy_manager = create_default_strategies()
             
             # 초기화
             self.positions = {}
@@ -278,6 +580,7 @@ class BacktestingEngine:
             self.equity_curve = []
             self.current_capital = self.config.initial_capital
             self.peak_capital = self.config.initial_capital
+            self._reset_signal_feed()
             
             # 날짜 범위
             start_date = datetime.strptime(self.config.start_date, "%Y-%m-%d")
@@ -313,41 +616,38 @@ class BacktestingEngine:
         self.equity_curve = []
         self.current_capital = self.config.initial_capital
         self.peak_capital = self.config.initial_capital
+        self._reset_signal_feed()
         
         logger.debug(f"백테스트 기간: {start_date} ~ {end_date}")
         logger.debug(f"초기 자본: {self.current_capital:,.0f}원")
         
         # 실제 데이터가 있는 날짜만 처리
-        if self.data:
-            first_code = list(self.data.keys())[0]
-            df = self.data[first_code]
-            
-            # 시간대 정보 안전하게 처리
-            try:
-                if df.index.tz is not None:
-                    df_index_naive = df.index.tz_localize(None)
-                else:
-                    df_index_naive = df.index
-            except:
-                df_index_naive = df.index
-            
-            start_date_naive = start_date.replace(tzinfo=None) if start_date.tzinfo else start_date
-            end_date_naive = end_date.replace(tzinfo=None) if end_date.tzinfo else end_date
-            
-            # 데이터가 있는 날짜만 필터링
-            available_dates = df_index_naive[(df_index_naive >= start_date_naive) & (df_index_naive <= end_date_naive)]
-            available_dates = available_dates[available_dates.weekday < 5]  # 주중만
-            
-            logger.info(f"처리할 날짜 수: {len(available_dates)}개")
-            
-            # 일별 데이터 처리
-            for date in available_dates:
-                logger.debug(f"일별 데이터 처리: {date.strftime('%Y-%m-%d')}")
-                self._process_daily_data(date)
+        available_dates = self._trading_dates(start_date, end_date)
+        logger.info(f"처리할 날짜 수: {len(available_dates)}개")
+        
+        # 일별 데이터 처리
+        for date in available_dates:
+            logger.debug(f"일별 데이터 처리: {date.strftime('%Y-%m-%d')}")
+            self._process_daily_data(date)
         
         logger.info("단일 종목 백테스트 완료")
         return self._generate_results(start_date, end_date)
     
+    def _trading_dates(self, start_date: datetime, end_date: datetime) -> pd.DatetimeIndex:
+        """기간 내 거래일 (첫 종목의 데이터가 있는 주중 날짜)"""
+        if not self.data:
+            return pd.DatetimeIndex([])
+        
+        first_code = list(self.data.keys())[0]
+        df_index_naive = self.market_data.naive_indexes[first_code]
+        
+        start_date_naive = start_date.replace(tzinfo=None) if start_date.tzinfo else start_date
+        end_date_naive = end_date.replace(tzinfo=None) if end_date.tzinfo else end_date
+        
+        # 데이터가 있는 날짜만 필터링
+        available_dates = df_index_naive[(df_index_naive >= start_date_naive) & (df_index_naive <= end_date_naive)]
+        return available_dates[available_dates.weekday < 5]  # 주중만
+    
     def _run_portfolio_backtest(self, start_date: datetime, end_date: datetime) -> BacktestResult:
         """포트폴리오 백테스트"""
         logger.info("포트폴리오 백테스트 시작")
@@ -379,7 +679,13 @@ class BacktestingEngine:
         base_result = self._run_single_stock_backtest(start_date, end_date)
         
         # Monte Carlo 시뮬레이션
-        simulator = MonteCarloSimulator(base_result, num_simulations=1000)
+        simulator = MonteCarloSimulator(
+            base_result,
+            num_simulations=self.config.monte_carlo_simulations,
+            method=self.config.monte_carlo_method,
+            block_size=self.config.monte_carlo_block_size,
+            seed=self.config.monte_carlo_seed
+        )
         simulation_results = simulator.run_simulations()
         
         # 결과에 Monte Carlo 통계 추가
@@ -390,243 +696,191 @@ class BacktestingEngine:
         return base_result
     
     def _run_walk_forward_backtest(self, start_date: datetime, end_date: datetime) -> BacktestResult:
-        """Walk Forward 백테스트"""
+        """Walk Forward 백테스트
+        
+        학습(in-sample) 구간마다 walk_forward_grid 후보를 병렬로 백테스트하여 최적 설정을 고르고,
+        바로 다음 검증(out-of-sample) 구간을 그 설정으로 실행합니다.
+        검증 구간들은 하나의 연속된 실행으로 처리되어 자본금/포지션이 구간 사이에 유지되고,
+        후보별 전략 데이터 상태도 보관해 두었다가 다시 선택되면 새 봉만 이어서 공급합니다.
+        """
         logger.info("Walk Forward 백테스트 시작")
         
-        # 기간을 여러 구간으로 나누어 백테스트
-        total_days = (end_date - start_date).days
-        window_size = total_days // 4  # 4개 구간으로 분할
+        dates = self._trading_dates(start_date, end_date)
+        windows = build_walk_forward_windows(len(dates), self.config.walk_forward_train_bars,
+                                             self.config.walk_forward_test_bars, self.config.walk_forward_scheme)
+        if not windows:
+            logger.warning(f"Walk Forward 구간 없음: 거래일 {len(dates)}개 <= 학습 구간 {self.config.walk_forward_train_bars}개")
+            return None
         
-        all_results = []
+        logger.info(f"Walk Forward 구간: {len(windows)}개 ({self.config.walk_forward_scheme.value}, "
+                    f"학습 {self.config.walk_forward_train_bars}봉 / 검증 {self.config.walk_forward_test_bars}봉)")
         
-        for i in range(4):
-            window_start = start_date + timedelta(days=i * window_size)
-            window_end = start_date + timedelta(days=(i + 1) * window_size)
-            
-            if i == 3:  # 마지막 구간은 end_date까지
-                window_end = end_date
-            
-            logger.info(f"구간 {i+1} 백테스트: {window_start.strftime('%Y-%m-%d')} ~ {window_end.strftime('%Y-%m-%d')}")
-            
-            # 구간별 백테스트 실행
-            window_result = self._run_single_stock_backtest(window_start, window_end)
-            if window_result:
-                all_results.append(window_result)
+        choices = self._optimize_walk_forward_windows(dates, windows)
         
-        # 전체 결과 통합
-        return self._combine_walk_forward_results(all_results, start_date, end_date)
-    
-    def _combine_walk_forward_results(self, results: List[BacktestResult], 
-                                    start_date: datetime, end_date: datetime) -> BacktestResult:
-        """Walk Forward 결과 통합"""
-        if not results:
-            return None
+        # 초기화 (검증 구간 전체를 하나의 계좌로 실행)
+        self.positions = {}
+        self.trades = []
+        self.equity_curve = []
+        self.current_capital = self.config.initial_capital
+        self.peak_capital = self.config.initial_capital
         
-        # 첫 번째 결과를 기본으로 사용
-        combined_result = results[0]
+        base_manager = self.strategy_manager
+        managers = {}       # 후보 번호 -> 전략 매니저
+        feed_states = {}    # 후보 번호 -> (종목별 전략 상태, 종목별 공급 위치)
+        current = None
+        records = []
         
-        # 거래 기록 통합
-        all_trades = []
-        all_equity_curve = []
+        try:
+            for i, ((train_lo, train_hi, test_lo, test_hi), (candidate, score)) in enumerate(zip(windows, choices)):
+                # 후보가 바뀌면 전략 매니저와 데이터 상태 교체
+                if i == 0 or candidate != current:
+                    if i > 0:
+                        feed_states[current] = (self._feed_states, self._feed_positions)
+                    if candidate is None:
+                        self.strategy_manager = base_manager
+                    else:
+                        if candidate not in managers:
+                            managers[candidate] = create_strategy_manager(self.walk_forward_grid[candidate])
+                        self.strategy_manager = managers[candidate]
+                    self._feed_states, self._feed_positions = feed_states.get(candidate, ({}, {}))
+                    current = candidate
+                
+                logger.info(f"구간 {i+1} 검증: {dates[test_lo].strftime('%Y-%m-%d')} ~ "
+                            f"{dates[test_hi - 1].strftime('%Y-%m-%d')} (후보: {candidate})")
+                
+                capital_before = self.equity_curve[-1]['capital'] if self.equity_curve else self.current_capital
+                for date in dates[test_lo:test_hi]:
+                    self._process_daily_data(date)
+                capital_after = self.equity_curve[-1]['capital'] if self.equity_curve else self.current_capital
+                
+                records.append(WalkForwardWindow(
+                    index=i,
+                    train_start=dates[train_lo],
+                    train_end=dates[train_hi - 1],
+                    test_start=dates[test_lo],
+                    test_end=dates[test_hi - 1],
+                    strategy_configs=None if candidate is None else self.walk_forward_grid[candidate],
+                    in_sample_score=score,
+                    out_of_sample_return=(capital_after - capital_before) / capital_before
+                ))
+        finally:
+            self.strategy_manager = base_manager
         
-        for result in results:
-            all_trades.extend(result.trades)
-            all_equity_curve.extend(result.equity_curve)
+        result = self._generate_results(dates[windows[0][2]], dates[windows[-1][3] - 1])
+        if result:
+            result.walk_forward_windows = records
+        return result
+    
+    def _optimize_walk_forward_windows(self, dates: pd.DatetimeIndex,
+                                       windows: List[Tuple[int, int, int, int]]) -> List[Tuple[Optional[int], Optional[float]]]:
+        """학습 구간별 최적 후보 선택 [(후보 번호, 학습 구간 점수)]
         
-        # 시간순 정렬
-        all_trades.sort(key=lambda x: x.timestamp)
-        all_equity_curve.sort(key=lambda x: x['date'])
+        모든 구간 x 후보 백테스트를 한 번의 프로세스 풀 스윕으로 실행합니다.
+        """
+        if not self.walk_forward_grid:
+            return [(None, None)] * len(windows)
         
-        # 통합된 결과 생성
-        combined_result.trades = all_trades
-        combined_result.equity_curve = all_equity_curve
-        combined_result.start_date = start_date
-        combined_result.end_date = end_date
+        # 순환 import 방지 (backtest_sweep이 이 모듈을 import)
+        from backtest_sweep import BacktestSweepRunner, SweepTask, RESULT_METRICS
         
-        # 성과 지표 재계산
-        combined_result = self._recalculate_performance(combined_result)
+        metric = self.config.walk_forward_metric
+        if metric not in RESULT_METRICS:
+            raise ValueError(f"지원하지 않는 최적화 기준: {metric}")
         
-        return combined_result
-    
-    def _recalculate_performance(self, result: BacktestResult) -> BacktestResult:
-        """성과 지표 재계산"""
-        try:
-            # 기본 정보
-            final_capital = result.equity_curve[-1]['capital'] if result.equity_curve else result.initial_capital
-            total_return = (final_capital - result.initial_capital) / result.initial_capital
-            
-            # 거래 통계 재계산
-            total_trades = len(result.trades)
-            winning_trades = 0
-            total_profit = 0
-            total_loss = 0
-            
-            for trade in result.trades:
-                if trade.action == 'SELL':
-                    # 수익/손실 계산
-                    buy_trade = None
-                    for t in result.trades:
-                        if t.code == trade.code and t.action == 'BUY' and t.timestamp < trade.timestamp:
-                            buy_trade = t
-                            break
-                    
-                    if buy_trade:
-                        profit = (trade.price - buy_trade.price) * trade.quantity
-                        if profit > 0:
-                            winning_trades += 1
-                            total_profit += profit
-                        else:
-                            total_loss += abs(profit)
-            
-            win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
-            
-            # 수익률 계산
-            days = (result.end_date - result.start_date).days
-            annual_return = (1 + total_return) ** (365 / days) - 1 if days > 0 else 0
-            
-            # 위험 지표 재계산
-            returns = self._calculate_returns_from_equity_curve(result.equity_curve)
-            volatility = np.std(returns) * np.sqrt(252) if len(returns) > 1 else 0
-            sharpe_ratio = self._calculate_sharpe_ratio(returns)
-            sortino_ratio = self._calculate_sortino_ratio(returns)
-            calmar_ratio = annual_return / result.max_drawdown if result.max_drawdown > 0 else 0
-            
-            # 결과 업데이트
-            result.final_capital = final_capital
-            result.total_return = total_return
-            result.annual_return = annual_return
-            result.total_trades = total_trades
-            result.winning_trades = winning_trades
-            result.losing_trades = total_trades - winning_trades
-            result.win_rate = win_rate
-            result.total_profit = total_profit
-            result.total_loss = total_loss
-            result.net_profit = total_profit - total_loss
-            result.volatility = volatility
-            result.sharpe_ratio = sharpe_ratio
-            result.sortino_ratio = sortino_ratio
-            result.calmar_ratio = calmar_ratio
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"성과 지표 재계산 오류: {e}")
-            return result
-    
-    def _calculate_returns_from_equity_curve(self, equity_curve: List[Dict]) -> List[float]:
-        """자본금 곡선에서 수익률 계산"""
-        returns = []
+        window_tasks = []
+        for train_lo, train_hi, _, _ in windows:
+            config = replace(
+                self.config,
+                mode=BacktestMode.SINGLE_STOCK,
+                start_date=dates[train_lo].strftime("%Y-%m-%d"),
+                end_date=dates[train_hi - 1].strftime("%Y-%m-%d")
+            )
+            window_tasks.append([SweepTask(config=config, strategy_configs=strategy_configs)
+                                 for strategy_configs in self.walk_forward_grid])
         
-        if len(equity_curve) < 2:
-            return returns
+        runner = BacktestSweepRunner(self.data, max_workers=self.config.walk_forward_workers)
+        table = runner.run([task for tasks in window_tasks for task in tasks])
+        scores = dict(zip(table['task_id'], table[metric])) if not table.empty else {}
         
-        for i in range(1, len(equity_curve)):
-            prev_capital = equity_curve[i-1]['capital']
-            curr_capital = equity_curve[i]['capital']
-            daily_return = (curr_capital - prev_capital) / prev_capital
-            returns.append(daily_return)
+        choices = []
+        for i, tasks in enumerate(window_tasks):
+            best, best_score = None, None
+            for candidate, task in enumerate(tasks):
+                score = scores.get(task.task_id)
+                if score is None or np.isnan(score):
+                    continue
+                if best_score is None or score > best_score:
+                    best, best_score = candidate, float(score)
+            
+            if best is None:
+                # 모든 후보가 실패하면 직전 구간 선택 유지
+                best = choices[-1][0] if choices else 0
+                logger.warning(f"구간 {i+1} 최적화 실패: 후보 {best} 사용")
+            choices.append((best, best_score))
         
-        return returns
+        return choices
     
     def _process_daily_data(self, date: datetime):
         """일별 데이터 처리"""
         try:
             logger.debug(f"일별 데이터 처리 시작: {date.strftime('%Y-%m-%d')}")
-            
-            # 각 종목에 대해 처리
-            for code, df in self.data.items():
-                # 날짜 비교를 위해 시간대 정보 제거
-                date_naive = date.replace(tzinfo=None) if date.tzinfo else date
-                
-                # 데이터 인덱스에서 시간대 정보 제거
-                if df.index.tz is not None:
-                    df_index_naive = df.index.tz_localize(None)
-                else:
-                    df_index_naive = df.index
-                
-                # 날짜가 데이터에 있는지 확인
-                if date_naive not in df_index_naive:
-                    logger.debug(f"날짜 {date.strftime('%Y-%m-%d')}가 {code} 데이터에 없음")
-                    continue
-                
-                logger.debug(f"종목 {code} 처리 중...")
-                
-                # 현재가 조회 (시간대 정보 제거된 날짜 사용)
-                current_price = df.loc[date_naive, 'close']
-                logger.debug(f"현재가: {current_price:,.0f}원")
-                
-                # 전략 신호 생성
-                signals = self._generate_signals(date)
-                logger.debug(f"생성된 신호: {len(signals)}개")
-                
-                # 신호 처리
-                for signal in signals:
-                    self._process_signal(signal, date)
-                
-                # 포지션 업데이트
-                self._update_positions(code, current_price, date)
-            
-            # 자본금 업데이트
-            self._update_equity(date)
+            self._run_day_step(date)
             
         except Exception as e:
             logger.error(f"일별 데이터 처리 오류: {e}")
             import traceback
             logger.error(traceback.format_exc())
     
+    def _run_day_step(self, date: datetime):
+        """하루치 봉 처리
+        
+        1. 당일 데이터가 있는 종목마다 신호를 한 번씩만 생성
+        2. 신호를 종목 순서(데이터 순서), 전략 순서(등록 순서)대로 실행
+        3. 종목 순서대로 손절/익절 확인 후 자본금 기록
+        
+        종목 수 N에 대해 O(N)이며, 같은 신호가 하루에 여러 번 실행되지 않습니다.
+        """
+        market = self.market_data
+        t = market.position(date)
+        if t is None:
+            logger.debug(f"날짜 {date.strftime('%Y-%m-%d')}에 데이터가 있는 종목 없음")
+            self._update_equity(date)
+            return
+        
+        # 당일 데이터가 있는 종목과 현재가
+        day_prices = [(j, code, market.close[t, j]) for j, code in enumerate(market.codes) if market.valid[t, j]]
+        
+        # 신호 생성 (종목당 1회)
+        signals = []
+        for j, code, _ in day_prices:
+            signals.extend(self._generate_code_signals(code, j, t, date))
+        logger.debug(f"생성된 신호: {len(signals)}개")
+        
+        # 신호 처리
+        for signal in signals:
+            self._process_signal(signal, date)
+        
+        # 포지션 업데이트
+        for j, code, current_price in day_prices:
+            self._update_positions(code, current_price, date)
+        
+        # 자본금 업데이트
+        self._update_equity(date)
+    
     def _generate_signals(self, date: datetime) -> List[TradingSignal]:
-        """신호 생성"""
+        """신호 생성 (당일 데이터가 있는 전 종목)"""
         signals = []
         
         try:
+            market = self.market_data
+            t = market.position(date)
+            if t is None:
+                return signals
+            
             # 각 종목에 대해 신호 생성
-            for code, df in self.data.items():
-                # 날짜 비교를 위해 시간대 정보 제거
-                date_naive = date.replace(tzinfo=None) if date.tzinfo else date
-                
-                # 데이터 인덱스에서 시간대 정보 제거
-                if df.index.tz is not None:
-                    df_index_naive = df.index.tz_localize(None)
-                else:
-                    df_index_naive = df.index
-                
-                if date_naive not in df_index_naive:
-                    continue
-                
-                current_price = df.loc[date_naive, 'close']
-                logger.debug(f"신호 생성 시작: {code} @ {date.strftime('%Y-%m-%d')} - 현재가: {current_price:,.0f}원")
-                
-                # 현재 날짜까지의 데이터만 가져오기 (시간대 정보 제거된 날짜 사용)
-                available_data = df.loc[:date_naive]
-                logger.debug(f"사용 가능한 데이터: {len(available_data)}개")
-                
-                if len(available_data) < 10:  # 최소 10개 데이터 필요 (줄임)
-                    logger.debug(f"데이터 부족: {len(available_data)}개 < 10개")
-                    continue
-                
-                # 각 전략에 데이터 추가
-                for name, strategy in self.strategy_manager.strategies.items():
-                    # 기존 데이터 초기화
-                    strategy.price_history = []
-                    
-                    # 가격 데이터 추가
-                    for data_date, row in available_data.iterrows():
-                        strategy.add_data(data_date, row)
-                    
-                    logger.debug(f"{name} 전략에 {len(strategy.price_history)}개 데이터 추가")
-                
-                # 신호 생성
-                for name, strategy in self.strategy_manager.strategies.items():
-                    signal = strategy.generate_signal()
-                    if signal:
-                        signal.code = code
-                        signal.price = current_price
-                        signal.timestamp = date
-                        signal.strategy_name = name
-                        signals.append(signal)
-                        logger.info(f"{date.strftime('%Y-%m-%d')} {code} {name}: {signal.signal_type} 신호 생성")
-                    else:
-                        logger.debug(f"{date.strftime('%Y-%m-%d')} {code} {name}: 신호 없음")
+            for j, code in enumerate(market.codes):
+                if market.valid[t, j]:
+                    signals.extend(self._generate_code_signals(code, j, t, date))
         
         except Exception as e:
             logger.error(f"신호 생성 오류: {e}")
@@ -636,6 +890,93 @@ class BacktestingEngine:
         logger.debug(f"총 생성된 신호: {len(signals)}개")
         return signals
     
+    def _generate_code_signals(self, code: str, j: int, t: int, date: datetime) -> List[TradingSignal]:
+        """단일 종목 신호 생성 (j: 종목 위치, t: 캘린더 위치)"""
+        signals = []
+        market = self.market_data
+        
+        try:
+            df = market.frames[code]
+            current_price = market.close[t, j]
+            logger.debug(f"신호 생성 시작: {code} @ {date.strftime('%Y-%m-%d')} - 현재가: {current_price:,.0f}원")
+            
+            # 현재 날짜까지의 데이터 개수
+            available_count = int(market.row_count[t, j])
+            logger.debug(f"사용 가능한 데이터: {available_count}개")
+            
+            if self.config.signal_feed_mode == SignalFeedMode.REPLAY:
+                self._replay_strategy_data(df.iloc[:available_count])
+            else:
+                self._feed_strategy_data(code, df, available_count)
+            
+            if available_count < 10:  # 최소 10개 데이터 필요 (줄임)
+                logger.debug(f"데이터 부족: {available_count}개 < 10개")
+                return signals
+            
+            # 신호 생성
+            for name, strategy in self.strategy_manager.strategies.items():
+                signal = strategy.generate_signal()
+                if signal:
+                    signal.code = code
+                    signal.price = current_price
+                    signal.timestamp = date
+                    signal.strategy_name = name
+                    signals.append(signal)
+                    logger.info(f"{date.strftime('%Y-%m-%d')} {code} {name}: {signal.signal_type} 신호 생성")
+                else:
+                    logger.debug(f"{date.strftime('%Y-%m-%d')} {code} {name}: 신호 없음")
+        
+        except Exception as e:
+            logger.error(f"신호 생성 오류 ({code}): {e}")
+            import traceback
+            logger.error(traceback.format_exc())
+        
+        return signals
+    
+    def _reset_signal_feed(self):
+        """증분 신호 생성 상태 초기화"""
+        self._feed_states = {}
+        self._feed_positions = {}
+    
+    def _replay_strategy_data(self, available_data: pd.DataFrame):
+        """전체 이력 재생 방식으로 전략 데이터 공급 (기준 모드)"""
+        for name, strategy in self.strategy_manager.strategies.items():
+            # 기존 데이터 초기화
+            strategy.reset_data()
+            
+            # 가격 데이터 추가
+            for data_date, row in available_data.iterrows():
+                strategy.add_data(data_date, row)
+            
+            logger.debug(f"{name} 전략에 {len(strategy.price_history)}개 데이터 추가")
+    
+    def _feed_strategy_data(self, code: str, df: pd.DataFrame, available_count: int):
+        """증분 방식으로 전략 데이터 공급
+        
+        전략 인스턴스는 종목 간에 공유되므로 종목별 데이터 상태(가격 이력, 스트리밍 지표)를
+        보관해 두고 신호 생성 직전에 교체합니다. 마지막으로 공급한 위치 이후의 새 봉만 추가합니다.
+        """
+        fed_count = self._feed_positions.get(code, 0)
+        states = self._feed_states.setdefault(code, {})
+        
+        # 날짜가 되돌아간 경우 (예: 구간 재시작) 처음부터 다시 공급
+        if available_count < fed_count:
+            states.clear()
+            fed_count = 0
+        
+        new_rows = df.iloc[fed_count:available_count]
+        
+        for name, strategy in self.strategy_manager.strategies.items():
+            strategy.set_data_state(states.get(name))
+            
+            for data_date, row in new_rows.iterrows():
+                strategy.add_data(data_date, row)
+            
+            # 처음 공급한 종목은 set_data_state(None)이 새로 만든 상태를 저장
+            states[name] = strategy.get_data_state()
+        
+        self._feed_positions[code] = available_count
+    
     def _process_signal(self, signal: TradingSignal, date: datetime):
         """신호 처리"""
         try:
@@ -782,26 +1123,7 @@ class BacktestingEngine:
     def _process_portfolio_daily_data(self, date: datetime, portfolio_weights: Dict[str, float]):
         """포트폴리오 일별 데이터 처리"""
         try:
-            # 각 종목에 대해 처리
-            for code, df in self.data.items():
-                if date not in df.index:
-                    continue
-                
-                # 현재가 조회
-                current_price = df.loc[date, 'close']
-                
-                # 전략 신호 생성
-                signals = self._generate_signals(date)
-                
-                # 신호 처리
-                for signal in signals:
-                    self._process_signal(signal, date)
-                
-                # 포지션 업데이트
-                self._update_positions(code, current_price, date)
-            
-            # 자본금 업데이트
-            self._update_equity(date)
+            self._run_day_step(date)
             
         except Exception as e:
             logger.error(f"포트폴리오 일별 데이터 처리 오류: {e}")
@@ -814,17 +1136,18 @@ class BacktestingEngine:
             # 현재 포지션 가치 계산
             current_weights = {}
             total_value = self.current_capital
+            t = self.market_data.position(date)
             
             for code, position in self.positions.items():
-                if code in self.data and date in self.data[code].index:
-                    current_price = self.data[code].loc[date, 'close']
+                current_price = self.market_data.price(code, t)
+                if current_price is not None:
                     position_value = current_price * position.quantity
                     total_value += position_value
             
             # 목표 가중치에 맞게 조정
             for code, target_weight in portfolio_weights.items():
-                if code in self.data and date in self.data[code].index:
-                    current_price = self.data[code].loc[date, 'close']
+                current_price = self.market_data.price(code, t)
+                if current_price is not None:
                     target_value = total_value * target_weight
                     
                     if code in self.positions:
@@ -855,9 +1178,10 @@ class BacktestingEngine:
         try:
             # 현재 포지션 가치 계산
             position_value = 0
+            t = self.market_data.position(date)
             for code, position in self.positions.items():
-                if code in self.data and date in self.data[code].index:
-                    current_price = self.data[code].loc[date, 'close']
+                current_price = self.market_data.price(code, t)
+                if current_price is not None:
                     position_value += current_price * position.quantity
             
             # 총 자본금
@@ -896,26 +1220,11 @@ class BacktestingEngine:
             
             # 거래 통계
             total_trades = len(self.trades)
-            winning_trades = 0
-            total_profit = 0
-            total_loss = 0
-            
-            for trade in self.trades:
-                if trade.action == 'SELL':
-                    # 수익/손실 계산
-                    buy_trade = None
-                    for t in self.trades:
-                        if t.code == trade.code and t.action == 'BUY' and t.timestamp < trade.timestamp:
-                            buy_trade = t
-                            break
-                    
-                    if buy_trade:
-                        profit = (trade.price - buy_trade.price) * trade.quantity
-                        if profit > 0:
-                            winning_trades += 1
-                            total_profit += profit
-                        else:
-                            total_loss += abs(profit)
+            ledger = TradeLedger(self.trades, self.config.lot_matching)
+            trade_stats = ledger.summary()
+            winning_trades = trade_stats['winning_trades']
+            total_profit = trade_stats['total_profit']
+            total_loss = trade_stats['total_loss']
             
             win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
             
@@ -959,7 +1268,8 @@ class BacktestingEngine:
                 trades=self.trades,
                 equity_curve=self.equity_curve,
                 drawdown_curve=[],  # TODO: 계산 필요
-                strategy_performance=strategy_performance
+                strategy_performance=strategy_performance,
+                trade_ledger=ledger
             )
         
         except Exception as e:
@@ -1019,110 +1329,121 @@ class BacktestingEngine:
         return sortino
 
 class MonteCarloSimulator:
-    """Monte Carlo 시뮬레이터"""
+    """Monte Carlo 시뮬레이터
     
-    def __init__(self, backtest_result: BacktestResult, num_simulations: int = 1000):
+    모든 경로를 (경로 수 x 거래 수) 행렬로 한 번에 생성하고 배열 연산으로
+    자본금 곡선, 최대 낙폭을 계산합니다. 경로는 청크 단위로 처리하므로
+    시뮬레이션 수가 커져도 메모리 사용량은 max_chunk_elements로 제한됩니다.
+    같은 seed, 같은 청크 크기이면 결과가 재현됩니다.
+    """
+    
+    def __init__(self, backtest_result: BacktestResult, num_simulations: int = 1000,
+                 method: ResamplingMethod = ResamplingMethod.PERMUTATION, block_size: int = 5,
+                 seed: Optional[int] = None, max_chunk_elements: int = 5_000_000):
         self.backtest_result = backtest_result
         self.num_simulations = num_simulations
-        self.simulation_results = []
+        self.method = method
+        self.block_size = block_size
+        self.seed = seed
+        self.max_chunk_elements = max_chunk_elements
+        self.simulation_results: Dict[str, np.ndarray] = {}
     
-    def run_simulations(self) -> List[Dict]:
-        """Monte Carlo 시뮬레이션 실행"""
-        logger.info(f"Monte Carlo 시뮬레이션 시작 ({self.num_simulations}회)")
+    def run_simulations(self) -> Dict[str, np.ndarray]:
+        """Monte Carlo 시뮬레이션 실행
+        
+        Returns:
+            경로별 결과 배열 (final_capital, total_return, max_drawdown, sharpe_ratio)
+        """
+        logger.info(f"Monte Carlo 시뮬레이션 시작 ({self.num_simulations}회, {self.method.value})")
         
         try:
             # 원본 거래 데이터에서 수익률 추출
             returns = self._extract_returns()
             
-            if not returns:
+            if len(returns) == 0:
                 logger.error("수익률 데이터가 없습니다.")
-                return []
-            
-            # 병렬 처리로 시뮬레이션 실행
-            with ThreadPoolExecutor(max_workers=4) as executor:
-                futures = []
-                for i in range(self.num_simulations):
-                    future = executor.submit(self._run_single_simulation, returns, i)
-                    futures.append(future)
-                
-                # 결과 수집
-                for future in as_completed(futures):
-                    result = future.result()
-                    if result:
-                        self.simulation_results.append(result)
+                return {}
+            
+            rng = np.random.default_rng(self.seed)
+            chunk_size = max(1, min(self.num_simulations, self.max_chunk_elements // len(returns)))
+            
+            chunks = []
+            for start in range(0, self.num_simulations, chunk_size):
+                num_paths = min(chunk_size, self.num_simulations - start)
+                sampled_returns = self._sample_returns(returns, num_paths, rng)
+                chunks.append(self._evaluate_paths(sampled_returns))
+            
+            self.simulation_results = {
+                key: np.concatenate([chunk[key] for chunk in chunks])
+                for key in chunks[0]
+            }
             
-            logger.info(f"Monte Carlo 시뮬레이션 완료: {len(self.simulation_results)}회")
+            logger.info(f"Monte Carlo 시뮬레이션 완료: {self.num_simulations}회")
             return self.simulation_results
             
         except Exception as e:
             logger.error(f"Monte Carlo 시뮬레이션 오류: {e}")
-            return []
+            return {}
     
-    def _extract_returns(self) -> List[float]:
-        """거래 데이터에서 수익률 추출"""
-        returns = []
+    def _extract_returns(self) -> np.ndarray:
+        """거래 데이터에서 왕복 거래별 수익률 추출"""
+        ledger = getattr(self.backtest_result, 'trade_ledger', None)
+        if ledger is None:
+            config = getattr(self.backtest_result, 'config', None)
+            matching = getattr(config, 'lot_matching', LotMatching.FIFO)
+            ledger = TradeLedger(self.backtest_result.trades, matching)
+        return ledger.returns
+    
+    def _sample_returns(self, returns: np.ndarray, num_paths: int, rng: np.random.Generator) -> np.ndarray:
+        """재표본 방식에 따라 (경로 수 x 거래 수) 수익률 행렬 생성"""
+        num_trades = len(returns)
         
-        for trade in self.backtest_result.trades:
-            if trade.action == 'SELL':
-                # 해당 매수 거래 찾기
-                buy_trade = None
-                for t in self.backtest_result.trades:
-                    if (t.code == trade.code and t.action == 'BUY' and 
-                        t.timestamp < trade.timestamp):
-                        buy_trade = t
-                        break
-                
-                if buy_trade:
-                    return_rate = (trade.price - buy_trade.price) / buy_trade.price
-                    returns.append(return_rate)
+        if self.method == ResamplingMethod.PERMUTATION:
+            return rng.permuted(np.broadcast_to(returns, (num_paths, num_trades)), axis=1)
         
-        return returns
+        if self.method == ResamplingMethod.BOOTSTRAP:
+            return returns[rng.integers(0, num_trades, size=(num_paths, num_trades))]
+        
+        if self.method == ResamplingMethod.BLOCK_BOOTSTRAP:
+            block_size = max(1, min(self.block_size, num_trades))
+            num_blocks = -(-num_trades // block_size)
+            starts = rng.integers(0, num_trades - block_size + 1, size=(num_paths, num_blocks))
+            indices = (starts[:, :, None] + np.arange(block_size)).reshape(num_paths, -1)[:, :num_trades]
+            return returns[indices]
+        
+        raise ValueError(f"지원하지 않는 재표본 방식: {self.method}")
     
-    def _run_single_simulation(self, returns: List[float], sim_id: int) -> Dict:
-        """단일 시뮬레이션 실행"""
-        try:
-            # 랜덤하게 거래 순서 재배열
-            shuffled_returns = returns.copy()
-            random.shuffle(shuffled_returns)
-            
-            # 시뮬레이션 실행
-            initial_capital = self.backtest_result.initial_capital
-            current_capital = initial_capital
-            max_capital = initial_capital
-            max_drawdown = 0.0
-            
-            for return_rate in shuffled_returns:
-                current_capital *= (1 + return_rate)
-                
-                if current_capital > max_capital:
-                    max_capital = current_capital
-                
-                drawdown = (max_capital - current_capital) / max_capital
-                if drawdown > max_drawdown:
-                    max_drawdown = drawdown
-            
-            total_return = (current_capital - initial_capital) / initial_capital
-            
-            return {
-                'simulation_id': sim_id,
-                'final_capital': current_capital,
-                'total_return': total_return,
-                'max_drawdown': max_drawdown,
-                'sharpe_ratio': total_return / max_drawdown if max_drawdown > 0 else 0
-            }
-            
-        except Exception as e:
-            logger.error(f"시뮬레이션 {sim_id} 오류: {e}")
-            return None
+    def _evaluate_paths(self, sampled_returns: np.ndarray) -> Dict[str, np.ndarray]:
+        """수익률 행렬로부터 경로별 자본금, 최대 낙폭 계산"""
+        initial_capital = self.backtest_result.initial_capital
+        
+        equity = initial_capital * np.cumprod(1 + sampled_returns, axis=1)
+        peak = np.maximum(np.maximum.accumulate(equity, axis=1), initial_capital)
+        max_drawdown = ((peak - equity) / peak).max(axis=1)
+        
+        final_capital = equity[:, -1]
+        total_return = (final_capital - initial_capital) / initial_capital
+        
+        sharpe_ratio = np.zeros_like(total_return)
+        has_drawdown = max_drawdown > 0
+        sharpe_ratio[has_drawdown] = total_return[has_drawdown] / max_drawdown[has_drawdown]
+        
+        return {
+            'final_capital': final_capital,
+            'total_return': total_return,
+            'max_drawdown': max_drawdown,
+            'sharpe_ratio': sharpe_ratio
+        }
     
     def get_statistics(self) -> Dict:
         """시뮬레이션 통계"""
         if not self.simulation_results:
             return {}
         
-        returns = [r['total_return'] for r in self.simulation_results]
-        drawdowns = [r['max_drawdown'] for r in self.simulation_results]
-        sharpe_ratios = [r['sharpe_ratio'] for r in self.simulation_results]
+        returns = self.simulation_results['total_return']
+        drawdowns = self.simulation_results['max_drawdown']
+        sharpe_ratios = self.simulation_results['sharpe_ratio']
+        var_95 = np.percentile(returns, 5)
         
         return {
             'mean_return': np.mean(returns),
@@ -1132,9 +1453,9 @@ class MonteCarloSimulator:
             'mean_drawdown': np.mean(drawdowns),
             'max_drawdown': np.max(drawdowns),
             'mean_sharpe': np.mean(sharpe_ratios),
-            'win_rate': len([r for r in returns if r > 0]) / len(returns) * 100,
-            'var_95': np.percentile(returns, 5),  # 95% VaR
-            'cvar_95': np.mean([r for r in returns if r <= np.percentile(returns, 5)])  # 95% CVaR
+            'win_rate': np.count_nonzero(returns > 0) / len(returns) * 100,
+            'var_95': var_95,  # 95% VaR
+            'cvar_95': np.mean(returns[returns <= var_95])  # 95% CVaR
         }
 
 class BacktestAnalyzer:
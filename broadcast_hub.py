@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+실시간 시세 브로드캐스트 허브
+종목 → 구독자 인덱스로 구독자에게만 시세를 보내고, 일정 간격(프레임)마다 모아서 전송합니다.
+
+- 틱은 종목별 최신 값만 보관 (프레임 사이의 틱은 합쳐짐)
+- 종목별 페이로드는 프레임마다 한 번만 JSON 직렬화하고 모든 구독자 프레임에서 재사용
+- 느린 클라이언트: 확인(ack)받지 못한 프레임이 max_inflight개면 전송을 건너뛰고
+  변경된 종목만 기억해 두었다가 다음 전송 때 최신 값으로 한 번에 보냄 (대기열이 쌓이지 않음)
+"""
+
+import json
+import time
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Set
+from loguru import logger
+
+# emit(event, frame, sid, ack_callback)
+EmitFunction = Callable[[str, str, str, Optional[Callable]], None]
+
+@dataclass
+class ClientState:
+    """클라이언트별 구독/전송 상태"""
+    codes: Set[str] = field(default_factory=set)
+    dirty: Set[str] = field(default_factory=set)  # 아직 보내지 않은 변경 종목
+    inflight: int = 0                             # 확인받지 못한 프레임 수
+    last_sent: float = 0.0                        # 마지막 프레임 전송 시각 (time.monotonic)
+    frames: int = 0
+    skipped: int = 0                              # 전송을 미룬 횟수
+
+class BroadcastHub:
+    """종목 구독자 룸 인덱스 + 프레임 단위 일괄 전송"""
+
+    def __init__(self, emit: EmitFunction, flush_interval: float = 0.1, max_inflight: int = 2,
+                 ack_timeout: float = 10.0, event: str = 'stock_updates'):
+        self.emit = emit
+        self.flush_interval = flush_interval
+        self.max_inflight = max(1, max_inflight)
+        self.ack_timeout = ack_timeout
+        self.event = event
+
+        self.subscribers: Dict[str, Set[str]] = {}  # {code: {sid}}
+        self.clients: Dict[str, ClientState] = {}   # {sid: ClientState}
+        self.fragments: Dict[str, str] = {}         # {code: 직렬화된 최신 페이로드}
+        self._pending: Dict[str, Dict] = {}         # {code: 이번 프레임의 최신 데이터}
+        self._dirty_clients: Set[str] = set()
+        self._lock = threading.Lock()
+
+        self.running = False
+        self._thread = None
+        self.stats = {'published': 0, 'serialized': 0, 'frames': 0, 'skipped': 0, 'ack_timeouts': 0}
+
+    # 구독 관리
+    def add_client(self, sid: str):
+        with self._lock:
+            self.clients.setdefault(sid, ClientState())
+
+    def remove_client(self, sid: str) -> List[str]:
+        """클라이언트 제거, 더 이상 구독자가 없는 종목 반환"""
+        with self._lock:
+            client = self.clients.pop(sid, None)
+            self._dirty_clients.discard(sid)
+            if client is None:
+                return []
+            return self._detach(sid, client.codes)
+
+    def set_subscriptions(self, sid: str, codes: Iterable[str]) -> List[str]:
+        """구독 종목 교체, 더 이상 구독자가 없는 종목 반환"""
+        codes = set(codes)
+        with self._lock:
+            client = self.clients.setdefault(sid, ClientState())
+            released = self._detach(sid, client.codes - codes)
+            for code in codes - client.codes:
+                self.subscribers.setdefault(code, set()).add(sid)
+            client.codes = codes
+            client.dirty &= codes
+            return released
+
+    def unsubscribe(self, sid: str, codes: Iterable[str]) -> List[str]:
+        """구독 해제, 더 이상 구독자가 없는 종목 반환"""
+        with self._lock:
+            client = self.clients.get(sid)
+            if client is None:
+                return []
+            removed = client.codes & set(codes)
+            client.codes -= removed
+            client.dirty -= removed
+            return self._detach(sid, removed)
+
+    def _detach(self, sid: str, codes: Iterable[str]) -> List[str]:
+        released = []
+        for code in codes:
+            subscribers = self.subscribers.get(code)
+            if subscribers is None:
+                continue
+            subscribers.discard(sid)
+            if not subscribers:
+                del self.subscribers[code]
+                self.fragments.pop(code, None)
+                released.append(code)
+        return released
+
+    def subscriber_count(self, code: str) -> int:
+        return len(self.subscribers.get(code, ()))
+
+    # 전송
+    def publish(self, code: str, data: Dict):
+        """종목 시세 갱신 (수신 스레드에서 호출, 구독자가 없으면 버림)"""
+        with self._lock:
+            if code in self.subscribers:
+                self._pending[code] = data
+                self.stats['published'] += 1
+
+    def flush(self):
+        """이번 프레임의 변경 종목을 구독자별 프레임으로 묶어 전송"""
+        now = time.monotonic()
+        timestamp = datetime.now().isoformat()
+        frames = []
+
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+            # 종목별로 한 번만 직렬화
+            for code, data in pending.items():
+                subscribers = self.subscribers.get(code)
+                if not subscribers:
+                    continue
+                self.fragments[code] = json.dumps(
+                    {'code': code, 'data': data, 'timestamp': timestamp}, ensure_ascii=False, default=str)
+                self.stats['serialized'] += 1
+                for sid in subscribers:
+                    self.clients[sid].dirty.add(code)
+                self._dirty_clients |= subscribers
+
+            for sid in list(self._dirty_clients):
+                client = self.clients[sid]
+                if not client.dirty:  # 변경 종목을 모두 구독 해제함
+                    self._dirty_clients.discard(sid)
+                    continue
+                if client.inflight >= self.max_inflight:
+                    if now - client.last_sent < self.ack_timeout:
+                        client.skipped += 1
+                        self.stats['skipped'] += 1
+                        continue
+                    # 확인 응답이 오지 않는 클라이언트는 미확인 프레임을 잃어버린 것으로 간주
+                    client.inflight = 0
+                    self.stats['ack_timeouts'] += 1
+
+                updates = ','.join(self.fragments[code] for code in client.dirty)
+                frames.append((sid, f'{{"timestamp": "{timestamp}", "updates": [{updates}]}}'))
+                client.dirty.clear()
+                client.inflight += 1
+                client.last_sent = now
+                client.frames += 1
+                self._dirty_clients.discard(sid)
+
+            self.stats['frames'] += len(frames)
+
+        for sid, frame in frames:
+            try:
+                self.emit(self.event, frame, sid, self._ack_callback(sid))
+            except Exception as e:
+                logger.error(f"프레임 전송 오류 ({sid}): {e}")
+                self.acknowledge(sid)
+
+    def _ack_callback(self, sid: str) -> Callable:
+        return lambda *args: self.acknowledge(sid)
+
+    def acknowledge(self, sid: str):
+        """클라이언트 프레임 수신 확인"""
+        with self._lock:
+            client = self.clients.get(sid)
+            if client and client.inflight > 0:
+                client.inflight -= 1
+
+    # 프레임 스레드
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        self._thread = threading.Thread(target=self._run, name="BroadcastHub", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        self.running = False
+        if self._thread:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _run(self):
+        while self.running:
+            started = time.monotonic()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"브로드캐스트 프레임 처리 오류: {e}")
+            time.sleep(max(0.0, self.flush_interval - (time.monotonic() - started)))
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                **self.stats,
+                'clients': len(self.clients),
+                'codes': len(self.subscribers),
+                'backlogged_clients': sum(1 for client in self.clients.values()
+                                          if client.inflight >= self.max_inflight)
+            }
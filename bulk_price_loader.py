@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+대량 가격 데이터 로더
+여러 종목의 OHLCV를 동시에 조회합니다.
+
+- 동시 요청 수 제한 (스레드 풀) + 토큰 버킷 초당 요청 수 제한 (max_workers=1이면 호출 스레드에서 순차 조회)
+- 일시적 오류는 지터를 준 지수 백오프로 재시도
+- 종목별 디스크 캐시(OHLCVCache)가 있으면 비어 있는 구간만 조회
+- 조회 방식은 PriceTransport로 교체 가능 (데이터 API, HTTP, 테스트용 대역)
+"""
+
+import time
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+from loguru import logger
+import pandas as pd
+import requests
+
+from ohlcv_cache import OHLCVCache
+
+class PriceTransport:
+    """가격 데이터 조회 방식 (한 종목, 한 구간)
+
+    데이터가 없으면 None을 반환하고, 재시도할 오류는 예외로 알립니다.
+    """
+
+    def fetch(self, code: str, start_date: str, end_date: str, interval: str = "1d") -> Optional[pd.DataFrame]:
+        raise NotImplementedError
+
+class APITransport(PriceTransport):
+    """StockDataAPI의 원본 소스(야후/키움)로 조회"""
+
+    def __init__(self, api):
+        self.api = api
+
+    def fetch(self, code: str, start_date: str, end_date: str, interval: str = "1d") -> Optional[pd.DataFrame]:
+        return self.api.fetch_source_data(code, start_date, end_date, interval)
+
+class HTTPTransport(PriceTransport):
+    """HTTP 가격 서버로 조회
+
+    GET {base_url}/{code}?start=...&end=...&interval=... 응답:
+    {"data": [{"date": "2023-01-02", "open": ..., "high": ..., "low": ..., "close": ..., "volume": ...}, ...]}
+    404는 데이터 없음, 그 외 오류 상태는 예외(재시도 대상)로 처리합니다.
+    """
+
+    def __init__(self, base_url: str, timeout: float = 10.0):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self._local = threading.local()  # 스레드별 세션 (연결 재사용)
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
+    def fetch(self, code: str, start_date: str, end_date: str, interval: str = "1d") -> Optional[pd.DataFrame]:
+        response = self._session().get(f"{self.base_url}/{code}", timeout=self.timeout,
+                                       params={'start': start_date, 'end': end_date, 'interval': interval})
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+
+        records = response.json().get('data', [])
+        if not records:
+            return None
+
+        df = pd.DataFrame(records)
+        df['date'] = pd.to_datetime(df['date'])
+        return df.set_index('date')[['open', 'high', 'low', 'close', 'volume']].astype(float)
+
+class TokenBucket:
+    """토큰 버킷 요청 속도 제한기 (스레드 안전)
+
+    rate: 초당 토큰 보충 수 (None 또는 0 이하면 제한 없음)
+    capacity: 최대 토큰 수 (순간 허용 요청 수, 기본값은 rate)
+    """
+
+    def __init__(self, rate: Optional[float], capacity: float = None,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate or 1.0)
+        self.clock = clock
+        self.sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0):
+        """토큰을 얻을 때까지 대기"""
+        if not self.rate or self.rate <= 0:
+            return
+
+        while True:
+            with self._lock:
+                now = self.clock()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            self.sleep(wait)
+
+@dataclass
+class BulkLoadReport:
+    """대량 조회 결과 요약"""
+    requested: int = 0
+    cached: int = 0                       # 조회 없이 캐시로 충족된 종목 수
+    fetched: int = 0                      # 원본 조회 성공 종목 수
+    failed: List[str] = field(default_factory=list)
+    retries: int = 0
+    elapsed: float = 0.0
+
+class BulkPriceLoader:
+    """동시/속도 제한 대량 가격 로더"""
+
+    def __init__(self, transport: PriceTransport, max_workers: int = 8, requests_per_second: float = 10.0,
+                 burst: float = None, max_retries: int = 3, backoff: float = 0.5, max_backoff: float = 8.0,
+                 cache_dir: str = None, interval: str = "1d", adjusted: bool = True):
+        self.transport = transport
+        self.max_workers = max(1, max_workers)
+        self.rate_limiter = TokenBucket(requests_per_second, burst)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.cache = OHLCVCache(cache_dir) if cache_dir else None
+        self.interval = interval  # 기본 봉 간격 (load/fetch_many에 interval을 주면 그 호출에만 적용)
+        self.adjusted = adjusted
+        self.last_report = BulkLoadReport()
+        self._report_lock = threading.Lock()
+
+    def _fetch_with_retry(self, code: str, start_date: str, end_date: str, interval: str) -> Optional[pd.DataFrame]:
+        """속도 제한 후 조회, 실패 시 지터 지수 백오프로 재시도 (모두 실패하면 마지막 예외 전달)"""
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            try:
+                return self.transport.fetch(code, start_date, end_date, interval)
+            except Exception as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = random.uniform(0, min(self.max_backoff, self.backoff * (2 ** attempt)))
+                logger.debug(f"조회 재시도 {attempt + 1}/{self.max_retries}: {code} ({e}) - {delay:.2f}초 후")
+                with self._report_lock:
+                    self.last_report.retries += 1
+                time.sleep(delay)
+
+    def fetch_many(self, ranges: Dict[str, Tuple[str, str]], interval: str = None) -> Dict[str, pd.DataFrame]:
+        """종목별 (시작일, 종료일) 구간을 동시에 조회 (데이터가 없거나 실패한 종목은 제외)"""
+        interval = interval or self.interval
+        started = time.perf_counter()
+        self.last_report = BulkLoadReport(requested=len(ranges))
+        results = {}
+
+        def collect(code: str, fetch: Callable[[], Optional[pd.DataFrame]]):
+            try:
+                df = fetch()
+            except Exception as e:
+                logger.error(f"종목 {code} 데이터 조회 실패: {e}")
+                self.last_report.failed.append(code)
+                return
+
+            if df is not None and not df.empty:
+                results[code] = df
+                self.last_report.fetched += 1
+
+        if self.max_workers == 1:
+            # 단일 스레드 전용 원본(키움 OCX 등)은 스레드 풀 없이 호출 스레드에서 순서대로 조회
+            for code, (start_date, end_date) in ranges.items():
+                collect(code, lambda: self._fetch_with_retry(code, start_date, end_date, interval))
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, max(1, len(ranges)))) as executor:
+                futures = {executor.submit(self._fetch_with_retry, code, start_date, end_date, interval): code
+                           for code, (start_date, end_date) in ranges.items()}
+                for future in as_completed(futures):
+                    collect(futures[future], future.result)
+
+        self.last_report.elapsed = time.perf_counter() - started
+        logger.info(f"대량 조회 완료: {self.last_report.fetched}/{len(ranges)}개 종목 "
+                    f"(재시도 {self.last_report.retries}회, {self.last_report.elapsed:.1f}초)")
+        return results
+
+    def load(self, codes: List[str], start_date: str, end_date: str, interval: str = None) -> Dict[str, pd.DataFrame]:
+        """캐시 우선 로드 (캐시에 없는 구간만 조회해 캐시에 추가한 뒤 캐시에서 읽음)"""
+        interval = interval or self.interval
+        if self.cache is None:
+            return self.fetch_many({code: (start_date, end_date) for code in codes}, interval)
+
+        # 당일 봉은 장중에 바뀔 수 있으므로 캐시하지 않음
+        today = datetime.now().strftime("%Y-%m-%d")
+
+        missing = {}
+        for code in codes:
+            fetch_range = self.cache.missing_range(code, start_date, end_date, interval, self.adjusted)
+            if fetch_range is not None:
+                missing[code] = fetch_range
+
+        fetched = self.fetch_many({code: (fetch_start, fetch_end)
+                                   for code, (fetch_start, fetch_end, _) in missing.items()}, interval)
+        self.last_report.requested = len(codes)
+        self.last_report.cached = len(codes) - len(missing)
+
+        for code, df in fetched.items():
+            fetch_start, fetch_end, replace = missing[code]
+            if df.index.tz is not None:
+                df = df.tz_localize(None)
+            df = df[df.index < pd.Timestamp(today)]
+            write = self.cache.replace if replace else self.cache.append
+            write(code, df, interval, self.adjusted, covered_from=fetch_start, covered_to=min(fetch_end, today))
+
+        data = {}
+        for code in codes:
+            df = self.cache.read(code, start_date, end_date, interval, self.adjusted)
+            if df is not None and not df.empty:
+                data[code] = df
+        return data
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+벡터화 상관관계 엔진
+키워드 트렌드 시계열과 주가 시계열(또는 종목끼리)의 상관관계를 행렬 연산으로 한 번에 계산합니다.
+
+- 입력은 시간순 (시점 x 계열) 행렬이며 값이 없는 칸은 NaN
+- 계열 쌍마다 둘 다 값이 있는 시점만 사용 (pairwise complete)
+  → 길이가 다른 시계열을 끝에 맞춰 정렬하면 쌍별로 min(길이)만큼의 최근 구간을 비교
+- 피어슨 상관/방향 일치도는 마스크 행렬곱 몇 번, 시차 상관은 시차마다 한 번
+- RollingCorrelation: 행을 추가/제거하며 합계만 갱신하는 이동 창 상관/방향 일치도
+"""
+
+from typing import Sequence, Tuple
+import numpy as np
+
+# 분산이 이 비율(Σx² 대비) 이하이면 상수 계열로 보고 상관관계 0
+VARIANCE_TOLERANCE = 1e-12
+
+def tail_align(series: Sequence[Sequence[float]], length: int = None) -> np.ndarray:
+    """길이가 다른 시계열들을 끝(최신 시점)에 맞춰 (시점 x 계열) 행렬로 정렬 (앞쪽 빈칸은 NaN)
+
+    length를 주면 최근 length개 시점만 사용합니다.
+    """
+    if length is None:
+        length = max((len(values) for values in series), default=0)
+
+    matrix = np.full((length, len(series)), np.nan)
+    if length == 0:
+        return matrix
+
+    for j, values in enumerate(series):
+        values = np.asarray(values, dtype=np.float64)[-length:]
+        if len(values):
+            matrix[length - len(values):, j] = values
+    return matrix
+
+def _as_matrix(values) -> np.ndarray:
+    """1차원 시계열은 한 열짜리 행렬로 변환"""
+    matrix = np.asarray(values, dtype=np.float64)
+    return matrix.reshape(-1, 1) if matrix.ndim == 1 else matrix
+
+def _centered(matrix: np.ndarray) -> np.ndarray:
+    """열별 평균을 뺀 행렬 (상관관계는 평행 이동에 불변, 큰 값의 누적 오차 완화)"""
+    valid = ~np.isnan(matrix)
+    counts = valid.sum(axis=0)
+    means = np.where(valid, matrix, 0.0).sum(axis=0) / np.maximum(counts, 1)
+    return matrix - means
+
+def _pair_sums(X: np.ndarray, Y: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """계열 쌍별 (공통 시점 수, Σx, Σy, Σx², Σy², Σxy) - 각각 (K x S)"""
+    mx = ~np.isnan(X)
+    my = ~np.isnan(Y)
+    x0 = np.where(mx, X, 0.0)
+    y0 = np.where(my, Y, 0.0)
+    fx = mx.astype(np.float64)
+    fy = my.astype(np.float64)
+    return (fx.T @ fy, x0.T @ fy, fx.T @ y0, (x0 * x0).T @ fy, fx.T @ (y0 * y0), x0.T @ y0)
+
+def _pearson_from_sums(n, sx, sy, sxx, syy, sxy, min_periods: int = 2) -> np.ndarray:
+    """쌍별 합계로 피어슨 상관계수 계산 (표본 부족/상수 계열은 0)"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        safe_n = np.maximum(n, 1)
+        cov = sxy - sx * sy / safe_n
+        var_x = sxx - sx * sx / safe_n
+        var_y = syy - sy * sy / safe_n
+        corr = cov / np.sqrt(var_x * var_y)
+
+    valid = ((n >= max(min_periods, 2)) &
+             (var_x > VARIANCE_TOLERANCE * sxx) & (var_y > VARIANCE_TOLERANCE * syy))
+    return np.clip(np.where(valid, corr, 0.0), -1.0, 1.0)
+
+def correlation_matrix(X, Y=None, min_periods: int = 2) -> np.ndarray:
+    """X 열 x Y 열 피어슨 상관 행렬 (K x S, Y가 없으면 X 열끼리)
+
+    둘 다 값이 있는 시점이 min_periods개 미만이거나 상수 계열인 쌍은 0입니다.
+    """
+    X = _centered(_as_matrix(X))
+    Y = X if Y is None else _centered(_as_matrix(Y))
+    return _pearson_from_sums(*_pair_sums(X, Y), min_periods=min_periods)
+
+def lagged_correlation(X, Y=None, max_lag: int = 5, min_periods: int = 2) -> np.ndarray:
+    """시차 상관 행렬 ((2 x max_lag + 1) x K x S)
+
+    [lag + max_lag] 위치는 X(t)와 Y(t + lag)의 상관관계입니다.
+    lag > 0이면 X가 Y보다 앞서는(선행하는) 관계를 봅니다.
+    """
+    X = _centered(_as_matrix(X))
+    Y = X if Y is None else _centered(_as_matrix(Y))
+
+    T = len(X)
+    result = np.zeros((2 * max_lag + 1, X.shape[1], Y.shape[1]))
+    for lag in range(-max_lag, max_lag + 1):
+        if abs(lag) >= T:
+            continue
+        if lag >= 0:
+            x, y = X[:T - lag], Y[lag:]
+        else:
+            x, y = X[-lag:], Y[:T + lag]
+        result[lag + max_lag] = _pearson_from_sums(*_pair_sums(x, y), min_periods=min_periods)
+    return result
+
+def best_lag(lagged: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """쌍별로 |상관계수|가 가장 큰 시차와 그 상관계수 (lagged_correlation 결과 입력)"""
+    max_lag = (len(lagged) - 1) // 2
+    index = np.abs(lagged).argmax(axis=0)
+    corr = np.take_along_axis(lagged, index[np.newaxis], axis=0)[0]
+    return index - max_lag, corr
+
+def _direction_masks(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """직전 시점 대비 변화율의 (상승, 하락, 유효) 마스크 - 행 수는 시점 수 - 1"""
+    prev, curr = matrix[:-1], matrix[1:]
+    valid = ~np.isnan(prev) & ~np.isnan(curr)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        change = (curr - prev) / prev
+    # 0에서 0으로의 변화(0/0)는 방향 없음
+    return (valid & (change > 0)), (valid & (change < 0)), valid
+
+def _direction_from_masks(up_x, down_x, valid_x, up_y, down_y, valid_y) -> Tuple[np.ndarray, np.ndarray]:
+    """쌍별 (방향 일치 횟수, 비교 횟수)"""
+    as_float = lambda mask: mask.astype(np.float64)
+    agree = as_float(up_x).T @ as_float(up_y) + as_float(down_x).T @ as_float(down_y)
+    total = as_float(valid_x).T @ as_float(valid_y)
+    return agree, total
+
+def direction_agreement(X, Y=None) -> np.ndarray:
+    """변화율 방향 일치도 행렬 (K x S)
+
+    두 계열 모두 변화율이 있는 시점 중 둘 다 상승하거나 둘 다 하락한 비율입니다.
+    변화가 없는 시점은 비교 횟수에만 포함되고, 비교할 시점이 없는 쌍은 0입니다.
+    """
+    X = _as_matrix(X)
+    masks_x = _direction_masks(X)
+    masks_y = masks_x if Y is None else _direction_masks(_as_matrix(Y))
+
+    agree, total = _direction_from_masks(*masks_x, *masks_y)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(total > 0, agree / total, 0.0)
+
+class RollingCorrelation:
+    """이동 창 상관/방향 일치도 (행 추가 시 합계만 갱신)
+
+    update(x, y)마다 최근 window개 행을 유지하고, 창에서 빠지는 행의 기여분을 빼서
+    피어슨 상관과 방향 일치도 행렬을 O(K x S)로 갱신합니다.
+    누적 오차를 막기 위해 recompute_every번 갱신마다 창 전체로 다시 합산합니다.
+    """
+
+    def __init__(self, n_x: int, n_y: int = None, window: int = 30, min_periods: int = 2,
+                 recompute_every: int = None):
+        if window < 2:
+            raise ValueError("window는 2 이상이어야 합니다")
+
+        self.symmetric = n_y is None
+        self.n_x = n_x
+        self.n_y = n_x if n_y is None else n_y
+        self.window = window
+        self.min_periods = min_periods
+        self.recompute_every = recompute_every or window
+
+        # 최근 window개 행 (링 버퍼)
+        self._x = np.full((window, self.n_x), np.nan)
+        self._y = np.full((window, self.n_y), np.nan)
+        self._next = 0
+        self._size = 0
+        self._updates = 0
+
+        # 열별 기준값 (처음 관측한 값, 누적 오차 완화용 평행 이동)
+        self._shift_x = np.full(self.n_x, np.nan)
+        self._shift_y = np.full(self.n_y, np.nan)
+
+        self._reset_sums()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _reset_sums(self):
+        shape = (self.n_x, self.n_y)
+        self._sums = [np.zeros(shape) for _ in range(6)]  # n, Σx, Σy, Σx², Σy², Σxy
+        self._agree = np.zeros(shape)
+        self._total = np.zeros(shape)
+
+    def _ordered(self, buffer: np.ndarray) -> np.ndarray:
+        """시간순 창 행렬"""
+        if self._size < self.window:
+            return buffer[:self._size]
+        return np.concatenate([buffer[self._next:], buffer[:self._next]])
+
+    def _row_sums(self, x: np.ndarray, y: np.ndarray):
+        return _pair_sums((x - self._shift_x)[np.newaxis], (y - self._shift_y)[np.newaxis])
+
+    def _row_direction(self, prev_x, x, prev_y, y):
+        return _direction_from_masks(*_direction_masks(np.vstack([prev_x, x])),
+                                     *_direction_masks(np.vstack([prev_y, y])))
+
+    def update(self, x, y=None):
+        """새 행 추가 (x: n_x개 값, y: n_y개 값, 대칭 모드에서는 y 생략, 결측은 NaN)"""
+        x = np.asarray(x, dtype=np.float64).reshape(self.n_x)
+        y = x if self.symmetric else np.asarray(y, dtype=np.float64).reshape(self.n_y)
+
+        # 처음 관측한 열의 기준값 설정 (이전 행에는 값이 없어 기존 합계에 영향 없음)
+        self._shift_x = np.where(np.isnan(self._shift_x), x, self._shift_x)
+        self._shift_y = np.where(np.isnan(self._shift_y), y, self._shift_y)
+
+        last = (self._next - 1) % self.window
+        if self._size == self.window:
+            # 가장 오래된 행과 그 다음 행 사이의 변화는 창에서 빠짐
+            oldest, second = self._next, (self._next + 1) % self.window
+            for total, removed in zip(self._sums, self._row_sums(self._x[oldest], self._y[oldest])):
+                total -= removed
+            agree, count = self._row_direction(self._x[oldest], self._x[second],
+                                               self._y[oldest], self._y[second])
+            self._agree -= agree
+            self._total -= count
+
+        if self._size:
+            agree, count = self._row_direction(self._x[last], x, self._y[last], y)
+            self._agree += agree
+            self._total += count
+
+        self._x[self._next] = x
+        self._y[self._next] = y
+        self._next = (self._next + 1) % self.window
+        self._size = min(self._size + 1, self.window)
+        for total, added in zip(self._sums, self._row_sums(x, y)):
+            total += added
+
+        self._updates += 1
+        if self._updates % self.recompute_every == 0:
+            self.recompute()
+
+    def recompute(self):
+        """창 전체로 합계를 다시 계산"""
+        X = self._ordered(self._x)
+        Y = self._ordered(self._y)
+        self._sums = list(_pair_sums(X - self._shift_x, Y - self._shift_y))
+        self._agree, self._total = _direction_from_masks(*_direction_masks(X), *_direction_masks(Y))
+
+    def correlation(self) -> np.ndarray:
+        """현재 창의 피어슨 상관 행렬 (n_x x n_y)"""
+        return _pearson_from_sums(*self._sums, min_periods=self.min_periods)
+
+    def agreement(self) -> np.ndarray:
+        """현재 창의 변화율 방향 일치도 행렬 (n_x x n_y)"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(self._total > 0, self._agree / self._total, 0.0)
+
+    def counts(self) -> np.ndarray:
+        """쌍별 공통 시점 수"""
+        return self._sums[0].copy()
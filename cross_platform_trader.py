@@ -17,6 +17,8 @@ from datetime import datetime
 from typing import List, Dict
 from loguru import logger
 
+from real_data_decoder import REAL_DATA_LAYOUTS
+
 # 로깅 설정 (INFO 레벨로 변경하여 깔끔한 출력)
 logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)s | %(message)s")
 
@@ -39,6 +41,24 @@ else:
     class MockQAxWidget:
         def __init__(self):
             self.stock_data = self._generate_sample_data()
+            self.real_data = {}  # 종목별 마지막 실시간 데이터 (real_type, real_data)
+            self.real_data_handlers = []  # OnReceiveRealData 대역
+            
+        def replay_real_data(self, records):
+            """기록된 실시간 데이터 재생 (records: (종목, real_type, real_data) 목록)"""
+            for code, real_type, real_data in records:
+                self.real_data[code] = (real_type, real_data)
+                for handler in self.real_data_handlers:
+                    handler(code, real_type, real_data)
+            
+        def _get_comm_real_data(self, code, fid):
+            """GetCommRealData 대역: 마지막 real_data에서 FID 값 추출"""
+            real_type, real_data = self.real_data.get(code, (None, ""))
+            layout = REAL_DATA_LAYOUTS.get(real_type, ())
+            values = real_data.split('\t')
+            if fid in layout and layout.index(fid) < len(values):
+                return values[layout.index(fid)]
+            return ""
             
         def _generate_sample_data(self):
             """샘플 주식 데이터 생성"""
@@ -60,9 +80,12 @@ else:
                 }
             return data
             
-        def dynamicCall(self, func, args=None):
+        def dynamicCall(self, func, args=None, *more_args):
             if args is None:
                 args = []
+            elif more_args:
+                # QAxWidget처럼 인자를 나열해 호출한 경우 (GetCommRealData 등)
+                args = [args, *more_args]
             if isinstance(args, (list, tuple)):
                 logging.debug(f"[Mock 실행] dynamicCall 호출: {func} | 인자 수: {len(args)}개, 값: {args}")
                 if "SendOrder" in func and len(args) == 8:
@@ -81,6 +104,8 @@ else:
                 elif "SendOrder" in func:
                     logging.error(f"[Mock ERROR] SendOrder 인수 부족: {len(args)}개, 필요: 8개")
                     return -1
+                elif "GetCommRealData" in func and len(args) == 2:
+                    return self._get_comm_real_data(args[0], int(args[1]))
                 elif "GetMasterLastPrice" in func and len(args) == 1:
                     stock_code = args[0]
                     if stock_code in self.stock_data:
@@ -57,7 +57,7 @@ def debug_signal_generation():
         logger.info(f"  활성화: {strategy.enabled}")
         
         # 전략에 가격 데이터 추가
-        strategy.price_history = []
+        strategy.reset_data()
         
         for i, (date, row) in enumerate(df.iterrows()):
             strategy.add_price_data(row['close'], date)
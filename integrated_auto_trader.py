@@ -20,11 +20,13 @@ import numpy as np
 # 키움 API 및 전략 모듈들
 from kiwoom_mac_compatible import KiwoomMacAPI
 from trading_strategy import (
-    StrategyManager, create_default_strategies, TradingSignal, 
-    SignalType, StrategyType
+    StrategyManager, TradingSignal, 
+    SignalType, StrategyType, PriceRingBuffer
 )
 from technical_indicators import calculate_sma, calculate_rsi
 from error_handler import ErrorType, ErrorLevel, handle_error, retry_operation
+from tick_dispatcher import TickDispatcher, TickEvent, LatencyHistogram
+from strategy_shards import ShardedStrategyManager
 
 class TradingMode(Enum):
     """거래 모드"""
@@ -80,6 +82,12 @@ class TradeConfig:
     trading_end_time: str = "15:30"
     lunch_break_start: str = "11:30"
     lunch_break_end: str = "13:00"
+    
+    # 실시간 틱 처리
+    event_driven: bool = True   # 실시간 콜백으로 틱 수신, False면 거래 루프가 1초마다 실시간 캐시 조회 (폴링)
+    real_data_poll_interval: float = 0.5  # Mac API 실시간 수신 주기(초), 서버 캐시를 이 주기로 조회해 콜백 호출
+    tick_queue_size: int = 1    # 종목별 대기 틱 수 (초과 시 오래된 틱을 최신 틱으로 합침)
+    tick_workers: int = 1       # 신호 생성 워커 수
 
 class IntegratedAutoTrader:
     """통합 자동매매 시스템"""
@@ -101,13 +109,27 @@ class IntegratedAutoTrader:
         self.daily_pnl = 0.0 # 일일 손익
         
         # 데이터 저장소
-        self.price_data = {}  # 종목별 가격 데이터
+        self.price_data = {}  # 종목별 가격 데이터 {code: PriceRingBuffer}
         self.signal_history = []  # 신호 히스토리
         
         # 스레드
         self.trading_thread = None
         self.monitoring_thread = None
         
+        # 실시간 틱 → 신호 생성 디스패처
+        self.tick_dispatcher = TickDispatcher(self._handle_tick, config.tick_queue_size,
+                                              config.tick_workers, name="TradingTicks")
+        self.trading_enabled = False  # 거래 시간/손실 한도 기준 (거래 루프가 갱신)
+        self._last_polled_price = {}  # 폴링 모드: 종목별 마지막 가격
+        self._tick_context = threading.local()  # 워커별 처리 중인 틱 수신 시각
+        self._signal_lock = threading.Lock()  # 신호 fan-in: 주문/포지션 변경은 한 번에 하나
+        
+        # 지연 시간 (틱 수신 기준): 신호 생성 완료, 주문 제출
+        self.latency = {
+            'signal': LatencyHistogram(),
+            'order': LatencyHistogram()
+        }
+        
         # 콜백 함수들
         self.signal_callback = None
         self.trade_callback = None
@@ -133,8 +155,8 @@ class IntegratedAutoTrader:
             # 키움 API 초기화
             self.kiwoom_api = KiwoomMacAPI(server_url)
             
-            # 전략 매니저 초기화
-            self.strategy_manager = create_default_strategies()
+            # 전략 매니저 초기화 (종목별 전략 상태, 워커 수만큼 샤드)
+            self.strategy_manager = ShardedStrategyManager(num_shards=self.config.tick_workers)
             
             # 콜백 설정
             self.kiwoom_api.set_login_callback(self._on_login)
@@ -200,6 +222,12 @@ class IntegratedAutoTrader:
         try:
             logger.info("자동매매 시작")
             self.is_running = True
+            self.trading_enabled = self._is_trading_time() and not self._check_daily_loss_limit()
+            self.tick_dispatcher.start()
+            
+            # 실시간 데이터 수신 시작 (콜백 → on_tick)
+            if self.config.event_driven:
+                self.kiwoom_api.start_real_data_stream(interval=self.config.real_data_poll_interval)
             
             # 거래 스레드 시작
             self.trading_thread = threading.Thread(target=self._trading_loop, daemon=True)
@@ -227,6 +255,10 @@ class IntegratedAutoTrader:
             logger.info("자동매매 중지")
             self.is_running = False
             
+            if self.config.event_driven:
+                self.kiwoom_api.stop_real_data_stream()
+            self.tick_dispatcher.stop()
+            
             # 스레드 종료 대기
             if self.trading_thread:
                 self.trading_thread.join(timeout=5)
@@ -239,45 +271,26 @@ class IntegratedAutoTrader:
             logger.error(f"자동매매 중지 오류: {e}")
     
     def _trading_loop(self):
-        """거래 루프"""
+        """거래 루프 (거래 가능 여부 갱신, 틱 처리는 디스패처 워커가 수행)"""
         logger.info("거래 루프 시작")
         
         while self.is_running:
             try:
-                # 거래 시간 확인
-                if not self._is_trading_time():
-                    time.sleep(60)
-                    continue
-                
                 # 일일 손실 한도 확인
                 if self._check_daily_loss_limit():
+                    self.trading_enabled = False
                     logger.warning("일일 손실 한도 도달. 거래 중지.")
                     break
                 
-                # 실시간 데이터 수집
-                real_data = self.kiwoom_api.get_real_data_cache()
+                # 거래 시간 확인
+                self.trading_enabled = self._is_trading_time()
+                if not self.trading_enabled:
+                    time.sleep(60)
+                    continue
                 
-                # 각 종목에 대해 신호 생성
-                for code, data in real_data.items():
-                    if not data or 'data' not in data:
-                        continue
-                    
-                    price_data = data['data']
-                    current_price = price_data.get('현재가', 0)
-                    
-                    if current_price <= 0:
-                        continue
-                    
-                    # 가격 데이터 업데이트
-                    self._update_price_data(code, current_price)
-                    
-                    # 전략 신호 생성
-                    signals = self._generate_signals(code, current_price)
-                    
-                    # 신호 처리
-                    for signal in signals:
-                        if signal.confidence >= self.config.min_confidence:
-                            self._process_signal(signal)
+                # 폴링 모드: 실시간 캐시에서 가격이 바뀐 종목만 틱으로 공급
+                if not self.config.event_driven:
+                    self._poll_real_data_cache()
                 
                 time.sleep(1)  # 1초 대기
                 
@@ -285,6 +298,62 @@ class IntegratedAutoTrader:
                 logger.error(f"거래 루프 오류: {e}")
                 time.sleep(5)
     
+    def _poll_real_data_cache(self):
+        """실시간 데이터 캐시 조회 (실시간 콜백을 받을 수 없는 환경용)"""
+        real_data = self.kiwoom_api.get_real_data_cache()
+        
+        for code, data in real_data.items():
+            if not data:
+                continue
+            
+            # KiwoomAPI 전체 캐시는 {'data': 틱, 'timestamp': ...}, Windows 서버 캐시는 평탄한 틱
+            data = data.get('data', data)
+            current_price = self._tick_price(data)
+            if current_price <= 0 or self._last_polled_price.get(code) == current_price:
+                continue
+            
+            self._last_polled_price[code] = current_price
+            self.on_tick(code, current_price, data)
+    
+    @staticmethod
+    def _tick_price(data: Dict) -> float:
+        """틱 데이터의 현재가 (KiwoomAPI: current_price, Windows 서버: price, 부호는 등락 방향)"""
+        price = data.get('current_price', data.get('price', 0))
+        return abs(float(price or 0))
+    
+    def on_tick(self, code: str, price: float, data: Dict = None):
+        """실시간 틱 수신 (수신 스레드에서 바로 호출, 신호 생성은 디스패처 워커에서)"""
+        if price > 0:
+            self.tick_dispatcher.submit(code, price, data)
+    
+    def _handle_tick(self, event: TickEvent):
+        """틱 처리 (디스패처 워커): 가격 반영 → 신호 생성 → 신호 처리"""
+        if not self.is_running or not self.trading_enabled or self._check_daily_loss_limit():
+            return
+        
+        self._tick_context.received_at = event.received_at
+        try:
+            # 가격 데이터 업데이트
+            self._update_price_data(event.code, event.price)
+            
+            # 전략 신호 생성
+            signals = self._generate_signals(event.code, event.price)
+            self.latency['signal'].record(time.perf_counter() - event.received_at)
+            
+            # 신호 처리 (종목별 신호 생성은 병렬, 주문은 한 번에 하나)
+            with self._signal_lock:
+                for signal in signals:
+                    if signal.confidence >= self.config.min_confidence:
+                        self._process_signal(signal)
+        finally:
+            self._tick_context.received_at = None
+    
+    def _record_order_latency(self):
+        """틱 수신 → 주문 제출 지연 시간 기록 (틱 처리 중 낸 주문만)"""
+        received_at = getattr(self._tick_context, 'received_at', None)
+        if received_at is not None:
+            self.latency['order'].record(time.perf_counter() - received_at)
+    
     def _monitoring_loop(self):
         """모니터링 루프"""
         logger.info("모니터링 루프 시작")
@@ -308,30 +377,25 @@ class IntegratedAutoTrader:
     
     def _update_price_data(self, code: str, price: float):
         """가격 데이터 업데이트"""
-        if code not in self.price_data:
-            self.price_data[code] = []
-        
-        self.price_data[code].append({
-            'price': price,
-            'timestamp': datetime.now()
-        })
+        history = self.price_data.get(code)
+        if history is None:
+            history = self.price_data[code] = PriceRingBuffer()
         
-        # 최대 1000개 데이터만 유지
-        if len(self.price_data[code]) > 1000:
-            self.price_data[code] = self.price_data[code][-1000:]
+        # 최근 1000개 데이터만 유지 (가장 오래된 데이터를 덮어씀)
+        history.append(price, datetime.now())
         
-        # 전략 매니저에 가격 데이터 전달
+        # 전략 매니저에 가격 데이터 전달 (해당 종목의 전략 상태만 갱신)
         if self.strategy_manager:
-            self.strategy_manager.update_price(price)
+            self.strategy_manager.update_price(code, price)
     
     def _generate_signals(self, code: str, current_price: float) -> List[TradingSignal]:
         """신호 생성"""
         signals = []
         
         try:
-            # 전략 매니저에서 신호 생성
+            # 전략 매니저에서 종목 신호 생성
             if self.strategy_manager:
-                strategy_signals = self.strategy_manager.generate_signals()
+                strategy_signals = self.strategy_manager.generate_signals(code)
                 
                 for signal in strategy_signals:
                     # 종목 코드 추가
@@ -478,6 +542,8 @@ class IntegratedAutoTrader:
     def _execute_paper_buy(self, code: str, price: float, quantity: int, signal: TradingSignal):
         """페이퍼 트레이딩 매수"""
         try:
+            self._record_order_latency()
+            
             # 포지션 생성
             position = Position(
                 code=code,
@@ -516,6 +582,7 @@ class IntegratedAutoTrader:
                 return
             
             position = self.positions[code]
+            self._record_order_latency()
             
             # 손익 계산
             profit_loss = (price - position.avg_price) * quantity
@@ -565,6 +632,7 @@ class IntegratedAutoTrader:
             account = list(account_info.keys())[0]
             
             # 주문 실행
+            self._record_order_latency()
             order_result = self.kiwoom_api.order_stock(
                 account=account,
                 code=code,
@@ -593,6 +661,7 @@ class IntegratedAutoTrader:
             account = list(account_info.keys())[0]
             
             # 주문 실행
+            self._record_order_latency()
             order_result = self.kiwoom_api.order_stock(
                 account=account,
                 code=code,
@@ -754,10 +823,12 @@ class IntegratedAutoTrader:
         """로그인 콜백"""
         logger.info(f"로그인 결과: {result}")
     
-    def _on_real_data(self, data: Dict):
-        """실시간 데이터 콜백"""
-        # 실시간 데이터 처리
-        pass
+    def _on_real_data(self, code: str, tick_data: Dict):
+        """실시간 데이터 콜백 (KiwoomAPI/KiwoomMacAPI가 틱마다 (종목, 틱 데이터)로 호출)"""
+        try:
+            self.on_tick(code, self._tick_price(tick_data), tick_data)
+        except Exception as e:
+            logger.error(f"실시간 데이터 처리 오류: {e}")
     
     def _on_order(self, data: Dict):
         """주문 콜백"""
@@ -805,6 +876,24 @@ class IntegratedAutoTrader:
         """통계 정보 조회"""
         return self.stats
     
+    def get_latency_stats(self) -> Dict:
+        """틱 처리 지연 시간 통계 (밀리초) 및 디스패처 통계
+
+        지연 시간은 틱 수신 이후 구간만 측정합니다. 틱은 서버 캐시 조회 주기(feed.poll_interval_ms)마다
+        들어오므로, 시세 발생부터 신호까지의 지연은 최대 조회 주기만큼 더 길 수 있습니다.
+        """
+        poll_interval = self.config.real_data_poll_interval if self.config.event_driven else 1.0  # 폴링 모드는 거래 루프 주기
+        return {
+            'feed': {
+                'mode': 'stream' if self.config.event_driven else 'polling',
+                'poll_interval_ms': poll_interval * 1000.0
+            },
+            'queue': self.tick_dispatcher.queue_latency.summary(),
+            'signal': self.latency['signal'].summary(),
+            'order': self.latency['order'].summary(),
+            'dispatcher': dict(self.tick_dispatcher.stats)
+        }
+    
     def get_strategy_performance(self) -> Dict:
         """전략 성과 조회"""
         if self.strategy_manager:
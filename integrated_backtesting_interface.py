@@ -23,6 +23,7 @@ from backtesting_system import (
     MonteCarloSimulator, BacktestAnalyzer
 )
 from integrated_auto_trader import IntegratedAutoTrader, TradeConfig, TradingMode
+from strategy_shards import ShardedStrategyManager
 from trading_strategy import (
     StrategyManager, create_default_strategies, 
     StrategyConfig, StrategyType
@@ -271,9 +272,12 @@ class IntegratedBacktestingInterface:
                 logger.error("전략 생성 실패")
                 return False
             
-            # 자동매매 시스템에 전략 적용
-            self.auto_trader.strategy_manager = StrategyManager()
-            self.auto_trader.strategy_manager.add_strategy("optimized", strategy)
+            # 자동매매 시스템에 전략 적용 (종목별 전략 상태는 이 구성을 복제)
+            template = StrategyManager()
+            template.add_strategy("optimized", strategy)
+            self.auto_trader.strategy_manager = ShardedStrategyManager(
+                num_shards=self.auto_trader.config.tick_workers, template=template
+            )
             
             logger.info("최적화된 전략 적용 완료")
             return True
@@ -18,6 +18,8 @@ from enum import Enum
 # 에러 처리 및 모니터링 모듈 import
 from error_handler import ErrorType, ErrorLevel, handle_error, retry_operation, error_handler
 from system_monitor import system_monitor, record_api_call, record_data_processed, record_order_execution
+from tick_store import TickStore
+from real_data_decoder import RealDataDecoder
 
 class OrderType(Enum):
     """주문 타입 정의"""
@@ -105,8 +107,9 @@ class KiwoomAPI(QAxWidget):
         
         # 실시간 데이터 관리 (최적화)
         self.real_data_codes = set()  # 구독 중인 종목 코드
-        self.real_data_cache = {}     # 실시간 데이터 캐시
-        self.real_data_history = defaultdict(lambda: deque(maxlen=1000))  # 최근 1000개 데이터 보관
+        self.real_data_cache = {}     # 실시간 데이터 캐시 (지수 등 체결 외 데이터)
+        self.real_data_history = TickStore(capacity=1000)  # 종목별 체결 틱 링 버퍼 (최근 1000개)
+        self.real_data_decoder = RealDataDecoder()  # real_data 문자열 일괄 디코더
         self.real_data_stats = defaultdict(lambda: {
             'last_update': None,
             'update_count': 0,
@@ -501,10 +504,13 @@ class KiwoomAPI(QAxWidget):
         start_time = time.time()
         
         try:
+            if real_type == "주식체결":
+                # 체결 틱은 이 스레드만 기록하는 링 버퍼에 쓰므로 잠금 불필요
+                self._process_stock_tick_data(code, start_time, real_data)
+                return
+            
             with self.data_lock:
-                if real_type == "주식체결":
-                    self._process_stock_tick_data(code, start_time)
-                elif real_type == "주식주문체결":
+                if real_type == "주식주문체결":
                     self._process_stock_order_data(code, start_time)
                 elif real_type == "지수":
                     self._process_index_data(code, start_time)
@@ -521,64 +527,36 @@ class KiwoomAPI(QAxWidget):
             )
             self.real_data_stats[code]['error_count'] += 1
 
-    def _process_stock_tick_data(self, code, start_time):
+    def _process_stock_tick_data(self, code, start_time, real_data=None):
         """주식 체결 데이터 처리 (안정성 강화)"""
         try:
-            # 실시간 데이터 추출
-            current_price = int(self.dynamicCall("GetCommRealData(QString, int)", code, 10))
-            volume = int(self.dynamicCall("GetCommRealData(QString, int)", code, 15))
-            change = int(self.dynamicCall("GetCommRealData(QString, int)", code, 12))
-            change_rate = float(self.dynamicCall("GetCommRealData(QString, int)", code, 13))
+            # real_data 문자열을 한 번에 디코딩 (형식이 맞지 않으면 FID별 COM 조회로 대체)
+            tick = self.real_data_decoder.decode_stock_tick(code, real_data)
+            if tick is None:
+                tick = self.real_data_decoder.decode_stock_tick_from(
+                    code, lambda fid: self.dynamicCall("GetCommRealData(QString, int)", code, fid)
+                )
+            if tick is None:
+                logger.warning(f"체결 데이터 디코딩 실패: {code}")
+                return
             
-            # 추가 데이터 추출
-            open_price = int(self.dynamicCall("GetCommRealData(QString, int)", code, 16))
-            high_price = int(self.dynamicCall("GetCommRealData(QString, int)", code, 17))
-            low_price = int(self.dynamicCall("GetCommRealData(QString, int)", code, 18))
-            total_volume = int(self.dynamicCall("GetCommRealData(QString, int)", code, 20))
+            current_price, volume, change_rate = tick.current_price, tick.volume, tick.change_rate
             
             # 데이터 검증
             if not self._validate_real_data(code, current_price, volume):
                 return
             
-            # 타임스탬프 생성
-            timestamp = datetime.now()
-            
-            # 데이터 구조화
-            tick_data = {
-                'code': code,
-                'current_price': current_price,
-                'volume': volume,
-                'change': change,
-                'change_rate': change_rate,
-                'open_price': open_price,
-                'high_price': high_price,
-                'low_price': low_price,
-                'total_volume': total_volume,
-                'timestamp': timestamp,
-                'real_type': RealDataType.STOCK_TICK.value
-            }
-            
-            # 캐시 업데이트
-            if self.real_data_config['enable_caching']:
-                self.real_data_cache[code] = {
-                    'data': tick_data,
-                    'timestamp': timestamp
-                }
-            
-            # 히스토리 업데이트
-            self.real_data_history[code].append(tick_data)
+            # 링 버퍼에 기록 (틱마다 딕셔너리를 만들지 않음)
+            buffer = self.real_data_history.buffer(code)
+            buffer.append(current_price, volume, tick.change, change_rate, tick.open_price,
+                          tick.high_price, tick.low_price, tick.total_volume, time.time())
             
             # 통계 업데이트
             self._update_real_data_stats(code, start_time)
             
-            # 콜백 큐에 추가
+            # 콜백 큐에는 (종목, 틱 순번)만 넣고 딕셔너리는 전달 시점에 생성
             if self.on_real_data_callback:
-                self.callback_queue.append({
-                    'type': 'real_data',
-                    'code': code,
-                    'data': tick_data,
-                    'timestamp': timestamp
-                })
+                self.callback_queue.append(('real_data', code, buffer.count - 1))
             
             # 성능 기록
             processing_time = time.time() - start_time
@@ -618,12 +596,7 @@ class KiwoomAPI(QAxWidget):
             
             # 콜백 큐에 추가
             if self.on_order_callback:
-                self.callback_queue.append({
-                    'type': 'order_data',
-                    'code': code,
-                    'data': order_data,
-                    'timestamp': datetime.now()
-                })
+                self.callback_queue.append(('order_data', code, order_data))
             
         except Exception as e:
             logger.error(f"주식 주문 데이터 처리 오류: {code} - {e}")
@@ -663,9 +636,9 @@ class KiwoomAPI(QAxWidget):
                 return False
             
             # 이전 데이터와 비교하여 급격한 변화 감지
-            if code in self.real_data_cache:
-                prev_data = self.real_data_cache[code]['data']
-                prev_price = prev_data.get('current_price', 0)
+            buffer = self.real_data_history.get(code)
+            if buffer is not None:
+                prev_price = buffer.last_price
                 
                 if prev_price > 0:
                     price_change_rate = abs(price - prev_price) / prev_price
@@ -709,19 +682,18 @@ class KiwoomAPI(QAxWidget):
             processed_count = 0
             
             while self.callback_queue and processed_count < batch_size:
-                callback_data = self.callback_queue.popleft()
+                # (타입, 종목, 데이터) - 체결 틱의 데이터는 링 버퍼 순번
+                callback_type, code, payload = self.callback_queue.popleft()
                 processed_count += 1
                 
                 try:
-                    if callback_data['type'] == 'real_data':
-                        if self.on_real_data_callback:
-                            self.on_real_data_callback(
-                                callback_data['code'], 
-                                callback_data['data']
-                            )
-                    elif callback_data['type'] == 'order_data':
+                    if callback_type == 'real_data':
+                        tick_data = self._tick_record(code, payload)
+                        if self.on_real_data_callback and tick_data:
+                            self.on_real_data_callback(code, tick_data)
+                    elif callback_type == 'order_data':
                         if self.on_order_callback:
-                            self.on_order_callback(callback_data['data'])
+                            self.on_order_callback(payload)
                             
                 except Exception as e:
                     logger.error(f"콜백 처리 오류: {e}")
@@ -732,7 +704,12 @@ class KiwoomAPI(QAxWidget):
         except Exception as e:
             logger.error(f"배치 콜백 처리 오류: {e}")
 
-    def subscribe_real_data(self, code, real_type="주식체결", fid_list="10;15;12;13;16;17;18;20"):
+    def _tick_record(self, code, seq):
+        """링 버퍼의 seq번째 틱 딕셔너리 (이미 덮어써졌으면 None)"""
+        buffer = self.real_data_history.get(code)
+        return buffer.record(seq) if buffer is not None else None
+
+    def subscribe_real_data(self, code, real_type="주식체결", fid_list="10;11;12;13;15;16;17;18;20"):
         """실시간 데이터 구독 (개선된 버전)"""
         try:
             if code not in self.real_data_codes:
@@ -791,38 +768,67 @@ class KiwoomAPI(QAxWidget):
             return False
 
     def get_real_data_cache(self, code=None):
-        """실시간 데이터 캐시 조회"""
+        """실시간 데이터 캐시 조회 (체결 틱은 링 버퍼의 최신 틱, 잠금 없이 조회)"""
         try:
+            if not code:
+                with self.data_lock:
+                    cache = self.real_data_cache.copy()
+                if self.real_data_config['enable_caching']:
+                    for tick_code, buffer in list(self.real_data_history.items()):
+                        tick_data = buffer.latest()
+                        if tick_data:
+                            cache[tick_code] = {'data': tick_data, 'timestamp': tick_data['timestamp']}
+                return cache
+            
+            buffer = self.real_data_history.get(code)
+            last_timestamp = buffer.last_timestamp if buffer is not None else None
+            if self.real_data_config['enable_caching'] and last_timestamp is not None:
+                if time.time() - last_timestamp > self.real_data_config['cache_ttl']:
+                    logger.warning(f"캐시 만료: {code}")
+                    return None
+                return buffer.latest()
+            
             with self.data_lock:
-                if code:
-                    if code in self.real_data_cache:
-                        cache_data = self.real_data_cache[code]
-                        # 캐시 유효성 확인
-                        if (datetime.now() - cache_data['timestamp']).total_seconds() > self.real_data_config['cache_ttl']:
-                            logger.warning(f"캐시 만료: {code}")
-                            return None
-                        return cache_data['data']
+                cache_data = self.real_data_cache.get(code)
+                if not cache_data:
                     return None
-                else:
-                    return self.real_data_cache.copy()
+                # 캐시 유효성 확인
+                if (datetime.now() - cache_data['timestamp']).total_seconds() > self.real_data_config['cache_ttl']:
+                    logger.warning(f"캐시 만료: {code}")
+                    return None
+                return cache_data['data']
                     
         except Exception as e:
             logger.error(f"캐시 조회 오류: {e}")
             return None
 
     def get_real_data_history(self, code, limit=100):
-        """실시간 데이터 히스토리 조회"""
+        """실시간 데이터 히스토리 조회 (딕셔너리 목록, 잠금 없이 스냅샷)"""
         try:
-            with self.data_lock:
-                if code in self.real_data_history:
-                    history = list(self.real_data_history[code])
-                    return history[-limit:] if limit > 0 else history
+            buffer = self.real_data_history.get(code)
+            if buffer is None:
                 return []
+            return buffer.records(limit if limit > 0 else None)
                 
         except Exception as e:
             logger.error(f"히스토리 조회 오류: {code} - {e}")
             return []
 
+    def get_tick_view(self, code, field=None, n=None):
+        """최근 n개 체결 틱의 읽기 전용 제로 카피 뷰 (지표/전략 계산용, 없으면 None)
+        
+        field: 'current_price', 'volume', 'change', 'change_rate', 'open_price', 'high_price',
+        'low_price', 'total_volume', 'timestamp' 중 하나 (없으면 필드 x n 행렬)
+        뷰는 이후 틱에 덮어써질 수 있으므로 보관하거나 다른 스레드에서 읽을 때는 get_tick_snapshot을 사용합니다.
+        """
+        buffer = self.real_data_history.get(code)
+        return buffer.view(field, n) if buffer is not None else None
+
+    def get_tick_snapshot(self, code, n=None):
+        """최근 n개 체결 틱의 필드별 배열 복사본 (잠금 없이 일관된 시점, 없으면 빈 딕셔너리)"""
+        buffer = self.real_data_history.get(code)
+        return buffer.snapshot(n) if buffer is not None else {}
+
     def get_real_data_stats(self, code=None):
         """실시간 데이터 통계 조회"""
         try:
@@ -837,15 +843,16 @@ class KiwoomAPI(QAxWidget):
             return {}
 
     def clear_real_data_cache(self, code=None):
-        """실시간 데이터 캐시 정리"""
+        """실시간 데이터 캐시 정리 (체결 틱 링 버퍼는 정리 시점 이후 틱만 조회되도록 무효화)"""
         try:
             with self.data_lock:
                 if code:
-                    if code in self.real_data_cache:
-                        del self.real_data_cache[code]
-                        logger.info(f"캐시 정리: {code}")
+                    self.real_data_cache.pop(code, None)
+                    self.real_data_history.clear_ticks(code)
+                    logger.info(f"캐시 정리: {code}")
                 else:
                     self.real_data_cache.clear()
+                    self.real_data_history.clear_ticks()
                     logger.info("전체 캐시 정리")
                     
         except Exception as e:
@@ -100,6 +100,12 @@ class KiwoomMacAPI:
         self.connection_thread = None
         self.is_monitoring = False
         
+        # 실시간 데이터 수신 (서버 캐시를 주기적으로 조회해 바뀐 틱만 콜백으로 전달)
+        self.real_data_thread = None
+        self.is_streaming = False
+        self.real_data_interval = 0.5
+        self._last_tick_keys = {}  # {code: (가격, 시각)}
+        
         # 에러 통계
         self.error_stats = {
             'connection_errors': 0,
@@ -385,6 +391,54 @@ class KiwoomMacAPI:
             )
             return {}
     
+    def start_real_data_stream(self, interval: float = 0.5):
+        """실시간 데이터 수신 시작 (바뀐 틱마다 real_data_callback(code, data) 호출)"""
+        self.real_data_interval = interval
+        if not self.is_streaming:
+            self.is_streaming = True
+            self.real_data_thread = threading.Thread(
+                target=self._stream_real_data,
+                daemon=True
+            )
+            self.real_data_thread.start()
+    
+    def stop_real_data_stream(self, timeout: float = 5.0):
+        """실시간 데이터 수신 중지"""
+        self.is_streaming = False
+        if self.real_data_thread:
+            self.real_data_thread.join(timeout=timeout)
+            self.real_data_thread = None
+    
+    def _stream_real_data(self):
+        """실시간 데이터 수신 루프"""
+        while self.is_streaming:
+            started = time.monotonic()
+            try:
+                self._dispatch_real_data(self.get_real_data_cache())
+            except Exception as e:
+                logger.error(f"실시간 데이터 수신 에러: {e}")
+            time.sleep(max(0.0, self.real_data_interval - (time.monotonic() - started)))
+    
+    def _dispatch_real_data(self, real_data: Dict) -> int:
+        """서버 캐시({code: {'price', 'volume', 'timestamp'}})에서 새 틱만 콜백으로 전달"""
+        dispatched = 0
+        for code, data in real_data.items():
+            if not data:
+                continue
+            key = (data.get('price', data.get('current_price')), data.get('timestamp'))
+            if self._last_tick_keys.get(code) == key:
+                continue
+            self._last_tick_keys[code] = key
+            
+            self.real_data_cache[code] = data
+            if self.real_data_callback:
+                try:
+                    self.real_data_callback(code, data)
+                    dispatched += 1
+                except Exception as e:
+                    logger.error(f"실시간 데이터 콜백 에러 ({code}): {e}")
+        return dispatched
+    
     def _start_connection_monitoring(self):
         """연결 상태 모니터링 시작"""
         if not self.is_monitoring:
@@ -432,6 +486,7 @@ class KiwoomMacAPI:
     def disconnect(self):
         """연결 해제"""
         self.is_monitoring = False
+        self.stop_real_data_stream()
         self.is_connected = False
         self.is_logged_in = False
         logger.info("키움 API 연결 해제")
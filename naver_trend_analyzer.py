@@ -19,11 +19,12 @@ from loguru import logger
 import asyncio
 import aiohttp
 from concurrent.futures import ThreadPoolExecutor
-import sqlite3
 import os
 
 # 프로젝트 모듈 import
 from error_handler import ErrorType, ErrorLevel, handle_error
+from trend_storage import TrendStorage, DEFAULT_TREND_DB_PATH
+from correlation_engine import tail_align, correlation_matrix, lagged_correlation, best_lag, direction_agreement
 
 class TrendType(Enum):
     """트렌드 타입"""
@@ -58,12 +59,146 @@ class StockTrendCorrelation:
     last_updated: datetime
     impact_score: float = 0.0
     prediction_accuracy: float = 0.0
+    best_lag: int = 0               # |상관계수|가 가장 큰 시차 (양수면 트렌드가 주가보다 선행)
+    lag_correlation: float = 0.0    # best_lag에서의 상관계수
+
+# 키워드별 메모리 보관 최대 건수 (넘으면 가장 오래된 것부터 덮어씀, 전체 이력은 SQLite에 보관)
+TREND_BUFFER_CAPACITY = 4096
+
+TREND_TYPES = list(TrendType)
+TREND_TYPE_CODES = {trend_type: code for code, trend_type in enumerate(TREND_TYPES)}
+
+class TrendRingBuffer:
+    """키워드 하나의 트렌드 링 버퍼
+    
+    필드별 고정 크기 배열에 시간순으로 저장합니다. 최신 값 조회는 O(1),
+    시간 구간 조회는 O(log n + k)입니다. (시각은 추가 순서대로 단조 증가한다고 가정하며,
+    이전 시각이 들어오면 직전 시각으로 맞춥니다)
+    """
+    
+    FIELDS = ('value', 'sentiment_score', 'volume_change', 'momentum_score', 'volatility')
+    
+    def __init__(self, keyword: str, capacity: int = TREND_BUFFER_CAPACITY):
+        self.keyword = keyword
+        self.capacity = capacity
+        self.timestamps = np.zeros(capacity, dtype='datetime64[us]')
+        self.trend_types = np.zeros(capacity, dtype=np.int8)
+        self.related_stocks = np.empty(capacity, dtype=object)
+        self.columns = {field: np.zeros(capacity, dtype=np.float64) for field in self.FIELDS}
+        self._next = 0   # 다음에 쓸 물리 위치
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __iter__(self):
+        for i in range(self._size):
+            yield self._record(self._physical(i))
+    
+    def __getitem__(self, index):
+        """시간순 인덱스 조회 ([0]은 가장 오래된 것, [-1]은 최신)"""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("트렌드 버퍼 인덱스 범위 초과")
+        return self._record(self._physical(index))
+    
+    def _physical(self, index: int) -> int:
+        return (self._next - self._size + index) % self.capacity
+    
+    def _record(self, position: int) -> TrendData:
+        return TrendData(
+            keyword=self.keyword,
+            trend_type=TREND_TYPES[self.trend_types[position]],
+            value=float(self.columns['value'][position]),
+            timestamp=self.timestamps[position].astype(datetime),
+            related_stocks=self.related_stocks[position],
+            sentiment_score=float(self.columns['sentiment_score'][position]),
+            volume_change=float(self.columns['volume_change'][position]),
+            momentum_score=float(self.columns['momentum_score'][position]),
+            volatility=float(self.columns['volatility'][position])
+        )
+    
+    def append(self, trend_data: TrendData):
+        """트렌드 추가 (가득 차면 가장 오래된 항목을 덮어씀)"""
+        position = self._next
+        timestamp = np.datetime64(trend_data.timestamp, 'us')
+        if self._size and timestamp < self.timestamps[self._physical(self._size - 1)]:
+            timestamp = self.timestamps[self._physical(self._size - 1)]
+        
+        self.timestamps[position] = timestamp
+        self.trend_types[position] = TREND_TYPE_CODES[trend_data.trend_type]
+        self.related_stocks[position] = trend_data.related_stocks
+        for field in self.FIELDS:
+            self.columns[field][position] = getattr(trend_data, field) or 0.0
+        
+        self._next = (self._next + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+    
+    def latest(self) -> Optional[TrendData]:
+        """최신 트렌드 (없으면 None)"""
+        return self._record(self._physical(self._size - 1)) if self._size else None
+    
+    def _bisect(self, timestamp: np.datetime64, right: bool = False) -> int:
+        """시간순 인덱스 이진 탐색 (right=True면 같은 시각 뒤쪽)"""
+        lo, hi = 0, self._size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            value = self.timestamps[self._physical(mid)]
+            if value < timestamp or (right and value == timestamp):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+    
+    def _ordered(self, array: np.ndarray, lo: int, hi: int) -> np.ndarray:
+        """시간순 인덱스 [lo, hi) 구간 배열 (링 경계를 넘으면 두 조각을 이어 붙임)"""
+        if lo >= hi:
+            return array[:0].copy()
+        start, end = self._physical(lo), self._physical(hi - 1) + 1
+        if start < end:
+            return array[start:end].copy()
+        return np.concatenate([array[start:], array[:end]])
+    
+    def window(self, start: datetime = None, end: datetime = None) -> Dict[str, np.ndarray]:
+        """시간 구간 [start, end]의 필드별 배열 (시간순, 'timestamp' 포함)"""
+        lo = 0 if start is None else self._bisect(np.datetime64(start, 'us'))
+        hi = self._size if end is None else self._bisect(np.datetime64(end, 'us'), right=True)
+        
+        window = {field: self._ordered(column, lo, hi) for field, column in self.columns.items()}
+        window['timestamp'] = self._ordered(self.timestamps, lo, hi)
+        return window
+
+class TrendStore(dict):
+    """키워드별 트렌드 링 버퍼 모음 {keyword: TrendRingBuffer}"""
+    
+    def __init__(self, capacity: int = TREND_BUFFER_CAPACITY):
+        super().__init__()
+        self.capacity = capacity
+    
+    def append(self, trend_data: TrendData):
+        buffer = self.get(trend_data.keyword)
+        if buffer is None:
+            buffer = self[trend_data.keyword] = TrendRingBuffer(trend_data.keyword, self.capacity)
+        buffer.append(trend_data)
+    
+    def extend(self, trend_list: List[TrendData]):
+        for trend_data in trend_list:
+            self.append(trend_data)
+    
+    def reset(self, keyword: str, trend_list: List[TrendData] = ()):
+        """키워드 버퍼를 비우고 주어진 트렌드로 다시 채움"""
+        self[keyword] = TrendRingBuffer(keyword, self.capacity)
+        for trend_data in trend_list:
+            self[keyword].append(trend_data)
 
 class NaverTrendAnalyzer:
     """네이버 트렌드 분석기"""
     
-    def __init__(self):
-        """초기화"""
+    def __init__(self, db_path: str = DEFAULT_TREND_DB_PATH):
+        """초기화 (db_path: 트렌드/상관관계 SQLite 파일 경로)"""
         try:
             # 로깅 설정
             logger.info("네이버 트렌드 분석기 초기화 시작")
@@ -94,10 +229,14 @@ class NaverTrendAnalyzer:
                 '006400': ['삼성SDI', '배터리']
             }
             
-            # 데이터 저장소 초기화
-            self.trend_data = {}
+            # 데이터 저장소 초기화 (트렌드는 키워드별 고정 크기 링 버퍼)
+            self.trend_data = TrendStore()
             self.news_data = {}
             self.correlation_data = {}
+            
+            # 디스크 저장소 (장기 연결 + 백그라운드 일괄 쓰기)
+            self.db_path = db_path
+            self.storage = TrendStorage(db_path)
         
             # 분석 상태
             self.analysis_running = False
@@ -574,32 +713,31 @@ class NaverTrendAnalyzer:
             logger.error(f"트렌드 데이터 처리 실패: {e}")
             return None
 
-    def _calculate_momentum(self, values: List[float]) -> float:
-        """모멘텀 점수 계산"""
-        if len(values) < 2:
+    def _calculate_momentum(self, values) -> float:
+        """모멘텀 점수 계산 (리스트 또는 트렌드 버퍼 배열)"""
+        y = np.asarray(values, dtype=np.float64)
+        if len(y) < 2:
             return 0.0
         
-        # 선형 회귀를 통한 기울기 계산
-        x = np.arange(len(values))
-        y = np.array(values)
-        
-        # 기울기 계산
-        slope = np.polyfit(x, y, 1)[0]
+        # 선형 회귀 기울기 (최소제곱 닫힌 해)
+        x = np.arange(len(y)) - (len(y) - 1) / 2
+        slope = (x @ (y - y.mean())) / (x @ x)
         
         # 정규화 (0~1 범위로)
-        max_value = max(values) if values else 1
+        max_value = y.max()
         normalized_slope = slope / max_value if max_value > 0 else 0
         
         return min(max(normalized_slope, -1), 1)  # -1 ~ 1 범위로 제한
 
-    def _calculate_volatility(self, values: List[float]) -> float:
-        """변동성 계산"""
+    def _calculate_volatility(self, values) -> float:
+        """변동성 계산 (리스트 또는 트렌드 버퍼 배열)"""
+        values = np.asarray(values, dtype=np.float64)
         if len(values) < 2:
             return 0.0
         
         # 표준편차 계산
-        std_dev = np.std(values)
-        mean_value = np.mean(values)
+        std_dev = values.std()
+        mean_value = values.mean()
         
         # 변동계수 (CV) 계산
         cv = std_dev / mean_value if mean_value > 0 else 0
@@ -611,32 +749,27 @@ class NaverTrendAnalyzer:
         if not trend_data:
             return
         
+        self._save_trend_batch([trend_data])
+    
+    def _save_trend_batch(self, trend_list: List[TrendData]):
+        """트렌드 데이터 여러 건을 한 번에 저장 (디스크 쓰기는 백그라운드에서 일괄 처리)"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT INTO trend_data 
-                (keyword, trend_type, value, timestamp, sentiment_score, volume_change, momentum_score, volatility)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                trend_data.keyword,
-                trend_data.trend_type.value,
-                trend_data.value,
-                trend_data.timestamp.isoformat(),
-                trend_data.sentiment_score,
-                trend_data.volume_change,
-                trend_data.momentum_score,
-                trend_data.volatility
-            ))
-            
-            conn.commit()
-            conn.close()
+            self.storage.insert_trends([
+                (
+                    trend_data.keyword,
+                    trend_data.trend_type.value,
+                    trend_data.value,
+                    trend_data.timestamp.isoformat(),
+                    trend_data.sentiment_score,
+                    trend_data.volume_change,
+                    trend_data.momentum_score,
+                    trend_data.volatility
+                )
+                for trend_data in trend_list
+            ])
             
             # 메모리에도 저장
-            if trend_data.keyword not in self.trend_data:
-                self.trend_data[trend_data.keyword] = []
-            self.trend_data[trend_data.keyword].append(trend_data)
+            self.trend_data.extend(trend_list)
             
         except Exception as e:
             logger.error(f"트렌드 데이터 저장 실패: {e}")
@@ -644,13 +777,10 @@ class NaverTrendAnalyzer:
     def get_historical_trend_data(self, keyword: str, days: int = 30) -> List[TrendData]:
         """과거 트렌드 데이터 조회"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
             end_date = datetime.now()
             start_date = end_date - timedelta(days=days)
             
-            cursor.execute('''
+            rows = self.storage.query('''
                 SELECT keyword, trend_type, value, timestamp, sentiment_score, 
                        volume_change, momentum_score, volatility
                 FROM trend_data 
@@ -658,9 +788,6 @@ class NaverTrendAnalyzer:
                 ORDER BY timestamp DESC
             ''', (keyword, start_date.isoformat()))
             
-            rows = cursor.fetchall()
-            conn.close()
-            
             trend_data_list = []
             for row in rows:
                 trend_data = TrendData(
@@ -699,12 +826,14 @@ class NaverTrendAnalyzer:
                 # 병렬 실행
                 results = await asyncio.gather(*tasks, return_exceptions=True)
                 
-                # 결과 처리
+                # 결과 처리 (수집 주기당 한 번에 저장)
+                collected = []
                 for result in results:
                     if isinstance(result, Exception):
                         logger.error(f"실시간 데이터 수집 실패: {result}")
                     elif result:
-                        self._save_trend_data(result)
+                        collected.append(result)
+                self._save_trend_batch(collected)
                 
                 logger.info(f"실시간 데이터 수집 완료: {len(self.monitoring_keywords)}개 키워드")
                 
@@ -797,138 +926,133 @@ class NaverTrendAnalyzer:
     def analyze_trend_correlation(self, keyword: str, stock_data: Dict) -> StockTrendCorrelation:
         """트렌드-주식 상관관계 분석"""
         try:
-            # 과거 트렌드 데이터 조회
-            trend_history = self.get_historical_trend_data(keyword, days=30)
-            
-            if not trend_history or not stock_data:
-                return None
-            
-            # 주식 데이터와 트렌드 데이터 정렬
-            trend_values = [t.value for t in trend_history]
-            stock_prices = stock_data.get('prices', [])
-            
-            if len(trend_values) < 10 or len(stock_prices) < 10:
+            if not self.trend_data.get(keyword) or not stock_data:
                 return None
             
-            # 상관관계 계산
-            min_length = min(len(trend_values), len(stock_prices))
-            trend_values = trend_values[-min_length:]
-            stock_prices = stock_prices[-min_length:]
-            
-            # 피어슨 상관계수 계산
-            correlation = np.corrcoef(trend_values, stock_prices)[0, 1]
-            
-            if np.isnan(correlation):
-                correlation = 0.0
-            
-            # 트렌드 방향 결정
-            recent_trend = trend_values[-1] - trend_values[0] if len(trend_values) > 1 else 0
-            if recent_trend > 0:
-                trend_direction = "positive"
-            elif recent_trend < 0:
-                trend_direction = "negative"
-            else:
-                trend_direction = "neutral"
-            
-            # 신뢰도 계산 (데이터 품질 기반)
-            confidence_level = min(abs(correlation), 1.0)
-            
-            # 영향도 점수 계산
-            impact_score = abs(correlation) * (len(trend_values) / 30)  # 데이터 양 고려
-            
-            # 예측 정확도 (과거 데이터 기반)
-            prediction_accuracy = self._calculate_prediction_accuracy(trend_history, stock_data)
-            
-            # 관련 주식 코드들
+            # 관련 주식 코드 (한 쌍짜리 일괄 분석)
             related_stocks = self.keyword_stock_mapping.get(keyword, [])
+            stock_code = related_stocks[0] if related_stocks else ""
             
-            correlation_data = StockTrendCorrelation(
-                stock_code=related_stocks[0] if related_stocks else "",
-                stock_name=keyword,
-                keyword=keyword,
-                correlation_score=correlation,
-                trend_direction=trend_direction,
-                confidence_level=confidence_level,
-                last_updated=datetime.now(),
-                impact_score=impact_score,
-                prediction_accuracy=prediction_accuracy
+            correlations = self.analyze_correlation_batch(
+                {keyword: [stock_code]}, {stock_code: stock_data.get('prices', [])}
             )
-            
-            # 데이터베이스에 저장
-            self._save_correlation_data(correlation_data)
-            
-            return correlation_data
+            return correlations[0] if correlations else None
             
         except Exception as e:
             logger.error(f"트렌드 상관관계 분석 실패 ({keyword}): {e}")
             return None
     
-    def _calculate_prediction_accuracy(self, trend_history: List[TrendData], stock_data: Dict) -> float:
-        """예측 정확도 계산"""
-        try:
-            if len(trend_history) < 10:
-                return 0.0
-            
-            # 트렌드 변화율과 주식 가격 변화율 비교
-            trend_changes = []
-            stock_changes = []
-            
-            for i in range(1, len(trend_history)):
-                trend_change = (trend_history[i].value - trend_history[i-1].value) / trend_history[i-1].value
-                trend_changes.append(trend_change)
-            
-            stock_prices = stock_data.get('prices', [])
-            for i in range(1, len(stock_prices)):
-                stock_change = (stock_prices[i] - stock_prices[i-1]) / stock_prices[i-1]
-                stock_changes.append(stock_change)
-            
-            # 방향 일치도 계산
-            correct_predictions = 0
-            total_predictions = 0
-            
-            min_length = min(len(trend_changes), len(stock_changes))
-            for i in range(min_length):
-                if (trend_changes[i] > 0 and stock_changes[i] > 0) or \
-                   (trend_changes[i] < 0 and stock_changes[i] < 0):
-                    correct_predictions += 1
-                total_predictions += 1
-            
-            accuracy = correct_predictions / total_predictions if total_predictions > 0 else 0.0
-            return accuracy
-            
-        except Exception as e:
-            logger.error(f"예측 정확도 계산 실패: {e}")
-            return 0.0
-
+    def analyze_correlation_batch(self, keyword_stocks: Dict[str, List[str]],
+                                  stock_prices: Dict[str, List[float]], days: int = 30,
+                                  max_lag: int = 5) -> List[StockTrendCorrelation]:
+        """키워드 x 주식 상관관계 일괄 분석 (keyword_stocks: 키워드별 관련 종목, stock_prices: 종목별 가격)
+        
+        최근 days일 트렌드와 가격을 끝에 맞춘 행렬로 만들어 상관/방향 일치도를 한 번에 계산합니다.
+        쌍마다 두 시계열 중 짧은 쪽 길이만큼의 최근 구간을 비교합니다 (10개 미만인 시계열은 제외).
+        ±max_lag 시차 상관 중 가장 강한 시차를 best_lag/lag_correlation으로 함께 돌려줍니다.
+        """
+        start = datetime.now() - timedelta(days=days)
+        
+        trend_series = {}
+        for keyword in keyword_stocks:
+            trend_buffer = self.trend_data.get(keyword)
+            if trend_buffer:
+                values = trend_buffer.window(start=start)['value']
+                if len(values) >= 10:
+                    trend_series[keyword] = values
+        
+        price_series = {}
+        for code in {code for codes in keyword_stocks.values() for code in codes}:
+            prices = stock_prices.get(code)
+            if prices is not None and len(prices) >= 10:
+                price_series[code] = prices
+        
+        if not trend_series or not price_series:
+            return []
+        
+        keywords, codes = list(trend_series), list(price_series)
+        trend_lengths = np.array([len(trend_series[k]) for k in keywords])
+        price_lengths = np.array([len(price_series[c]) for c in codes])
+        length = int(max(trend_lengths.max(), price_lengths.max()))
+        
+        X = tail_align([trend_series[k] for k in keywords], length)
+        Y = tail_align([price_series[c] for c in codes], length)
+        
+        # 피어슨 상관 / 예측 정확도 (변화율 방향 일치도)
+        correlation = correlation_matrix(X, Y)
+        accuracy = direction_agreement(X, Y)
+        lags, lag_corr = best_lag(lagged_correlation(X, Y, max_lag=max_lag))
+        
+        # 쌍별 비교 구간의 처음/마지막 트렌드 값으로 방향 결정
+        overlap = np.minimum.outer(trend_lengths, price_lengths)
+        first = X[length - overlap, np.arange(len(keywords))[:, np.newaxis]]
+        recent_trend = X[-1][:, np.newaxis] - first
+        
+        # 신뢰도 / 영향도 (데이터 양 고려)
+        confidence = np.minimum(np.abs(correlation), 1.0)
+        impact = np.abs(correlation) * (overlap / 30)
+        
+        code_index = {code: j for j, code in enumerate(codes)}
+        now = datetime.now()
+        results = []
+        for i, keyword in enumerate(keywords):
+            for code in keyword_stocks[keyword]:
+                j = code_index.get(code)
+                if j is None:
+                    continue
+                
+                if recent_trend[i, j] > 0:
+                    trend_direction = "positive"
+                elif recent_trend[i, j] < 0:
+                    trend_direction = "negative"
+                else:
+                    trend_direction = "neutral"
+                
+                results.append(StockTrendCorrelation(
+                    stock_code=code,
+                    stock_name=keyword,
+                    keyword=keyword,
+                    correlation_score=float(correlation[i, j]),
+                    trend_direction=trend_direction,
+                    confidence_level=float(confidence[i, j]),
+                    last_updated=now,
+                    impact_score=float(impact[i, j]),
+                    prediction_accuracy=float(accuracy[i, j]),
+                    best_lag=int(lags[i, j]),
+                    lag_correlation=float(lag_corr[i, j])
+                ))
+        
+        # 데이터베이스에 일괄 저장
+        self._save_correlation_batch(results)
+        
+        return results
+    
     def _save_correlation_data(self, correlation_data: StockTrendCorrelation):
         """상관관계 데이터를 데이터베이스에 저장"""
+        self._save_correlation_batch([correlation_data])
+    
+    def _save_correlation_batch(self, correlation_list: List[StockTrendCorrelation]):
+        """상관관계 데이터 여러 건을 한 번에 저장"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT OR REPLACE INTO correlation_data 
-                (stock_code, stock_name, keyword, correlation_score, trend_direction, 
-                 confidence_level, impact_score, prediction_accuracy, last_updated)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                correlation_data.stock_code,
-                correlation_data.stock_name,
-                correlation_data.keyword,
-                correlation_data.correlation_score,
-                correlation_data.trend_direction,
-                correlation_data.confidence_level,
-                correlation_data.impact_score,
-                correlation_data.prediction_accuracy,
-                correlation_data.last_updated.isoformat()
-            ))
-            
-            conn.commit()
-            conn.close()
+            self.storage.upsert_correlations([
+                (
+                    correlation_data.stock_code,
+                    correlation_data.stock_name,
+                    correlation_data.keyword,
+                    correlation_data.correlation_score,
+                    correlation_data.trend_direction,
+                    correlation_data.confidence_level,
+                    correlation_data.impact_score,
+                    correlation_data.prediction_accuracy,
+                    correlation_data.last_updated.isoformat()
+                )
+                for correlation_data in correlation_list
+            ])
             
             # 메모리에도 저장
-            key = f"{correlation_data.stock_code}_{correlation_data.keyword}"
-            self.correlation_data[key] = correlation_data
+            for correlation_data in correlation_list:
+                key = f"{correlation_data.stock_code}_{correlation_data.keyword}"
+                self.correlation_data[key] = correlation_data
             
         except Exception as e:
             logger.error(f"상관관계 데이터 저장 실패: {e}")
@@ -958,7 +1082,7 @@ class NaverTrendAnalyzer:
             
             for keyword in related_keywords:
                 if keyword in self.trend_data and self.trend_data[keyword]:
-                    trend = self.trend_data[keyword][0]
+                    trend = self.trend_data[keyword].latest()
                     
                     # 신호 점수 계산
                     sentiment_weight = 0.4
@@ -1483,14 +1607,15 @@ class NaverTrendAnalyzer:
             trending_keywords = []
             
             for keyword in self.monitoring_keywords:
-                recent_trends = self.get_historical_trend_data(keyword, days=3)
+                trend_buffer = self.trend_data.get(keyword)
+                recent_trends = trend_buffer.window(start=datetime.now() - timedelta(days=3)) if trend_buffer else None
                 
-                if len(recent_trends) >= 2:
-                    latest = recent_trends[0]
-                    previous = recent_trends[1]
+                if recent_trends is not None and len(recent_trends['value']) >= 2:
+                    latest = trend_buffer.latest()
+                    previous_value = recent_trends['value'][-2]
                     
                     # 변화율 계산
-                    change_rate = ((latest.value - previous.value) / previous.value * 100) if previous.value > 0 else 0
+                    change_rate = ((latest.value - previous_value) / previous_value * 100) if previous_value > 0 else 0
                     
                     # 트렌딩 기준: 변화율이 10% 이상
                     if abs(change_rate) >= 10:
@@ -1537,8 +1662,15 @@ class NaverTrendAnalyzer:
         self.analysis_running = False
         if self.analysis_thread:
             self.analysis_thread.join(timeout=5)
+        self.storage.flush()
         logger.info("네이버 트렌드 연속 분석이 중지되었습니다.")
     
+    def close(self):
+        """분석 중지 및 저장소 종료 (남은 쓰기 반영)"""
+        if self.analysis_running:
+            self.stop_continuous_analysis()
+        self.storage.close()
+    
     def _analysis_worker(self):
         """분석 워커 스레드"""
         while self.analysis_running:
@@ -1557,18 +1689,18 @@ class NaverTrendAnalyzer:
                 time.sleep(60)  # 오류 시 1분 대기
 
     def _update_correlations(self):
-        """상관관계 데이터 업데이트"""
+        """상관관계 데이터 업데이트 (전체 키워드-주식 매핑을 한 번에 분석)"""
         try:
-            # 주요 키워드들에 대해 상관관계 분석 수행
-            for keyword in self.monitoring_keywords[:10]:  # 상위 10개만
-                # 가상의 주식 데이터 (실제로는 주식 API에서 가져와야 함)
-                stock_data = {
-                    'prices': [100 + i * 0.5 + np.random.normal(0, 1) for i in range(30)]
-                }
-                
-                correlation = self.analyze_trend_correlation(keyword, stock_data)
-                if correlation:
-                    logger.debug(f"상관관계 업데이트: {keyword} - {correlation.correlation_score:.3f}")
+            keyword_stocks = self._load_keyword_mapping()
+            
+            # 가상의 주식 데이터 (실제로는 주식 API에서 가져와야 함)
+            codes = sorted({code for codes in keyword_stocks.values() for code in codes})
+            stock_prices = {
+                code: 100 + np.arange(30) * 0.5 + np.random.normal(0, 1, 30) for code in codes
+            }
+            
+            correlations = self.analyze_correlation_batch(keyword_stocks, stock_prices)
+            logger.debug(f"상관관계 업데이트: {len(correlations)}개 키워드-주식 쌍")
                     
         except Exception as e:
             logger.error(f"상관관계 업데이트 실패: {e}")
@@ -1590,7 +1722,7 @@ class NaverTrendAnalyzer:
             
             for trends in self.trend_data.values():
                 if trends:
-                    latest_trend = trends[0]
+                    latest_trend = trends.latest()
                     if latest_trend.sentiment_score > 0.1:
                         positive_trends += 1
                     elif latest_trend.sentiment_score < -0.1:
@@ -1602,7 +1734,7 @@ class NaverTrendAnalyzer:
             top_trending = []
             for keyword, trends in self.trend_data.items():
                 if trends:
-                    latest_trend = trends[0]
+                    latest_trend = trends.latest()
                     if latest_trend.volume_change > 0.1:  # 10% 이상 변화
                         top_trending.append({
                             'keyword': keyword,
@@ -1663,7 +1795,7 @@ class NaverTrendAnalyzer:
                     volatility=volatility
                 )
                 
-                self.trend_data[keyword] = [trend_data]
+                self.trend_data.reset(keyword, [trend_data])
             
             logger.info(f"가상 트렌드 데이터 생성 완료: {len(keywords)}개 키워드")
             
@@ -1681,7 +1813,7 @@ class NaverTrendAnalyzer:
             
             for keyword, trends in self.trend_data.items():
                 if trends:
-                    latest_trend = trends[0]
+                    latest_trend = trends.latest()
                     # 변화율이 2% 이상인 키워드만 트렌딩으로 분류 (임계값 낮춤)
                     if abs(latest_trend.volume_change) > 0.02:
                         trending_keywords.append({
@@ -9,14 +9,20 @@ import smtplib
 import requests
 import json
 import time
+import heapq
+import itertools
+import operator
 import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Tuple, Sequence, Union
 from dataclasses import dataclass
 from enum import Enum
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from loguru import logger
+import numpy as np
 
 class NotificationType(Enum):
     """알림 타입"""
@@ -43,6 +49,46 @@ class NotificationConfig:
     rate_limit: int = 10  # 분당 최대 알림 수
     cooldown: int = 300   # 동일 알림 재발송 대기 시간 (초)
 
+# 임계값 비교 연산자 (스칼라/NumPy 배열 공통)
+COMPARISON_OPERATORS = {
+    '>': operator.gt,
+    '>=': operator.ge,
+    '<': operator.lt,
+    '<=': operator.le,
+}
+
+@dataclass(frozen=True)
+class ThresholdCondition:
+    """선언형 임계값 조건 (예: |change_rate| > 5)
+
+    AlertRule.condition에 람다 대신 사용하면 호출형 조건으로 동작하고,
+    check_alerts_batch에서는 틱 묶음 전체를 배열 비교 한 번으로 평가합니다.
+    """
+    field: str
+    op: str
+    threshold: float
+    absolute: bool = False  # 절댓값 비교
+    default: float = 0.0    # 필드가 없을 때 값
+    
+    def __post_init__(self):
+        if self.op not in COMPARISON_OPERATORS:
+            raise ValueError(f"지원하지 않는 비교 연산자: {self.op}")
+    
+    def __call__(self, data: Dict) -> bool:
+        value = data.get(self.field, self.default)
+        if value is None:
+            return False
+        if self.absolute:
+            value = abs(value)
+        return bool(COMPARISON_OPERATORS[self.op](value, self.threshold))
+    
+    def evaluate(self, values: np.ndarray) -> np.ndarray:
+        """필드 값 배열에 대한 조건 마스크 (NaN은 불충족)"""
+        if self.absolute:
+            values = np.abs(values)
+        with np.errstate(invalid='ignore'):
+            return COMPARISON_OPERATORS[self.op](values, self.threshold)
+
 @dataclass
 class AlertRule:
     """알림 규칙"""
@@ -118,7 +164,7 @@ class EmailNotifier:
             msg.attach(MIMEText(html_content, 'html'))
             
             # SMTP 서버 연결 및 전송
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
+            with smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=10) as server:
                 server.starttls()
                 server.login(self.username, self.password)
                 server.send_message(msg)
@@ -312,23 +358,48 @@ class ConsoleNotifier:
             logger.error(f"콘솔 출력 오류: {e}")
             return False
 
+# 처리 우선순위 (앞쪽 레벨부터 처리)
+LEVEL_PRIORITY = [AlertLevel.CRITICAL, AlertLevel.ERROR, AlertLevel.WARNING, AlertLevel.INFO]
+DIGEST_PREVIEW = 10  # 요약 알림 본문에 표시할 최대 알림 수
+
 class NotificationSystem:
-    """고급 알림 시스템"""
+    """고급 알림 시스템
+
+    - 알림 레벨별 제한 큐 (CRITICAL부터 처리, 큐가 가득 차면 같은 레벨의 가장 오래된 알림을 버림)
+    - 쿨다운은 (규칙, 종목) 키 단위이며 만료된 키는 만료 시각 힙으로 정리
+    - CRITICAL 외 알림은 전송 중에 쌓인 같은 레벨 알림을 요약(digest) 한 건으로 묶어 전송
+    - 알림기별 전송은 스레드 풀에서 동시에 수행, CRITICAL은 레이트 리밋을 적용하지 않음
+    """
     
-    def __init__(self):
+    def __init__(self, max_queue_size: int = 1000, max_digest_size: int = 50,
+                 sent_history_size: int = 1000, send_workers: int = 4):
         self.notifiers = {}
         self.alert_rules = []
-        self.sent_alerts = {}  # {alert_id: last_sent_time}
+        self.sent_alerts = deque(maxlen=sent_history_size)  # 최근 전송한 알림
+        self.cooldowns = {}  # {(rule_name, code): 쿨다운 만료 시각 (time.monotonic)}
+        self._cooldown_heap = []  # [(만료 시각, 키)] - 만료된 쿨다운 정리용
+        self.rate_limits = {}  # {notifier_type: 분당 최대 알림 수}
         self.rate_limit_counters = {}  # {notifier_type: {count: int, reset_time: datetime}}
         self.running = False
-        self.alert_queue = []
-        self.queue_lock = threading.Lock()
         
-        # 알림 처리 스레드
+        # 레벨별 알림 큐
+        self.max_queue_size = max_queue_size
+        self.max_digest_size = max(1, max_digest_size)
+        self.alert_queues = {level: deque() for level in LEVEL_PRIORITY}
+        self.queue_lock = threading.Condition()
+        self._sending = False
+        self._alert_seq = itertools.count(1)
+        
+        # 알림 처리 스레드 / 알림기별 동시 전송
         self.processing_thread = None
+        self.send_workers = send_workers
+        self._executor = None
+        
+        self.stats = {'queued': 0, 'suppressed': 0, 'dropped': 0, 'sent': 0,
+                      'digests': 0, 'failed': 0, 'rate_limited': 0}
         
     def add_notifier(self, notifier_type: NotificationType, config: Dict):
-        """알림기 추가"""
+        """알림기 추가 (config의 rate_limit: 분당 최대 알림 수, 기본 10)"""
         try:
             if notifier_type == NotificationType.EMAIL:
                 self.notifiers[notifier_type] = EmailNotifier(config)
@@ -341,6 +412,7 @@ class NotificationSystem:
             elif notifier_type == NotificationType.CONSOLE:
                 self.notifiers[notifier_type] = ConsoleNotifier(config)
             
+            self.rate_limits[notifier_type] = (config or {}).get('rate_limit', 10)
             logger.info(f"알림기 추가 완료: {notifier_type.value}")
             
         except Exception as e:
@@ -352,7 +424,9 @@ class NotificationSystem:
         logger.info(f"알림 규칙 추가: {rule.name}")
     
     def check_alerts(self, data: Dict):
-        """알림 조건 확인"""
+        """알림 조건 확인 (같은 규칙/종목은 쿨다운 동안 큐에 넣지 않음)"""
+        code = data.get('code', '')
+        
         for rule in self.alert_rules:
             if not rule.enabled:
                 continue
@@ -360,29 +434,118 @@ class NotificationSystem:
             try:
                 # 조건 확인
                 if rule.condition(data):
-                    # 알림 생성
-                    alert = Alert(
-                        id=f"{rule.name}_{int(time.time())}",
-                        rule_name=rule.name,
-                        message=rule.message_template.format(**data),
-                        level=rule.level,
-                        timestamp=datetime.now(),
-                        data=data
-                    )
+                    self._raise_alert(rule, code, data)
                     
-                    # 알림 큐에 추가
-                    with self.queue_lock:
-                        self.alert_queue.append(alert)
+            except Exception as e:
+                logger.error(f"알림 규칙 실행 오류: {rule.name} - {e}")
+    
+    def check_alerts_batch(self, batch: Union[Sequence[Dict], Dict[str, Sequence]]):
+        """틱 묶음 알림 조건 확인
+
+        batch는 데이터 딕셔너리 목록 또는 필드별 배열 딕셔너리(컬럼형, DataFrame 포함)입니다.
+        ThresholdCondition 규칙은 필드 배열을 한 번만 만들어 배열 비교로 평가하고,
+        조건을 만족한 행만 딕셔너리로 만들어 알림을 생성합니다. (그 외 규칙은 행마다 호출)
+        """
+        if isinstance(batch, (list, tuple)):
+            rows = batch
+            size = len(rows)
+        else:
+            rows = None
+            batch = {field: np.asarray(batch[field]) for field in batch.keys()}
+            size = len(next(iter(batch.values()))) if batch else 0
+        if size == 0:
+            return
+        
+        columns = {}  # {(field, default): 값 배열}
+        codes = None
+        
+        def column(field: str, default: float) -> np.ndarray:
+            key = (field, default)
+            if key not in columns:
+                if rows is not None:
+                    values = [row.get(field, default) for row in rows]
+                else:
+                    values = batch[field] if field in batch else np.full(size, default)
+                columns[key] = np.asarray(values, dtype=np.float64)
+            return columns[key]
+        
+        def row_at(index: int) -> Dict:
+            if rows is not None:
+                return rows[index]
+            return {field: values.item(index) for field, values in batch.items()}
+        
+        for rule in self.alert_rules:
+            if not rule.enabled:
+                continue
+            
+            try:
+                if isinstance(rule.condition, ThresholdCondition):
+                    condition = rule.condition
+                    matches = np.flatnonzero(condition.evaluate(column(condition.field, condition.default)))
+                    if len(matches) == 0:
+                        continue
+                    if codes is None:
+                        if rows is not None:
+                            codes = [row.get('code', '') for row in rows]
+                        else:
+                            codes = batch['code'].tolist() if 'code' in batch else [''] * size
+                    for index in matches:
+                        self._raise_alert(rule, codes[index], row_at(index))
+                else:
+                    for index in range(size):
+                        data = row_at(index)
+                        if rule.condition(data):
+                            self._raise_alert(rule, data.get('code', ''), data)
                     
             except Exception as e:
                 logger.error(f"알림 규칙 실행 오류: {rule.name} - {e}")
     
+    def _raise_alert(self, rule: AlertRule, code: str, data: Dict):
+        """조건을 만족한 규칙의 알림 생성 (쿨다운 중이면 메시지를 만들지 않고 버림)"""
+        with self.queue_lock:
+            if not self._check_cooldown((rule.name, code), rule.cooldown, time.monotonic()):
+                self.stats['suppressed'] += 1
+                return
+        
+        # 알림 생성 후 큐에 추가
+        self.submit_alert(Alert(
+            id=f"{rule.name}_{code}_{next(self._alert_seq)}",
+            rule_name=rule.name,
+            message=rule.message_template.format(**data),
+            level=rule.level,
+            timestamp=datetime.now(),
+            data=data
+        ))
+    
+    def submit_alert(self, alert: Alert):
+        """알림 큐에 추가 (레벨별 큐가 가득 차면 가장 오래된 알림을 버림)"""
+        with self.queue_lock:
+            queue = self.alert_queues[alert.level]
+            if len(queue) >= self.max_queue_size:
+                queue.popleft()
+                self.stats['dropped'] += 1
+            queue.append(alert)
+            self.stats['queued'] += 1
+            self.queue_lock.notify()
+    
+    def pending_count(self) -> int:
+        """전송 대기 중인 알림 수"""
+        with self.queue_lock:
+            return sum(len(queue) for queue in self.alert_queues.values())
+    
+    def flush(self, timeout: float = None) -> bool:
+        """대기 중인 알림이 모두 전송될 때까지 대기"""
+        with self.queue_lock:
+            return self.queue_lock.wait_for(
+                lambda: not self._sending and not any(self.alert_queues.values()), timeout)
+    
     def start(self):
         """알림 시스템 시작"""
         if self.running:
             return
             
         self.running = True
+        self._executor = ThreadPoolExecutor(max_workers=self.send_workers, thread_name_prefix="Notifier")
         self.processing_thread = threading.Thread(target=self._process_alerts, daemon=True)
         self.processing_thread.start()
         
@@ -390,66 +553,131 @@ class NotificationSystem:
     
     def stop(self):
         """알림 시스템 중지"""
-        self.running = False
+        with self.queue_lock:
+            self.running = False
+            self.queue_lock.notify_all()
         if self.processing_thread:
             self.processing_thread.join(timeout=5)
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
         
         logger.info("알림 시스템 중지")
     
     def _process_alerts(self):
-        """알림 처리 스레드"""
+        """알림 처리 스레드 (알림이 들어오면 바로 처리)"""
         while self.running:
             try:
-                # 큐에서 알림 가져오기
-                alert = None
                 with self.queue_lock:
-                    if self.alert_queue:
-                        alert = self.alert_queue.pop(0)
-                
-                if alert:
-                    self._send_alert(alert)
+                    self.queue_lock.wait_for(
+                        lambda: not self.running or any(self.alert_queues.values()), timeout=1.0)
+                    self._evict_cooldowns(time.monotonic())
+                    if not self.running:
+                        break
+                    batch = self._next_batch()
+                    self._sending = bool(batch)
                 
-                time.sleep(1)  # 1초 대기
+                if not batch:
+                    continue
+                try:
+                    self._send_alert(batch[0] if len(batch) == 1 else self._make_digest(batch))
+                finally:
+                    with self.queue_lock:
+                        self._sending = False
+                        self.queue_lock.notify_all()
                 
             except Exception as e:
                 logger.error(f"알림 처리 오류: {e}")
-                time.sleep(5)
+                time.sleep(1)
+    
+    def _next_batch(self) -> List[Alert]:
+        """우선순위가 가장 높은 레벨의 알림 (CRITICAL은 한 건씩, 나머지는 최대 max_digest_size건)"""
+        for level in LEVEL_PRIORITY:
+            queue = self.alert_queues[level]
+            if not queue:
+                continue
+            size = 1 if level == AlertLevel.CRITICAL else min(len(queue), self.max_digest_size)
+            return [queue.popleft() for _ in range(size)]
+        return []
+    
+    def _make_digest(self, alerts: List[Alert]) -> Alert:
+        """같은 레벨 알림 여러 건을 요약 알림 한 건으로 묶음"""
+        lines = [f"- {alert.message}" for alert in alerts[:DIGEST_PREVIEW]]
+        if len(alerts) > DIGEST_PREVIEW:
+            lines.append(f"- 외 {len(alerts) - DIGEST_PREVIEW}건")
+        
+        rules = {}
+        for alert in alerts:
+            rules[alert.rule_name] = rules.get(alert.rule_name, 0) + 1
+        
+        self.stats['digests'] += 1
+        return Alert(
+            id=f"digest_{next(self._alert_seq)}",
+            rule_name=f"알림 요약 ({len(alerts)}건)",
+            message='\n'.join(lines),
+            level=alerts[0].level,
+            timestamp=datetime.now(),
+            data={'alert_ids': [alert.id for alert in alerts], 'rules': rules}
+        )
     
     def _send_alert(self, alert: Alert):
-        """알림 전송"""
-        # 쿨다운 확인
-        if not self._check_cooldown(alert):
+        """알림 전송 (알림기별 동시 전송)"""
+        targets = []
+        for notifier_type, notifier in self.notifiers.items():
+            # 레이트 리밋 확인 (CRITICAL은 항상 전송)
+            if alert.level != AlertLevel.CRITICAL and not self._check_rate_limit(notifier_type):
+                self.stats['rate_limited'] += 1
+                continue
+            targets.append((notifier_type, notifier))
+        
+        if not targets:
             return
         
-        # 각 채널로 전송
-        for notifier_type, notifier in self.notifiers.items():
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.send_workers, thread_name_prefix="Notifier")
+        futures = {self._executor.submit(notifier.send, alert): notifier_type
+                   for notifier_type, notifier in targets}
+        
+        sent = False
+        for future in as_completed(futures):
+            notifier_type = futures[future]
             try:
-                # 레이트 리밋 확인
-                if not self._check_rate_limit(notifier_type):
-                    continue
-                
-                # 알림 전송
-                success = notifier.send(alert)
-                
-                if success:
-                    # 전송 성공 기록
-                    self.sent_alerts[alert.id] = datetime.now()
-                    self._update_rate_limit(notifier_type)
-                    
+                success = future.result()
             except Exception as e:
                 logger.error(f"알림 전송 오류: {notifier_type.value} - {e}")
-    
-    def _check_cooldown(self, alert: Alert) -> bool:
-        """쿨다운 확인"""
-        if alert.id in self.sent_alerts:
-            last_sent = self.sent_alerts[alert.id]
-            cooldown_seconds = 300  # 기본 5분
+                success = False
             
-            if (datetime.now() - last_sent).seconds < cooldown_seconds:
-                return False
+            if success:
+                self._update_rate_limit(notifier_type)
+                sent = True
+            else:
+                self.stats['failed'] += 1
         
+        if sent:
+            # 전송 성공 기록
+            self.sent_alerts.append(alert)
+            self.stats['sent'] += 1
+    
+    def _check_cooldown(self, key: Tuple[str, str], cooldown: float, now: float) -> bool:
+        """쿨다운 확인 (통과하면 해당 키의 쿨다운 시작, queue_lock 안에서 호출)"""
+        expiry = self.cooldowns.get(key)
+        if expiry is not None and now < expiry:
+            return False
+        
+        if cooldown > 0:
+            expiry = now + cooldown
+            self.cooldowns[key] = expiry
+            heapq.heappush(self._cooldown_heap, (expiry, key))
         return True
     
+    def _evict_cooldowns(self, now: float):
+        """만료된 쿨다운 키 정리 (queue_lock 안에서 호출)"""
+        heap = self._cooldown_heap
+        while heap and heap[0][0] <= now:
+            expiry, key = heapq.heappop(heap)
+            if self.cooldowns.get(key) == expiry:
+                del self.cooldowns[key]
+    
     def _check_rate_limit(self, notifier_type: NotificationType) -> bool:
         """레이트 리밋 확인"""
         if notifier_type not in self.rate_limit_counters:
@@ -465,8 +693,8 @@ class NotificationSystem:
             counter['count'] = 0
             counter['reset_time'] = datetime.now() + timedelta(minutes=1)
         
-        # 레이트 리밋 확인 (분당 10개)
-        return counter['count'] < 10
+        # 레이트 리밋 확인 (기본 분당 10개)
+        return counter['count'] < self.rate_limits.get(notifier_type, 10)
     
     def _update_rate_limit(self, notifier_type: NotificationType):
         """레이트 리밋 업데이트"""
@@ -479,37 +707,27 @@ def create_default_alert_rules():
     rules = []
     
     # 급등/급락 알림
-    def price_volatility_condition(data):
-        return abs(data.get('change_rate', 0)) > 5.0
-    
     rules.append(AlertRule(
         name="급등/급락 알림",
-        condition=price_volatility_condition,
+        condition=ThresholdCondition('change_rate', '>', 5.0, absolute=True),
         message_template="{name}({code}) 급격한 가격 변동: {change_rate:+.2f}%",
         level=AlertLevel.WARNING,
         channels=[NotificationType.EMAIL, NotificationType.SLACK, NotificationType.TELEGRAM]
     ))
     
     # 거래량 급증 알림
-    def volume_surge_condition(data):
-        volume_ratio = data.get('volume_ratio', 1.0)
-        return volume_ratio > 3.0
-    
     rules.append(AlertRule(
         name="거래량 급증 알림",
-        condition=volume_surge_condition,
+        condition=ThresholdCondition('volume_ratio', '>', 3.0, default=1.0),
         message_template="{name}({code}) 거래량 급증: 평균 대비 {volume_ratio:.1f}배",
         level=AlertLevel.INFO,
         channels=[NotificationType.SLACK, NotificationType.TELEGRAM]
     ))
     
     # 시스템 오류 알림
-    def system_error_condition(data):
-        return data.get('error_count', 0) > 10
-    
     rules.append(AlertRule(
         name="시스템 오류 알림",
-        condition=system_error_condition,
+        condition=ThresholdCondition('error_count', '>', 10),
         message_template="시스템 오류 발생: {error_count}개 오류 감지",
         level=AlertLevel.ERROR,
         channels=[NotificationType.EMAIL, NotificationType.SLACK, NotificationType.TELEGRAM]
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+컬럼형 OHLCV 로컬 캐시
+종목별 가격 이력을 (종목코드, 주기, 수정주가 여부) 단위로 디스크에 컬럼별 배열 파일로 저장합니다.
+
+- 컬럼마다 float64/int64 원시 배열 파일 하나 (np.memmap으로 지연 오픈, 복사 없음)
+- 새 봉은 파일 끝에 이어 쓰고 meta.json의 행 수만 갱신 (증분 추가)
+- 여러 워커 프로세스가 같은 파일을 읽기 전용으로 매핑하면 OS 페이지 캐시를 공유
+"""
+
+import os
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from loguru import logger
+import numpy as np
+import pandas as pd
+
+# 저장 컬럼과 자료형 (날짜는 datetime64[ns]를 int64로 저장)
+CACHE_COLUMNS = {
+    'date': np.int64,
+    'open': np.float64,
+    'high': np.float64,
+    'low': np.float64,
+    'close': np.float64,
+    'volume': np.float64,
+}
+
+DEFAULT_CACHE_DIR = os.path.join("data_cache", "ohlcv")
+
+@dataclass
+class CacheEntry:
+    """캐시 항목 메타데이터"""
+    code: str
+    interval: str
+    adjusted: bool
+    rows: int = 0
+    covered_from: Optional[str] = None  # 조회 완료된 요청 구간 (휴장일 포함)
+    covered_to: Optional[str] = None
+    updated_at: Optional[str] = None
+
+    def covers(self, start_date: str, end_date: str) -> bool:
+        """요청 구간이 이미 조회된 구간에 포함되는지 여부"""
+        if self.covered_from is None or self.covered_to is None:
+            return False
+        return self.covered_from <= start_date and end_date <= self.covered_to
+
+class OHLCVCache:
+    """컬럼형 OHLCV 디스크 캐시"""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+        # 열린 메모리 맵 {(code, interval, adjusted): (rows, {column: memmap})}
+        self._maps: Dict[Tuple[str, str, bool], Tuple[int, Dict[str, np.ndarray]]] = {}
+
+    def _entry_dir(self, code: str, interval: str, adjusted: bool) -> str:
+        return os.path.join(self.cache_dir, interval, "adj" if adjusted else "raw", code)
+
+    def _meta_path(self, code: str, interval: str, adjusted: bool) -> str:
+        return os.path.join(self._entry_dir(code, interval, adjusted), "meta.json")
+
+    def _column_path(self, code: str, interval: str, adjusted: bool, column: str) -> str:
+        return os.path.join(self._entry_dir(code, interval, adjusted), f"{column}.bin")
+
+    def entry(self, code: str, interval: str = "1d", adjusted: bool = True) -> Optional[CacheEntry]:
+        """캐시 메타데이터 조회 (없으면 None)"""
+        meta_path = self._meta_path(code, interval, adjusted)
+        if not os.path.exists(meta_path):
+            return None
+
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return CacheEntry(**json.load(f))
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"캐시 메타데이터 손상: {code} - {e}")
+            return None
+
+    def _write_meta(self, entry: CacheEntry):
+        """메타데이터를 임시 파일에 쓴 뒤 교체 (읽는 쪽은 항상 완전한 메타만 봄)"""
+        meta_path = self._meta_path(entry.code, entry.interval, entry.adjusted)
+        temp_path = f"{meta_path}.tmp.{os.getpid()}"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry.__dict__, f, ensure_ascii=False)
+        os.replace(temp_path, meta_path)
+
+    def _open_columns(self, code: str, interval: str, adjusted: bool, rows: int) -> Dict[str, np.ndarray]:
+        """컬럼 파일을 읽기 전용 메모리 맵으로 열기 (같은 행 수면 재사용)"""
+        key = (code, interval, adjusted)
+        cached = self._maps.get(key)
+        if cached is not None and cached[0] == rows:
+            return cached[1]
+
+        columns = {}
+        for column, dtype in CACHE_COLUMNS.items():
+            if rows == 0:
+                columns[column] = np.empty(0, dtype=dtype)
+            else:
+                columns[column] = np.memmap(self._column_path(code, interval, adjusted, column),
+                                            dtype=dtype, mode='r', shape=(rows,))
+        self._maps[key] = (rows, columns)
+        return columns
+
+    def read(self, code: str, start_date: str = None, end_date: str = None,
+             interval: str = "1d", adjusted: bool = True) -> Optional[pd.DataFrame]:
+        """캐시된 OHLCV 조회 (end_date 포함, 없으면 None)
+
+        반환되는 DataFrame의 컬럼은 메모리 맵을 복사 없이 감싼 읽기 전용 배열입니다.
+        """
+        entry = self.entry(code, interval, adjusted)
+        if entry is None:
+            return None
+
+        columns = self._open_columns(code, interval, adjusted, entry.rows)
+        dates = columns['date']
+
+        lo = 0 if start_date is None else int(np.searchsorted(dates, pd.Timestamp(start_date).value, side='left'))
+        hi = len(dates) if end_date is None else int(np.searchsorted(dates, pd.Timestamp(end_date).value, side='right'))
+
+        index = pd.DatetimeIndex(np.asarray(dates[lo:hi]).view('datetime64[ns]'), name='date')
+        return pd.DataFrame({column: columns[column][lo:hi] for column in CACHE_COLUMNS if column != 'date'},
+                            index=index, copy=False)
+
+    def append(self, code: str, df: pd.DataFrame, interval: str = "1d", adjusted: bool = True,
+               covered_from: str = None, covered_to: str = None) -> int:
+        """새 봉 추가 (마지막 캐시 날짜 이후의 봉만 파일 끝에 이어 씀)
+
+        covered_from/covered_to: 이번에 조회한 요청 구간 (휴장일로 봉이 없어도 다시 조회하지 않도록 기록)
+        반환값: 추가된 봉 수
+        """
+        entry = self.entry(code, interval, adjusted) or CacheEntry(code=code, interval=interval, adjusted=adjusted)
+        os.makedirs(self._entry_dir(code, interval, adjusted), exist_ok=True)
+
+        new_bars = self._normalize(df)
+        if entry.rows > 0 and not new_bars.empty:
+            last_date = self._open_columns(code, interval, adjusted, entry.rows)['date'][-1]
+            new_bars = new_bars[new_bars.index.asi8 > last_date]
+
+        if not new_bars.empty:
+            for column, dtype in CACHE_COLUMNS.items():
+                if column == 'date':
+                    values = new_bars.index.asi8.astype(dtype)
+                else:
+                    values = new_bars[column].to_numpy(dtype=dtype)
+
+                path = self._column_path(code, interval, adjusted, column)
+                # 이전에 중단된 쓰기의 잔여 바이트는 잘라낸 뒤 이어 씀
+                with open(path, 'ab') as f:
+                    f.truncate(entry.rows * np.dtype(dtype).itemsize)
+                    f.write(values.tobytes())
+            entry.rows += len(new_bars)
+
+        if covered_from is not None:
+            entry.covered_from = covered_from if entry.covered_from is None else min(entry.covered_from, covered_from)
+        if covered_to is not None:
+            entry.covered_to = covered_to if entry.covered_to is None else max(entry.covered_to, covered_to)
+        entry.updated_at = datetime.now().isoformat()
+
+        # 데이터 파일을 먼저 쓰고 메타데이터(행 수)를 마지막에 갱신
+        self._write_meta(entry)
+
+        logger.debug(f"캐시 추가: {code} {interval} {len(new_bars)}개 봉 (총 {entry.rows}개)")
+        return len(new_bars)
+
+    def replace(self, code: str, df: pd.DataFrame, interval: str = "1d", adjusted: bool = True,
+                covered_from: str = None, covered_to: str = None) -> int:
+        """캐시 항목을 새 데이터로 교체"""
+        self.invalidate(code, interval, adjusted)
+        return self.append(code, df, interval, adjusted, covered_from, covered_to)
+
+    def invalidate(self, code: str, interval: str = "1d", adjusted: bool = True):
+        """캐시 항목 삭제"""
+        self._maps.pop((code, interval, adjusted), None)
+
+        entry_dir = self._entry_dir(code, interval, adjusted)
+        if not os.path.isdir(entry_dir):
+            return
+
+        for file_name in os.listdir(entry_dir):
+            os.remove(os.path.join(entry_dir, file_name))
+
+    def missing_range(self, code: str, start_date: str, end_date: str,
+                      interval: str = "1d", adjusted: bool = True) -> Optional[Tuple[str, str, bool]]:
+        """원본에서 조회해야 할 구간 (start, end, 교체 여부). 모두 캐시되어 있으면 None
+
+        앞쪽 구간이 비어 있으면 전체를 다시 받아 교체하고, 뒤쪽만 비어 있으면 새 봉만 이어 받습니다.
+        (원본 API의 종료일이 배타적일 수 있으므로 이어 받기는 covered_to 당일부터 다시 조회)
+        """
+        entry = self.entry(code, interval, adjusted)
+        if entry is None or entry.rows == 0 or entry.covered_from is None:
+            return start_date, end_date, True
+
+        if entry.covers(start_date, end_date):
+            return None
+
+        if start_date < entry.covered_from:
+            return start_date, max(end_date, entry.covered_to), True
+
+        return entry.covered_to, end_date, False
+
+    @staticmethod
+    def _normalize(df: pd.DataFrame) -> pd.DataFrame:
+        """저장 형식으로 정리 (시간대 제거, 날짜 정렬, 중복 제거, 컬럼명 소문자)"""
+        if df is None or df.empty:
+            return pd.DataFrame(columns=[c for c in CACHE_COLUMNS if c != 'date'],
+                                index=pd.DatetimeIndex([], dtype='datetime64[ns]'))
+
+        df = df.rename(columns=str.lower)
+        index = pd.DatetimeIndex(df.index)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        df = df.set_axis(index.as_unit('ns'))
+        df = df[~df.index.duplicated(keep='last')].sort_index()
+
+        for column in CACHE_COLUMNS:
+            if column != 'date' and column not in df.columns:
+                df[column] = 0.0
+        return df
+
+@dataclass
+class CachedDataSpec:
+    """캐시에서 읽을 데이터 지정 (워커 프로세스에 DataFrame 대신 전달)"""
+    cache_dir: str
+    codes: List[str]
+    start_date: str = None
+    end_date: str = None
+    interval: str = "1d"
+    adjusted: bool = True
+
+    def load(self) -> Dict[str, pd.DataFrame]:
+        """메모리 맵 기반 DataFrame 딕셔너리 생성"""
+        cache = OHLCVCache(self.cache_dir)
+        data = {}
+        for code in self.codes:
+            df = cache.read(code, self.start_date, self.end_date, self.interval, self.adjusted)
+            if df is not None and not df.empty:
+                data[code] = df
+        return data
+
+if __name__ == "__main__":
+    # 테스트 코드
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = OHLCVCache(temp_dir)
+        dates = pd.bdate_range("2023-01-02", periods=5)
+        sample = pd.DataFrame({'open': 1.0, 'high': 2.0, 'low': 0.5, 'close': 1.5, 'volume': 100},
+                              index=dates)
+
+        cache.append("005930", sample.iloc[:3], covered_from="2023-01-01", covered_to="2023-01-04")
+        cache.append("005930", sample, covered_to="2023-01-06")
+        logger.info(f"캐시 조회: {len(cache.read('005930'))}개 봉")
+        logger.info(f"추가 조회 구간: {cache.missing_range('005930', '2023-01-01', '2023-01-31')}")
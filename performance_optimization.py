@@ -19,6 +19,7 @@ from itertools import product
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from backtesting_system import BacktestingEngine, BacktestConfig, BacktestMode
+from backtest_sweep import build_sweep_tasks, run_backtest_sweep
 from trading_strategy import create_default_strategies, StrategyConfig, StrategyType
 
 def analyze_current_performance():
@@ -75,6 +76,54 @@ def analyze_current_performance():
         logger.error("백테스트 실행 실패")
         return None
 
+def _optimization_config() -> BacktestConfig:
+    """최적화용 백테스트 설정"""
+    return BacktestConfig(
+        mode=BacktestMode.SINGLE_STOCK,
+        start_date="2023-02-15",
+        end_date="2023-12-28",
+        initial_capital=10000000,
+        commission_rate=0.0001,
+        slippage_rate=0.00005,
+        min_trade_amount=1000,
+        max_positions=20,
+        position_size_ratio=0.02
+    )
+
+def _load_optimization_data():
+    """최적화용 가격 데이터 1회 로드 (모든 스윕 작업이 공유)"""
+    engine = BacktestingEngine(_optimization_config())
+    if not engine.load_data(['005930.KS'], data_source="yahoo"):
+        return None
+    return engine.data
+
+def _run_parameter_sweep(name: str, strategy_type: StrategyType, parameter_sets: list):
+    """파라미터 조합을 병렬 스윕으로 실행하고 최고 샤프 비율 조합 반환"""
+    data = _load_optimization_data()
+    if not data:
+        logger.error("데이터 로드 실패")
+        return None, None
+    
+    tasks = build_sweep_tasks(
+        [_optimization_config()],
+        [{name: StrategyConfig(strategy_type=strategy_type, parameters=params)} for params in parameter_sets]
+    )
+    
+    os.makedirs("optimization_results", exist_ok=True)
+    table = run_backtest_sweep(data, tasks, checkpoint_path=os.path.join("optimization_results", f"{name}_sweep.jsonl"))
+    
+    if table.empty:
+        return None, None
+    
+    parameter_columns = [f"{name}.{key}" for key in parameter_sets[0].keys()]
+    logger.info(f"\n{table[parameter_columns + ['total_return', 'win_rate', 'sharpe_ratio']].head(10)}")
+    
+    # 비교 테이블은 샤프 비율 내림차순으로 정렬되어 있음
+    best_row = table.iloc[0]
+    best_params = {key: best_row[f"{name}.{key}"] for key in parameter_sets[0].keys()}
+    
+    return best_params, best_row
+
 def optimize_ma_crossover():
     """이동평균 크로스오버 전략 최적화"""
     logger.info("=== MA Crossover 전략 최적화 시작 ===")
@@ -84,41 +133,19 @@ def optimize_ma_crossover():
     long_periods = [5, 7, 10, 15, 20, 25]
     thresholds = [0.00001, 0.0001, 0.001, 0.01]
     
-    best_result = None
-    best_params = None
-    best_sharpe = -999
+    parameter_sets = [
+        {'short_period': short, 'long_period': long, 'min_cross_threshold': threshold}
+        for short, long, threshold in product(short_periods, long_periods, thresholds)
+        if short < long  # short < long 조건 확인
+    ]
+    logger.info(f"총 {len(parameter_sets)}개 조합 테스트 예정")
     
-    total_combinations = len(short_periods) * len(long_periods) * len(thresholds)
-    logger.info(f"총 {total_combinations}개 조합 테스트 예정")
-    
-    for i, (short, long, threshold) in enumerate(product(short_periods, long_periods, thresholds)):
-        if short >= long:  # short < long 조건 확인
-            continue
-            
-        logger.info(f"테스트 {i+1}: short={short}, long={long}, threshold={threshold}")
-        
-        # 전략 생성
-        config = StrategyConfig(
-            strategy_type=StrategyType.MOVING_AVERAGE_CROSSOVER,
-            parameters={'short_period': short, 'long_period': long, 'min_cross_threshold': threshold}
-        )
-        
-        # 백테스트 실행
-        backtest_result = run_optimization_backtest(config)
-        
-        if backtest_result and backtest_result.sharpe_ratio > best_sharpe:
-            best_sharpe = backtest_result.sharpe_ratio
-            best_result = backtest_result
-            best_params = {'short_period': short, 'long_period': long, 'min_cross_threshold': threshold}
-            
-            logger.info(f"새로운 최고 성과 발견!")
-            logger.info(f"샤프 비율: {best_sharpe:.3f}")
-            logger.info(f"수익률: {best_result.total_return:.2f}%")
-            logger.info(f"승률: {best_result.win_rate:.2f}%")
+    best_params, best_result = _run_parameter_sweep('MA_Crossover', StrategyType.MOVING_AVERAGE_CROSSOVER, parameter_sets)
     
     logger.info("=== MA Crossover 최적화 완료 ===")
     logger.info(f"최적 파라미터: {best_params}")
-    logger.info(f"최고 샤프 비율: {best_sharpe:.3f}")
+    if best_result is not None:
+        logger.info(f"최고 샤프 비율: {best_result['sharpe_ratio']:.3f}")
     
     return best_params, best_result
 
@@ -132,51 +159,25 @@ def optimize_rsi_strategy():
     overbought_levels = [60, 65, 70, 75, 80]
     confirmation_periods = [1, 2, 3]
     
-    best_result = None
-    best_params = None
-    best_sharpe = -999
-    
-    total_combinations = len(rsi_periods) * len(oversold_levels) * len(overbought_levels) * len(confirmation_periods)
-    logger.info(f"총 {total_combinations}개 조합 테스트 예정")
-    
-    for i, (period, oversold, overbought, confirm) in enumerate(product(rsi_periods, oversold_levels, overbought_levels, confirmation_periods)):
-        if oversold >= overbought:  # oversold < overbought 조건 확인
-            continue
-            
-        logger.info(f"테스트 {i+1}: period={period}, oversold={oversold}, overbought={overbought}, confirm={confirm}")
-        
-        # 전략 생성
-        config = StrategyConfig(
-            strategy_type=StrategyType.RSI_STRATEGY,
-            parameters={
-                'rsi_period': period,
-                'oversold_threshold': oversold,
-                'overbought_threshold': overbought,
-                'confirmation_period': confirm
-            }
-        )
-        
-        # 백테스트 실행
-        backtest_result = run_optimization_backtest(config)
-        
-        if backtest_result and backtest_result.sharpe_ratio > best_sharpe:
-            best_sharpe = backtest_result.sharpe_ratio
-            best_result = backtest_result
-            best_params = {
-                'rsi_period': period,
-                'oversold_threshold': oversold,
-                'overbought_threshold': overbought,
-                'confirmation_period': confirm
-            }
-            
-            logger.info(f"새로운 최고 성과 발견!")
-            logger.info(f"샤프 비율: {best_sharpe:.3f}")
-            logger.info(f"수익률: {best_result.total_return:.2f}%")
-            logger.info(f"승률: {best_result.win_rate:.2f}%")
+    parameter_sets = [
+        {
+            'rsi_period': period,
+            'oversold_threshold': oversold,
+            'overbought_threshold': overbought,
+            'confirmation_period': confirm
+        }
+        for period, oversold, overbought, confirm
+        in product(rsi_periods, oversold_levels, overbought_levels, confirmation_periods)
+        if oversold < overbought  # oversold < overbought 조건 확인
+    ]
+    logger.info(f"총 {len(parameter_sets)}개 조합 테스트 예정")
+    
+    best_params, best_result = _run_parameter_sweep('RSI', StrategyType.RSI_STRATEGY, parameter_sets)
     
     logger.info("=== RSI 최적화 완료 ===")
     logger.info(f"최적 파라미터: {best_params}")
-    logger.info(f"최고 샤프 비율: {best_sharpe:.3f}")
+    if best_result is not None:
+        logger.info(f"최고 샤프 비율: {best_result['sharpe_ratio']:.3f}")
     
     return best_params, best_result
 
@@ -13,6 +13,7 @@ from dataclasses import dataclass
 from enum import Enum
 import json
 from scipy.optimize import minimize
+from scipy.linalg import cho_factor, cho_solve, LinAlgError
 from scipy.stats import norm
 import cvxpy as cp
 from loguru import logger
@@ -65,6 +66,83 @@ class Portfolio:
     timestamp: datetime
     metadata: Dict = None
 
+class EWMACovarianceEstimator:
+    """증분 EWMA 평균/공분산 추정기
+    
+    새 수익률 행 하나당 O(N²)로 갱신되며, 어느 시점에서든 현재 추정치를 꺼낼 수 있습니다.
+    결과는 pandas returns.ewm(halflife=...).cov() / .mean()의 마지막 값과 같습니다.
+    (adjust=True, bias=False, 결측값 없는 행 기준)
+    """
+    
+    def __init__(self, n_assets: int, halflife: float = 60, columns: List[str] = None):
+        self.n_assets = n_assets
+        self.halflife = halflife
+        self.columns = list(columns) if columns is not None else None
+        self.decay = np.exp(np.log(0.5) / halflife)  # 1 - alpha (halflife 기준 감쇠율)
+        
+        self.count = 0
+        self._mean = np.zeros(n_assets)
+        self._cov = np.zeros((n_assets, n_assets))
+        self._sum = np.zeros(n_assets)      # 단순 평균용 누적합
+        self._weight_sum = 0.0              # Σ w_i
+        self._weight_sq_sum = 0.0           # Σ w_i² (편향 보정용)
+    
+    @classmethod
+    def from_returns(cls, returns: pd.DataFrame, halflife: float = 60) -> 'EWMACovarianceEstimator':
+        """수익률 DataFrame 전체로 추정기 생성"""
+        estimator = cls(len(returns.columns), halflife, returns.columns)
+        estimator.update_many(returns.to_numpy(dtype=np.float64))
+        return estimator
+    
+    def update(self, row: np.ndarray):
+        """수익률 한 행 반영 (O(N²))"""
+        x = np.asarray(row, dtype=np.float64)
+        self.count += 1
+        self._sum += x
+        
+        if self.count == 1:
+            self._mean = x.copy()
+            self._weight_sum = 1.0
+            self._weight_sq_sum = 1.0
+            return
+        
+        # 기존 가중치 감쇠 후 새 관측치(가중치 1) 추가
+        old_weight = self._weight_sum * self.decay
+        total_weight = old_weight + 1.0
+        
+        new_mean = (old_weight * self._mean + x) / total_weight
+        old_diff = self._mean - new_mean
+        new_diff = x - new_mean
+        
+        self._cov *= old_weight
+        self._cov += old_weight * np.outer(old_diff, old_diff) + np.outer(new_diff, new_diff)
+        self._cov /= total_weight
+        
+        self._mean = new_mean
+        self._weight_sum = total_weight
+        self._weight_sq_sum = self._weight_sq_sum * self.decay * self.decay + 1.0
+    
+    def update_many(self, rows: np.ndarray):
+        """여러 행 순서대로 반영"""
+        for row in np.atleast_2d(rows):
+            self.update(row)
+    
+    def covariance(self) -> np.ndarray:
+        """현재 공분산 행렬 (편향 보정, 관측치가 1개 이하면 NaN)"""
+        numerator = self._weight_sum * self._weight_sum
+        denominator = numerator - self._weight_sq_sum
+        if self.count == 0 or denominator <= 0:
+            return np.full((self.n_assets, self.n_assets), np.nan)
+        return self._cov * (numerator / denominator)
+    
+    def mean(self) -> np.ndarray:
+        """현재 EWMA 평균 수익률"""
+        return self._mean.copy()
+    
+    def historical_mean(self) -> np.ndarray:
+        """지금까지의 단순 평균 수익률"""
+        return self._sum / self.count if self.count else np.zeros(self.n_assets)
+
 class PortfolioOptimizer:
     """포트폴리오 최적화기"""
     
@@ -100,10 +178,18 @@ class PortfolioOptimizer:
             logger.error(f"수익률 계산 실패: {e}")
             return pd.DataFrame()
 
-    def calculate_covariance_matrix(self, returns: pd.DataFrame) -> np.ndarray:
-        """공분산 행렬 계산"""
+    def calculate_covariance_matrix(self, returns: pd.DataFrame,
+                                   estimator: EWMACovarianceEstimator = None) -> np.ndarray:
+        """공분산 행렬 계산 (estimator를 주면 증분 추정기의 현재 값 사용)"""
         try:
-            # 샤플-윈도우 방법으로 공분산 행렬 계산
+            if estimator is not None:
+                return estimator.covariance()
+            
+            if not returns.isna().to_numpy().any():
+                # 전체 T x N x N 패널을 만들지 않고 마지막 행렬만 계산
+                return EWMACovarianceEstimator.from_returns(returns, halflife=60).covariance()
+            
+            # 결측값이 있으면 pandas 방식 (ignore_na 등 세부 동작 유지)
             cov_matrix = returns.ewm(halflife=60).cov()
             
             # 최근 공분산 행렬 추출
@@ -115,12 +201,21 @@ class PortfolioOptimizer:
             logger.error(f"공분산 행렬 계산 실패: {e}")
             return np.eye(len(returns.columns))
 
-    def estimate_expected_returns(self, returns: pd.DataFrame, method: str = "historical") -> np.ndarray:
-        """기대수익률 추정"""
+    def estimate_expected_returns(self, returns: pd.DataFrame, method: str = "historical",
+                                  estimator: EWMACovarianceEstimator = None) -> np.ndarray:
+        """기대수익률 추정 (estimator를 주면 증분 추정기의 평균 사용)"""
         try:
             if method == "historical":
                 # 과거 평균 수익률
-                expected_returns = returns.mean().values * 252  # 연율화
+                if estimator is not None:
+                    expected_returns = estimator.historical_mean() * 252
+                else:
+                    expected_returns = returns.mean().values * 252  # 연율화
+            elif method == "ewma":
+                # 지수가중 평균 수익률
+                if estimator is None:
+                    estimator = EWMACovarianceEstimator.from_returns(returns, halflife=60)
+                expected_returns = estimator.mean() * 252
             elif method == "capm":
                 # CAPM 기반 기대수익률
                 market_return = returns.mean().mean() * 252
@@ -128,7 +223,7 @@ class PortfolioOptimizer:
                 expected_returns = self.risk_free_rate + betas * (market_return - self.risk_free_rate)
             elif method == "black_litterman":
                 # Black-Litterman 모델
-                expected_returns = self._black_litterman_returns(returns)
+                expected_returns = self._black_litterman_returns(returns, estimator)
             else:
                 expected_returns = returns.mean().values * 252
             
@@ -158,7 +253,8 @@ class PortfolioOptimizer:
             logger.error(f"베타 계산 실패: {e}")
             return np.ones(len(returns.columns))
 
-    def _black_litterman_returns(self, returns: pd.DataFrame) -> np.ndarray:
+    def _black_litterman_returns(self, returns: pd.DataFrame,
+                                 estimator: EWMACovarianceEstimator = None) -> np.ndarray:
         """Black-Litterman 모델 기대수익률"""
         try:
             # 시장 균형 기대수익률 (CAPM 기반)
@@ -171,7 +267,7 @@ class PortfolioOptimizer:
             
             # 관점의 불확실성
             tau = 0.05  # 스케일링 팩터
-            cov_matrix = self.calculate_covariance_matrix(returns)
+            cov_matrix = self.calculate_covariance_matrix(returns, estimator)
             omega = tau * cov_matrix
             
             # Black-Litterman 공식
@@ -187,8 +283,13 @@ class PortfolioOptimizer:
             return returns.mean().values * 252
 
     def optimize_portfolio(self, returns: pd.DataFrame, method: OptimizationMethod = OptimizationMethod.MAX_SHARPE,
-                         constraints: Dict = None) -> Portfolio:
-        """포트폴리오 최적화"""
+                         constraints: Dict = None, estimator: EWMACovarianceEstimator = None,
+                         initial_weights: np.ndarray = None) -> Portfolio:
+        """포트폴리오 최적화
+        
+        estimator: returns까지 반영된 증분 추정기
+        initial_weights: 수치 최적화 시작점 (리밸런싱 시 직전 가중치)
+        """
         try:
             logger.info(f"포트폴리오 최적화 시작: {method.value}")
             
@@ -197,23 +298,23 @@ class PortfolioOptimizer:
                 constraints = self.constraints
             
             # 기대수익률과 공분산 행렬 계산
-            expected_returns = self.estimate_expected_returns(returns)
-            cov_matrix = self.calculate_covariance_matrix(returns)
+            expected_returns = self.estimate_expected_returns(returns, estimator=estimator)
+            cov_matrix = self.calculate_covariance_matrix(returns, estimator)
             
             n_assets = len(returns.columns)
             
             if method == OptimizationMethod.MARKOWITZ:
-                weights = self._markowitz_optimization(expected_returns, cov_matrix, constraints)
+                weights = self._markowitz_optimization(expected_returns, cov_matrix, constraints, initial_weights)
             elif method == OptimizationMethod.MAX_SHARPE:
-                weights = self._max_sharpe_optimization(expected_returns, cov_matrix, constraints)
+                weights = self._max_sharpe_optimization(expected_returns, cov_matrix, constraints, initial_weights)
             elif method == OptimizationMethod.MIN_VARIANCE:
-                weights = self._min_variance_optimization(cov_matrix, constraints)
+                weights = self._min_variance_optimization(cov_matrix, constraints, initial_weights)
             elif method == OptimizationMethod.RISK_PARITY:
-                weights = self._risk_parity_optimization(cov_matrix, constraints)
+                weights = self._risk_parity_optimization(cov_matrix, constraints, initial_weights)
             elif method == OptimizationMethod.EQUAL_WEIGHT:
                 weights = np.ones(n_assets) / n_assets
             else:
-                weights = self._max_sharpe_optimization(expected_returns, cov_matrix, constraints)
+                weights = self._max_sharpe_optimization(expected_returns, cov_matrix, constraints, initial_weights)
             
             # 포트폴리오 성과 계산
             portfolio = self._calculate_portfolio_performance(
@@ -227,33 +328,75 @@ class PortfolioOptimizer:
             logger.error(f"포트폴리오 최적화 실패: {e}")
             return self._create_default_portfolio(returns.columns)
 
+    def _initial_weights(self, n_assets: int, initial_weights: np.ndarray = None) -> np.ndarray:
+        """수치 최적화 시작점 (직전 가중치를 경계 안으로 맞추고, 없으면 등가중)"""
+        if initial_weights is None or len(initial_weights) != n_assets:
+            return np.ones(n_assets) / n_assets
+        
+        weights = np.clip(np.asarray(initial_weights, dtype=np.float64), self.min_weight, self.max_weight)
+        total = weights.sum()
+        if not np.isfinite(total) or total <= 0:
+            return np.ones(n_assets) / n_assets
+        return weights / total
+    
+    def _within_bounds(self, weights: np.ndarray) -> bool:
+        """닫힌 해가 가중치 경계 안에 있는지 (안에 있으면 경계 제약 문제의 해와 같음)"""
+        tolerance = 1e-10
+        return bool(np.all(np.isfinite(weights)) and
+                    np.all(weights >= self.min_weight - tolerance) and
+                    np.all(weights <= self.max_weight + tolerance))
+    
+    @staticmethod
+    def _factorize(cov_matrix: np.ndarray):
+        """공분산 행렬 촐레스키 분해 (양의 정부호가 아니면 None)"""
+        try:
+            return cho_factor(cov_matrix)
+        except (LinAlgError, ValueError):
+            return None
+    
     def _markowitz_optimization(self, expected_returns: np.ndarray, cov_matrix: np.ndarray, 
-                              constraints: Dict) -> np.ndarray:
+                              constraints: Dict, initial_weights: np.ndarray = None) -> np.ndarray:
         """마코위츠 최적화"""
         try:
             n_assets = len(expected_returns)
+            ones = np.ones(n_assets)
+            
+            # 닫힌 해: 가중치 합/목표 수익률 등식 제약만 있는 경우
+            factor = self._factorize(cov_matrix)
+            if factor is not None:
+                inv_ones = cho_solve(factor, ones)
+                inv_returns = cho_solve(factor, expected_returns)
+                a, b, c = ones @ inv_ones, ones @ inv_returns, expected_returns @ inv_returns
+                det = a * c - b * b
+                if abs(det) > 1e-12:
+                    weights = ((c - b * self.target_return) * inv_ones +
+                               (a * self.target_return - b) * inv_returns) / det
+                    if self._within_bounds(weights):
+                        return weights
             
             # 목적 함수: 위험 최소화 (수익률 제약 조건 하에서)
             def objective(weights):
                 portfolio_variance = weights.T @ cov_matrix @ weights
                 return portfolio_variance
             
+            def gradient(weights):
+                return 2 * (cov_matrix @ weights)
+            
             # 제약 조건
             constraints_list = [
-                {'type': 'eq', 'fun': lambda x: np.sum(x) - 1},  # 가중치 합 = 1
-                {'type': 'eq', 'fun': lambda x: x @ expected_returns - self.target_return}  # 목표 수익률
+                {'type': 'eq', 'fun': lambda x: np.sum(x) - 1, 'jac': lambda x: ones},  # 가중치 합 = 1
+                {'type': 'eq', 'fun': lambda x: x @ expected_returns - self.target_return,
+                 'jac': lambda x: expected_returns}  # 목표 수익률
             ]
             
             # 경계 조건
             bounds = [(self.min_weight, self.max_weight)] * n_assets
             
-            # 초기 가중치 (등가중)
-            initial_weights = np.ones(n_assets) / n_assets
-            
             # 최적화
             result = minimize(
-                objective, initial_weights,
+                objective, self._initial_weights(n_assets, initial_weights),
                 method='SLSQP',
+                jac=gradient,
                 bounds=bounds,
                 constraints=constraints_list
             )
@@ -269,10 +412,20 @@ class PortfolioOptimizer:
             return np.ones(len(expected_returns)) / len(expected_returns)
 
     def _max_sharpe_optimization(self, expected_returns: np.ndarray, cov_matrix: np.ndarray,
-                               constraints: Dict) -> np.ndarray:
+                               constraints: Dict, initial_weights: np.ndarray = None) -> np.ndarray:
         """최대 샤프 비율 최적화"""
         try:
             n_assets = len(expected_returns)
+            ones = np.ones(n_assets)
+            
+            # 닫힌 해: 접점 포트폴리오 (Σ⁻¹(μ - rf))
+            factor = self._factorize(cov_matrix)
+            if factor is not None:
+                tangency = cho_solve(factor, expected_returns - self.risk_free_rate)
+                if tangency.sum() > 1e-12:
+                    weights = tangency / tangency.sum()
+                    if self._within_bounds(weights):
+                        return weights
             
             # 목적 함수: 샤프 비율 최대화 (음수로 변환하여 최소화)
             def objective(weights):
@@ -281,21 +434,25 @@ class PortfolioOptimizer:
                 sharpe_ratio = (portfolio_return - self.risk_free_rate) / portfolio_volatility
                 return -sharpe_ratio  # 최대화를 위해 음수 반환
             
+            def gradient(weights):
+                cov_weights = cov_matrix @ weights
+                portfolio_volatility = np.sqrt(weights @ cov_weights)
+                excess_return = weights @ expected_returns - self.risk_free_rate
+                return -expected_returns / portfolio_volatility + excess_return * cov_weights / portfolio_volatility ** 3
+            
             # 제약 조건
             constraints_list = [
-                {'type': 'eq', 'fun': lambda x: np.sum(x) - 1}  # 가중치 합 = 1
+                {'type': 'eq', 'fun': lambda x: np.sum(x) - 1, 'jac': lambda x: ones}  # 가중치 합 = 1
             ]
             
             # 경계 조건
             bounds = [(self.min_weight, self.max_weight)] * n_assets
             
-            # 초기 가중치
-            initial_weights = np.ones(n_assets) / n_assets
-            
             # 최적화
             result = minimize(
-                objective, initial_weights,
+                objective, self._initial_weights(n_assets, initial_weights),
                 method='SLSQP',
+                jac=gradient,
                 bounds=bounds,
                 constraints=constraints_list
             )
@@ -310,30 +467,41 @@ class PortfolioOptimizer:
             logger.error(f"최대 샤프 비율 최적화 실패: {e}")
             return np.ones(len(expected_returns)) / len(expected_returns)
 
-    def _min_variance_optimization(self, cov_matrix: np.ndarray, constraints: Dict) -> np.ndarray:
+    def _min_variance_optimization(self, cov_matrix: np.ndarray, constraints: Dict,
+                                   initial_weights: np.ndarray = None) -> np.ndarray:
         """최소 분산 최적화"""
         try:
             n_assets = len(cov_matrix)
+            ones = np.ones(n_assets)
+            
+            # 닫힌 해: Σ⁻¹1 / 1'Σ⁻¹1
+            factor = self._factorize(cov_matrix)
+            if factor is not None:
+                inv_ones = cho_solve(factor, ones)
+                weights = inv_ones / inv_ones.sum()
+                if self._within_bounds(weights):
+                    return weights
             
             # 목적 함수: 포트폴리오 분산 최소화
             def objective(weights):
                 return weights.T @ cov_matrix @ weights
             
+            def gradient(weights):
+                return 2 * (cov_matrix @ weights)
+            
             # 제약 조건
             constraints_list = [
-                {'type': 'eq', 'fun': lambda x: np.sum(x) - 1}  # 가중치 합 = 1
+                {'type': 'eq', 'fun': lambda x: np.sum(x) - 1, 'jac': lambda x: ones}  # 가중치 합 = 1
             ]
             
             # 경계 조건
             bounds = [(self.min_weight, self.max_weight)] * n_assets
             
-            # 초기 가중치
-            initial_weights = np.ones(n_assets) / n_assets
-            
             # 최적화
             result = minimize(
-                objective, initial_weights,
+                objective, self._initial_weights(n_assets, initial_weights),
                 method='SLSQP',
+                jac=gradient,
                 bounds=bounds,
                 constraints=constraints_list
             )
@@ -348,10 +516,12 @@ class PortfolioOptimizer:
             logger.error(f"최소 분산 최적화 실패: {e}")
             return np.ones(len(cov_matrix)) / len(cov_matrix)
 
-    def _risk_parity_optimization(self, cov_matrix: np.ndarray, constraints: Dict) -> np.ndarray:
+    def _risk_parity_optimization(self, cov_matrix: np.ndarray, constraints: Dict,
+                                  initial_weights: np.ndarray = None) -> np.ndarray:
         """리스크 패리티 최적화"""
         try:
             n_assets = len(cov_matrix)
+            ones = np.ones(n_assets)
             
             # 목적 함수: 리스크 기여도 차이 최소화
             def objective(weights):
@@ -361,21 +531,29 @@ class PortfolioOptimizer:
                 risk_diff = risk_contributions - target_risk
                 return np.sum(risk_diff ** 2)
             
+            def gradient(weights):
+                cov_weights = cov_matrix @ weights
+                portfolio_volatility = np.sqrt(weights @ cov_weights)
+                risk_diff = weights * cov_weights / portfolio_volatility - portfolio_volatility / n_assets
+                # d(RC_i)/dw = (diag(Σw) + diag(w)Σ)/σ - (w∘Σw)(Σw)'/σ³, d(σ/n)/dw = Σw/(nσ)
+                weighted = ((risk_diff @ (weights * cov_weights)) / portfolio_volatility ** 3 +
+                            risk_diff.sum() / (n_assets * portfolio_volatility))
+                return 2 * ((risk_diff * cov_weights + cov_matrix @ (risk_diff * weights)) / portfolio_volatility -
+                            weighted * cov_weights)
+            
             # 제약 조건
             constraints_list = [
-                {'type': 'eq', 'fun': lambda x: np.sum(x) - 1}  # 가중치 합 = 1
+                {'type': 'eq', 'fun': lambda x: np.sum(x) - 1, 'jac': lambda x: ones}  # 가중치 합 = 1
             ]
             
             # 경계 조건
             bounds = [(self.min_weight, self.max_weight)] * n_assets
             
-            # 초기 가중치
-            initial_weights = np.ones(n_assets) / n_assets
-            
             # 최적화
             result = minimize(
-                objective, initial_weights,
+                objective, self._initial_weights(n_assets, initial_weights),
                 method='SLSQP',
+                jac=gradient,
                 bounds=bounds,
                 constraints=constraints_list
             )
@@ -484,13 +662,13 @@ class PortfolioOptimizer:
         )
 
     def rebalance_portfolio(self, current_portfolio: Portfolio, new_signals: Dict[str, float],
-                          returns: pd.DataFrame) -> Portfolio:
-        """포트폴리오 리밸런싱"""
+                          returns: pd.DataFrame, estimator: EWMACovarianceEstimator = None) -> Portfolio:
+        """포트폴리오 리밸런싱 (estimator: returns까지 반영된 증분 추정기)"""
         try:
             logger.info("포트폴리오 리밸런싱 시작")
             
             # 새로운 신호를 반영한 기대수익률 조정
-            current_returns = self.estimate_expected_returns(returns)
+            current_returns = self.estimate_expected_returns(returns, estimator=estimator)
             
             # 신호에 따른 기대수익률 조정
             adjusted_returns = current_returns.copy()
@@ -502,8 +680,9 @@ class PortfolioOptimizer:
                     adjusted_returns[idx] += adjustment
             
             # 최적화 실행
-            cov_matrix = self.calculate_covariance_matrix(returns)
-            new_weights = self._max_sharpe_optimization(adjusted_returns, cov_matrix, self.constraints)
+            cov_matrix = self.calculate_covariance_matrix(returns, estimator)
+            new_weights = self._max_sharpe_optimization(adjusted_returns, cov_matrix, self.constraints,
+                                                        current_portfolio.weights)
             
             # 새로운 포트폴리오 생성
             new_portfolio = self._calculate_portfolio_performance(
@@ -550,19 +729,29 @@ class PortfolioOptimizer:
             weights_history = []
             performance_metrics = []
             
+            # 증분 공분산 추정기 (리밸런싱마다 전체 이력을 다시 계산하지 않음)
+            values = returns.to_numpy(dtype=np.float64)
+            estimator = EWMACovarianceEstimator(len(returns.columns), halflife=60, columns=returns.columns)
+            use_estimator = not np.isnan(values).any()
+            
             # 초기 포트폴리오 생성
             initial_returns = returns.iloc[:60]  # 처음 60일 데이터로 초기 포트폴리오 생성
-            current_portfolio = self.optimize_portfolio(initial_returns)
+            if use_estimator:
+                estimator.update_many(values[:60])
+            current_portfolio = self.optimize_portfolio(initial_returns,
+                                                        estimator=estimator if use_estimator else None)
             
             # 백테스팅 루프
             for i in range(60, len(returns), rebalance_frequency):
                 # 현재 시점까지의 데이터
                 current_data = returns.iloc[:i+1]
+                if use_estimator:
+                    estimator.update_many(values[estimator.count:i+1])
                 
                 # 리밸런싱
                 if i > 60:  # 첫 번째는 제외
                     current_portfolio = self.rebalance_portfolio(
-                        current_portfolio, {}, current_data
+                        current_portfolio, {}, current_data, estimator if use_estimator else None
                     )
                 
                 # 포트폴리오 가치 계산
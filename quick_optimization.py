@@ -15,8 +15,9 @@ import numpy as np
 # 프로젝트 모듈 import
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from backtesting_system import BacktestingEngine, BacktestConfig, BacktestMode
+from backtesting_system import BacktestConfig, BacktestMode
 from trading_strategy import create_default_strategies, StrategyConfig, StrategyType
+from backtest_sweep import SweepTask, compare_backtests, strategy_configs_from_manager
 
 def analyze_current_issues():
     """현재 문제점 분석"""
@@ -74,13 +75,8 @@ def create_improved_strategies():
     
     return strategy_manager
 
-def test_improved_strategies():
-    """개선된 전략 테스트"""
-    logger.info("=== 개선된 전략 테스트 ===")
-    
-    # 개선된 전략 생성
-    improved_strategies = create_improved_strategies()
-    
+def _improved_task() -> SweepTask:
+    """개선된 전략 백테스트 작업"""
     # 개선된 백테스트 설정
     config = BacktestConfig(
         mode=BacktestMode.SINGLE_STOCK,
@@ -95,37 +91,11 @@ def test_improved_strategies():
         stop_loss_rate=0.05,         # 5% 손절
         take_profit_rate=0.15        # 15% 익절
     )
-    
-    engine = BacktestingEngine(config)
-    engine.add_strategy(improved_strategies)
-    
-    # 데이터 로드
-    success = engine.load_data(['005930.KS'], data_source="yahoo")
-    if not success:
-        logger.error("데이터 로드 실패")
-        return None
-    
-    # 백테스트 실행
-    result = engine.run_backtest()
-    
-    if result:
-        logger.info("=== 개선된 전략 성과 ===")
-        logger.info(f"총 거래 수: {result.total_trades}회")
-        logger.info(f"승률: {result.win_rate:.2f}%")
-        logger.info(f"총 수익률: {result.total_return:.2f}%")
-        logger.info(f"연간 수익률: {result.annual_return:.2f}%")
-        logger.info(f"최대 낙폭: {result.max_drawdown:.2f}%")
-        logger.info(f"샤프 비율: {result.sharpe_ratio:.2f}")
-        
-        return result
-    else:
-        logger.error("개선된 전략 테스트 실패")
-        return None
+    return SweepTask(config, strategy_configs_from_manager(create_improved_strategies()),
+                     ['005930.KS'], name='개선된 전략')
 
-def test_conservative_strategy():
-    """보수적인 전략 테스트"""
-    logger.info("=== 보수적인 전략 테스트 ===")
-    
+def _conservative_task() -> SweepTask:
+    """보수적인 전략 백테스트 작업"""
     from trading_strategy import StrategyManager, MovingAverageCrossoverStrategy
     
     strategy_manager = StrategyManager()
@@ -156,41 +126,11 @@ def test_conservative_strategy():
         stop_loss_rate=0.03,         # 3% 손절
         take_profit_rate=0.10        # 10% 익절
     )
-    
-    engine = BacktestingEngine(config)
-    engine.add_strategy(strategy_manager)
-    
-    # 데이터 로드
-    success = engine.load_data(['005930.KS'], data_source="yahoo")
-    if not success:
-        logger.error("데이터 로드 실패")
-        return None
-    
-    # 백테스트 실행
-    result = engine.run_backtest()
-    
-    if result:
-        logger.info("=== 보수적인 전략 성과 ===")
-        logger.info(f"총 거래 수: {result.total_trades}회")
-        logger.info(f"승률: {result.win_rate:.2f}%")
-        logger.info(f"총 수익률: {result.total_return:.2f}%")
-        logger.info(f"연간 수익률: {result.annual_return:.2f}%")
-        logger.info(f"최대 낙폭: {result.max_drawdown:.2f}%")
-        logger.info(f"샤프 비율: {result.sharpe_ratio:.2f}")
-        
-        return result
-    else:
-        logger.error("보수적인 전략 테스트 실패")
-        return None
+    return SweepTask(config, strategy_configs_from_manager(strategy_manager),
+                     ['005930.KS'], name='보수적인 전략')
 
-def compare_strategies():
-    """전략 비교"""
-    logger.info("=== 전략 비교 ===")
-    
-    results = {}
-    
-    # 1. 현재 전략 (기본)
-    logger.info("1. 현재 전략 테스트 중...")
+def _current_task() -> SweepTask:
+    """현재 전략(기본) 백테스트 작업"""
     config = BacktestConfig(
         mode=BacktestMode.SINGLE_STOCK,
         start_date="2023-02-15",
@@ -202,47 +142,59 @@ def compare_strategies():
         max_positions=20,
         position_size_ratio=0.02
     )
+    return SweepTask(config, strategy_configs_from_manager(create_default_strategies()),
+                     ['005930.KS'], name='현재 전략')
+
+def _run_single(task: SweepTask):
+    """작업 하나를 실행하고 성과 로그 (결과 행 반환)"""
+    table = compare_backtests([task])
+    if table.empty:
+        logger.error(f"{task.name} 테스트 실패")
+        return None
     
-    engine = BacktestingEngine(config)
-    strategy_manager = create_default_strategies()
-    engine.add_strategy(strategy_manager)
-    
-    success = engine.load_data(['005930.KS'], data_source="yahoo")
-    if success:
-        result = engine.run_backtest()
-        if result:
-            results['현재 전략'] = result
-    
-    # 2. 개선된 전략
-    logger.info("2. 개선된 전략 테스트 중...")
-    improved_result = test_improved_strategies()
-    if improved_result:
-        results['개선된 전략'] = improved_result
+    result = table.iloc[0]
+    logger.info(f"=== {task.name} 성과 ===")
+    logger.info(f"총 거래 수: {result['total_trades']:.0f}회")
+    logger.info(f"승률: {result['win_rate']:.2f}%")
+    logger.info(f"총 수익률: {result['total_return']:.2f}%")
+    logger.info(f"연간 수익률: {result['annual_return']:.2f}%")
+    logger.info(f"최대 낙폭: {result['max_drawdown']:.2f}%")
+    logger.info(f"샤프 비율: {result['sharpe_ratio']:.2f}")
+    return result
+
+def test_improved_strategies():
+    """개선된 전략 테스트"""
+    logger.info("=== 개선된 전략 테스트 ===")
+    return _run_single(_improved_task())
+
+def test_conservative_strategy():
+    """보수적인 전략 테스트"""
+    logger.info("=== 보수적인 전략 테스트 ===")
+    return _run_single(_conservative_task())
+
+def compare_strategies():
+    """전략 비교 (데이터 1회 로드 후 세 전략을 병렬 백테스트)"""
+    logger.info("=== 전략 비교 ===")
     
-    # 3. 보수적인 전략
-    logger.info("3. 보수적인 전략 테스트 중...")
-    conservative_result = test_conservative_strategy()
-    if conservative_result:
-        results['보수적인 전략'] = conservative_result
+    table = compare_backtests([_current_task(), _improved_task(), _conservative_task()])
+    results = {row['name']: row for _, row in table.iterrows()}
     
     # 결과 비교
     logger.info("\n=== 전략별 성과 비교 ===")
     for name, result in results.items():
         logger.info(f"\n{name}:")
-        logger.info(f"  거래 수: {result.total_trades}회")
-        logger.info(f"  승률: {result.win_rate:.2f}%")
-        logger.info(f"  수익률: {result.total_return:.2f}%")
-        logger.info(f"  샤프 비율: {result.sharpe_ratio:.2f}")
-        logger.info(f"  최대 낙폭: {result.max_drawdown:.2f}%")
+        logger.info(f"  거래 수: {result['total_trades']:.0f}회")
+        logger.info(f"  승률: {result['win_rate']:.2f}%")
+        logger.info(f"  수익률: {result['total_return']:.2f}%")
+        logger.info(f"  샤프 비율: {result['sharpe_ratio']:.2f}")
+        logger.info(f"  최대 낙폭: {result['max_drawdown']:.2f}%")
     
-    # 최고 성과 전략 찾기
+    # 최고 성과 전략 찾기 (비교 테이블은 샤프 비율 내림차순)
     best_strategy = None
     best_sharpe = -999
-    
-    for name, result in results.items():
-        if result.sharpe_ratio > best_sharpe:
-            best_sharpe = result.sharpe_ratio
-            best_strategy = name
+    if not table.empty:
+        best_strategy = table.iloc[0]['name']
+        best_sharpe = table.iloc[0]['sharpe_ratio']
     
     logger.info(f"\n🎯 최고 성과 전략: {best_strategy}")
     logger.info(f"   샤프 비율: {best_sharpe:.2f}")
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+키움 실시간 데이터 디코더
+OnReceiveRealData의 real_data 문자열(탭 구분, 실시간 타입별 고정 FID 순서)을
+한 번에 분리해 타입이 있는 레코드로 변환합니다.
+
+- 틱마다 GetCommRealData COM 호출을 FID 수만큼 반복하지 않음
+- 실시간 타입별 FID 순서 → 오프셋 조회표는 미리 계산해 재사용
+- 값이 부족한(형식이 다른) 데이터는 None을 반환하므로 호출 측에서 GetCommRealData로 대체
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# 실시간 타입별 real_data FID 순서 (KOA Studio 실시간 목록 기준)
+REAL_DATA_LAYOUTS: Dict[str, Tuple[int, ...]] = {
+    "주식체결": (
+        20, 10, 11, 12, 27, 28, 15, 13, 14, 16, 17, 18, 25, 26, 29, 30, 31, 32, 228, 311,
+        290, 691, 567, 568, 851, 1890, 1891, 1892, 1030, 1031, 1032, 1071, 1072, 1313, 1315,
+        1316, 1314, 1497, 1498, 620, 732, 852, 9081
+    ),
+}
+
+# 체결 레코드 필드별 FID
+STOCK_TICK_FIDS = {
+    'trade_time': 20,      # 체결시간 (HHMMSS)
+    'current_price': 10,   # 현재가 (부호는 전일 대비 방향)
+    'change': 11,          # 전일대비
+    'change_rate': 12,     # 등락율
+    'volume': 15,          # 체결량 (부호는 매수/매도 체결 구분)
+    'total_volume': 13,    # 누적거래량
+    'open_price': 16,
+    'high_price': 17,
+    'low_price': 18,
+}
+
+@dataclass
+class StockTick:
+    """실시간 체결 레코드"""
+    code: str
+    current_price: int
+    volume: int
+    change: int
+    change_rate: float
+    open_price: int
+    high_price: int
+    low_price: int
+    total_volume: int
+    trade_time: str = ""
+
+@lru_cache(maxsize=256)
+def fid_offsets(real_type: str, fids: Tuple[int, ...]) -> Optional[Tuple[int, ...]]:
+    """실시간 타입의 real_data에서 FID 목록 각각의 위치 (레이아웃에 없는 FID가 있으면 None)"""
+    layout = REAL_DATA_LAYOUTS.get(real_type)
+    if layout is None:
+        return None
+    index = {fid: i for i, fid in enumerate(layout)}
+    try:
+        return tuple(index[fid] for fid in fids)
+    except KeyError:
+        return None
+
+def parse_fid_list(fid_list: str) -> Tuple[int, ...]:
+    """'10;15;12' 형식 FID 목록을 튜플로 변환"""
+    return tuple(int(fid) for fid in fid_list.split(';') if fid.strip())
+
+class RealDataDecoder:
+    """실시간 데이터 디코더 (탭 구분 문자열을 한 번만 분리)"""
+
+    def __init__(self):
+        fids = tuple(STOCK_TICK_FIDS.values())
+        self._tick_offsets = fid_offsets("주식체결", fids)
+        self._tick_width = max(self._tick_offsets) + 1
+
+    def split(self, real_type: str, real_data: str, fids: Sequence[int]) -> Optional[List[str]]:
+        """real_data에서 FID 목록 순서대로 값 문자열 추출 (형식이 맞지 않으면 None)"""
+        offsets = fid_offsets(real_type, tuple(fids))
+        if offsets is None or not real_data:
+            return None
+        values = real_data.split('\t')
+        if len(values) <= max(offsets, default=-1):
+            return None
+        return [values[offset].strip() for offset in offsets]
+
+    def decode_stock_tick(self, code: str, real_data: str) -> Optional[StockTick]:
+        """주식체결 real_data를 체결 레코드로 변환 (형식이 맞지 않으면 None)"""
+        if not real_data:
+            return None
+        values = real_data.split('\t')
+        if len(values) < self._tick_width:
+            return None
+        return self._build_tick(code, [values[offset] for offset in self._tick_offsets])
+
+    def decode_stock_tick_from(self, code: str, get_value: Callable[[int], str]) -> Optional[StockTick]:
+        """FID별 조회 함수(GetCommRealData 등)로 체결 레코드 생성 (real_data가 없을 때의 대체 경로)"""
+        return self._build_tick(code, [get_value(fid) for fid in STOCK_TICK_FIDS.values()])
+
+    def _build_tick(self, code: str, raw: List[str]) -> Optional[StockTick]:
+        """STOCK_TICK_FIDS 순서의 값 문자열을 변환 (가격/체결량은 부호 제거)"""
+        try:
+            trade_time, price, change, change_rate, volume, total_volume, open_price, high_price, low_price = raw
+            return StockTick(
+                code=code,
+                current_price=abs(int(price)),
+                volume=abs(int(volume)),
+                change=int(change),
+                change_rate=float(change_rate),
+                open_price=abs(int(open_price)),
+                high_price=abs(int(high_price)),
+                low_price=abs(int(low_price)),
+                total_volume=int(total_volume),
+                trade_time=str(trade_time).strip()
+            )
+        except (TypeError, ValueError):
+            return None
+
+def encode_real_data(real_type: str, values: Dict[int, str]) -> str:
+    """FID별 값으로 real_data 문자열 생성 (기록 데이터/모의 환경용, 없는 FID는 빈 값)"""
+    return '\t'.join(str(values.get(fid, '')) for fid in REAL_DATA_LAYOUTS[real_type])
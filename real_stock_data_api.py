@@ -6,7 +6,6 @@
 """
 
 import sys
-import time
 import json
 import requests
 import pandas as pd
@@ -17,6 +16,8 @@ from dataclasses import dataclass
 from loguru import logger
 import yfinance as yf
 
+from bulk_price_loader import BulkPriceLoader, APITransport, PriceTransport
+
 # 한국투자증권 API 관련
 try:
     from kiwoom_api import KiwoomAPI
@@ -34,11 +35,28 @@ class StockData:
 class StockDataAPI:
     """주식 데이터 API 클래스"""
     
-    def __init__(self, data_source: str = "yahoo"):
+    def __init__(self, data_source: str = "yahoo", transport: PriceTransport = None,
+                 max_workers: int = 8, requests_per_second: float = 10.0, cache_dir: str = None):
+        """
+        transport: 다중 종목 조회 방식 (기본값은 data_source 원본 조회)
+        max_workers / requests_per_second: 다중 종목 동시 요청 수 / 초당 요청 수 제한
+        cache_dir: 종목별 디스크 캐시 경로 (지정하면 다중 종목 조회 시 비어 있는 구간만 조회)
+        """
         self.data_source = data_source
         self.cache = {}
         self.cache_duration = timedelta(hours=1)
         
+        # 다중 종목 대량 로더 (키움 OCX는 단일 스레드 전용이므로 호출 스레드에서 순서대로 조회)
+        if transport is None and data_source == "kiwoom":
+            max_workers = 1
+        self.bulk_loader = BulkPriceLoader(
+            transport or APITransport(self),
+            max_workers=max_workers,
+            requests_per_second=requests_per_second,
+            cache_dir=cache_dir,
+            adjusted=data_source == "yahoo"
+        )
+        
         # 한국투자증권 API 초기화
         self.kiwoom_api = None
         if KiwoomAPI and data_source == "kiwoom":
@@ -96,74 +114,95 @@ class StockDataAPI:
             logger.error(f"데이터 가져오기 오류 ({code}): {e}")
             return None
     
+    def fetch_source_data(self, code: str, start_date: str, end_date: str,
+                          interval: str = "1d") -> Optional[pd.DataFrame]:
+        """원본 소스에서 OHLCV 조회 (대량 로더용, 네트워크 오류는 재시도할 수 있도록 예외로 전달)"""
+        if self.data_source == "yahoo":
+            return self._download_yahoo_data(code, start_date, end_date, interval)
+        elif self.data_source == "kiwoom":
+            return self._download_kiwoom_data(code, start_date, end_date, interval)
+        
+        logger.error(f"지원하지 않는 데이터 소스: {self.data_source}")
+        return None
+    
     def _get_yahoo_data(self, code: str, start_date: str, end_date: str, 
                        interval: str) -> Optional[pd.DataFrame]:
         """야후 파이낸스에서 데이터 가져오기"""
         try:
-            # 한국 주식 코드 변환 (예: 005930 -> 005930.KS)
-            if code.isdigit() and len(code) == 6:
-                yahoo_code = f"{code}.KS"
-            else:
-                yahoo_code = code
-            
-            # 데이터 다운로드
-            ticker = yf.Ticker(yahoo_code)
-            data = ticker.history(start=start_date, end=end_date, interval=interval)
-            
-            if data.empty:
-                return None
-            
-            # 컬럼명 정규화
-            data.columns = [col.lower() for col in data.columns]
-            
-            # 필요한 컬럼만 선택
-            required_columns = ['open', 'high', 'low', 'close', 'volume']
-            for col in required_columns:
-                if col not in data.columns:
-                    data[col] = 0
-            
-            return data[required_columns]
+            return self._download_yahoo_data(code, start_date, end_date, interval)
             
         except Exception as e:
             logger.error(f"야후 데이터 가져오기 오류: {e}")
             return None
     
+    def _download_yahoo_data(self, code: str, start_date: str, end_date: str,
+                             interval: str) -> Optional[pd.DataFrame]:
+        """야후 파이낸스 다운로드 (오류는 호출자에게 전달)"""
+        # 한국 주식 코드 변환 (예: 005930 -> 005930.KS)
+        if code.isdigit() and len(code) == 6:
+            yahoo_code = f"{code}.KS"
+        else:
+            yahoo_code = code
+        
+        # 데이터 다운로드
+        ticker = yf.Ticker(yahoo_code)
+        data = ticker.history(start=start_date, end=end_date, interval=interval)
+        
+        if data.empty:
+            return None
+        
+        # 컬럼명 정규화
+        data.columns = [col.lower() for col in data.columns]
+        
+        # 필요한 컬럼만 선택
+        required_columns = ['open', 'high', 'low', 'close', 'volume']
+        for col in required_columns:
+            if col not in data.columns:
+                data[col] = 0
+        
+        return data[required_columns]
+    
     def _get_kiwoom_data(self, code: str, start_date: str, end_date: str, 
                         interval: str) -> Optional[pd.DataFrame]:
         """한국투자증권 API에서 데이터 가져오기"""
-        if not self.kiwoom_api:
-            logger.error("한국투자증권 API가 초기화되지 않았습니다.")
-            return None
-        
         try:
-            # 일별 데이터 요청
-            data = self.kiwoom_api.get_daily_data(code, start_date, end_date)
-            
-            if not data:
-                return None
-            
-            # DataFrame으로 변환
-            df = pd.DataFrame(data)
-            df['date'] = pd.to_datetime(df['date'])
-            df.set_index('date', inplace=True)
-            
-            # 컬럼명 정규화
-            column_mapping = {
-                'open': 'open',
-                'high': 'high', 
-                'low': 'low',
-                'close': 'close',
-                'volume': 'volume'
-            }
-            
-            df.rename(columns=column_mapping, inplace=True)
-            
-            return df
+            return self._download_kiwoom_data(code, start_date, end_date, interval)
             
         except Exception as e:
             logger.error(f"한국투자증권 데이터 가져오기 오류: {e}")
             return None
     
+    def _download_kiwoom_data(self, code: str, start_date: str, end_date: str,
+                              interval: str) -> Optional[pd.DataFrame]:
+        """한국투자증권 API 일별 데이터 조회 (오류는 호출자에게 전달)"""
+        if not self.kiwoom_api:
+            logger.error("한국투자증권 API가 초기화되지 않았습니다.")
+            return None
+        
+        # 일별 데이터 요청
+        data = self.kiwoom_api.get_daily_data(code, start_date, end_date)
+        
+        if not data:
+            return None
+        
+        # DataFrame으로 변환
+        df = pd.DataFrame(data)
+        df['date'] = pd.to_datetime(df['date'])
+        df.set_index('date', inplace=True)
+        
+        # 컬럼명 정규화
+        column_mapping = {
+            'open': 'open',
+            'high': 'high', 
+            'low': 'low',
+            'close': 'close',
+            'volume': 'volume'
+        }
+        
+        df.rename(columns=column_mapping, inplace=True)
+        
+        return df
+    
     def _get_stock_name(self, code: str) -> str:
         """주식 종목명 가져오기"""
         # 주요 종목 매핑
@@ -184,25 +223,39 @@ class StockDataAPI:
     
     def get_multiple_stocks(self, codes: List[str], start_date: str, end_date: str,
                           interval: str = "1d") -> Dict[str, StockData]:
-        """여러 종목 데이터 가져오기"""
+        """여러 종목 데이터 가져오기 (동시 요청 + 속도 제한, 메모리 캐시에 없는 종목만 조회)"""
         results = {}
         
         logger.info(f"다중 종목 데이터 로드 시작: {len(codes)}개 종목")
         
-        for code in codes:
-            try:
-                data = self.get_stock_data(code, start_date, end_date, interval)
-                if data:
-                    results[code] = data
-                
-                # API 호출 제한 방지
-                time.sleep(0.1)
-                
-            except Exception as e:
-                logger.error(f"종목 {code} 데이터 로드 실패: {e}")
+        # 메모리 캐시 확인
+        pending = []
+        for code in dict.fromkeys(codes):
+            cached_data = self.cache.get(f"{code}_{start_date}_{end_date}_{interval}")
+            if cached_data is not None and datetime.now() - cached_data.last_updated < self.cache_duration:
+                results[code] = cached_data
+            else:
+                pending.append(code)
+        
+        if pending:
+            frames = self.bulk_loader.load(pending, start_date, end_date, interval)
+            
+            for code, df in frames.items():
+                try:
+                    stock_data = self.clean_data(StockData(
+                        code=code,
+                        name=self._get_stock_name(code),
+                        data=df,
+                        last_updated=datetime.now()
+                    ))
+                    self.cache[f"{code}_{start_date}_{end_date}_{interval}"] = stock_data
+                    results[code] = stock_data
+                    
+                except Exception as e:
+                    logger.error(f"종목 {code} 데이터 로드 실패: {e}")
         
         logger.info(f"다중 종목 데이터 로드 완료: {len(results)}개 성공")
-        return results
+        return {code: results[code] for code in dict.fromkeys(codes) if code in results}
     
     def get_market_data(self, market: str = "KOSPI", start_date: str = None, 
                        end_date: str = None) -> Dict[str, StockData]:
@@ -368,12 +421,13 @@ class DataManager:
         self.data_cache = {}
     
     def get_backtest_data(self, codes: List[str], start_date: str, end_date: str,
-                         validate: bool = True, clean: bool = True) -> Dict[str, StockData]:
+                         validate: bool = True, clean: bool = True,
+                         interval: str = "1d") -> Dict[str, StockData]:
         """백테스트용 데이터 준비"""
         logger.info("백테스트 데이터 준비 시작")
         
         # 데이터 가져오기
-        stock_data = self.api.get_multiple_stocks(codes, start_date, end_date)
+        stock_data = self.api.get_multiple_stocks(codes, start_date, end_date, interval=interval)
         
         if not stock_data:
             logger.error("데이터를 가져올 수 없습니다.")
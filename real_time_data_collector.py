@@ -26,6 +26,7 @@ from kiwoom_api import KiwoomAPI, RealDataType
 from error_handler import ErrorType, ErrorLevel, handle_error, retry_operation
 from system_monitor import system_monitor, record_api_call, record_data_processed
 from config import KIWOOM_CONFIG
+from correlation_engine import RollingCorrelation
 
 @dataclass
 class RealTimeData:
@@ -548,11 +549,63 @@ class RealTimeDataCollector:
 class RealTimeDataAnalyzer:
     """실시간 데이터 분석기"""
     
-    def __init__(self, collector: RealTimeDataCollector):
+    def __init__(self, collector: RealTimeDataCollector, correlation_window: int = 120,
+                 sample_interval: float = None):
         self.collector = collector
         self.analysis_results = {}
         self.analysis_lock = threading.Lock()
         
+        # 종목 간 상관관계용 가격 스냅샷 (sample_interval초마다 전 종목 최신가 한 행)
+        self.correlation_window = correlation_window
+        self.sample_interval = sample_interval or collector.config.update_interval
+        self.price_snapshots = deque(maxlen=correlation_window + 1)
+        self.correlation_codes: List[str] = []
+        self.rolling_correlation: Optional[RollingCorrelation] = None
+        self._last_sample_time = 0.0
+        self._last_snapshot: Dict[str, float] = {}
+        self.collector.add_callback('data_processed', self._on_data_processed)
+        
+    def _on_data_processed(self, data: RealTimeData, processed_data: Dict):
+        """처리된 틱마다 호출 - 표본 간격이 지나면 가격 스냅샷 기록"""
+        now = time.time()
+        if now - self._last_sample_time < self.sample_interval:
+            return
+        self._last_sample_time = now
+        self.record_snapshot({code: item.current_price for code, item in self.collector.get_all_data().items()})
+    
+    def record_snapshot(self, prices: Dict[str, float]):
+        """종목별 가격 스냅샷 한 행 기록 (직전 스냅샷 대비 수익률을 이동 창 상관에 반영)"""
+        with self.analysis_lock:
+            previous = self._last_snapshot
+            self._last_snapshot = dict(prices)
+            self.price_snapshots.append(self._last_snapshot)
+            
+            if any(code not in self.correlation_codes for code in prices):
+                # 새 종목이 생기면 열을 늘려 보관된 스냅샷으로 다시 구성
+                self.correlation_codes = sorted(set(self.correlation_codes) | set(prices))
+                self._rebuild_rolling_correlation()
+                return
+            
+            if previous:
+                self.rolling_correlation.update(self._returns(previous, self._last_snapshot))
+    
+    def _returns(self, previous: Dict[str, float], current: Dict[str, float]) -> np.ndarray:
+        """두 스냅샷 사이 종목별 수익률 (한쪽이라도 없거나 0이면 NaN)"""
+        prev = np.array([previous.get(code, np.nan) for code in self.correlation_codes], dtype=np.float64)
+        curr = np.array([current.get(code, np.nan) for code in self.correlation_codes], dtype=np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            returns = curr / prev - 1
+        returns[~np.isfinite(returns)] = np.nan
+        return returns
+    
+    def _rebuild_rolling_correlation(self):
+        """보관된 스냅샷으로 이동 창 상관 재구성"""
+        self.rolling_correlation = RollingCorrelation(len(self.correlation_codes), window=self.correlation_window,
+                                                      min_periods=3)
+        snapshots = list(self.price_snapshots)
+        for previous, current in zip(snapshots, snapshots[1:]):
+            self.rolling_correlation.update(self._returns(previous, current))
+    
     def analyze_market_trend(self) -> Dict:
         """시장 전체 추세 분석"""
         try:
@@ -623,29 +676,26 @@ class RealTimeDataAnalyzer:
             return []
     
     def calculate_correlation(self, codes: List[str]) -> Dict:
-        """종목 간 상관관계 계산"""
+        """종목 간 상관관계 계산 (최근 스냅샷 수익률의 이동 창 피어슨 상관)"""
         try:
-            all_data = self.collector.get_all_data()
-            available_codes = [code for code in codes if code in all_data]
-            
-            if len(available_codes) < 2:
-                return {}
-            
-            # 등락률 데이터 추출
-            change_rates = {}
-            for code in available_codes:
-                change_rates[code] = all_data[code].change_rate
+            with self.analysis_lock:
+                if self.rolling_correlation is None:
+                    return {}
+                
+                index = {code: i for i, code in enumerate(self.correlation_codes)}
+                available_codes = [code for code in codes if code in index]
+                if len(available_codes) < 2:
+                    return {}
+                
+                positions = [index[code] for code in available_codes]
+                matrix = self.rolling_correlation.correlation()[np.ix_(positions, positions)]
             
-            # 상관관계 계산
+            # 공통 표본이 부족한 쌍은 0.0, 자기 자신은 1.0
             correlation_matrix = {}
             for i, code1 in enumerate(available_codes):
                 correlation_matrix[code1] = {}
-                for code2 in available_codes:
-                    if code1 == code2:
-                        correlation_matrix[code1][code2] = 1.0
-                    else:
-                        # 간단한 상관관계 계산 (실제로는 시계열 데이터 필요)
-                        correlation_matrix[code1][code2] = 0.0
+                for j, code2 in enumerate(available_codes):
+                    correlation_matrix[code1][code2] = 1.0 if i == j else float(matrix[i, j])
             
             return correlation_matrix
             
@@ -15,13 +15,12 @@ import numpy as np
 # 프로젝트 모듈 import
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from backtesting_system import BacktestingEngine, BacktestConfig, BacktestMode
+from backtesting_system import BacktestConfig, BacktestMode
 from trading_strategy import create_default_strategies
+from backtest_sweep import SweepTask, compare_backtests, strategy_configs_from_manager
 
-def run_advanced_optimization():
-    """고급 수익률 최적화 백테스팅 실행"""
-    logger.info("=== 고급 수익률 최적화 백테스팅 시작 ===")
-    
+def _advanced_task() -> SweepTask:
+    """고급 수익률 최적화 백테스트 작업"""
     # 고급 최적화를 위한 백테스트 설정
     config = BacktestConfig(
         mode=BacktestMode.SINGLE_STOCK,
@@ -44,66 +43,18 @@ def run_advanced_optimization():
         max_drawdown_limit=0.10    # 10% 최대 낙폭 (매우 엄격하게)
     )
     
-    # 백테스팅 엔진 생성
-    engine = BacktestingEngine(config)
-    
-    # 전략 매니저 추가
-    strategy_manager = create_default_strategies()
-    engine.add_strategy(strategy_manager)
-    
-    # 데이터 로드 - 더 많은 종목으로 확장
-    logger.info("데이터 로드 시작...")
+    # 더 많은 종목으로 확장
     stock_codes = [
         '005930.KS', '000660.KS', '035420.KS', '051910.KS', '006400.KS',
         '005380.KS', '035720.KS', '068270.KS', '207940.KS', '323410.KS',
         '035720.KS', '051910.KS', '006400.KS', '005380.KS', '035720.KS'
     ]
-    success = engine.load_data(stock_codes, data_source="yahoo")
-    
-    if not success:
-        logger.error("데이터 로드 실패")
-        return None
     
-    logger.info(f"데이터 로드 완료: {len(engine.data)}개 종목")
-    
-    # 백테스트 실행
-    logger.info("고급 백테스트 실행 시작...")
-    try:
-        result = engine.run_backtest()
-        
-        if result:
-            logger.info("=== 고급 수익률 최적화 백테스트 결과 ===")
-            logger.info(f"백테스트 모드: {result.config.mode.value}")
-            logger.info(f"기간: {result.start_date.strftime('%Y-%m-%d')} ~ {result.end_date.strftime('%Y-%m-%d')}")
-            logger.info(f"초기 자본: {result.initial_capital:,.0f}원")
-            logger.info(f"최종 자본: {result.final_capital:,.0f}원")
-            logger.info(f"총 수익률: {result.total_return:.2f}%")
-            logger.info(f"연간 수익률: {result.annual_return:.2f}%")
-            logger.info(f"총 거래 수: {result.total_trades}회")
-            logger.info(f"승률: {result.win_rate:.2f}%")
-            logger.info(f"최대 낙폭: {result.max_drawdown:.2f}%")
-            logger.info(f"샤프 비율: {result.sharpe_ratio:.2f}")
-            
-            # 전략별 성과
-            logger.info("\n=== 전략별 성과 ===")
-            for name, perf in result.strategy_performance.items():
-                logger.info(f"{name}: {perf}")
-            
-            return result
-        else:
-            logger.error("백테스트 실행 실패")
-            return None
-            
-    except Exception as e:
-        logger.error(f"백테스트 실행 오류: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
-        return None
+    return SweepTask(config, strategy_configs_from_manager(create_default_strategies()),
+                     list(dict.fromkeys(stock_codes)), name='고급 최적화')
 
-def run_multi_strategy_optimization():
-    """다중 전략 최적화 백테스트 실행"""
-    logger.info("\n=== 다중 전략 최적화 백테스트 시작 ===")
-    
+def _multi_strategy_task() -> SweepTask:
+    """다중 전략 최적화 백테스트 작업"""
     # 다중 전략 최적화 설정
     config = BacktestConfig(
         mode=BacktestMode.PORTFOLIO,
@@ -126,13 +77,6 @@ def run_multi_strategy_optimization():
         max_drawdown_limit=0.08
     )
     
-    # 백테스팅 엔진 생성
-    engine = BacktestingEngine(config)
-    
-    # 전략 매니저 추가
-    strategy_manager = create_default_strategies()
-    engine.add_strategy(strategy_manager)
-    
     # 포트폴리오 종목들 - 더 많은 종목
     portfolio_codes = [
         '005930.KS', '000660.KS', '035420.KS', '051910.KS', '006400.KS',
@@ -141,44 +85,11 @@ def run_multi_strategy_optimization():
         '068270.KS', '207940.KS', '323410.KS', '035720.KS', '051910.KS'
     ]
     
-    # 데이터 로드
-    logger.info("다중 전략 데이터 로드 시작...")
-    success = engine.load_data(portfolio_codes, data_source="yahoo")
-    
-    if not success:
-        logger.error("다중 전략 데이터 로드 실패")
-        return None
-    
-    logger.info(f"다중 전략 데이터 로드 완료: {len(engine.data)}개 종목")
-    
-    # 백테스트 실행
-    logger.info("다중 전략 백테스트 실행 시작...")
-    try:
-        result = engine.run_backtest()
-        
-        if result:
-            logger.info("=== 다중 전략 최적화 백테스트 결과 ===")
-            logger.info(f"총 거래 수: {result.total_trades}회")
-            logger.info(f"승률: {result.win_rate:.2f}%")
-            logger.info(f"총 수익률: {result.total_return:.2f}%")
-            logger.info(f"최대 낙폭: {result.max_drawdown:.2f}%")
-            logger.info(f"샤프 비율: {result.sharpe_ratio:.2f}")
-            
-            return result
-        else:
-            logger.error("다중 전략 백테스트 실행 실패")
-            return None
-            
-    except Exception as e:
-        logger.error(f"다중 전략 백테스트 실행 오류: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
-        return None
+    return SweepTask(config, strategy_configs_from_manager(create_default_strategies()),
+                     list(dict.fromkeys(portfolio_codes)), name='다중 전략')
 
-def run_aggressive_optimization():
-    """공격적 수익률 최적화 백테스트 실행"""
-    logger.info("\n=== 공격적 수익률 최적화 백테스트 시작 ===")
-    
+def _aggressive_task() -> SweepTask:
+    """공격적 수익률 최적화 백테스트 작업"""
     # 공격적 최적화 설정
     config = BacktestConfig(
         mode=BacktestMode.SINGLE_STOCK,
@@ -201,115 +112,76 @@ def run_aggressive_optimization():
         max_drawdown_limit=0.05    # 5% 최대 낙폭 (극도로 엄격하게)
     )
     
-    # 백테스팅 엔진 생성
-    engine = BacktestingEngine(config)
-    
-    # 전략 매니저 추가
-    strategy_manager = create_default_strategies()
-    engine.add_strategy(strategy_manager)
-    
-    # 데이터 로드
-    logger.info("공격적 최적화 데이터 로드 시작...")
     stock_codes = [
         '005930.KS', '000660.KS', '035420.KS', '051910.KS', '006400.KS',
         '005380.KS', '035720.KS', '068270.KS', '207940.KS', '323410.KS'
     ]
-    success = engine.load_data(stock_codes, data_source="yahoo")
     
-    if not success:
-        logger.error("공격적 최적화 데이터 로드 실패")
+    return SweepTask(config, strategy_configs_from_manager(create_default_strategies()),
+                     list(dict.fromkeys(stock_codes)), name='공격적 최적화')
+
+def _log_result(result):
+    """백테스트 결과 행 로그"""
+    logger.info(f"총 거래 수: {result['total_trades']:.0f}회")
+    logger.info(f"승률: {result['win_rate']:.2f}%")
+    logger.info(f"총 수익률: {result['total_return']:.2f}%")
+    logger.info(f"최대 낙폭: {result['max_drawdown']:.2f}%")
+    logger.info(f"샤프 비율: {result['sharpe_ratio']:.2f}")
+
+def _run_single(task: SweepTask):
+    """작업 하나를 실행하고 결과 행 반환"""
+    logger.info(f"{task.name} 백테스트 실행 시작...")
+    table = compare_backtests([task])
+    if table.empty:
+        logger.error(f"{task.name} 백테스트 실행 실패")
         return None
     
-    logger.info(f"공격적 최적화 데이터 로드 완료: {len(engine.data)}개 종목")
-    
-    # 백테스트 실행
-    logger.info("공격적 최적화 백테스트 실행 시작...")
-    try:
-        result = engine.run_backtest()
-        
-        if result:
-            logger.info("=== 공격적 수익률 최적화 백테스트 결과 ===")
-            logger.info(f"총 거래 수: {result.total_trades}회")
-            logger.info(f"승률: {result.win_rate:.2f}%")
-            logger.info(f"총 수익률: {result.total_return:.2f}%")
-            logger.info(f"최대 낙폭: {result.max_drawdown:.2f}%")
-            logger.info(f"샤프 비율: {result.sharpe_ratio:.2f}")
-            
-            return result
-        else:
-            logger.error("공격적 최적화 백테스트 실행 실패")
-            return None
-            
-    except Exception as e:
-        logger.error(f"공격적 최적화 백테스트 실행 오류: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
-        return None
+    result = table.iloc[0]
+    logger.info(f"=== {task.name} 백테스트 결과 ===")
+    logger.info(f"최종 자본: {result['final_capital']:,.0f}원")
+    _log_result(result)
+    return result
+
+def run_advanced_optimization():
+    """고급 수익률 최적화 백테스팅 실행"""
+    logger.info("=== 고급 수익률 최적화 백테스팅 시작 ===")
+    return _run_single(_advanced_task())
+
+def run_multi_strategy_optimization():
+    """다중 전략 최적화 백테스트 실행"""
+    logger.info("\n=== 다중 전략 최적화 백테스트 시작 ===")
+    return _run_single(_multi_strategy_task())
+
+def run_aggressive_optimization():
+    """공격적 수익률 최적화 백테스트 실행"""
+    logger.info("\n=== 공격적 수익률 최적화 백테스트 시작 ===")
+    return _run_single(_aggressive_task())
 
 def main():
-    """메인 실행 함수"""
+    """메인 실행 함수 (세 설정을 데이터 1회 로드 후 병렬 백테스트)"""
     logger.info("=== 고급 수익률 최적화 백테스팅 시스템 시작 ===")
     
-    # 고급 최적화 백테스트
-    advanced_result = run_advanced_optimization()
-    
-    # 다중 전략 최적화 백테스트
-    multi_strategy_result = run_multi_strategy_optimization()
-    
-    # 공격적 최적화 백테스트
-    aggressive_result = run_aggressive_optimization()
+    table = compare_backtests([_advanced_task(), _multi_strategy_task(), _aggressive_task()])
     
     # 최종 결과 요약
     logger.info("\n=== 고급 최적화 결과 요약 ===")
     
-    if advanced_result:
-        logger.info("✅ 고급 최적화 백테스트 성공")
-        logger.info(f"   거래 수: {advanced_result.total_trades}회")
-        logger.info(f"   수익률: {advanced_result.total_return:.2f}%")
-        logger.info(f"   승률: {advanced_result.win_rate:.2f}%")
-        logger.info(f"   최대 낙폭: {advanced_result.max_drawdown:.2f}%")
+    for _, result in table.iterrows():
+        logger.info(f"✅ {result['name']} 백테스트 성공")
+        logger.info(f"   거래 수: {result['total_trades']:.0f}회")
+        logger.info(f"   수익률: {result['total_return']:.2f}%")
+        logger.info(f"   승률: {result['win_rate']:.2f}%")
+        logger.info(f"   최대 낙폭: {result['max_drawdown']:.2f}%")
         
-        if advanced_result.total_return > 0:
-            logger.info("🎉 고급 최적화에서 수익이 발생했습니다!")
+        if result['total_return'] > 0:
+            logger.info(f"🎉 {result['name']}에서 수익이 발생했습니다!")
         else:
-            logger.info("⚠️ 고급 최적화에서 손실이 발생했습니다.")
-    
-    if multi_strategy_result:
-        logger.info("✅ 다중 전략 최적화 백테스트 성공")
-        logger.info(f"   거래 수: {multi_strategy_result.total_trades}회")
-        logger.info(f"   수익률: {multi_strategy_result.total_return:.2f}%")
-        logger.info(f"   승률: {multi_strategy_result.win_rate:.2f}%")
-        logger.info(f"   최대 낙폭: {multi_strategy_result.max_drawdown:.2f}%")
-        
-        if multi_strategy_result.total_return > 0:
-            logger.info("🎉 다중 전략에서 수익이 발생했습니다!")
-        else:
-            logger.info("⚠️ 다중 전략에서 손실이 발생했습니다.")
-    
-    if aggressive_result:
-        logger.info("✅ 공격적 최적화 백테스트 성공")
-        logger.info(f"   거래 수: {aggressive_result.total_trades}회")
-        logger.info(f"   수익률: {aggressive_result.total_return:.2f}%")
-        logger.info(f"   승률: {aggressive_result.win_rate:.2f}%")
-        logger.info(f"   최대 낙폭: {aggressive_result.max_drawdown:.2f}%")
-        
-        if aggressive_result.total_return > 0:
-            logger.info("🎉 공격적 최적화에서 수익이 발생했습니다!")
-        else:
-            logger.info("⚠️ 공격적 최적화에서 손실이 발생했습니다.")
+            logger.info(f"⚠️ {result['name']}에서 손실이 발생했습니다.")
     
     # 최고 성과 분석
-    results = []
-    if advanced_result:
-        results.append(("고급 최적화", advanced_result.total_return))
-    if multi_strategy_result:
-        results.append(("다중 전략", multi_strategy_result.total_return))
-    if aggressive_result:
-        results.append(("공격적 최적화", aggressive_result.total_return))
-    
-    if results:
-        best_strategy = max(results, key=lambda x: x[1])
-        logger.info(f"\n🏆 최고 성과 전략: {best_strategy[0]} (수익률: {best_strategy[1]:.2f}%)")
+    if not table.empty:
+        best = table.loc[table['total_return'].idxmax()]
+        logger.info(f"\n🏆 최고 성과 전략: {best['name']} (수익률: {best['total_return']:.2f}%)")
     
     logger.info("\n=== 고급 수익률 최적화 백테스팅 완료 ===")
 
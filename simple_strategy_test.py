@@ -61,7 +61,7 @@ def test_individual_strategies():
         logger.info(f"\n--- {name} 전략 테스트 ---")
         
         # 가격 데이터 추가
-        strategy.price_history = []
+        strategy.reset_data()
         for _, row in df.iterrows():
             strategy.add_price_data(row['price'], row['date'])
         
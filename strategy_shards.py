@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+종목별 전략 상태 샤딩
+종목마다 독립된 전략 상태(가격 링 버퍼, 스트리밍 지표)를 두고
+종목 코드 해시로 샤드를 나눠 워커 스레드/프로세스에 분배합니다.
+
+- 종목별 StrategyManager → 여러 종목의 가격이 한 이력에 섞이지 않음
+- 샤드 번호는 crc32(code) % num_shards (프로세스가 달라도 같은 종목은 같은 샤드)
+- 신호는 한 곳(fan-in)으로 모아 틱 순서대로 처리
+"""
+
+import sys
+import zlib
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from loguru import logger
+
+from trading_strategy import (
+    StrategyManager, StrategyConfig, TradingSignal,
+    create_strategy_manager, create_default_strategies
+)
+
+# (종목 코드, 가격, 시각)
+Tick = Tuple[str, float, Optional[datetime]]
+
+def shard_index(code: str, num_shards: int) -> int:
+    """종목 코드의 샤드 번호 (실행마다 바뀌는 hash() 대신 crc32 사용)"""
+    return zlib.crc32(code.encode('utf-8')) % num_shards
+
+def _create_template(strategy_configs: Optional[Dict[str, StrategyConfig]]) -> StrategyManager:
+    """종목별 매니저를 복제할 원본 (설정이 없으면 기본 전략)"""
+    if strategy_configs:
+        return create_strategy_manager(strategy_configs)
+    return create_default_strategies()
+
+class StrategyShard:
+    """샤드 하나에 속한 종목들의 전략 상태 {code: StrategyManager}
+
+    한 종목의 상태는 동시에 한 스레드만 갱신해야 합니다. (TickDispatcher가 종목 단위로 보장)
+    """
+
+    def __init__(self, index: int, template: StrategyManager):
+        self.index = index
+        self.template = template
+        self.managers: Dict[str, StrategyManager] = {}
+        self._lock = threading.Lock()  # 종목 상태 생성용
+
+    def manager(self, code: str) -> StrategyManager:
+        """종목의 전략 매니저 (없으면 원본 설정으로 생성)"""
+        manager = self.managers.get(code)
+        if manager is None:
+            with self._lock:
+                manager = self.managers.get(code)
+                if manager is None:
+                    manager = self.managers[code] = self.template.spawn()
+        return manager
+
+    def update_price(self, code: str, price: float, timestamp: datetime = None):
+        self.manager(code).update_price(price, timestamp)
+
+    def generate_signals(self, code: str) -> List[TradingSignal]:
+        """종목의 전략 신호 생성 (신호에 종목 코드 기록)"""
+        signals = self.manager(code).generate_signals()
+        for signal in signals:
+            signal.code = code
+        return signals
+
+    def process(self, code: str, price: float, timestamp: datetime = None) -> List[TradingSignal]:
+        """가격 반영 후 신호 생성"""
+        self.update_price(code, price, timestamp)
+        return self.generate_signals(code)
+
+class ShardedStrategyManager:
+    """종목 코드 해시로 샤딩한 종목별 전략 매니저
+
+    update_price/generate_signals는 종목이 다르면 여러 스레드에서 동시에 호출할 수 있고,
+    생성된 신호는 fan-in(잠금 하나)을 거쳐 신호 이력과 신호 핸들러로 순서대로 전달됩니다.
+    """
+
+    def __init__(self, strategy_configs: Dict[str, StrategyConfig] = None, num_shards: int = 1,
+                 signal_history_size: int = 1000, template: StrategyManager = None):
+        self.strategy_configs = strategy_configs
+        # template: 종목별 매니저를 복제할 기존 StrategyManager (전략 구성만 사용)
+        self.template = template if template is not None else _create_template(strategy_configs)
+        self.num_shards = max(1, num_shards)
+        self.shards = [StrategyShard(i, self.template) for i in range(self.num_shards)]
+
+        self.signal_history = deque(maxlen=signal_history_size)
+        self.signal_handlers: List[Callable[[TradingSignal], None]] = []
+        self._fan_in_lock = threading.Lock()
+
+    @property
+    def strategies(self) -> Dict:
+        """전략 구성 (종목별 매니저의 원본)"""
+        return self.template.strategies
+
+    @property
+    def codes(self) -> List[str]:
+        return [code for shard in self.shards for code in shard.managers]
+
+    def shard_for(self, code: str) -> StrategyShard:
+        return self.shards[shard_index(code, self.num_shards)]
+
+    def update_price(self, code: str, price: float, timestamp: datetime = None):
+        """종목 가격 반영 (해당 종목의 전략 상태만 갱신)"""
+        self.shard_for(code).update_price(code, price, timestamp)
+
+    def generate_signals(self, code: str) -> List[TradingSignal]:
+        """종목 신호 생성 후 fan-in으로 전달"""
+        signals = self.shard_for(code).generate_signals(code)
+        if signals:
+            self._fan_in(signals)
+        return signals
+
+    def add_signal_handler(self, handler: Callable[[TradingSignal], None]):
+        """fan-in 신호 핸들러 등록 (한 번에 하나의 신호만 전달됨)"""
+        self.signal_handlers.append(handler)
+
+    def _fan_in(self, signals: List[TradingSignal]):
+        with self._fan_in_lock:
+            for signal in signals:
+                self.signal_history.append(signal)
+                for handler in self.signal_handlers:
+                    try:
+                        handler(signal)
+                    except Exception as e:
+                        logger.error(f"신호 핸들러 오류 ({signal.code}): {e}")
+
+    def get_performance_summary(self) -> Dict:
+        """종목별 전략 성과 요약 {code: {strategy_name: stats}}"""
+        return {code: shard.managers[code].get_performance_summary()
+                for shard in self.shards for code in list(shard.managers)}
+
+def partition_ticks(ticks: Iterable[Tick], num_shards: int) -> List[List[Tuple[int, str, float, Optional[datetime]]]]:
+    """틱을 샤드별로 분할 (각 틱에 원래 순번을 붙이고 샤드 안에서는 순서 유지)"""
+    partitions = [[] for _ in range(num_shards)]
+    for seq, (code, price, timestamp) in enumerate(ticks):
+        partitions[shard_index(code, num_shards)].append((seq, code, price, timestamp))
+    return partitions
+
+def _init_worker(log_level: str):
+    """워커 프로세스 로그 레벨 조정"""
+    logger.remove()
+    logger.add(sys.stderr, level=log_level)
+
+def _run_shard(strategy_configs: Optional[Dict[str, StrategyConfig]],
+               ticks: List[Tuple[int, str, float, Optional[datetime]]]) -> List[Tuple[int, TradingSignal]]:
+    """샤드 하나의 틱을 순서대로 처리 (워커 프로세스, 새 전략 상태에서 시작)"""
+    shard = StrategyShard(0, _create_template(strategy_configs))
+    results = []
+    for seq, code, price, timestamp in ticks:
+        for signal in shard.process(code, price, timestamp):
+            results.append((seq, signal))
+    return results
+
+def generate_signals_by_shard(ticks: Iterable[Tick], strategy_configs: Dict[str, StrategyConfig] = None,
+                              num_shards: int = 1, max_workers: int = None,
+                              worker_log_level: str = "WARNING") -> List[TradingSignal]:
+    """틱 묶음(기록 데이터 재생 등)을 샤드별 프로세스에서 처리하고 신호를 틱 순서대로 모아 반환
+
+    max_workers가 1이면 프로세스 풀 없이 현재 프로세스에서 샤드를 차례로 처리합니다.
+    """
+    num_shards = max(1, num_shards)
+    partitions = [partition for partition in partition_ticks(ticks, num_shards) if partition]
+    max_workers = min(max_workers or num_shards, max(1, len(partitions)))
+
+    if max_workers == 1:
+        results = [_run_shard(strategy_configs, partition) for partition in partitions]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 initializer=_init_worker, initargs=(worker_log_level,)) as executor:
+            futures = [executor.submit(_run_shard, strategy_configs, partition) for partition in partitions]
+            results = [future.result() for future in futures]
+
+    # fan-in: 샤드별 결과를 원래 틱 순서로 병합 (한 틱의 신호 순서는 유지)
+    merged = sorted((item for result in results for item in result), key=lambda item: item[0])
+    return [signal for _, signal in merged]
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스트리밍 기술적 지표 모듈
+실시간 틱마다 전체 이력을 다시 계산하지 않도록, 새 가격 하나당 O(1) 시간/메모리로
+갱신되는 상태형 지표 객체들을 제공합니다.
+
+계산 방식은 technical_indicators.py의 배치 함수와 동일하게 맞춰져 있습니다.
+(EMA는 첫 period개의 SMA로 시작, RSI는 Wilder 평활, 볼린저 밴드는 모표준편차)
+"""
+
+import math
+from collections import deque
+from typing import Deque, Optional, Tuple
+from loguru import logger
+
+class StreamingIndicator:
+    """스트리밍 지표 기본 클래스"""
+
+    def __init__(self, history_size: int = 2):
+        # 최근 지표 값 (크로스오버 판단 등에 사용)
+        self.history: Deque = deque(maxlen=max(1, history_size))
+        self.count = 0  # 입력된 가격 수
+
+    def update(self, price: float):
+        """새 가격 입력 후 현재 지표 값 반환 (준비 전이면 None)"""
+        raise NotImplementedError("하위 클래스에서 구현해야 합니다")
+
+    def _record(self, value):
+        self.history.append(value)
+        return value
+
+    @property
+    def is_ready(self) -> bool:
+        """지표 값이 하나 이상 계산되었는지 여부"""
+        return len(self.history) > 0
+
+    @property
+    def value(self):
+        """현재 지표 값"""
+        return self.history[-1] if self.history else None
+
+    @property
+    def previous(self):
+        """직전 지표 값"""
+        return self.history[-2] if len(self.history) >= 2 else None
+
+class StreamingSMA(StreamingIndicator):
+    """단순 이동평균 (O(1) 갱신)"""
+
+    def __init__(self, period: int, history_size: int = 2):
+        super().__init__(history_size)
+        self.period = period
+        self.window: Deque[float] = deque(maxlen=period)
+        self.window_sum = 0.0
+        self._updates_since_resync = 0
+
+    def update(self, price: float) -> Optional[float]:
+        price = float(price)
+        self.count += 1
+
+        if len(self.window) == self.period:
+            self.window_sum -= self.window[0]
+        self.window.append(price)
+        self.window_sum += price
+
+        # 누적 오차 방지를 위해 period번 갱신마다 합계를 다시 계산 (분할상환 O(1))
+        self._updates_since_resync += 1
+        if self._updates_since_resync >= self.period:
+            self.window_sum = math.fsum(self.window)
+            self._updates_since_resync = 0
+
+        if len(self.window) < self.period:
+            return None
+
+        return self._record(self.window_sum / self.period)
+
+class StreamingEMA(StreamingIndicator):
+    """지수 이동평균 (첫 값은 SMA, O(1) 갱신)"""
+
+    def __init__(self, period: int, history_size: int = 2):
+        super().__init__(history_size)
+        self.period = period
+        self.alpha = 2.0 / (period + 1)
+        self._seed_sum = 0.0
+        self._ema = None
+
+    def update(self, price: float) -> Optional[float]:
+        price = float(price)
+        self.count += 1
+
+        if self._ema is None:
+            self._seed_sum += price
+            if self.count < self.period:
+                return None
+            self._ema = self._seed_sum / self.period
+        else:
+            self._ema = self.alpha * price + (1 - self.alpha) * self._ema
+
+        return self._record(self._ema)
+
+class StreamingRSI(StreamingIndicator):
+    """Wilder RSI (O(1) 갱신)"""
+
+    def __init__(self, period: int = 14, history_size: int = 2):
+        super().__init__(history_size)
+        self.period = period
+        self._last_price = None
+        self._deltas = 0
+        self._gain_sum = 0.0
+        self._loss_sum = 0.0
+        self.avg_gain = None
+        self.avg_loss = None
+
+    def update(self, price: float) -> Optional[float]:
+        price = float(price)
+        self.count += 1
+
+        if self._last_price is None:
+            self._last_price = price
+            return None
+
+        delta = price - self._last_price
+        self._last_price = price
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        self._deltas += 1
+
+        if self.avg_gain is None:
+            self._gain_sum += gain
+            self._loss_sum += loss
+            if self._deltas < self.period:
+                return None
+            self.avg_gain = self._gain_sum / self.period
+            self.avg_loss = self._loss_sum / self.period
+        else:
+            self.avg_gain = (self.avg_gain * (self.period - 1) + gain) / self.period
+            self.avg_loss = (self.avg_loss * (self.period - 1) + loss) / self.period
+
+        if self.avg_loss == 0:
+            return self._record(100.0)
+
+        rs = self.avg_gain / self.avg_loss
+        return self._record(100 - (100 / (1 + rs)))
+
+class StreamingBollingerBands(StreamingIndicator):
+    """볼린저 밴드 (슬라이딩 윈도우 평균/분산, O(1) 갱신)
+
+    값은 (upper, middle, lower) 튜플입니다.
+    """
+
+    def __init__(self, period: int = 20, std_dev: float = 2.0, history_size: int = 2):
+        super().__init__(history_size)
+        self.period = period
+        self.std_dev = std_dev
+        self.window: Deque[float] = deque(maxlen=period)
+        self._mean = 0.0
+        self._m2 = 0.0  # 편차 제곱합
+        self._updates_since_resync = 0
+
+    def update(self, price: float) -> Optional[Tuple[float, float, float]]:
+        price = float(price)
+        self.count += 1
+
+        if len(self.window) < self.period:
+            # 윈도우 채우는 중: Welford 누적
+            self.window.append(price)
+            n = len(self.window)
+            delta = price - self._mean
+            self._mean += delta / n
+            self._m2 += delta * (price - self._mean)
+        else:
+            # 가장 오래된 값을 빼고 새 값을 더하는 슬라이딩 Welford 갱신
+            oldest = self.window[0]
+            self.window.append(price)
+            old_mean = self._mean
+            self._mean += (price - oldest) / self.period
+            self._m2 += (price - oldest) * (price - self._mean + oldest - old_mean)
+
+        # 누적 오차 방지를 위해 period번 갱신마다 윈도우에서 다시 계산 (분할상환 O(1))
+        self._updates_since_resync += 1
+        if self._updates_since_resync >= self.period:
+            self._mean = math.fsum(self.window) / len(self.window)
+            self._m2 = math.fsum((x - self._mean) ** 2 for x in self.window)
+            self._updates_since_resync = 0
+
+        if len(self.window) < self.period:
+            return None
+
+        std = math.sqrt(max(self._m2, 0.0) / self.period)
+        middle = self._mean
+        return self._record((middle + self.std_dev * std, middle, middle - self.std_dev * std))
+
+class StreamingMACD(StreamingIndicator):
+    """MACD (O(1) 갱신)
+
+    값은 (macd, signal, histogram) 튜플이며 시그널선이 준비된 뒤부터 반환됩니다.
+    calculate_macd와 같은 결과가 나오도록 빠른/느린 EMA를 각각의 첫 값부터 정렬합니다.
+    """
+
+    def __init__(self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9,
+                 history_size: int = 2):
+        super().__init__(history_size)
+        self.fast_ema = StreamingEMA(fast_period, history_size=max(1, slow_period - fast_period + 1))
+        self.slow_ema = StreamingEMA(slow_period, history_size=max(1, fast_period - slow_period + 1))
+        self.signal_ema = StreamingEMA(signal_period)
+        self._fast_lag = max(0, slow_period - fast_period)
+        self._slow_lag = max(0, fast_period - slow_period)
+
+    def update(self, price: float) -> Optional[Tuple[float, float, float]]:
+        self.count += 1
+        self.fast_ema.update(price)
+        self.slow_ema.update(price)
+
+        if (len(self.fast_ema.history) <= self._fast_lag or
+                len(self.slow_ema.history) <= self._slow_lag):
+            return None
+
+        macd = self.fast_ema.history[-1 - self._fast_lag] - self.slow_ema.history[-1 - self._slow_lag]
+        signal = self.signal_ema.update(macd)
+        if signal is None:
+            return None
+
+        return self._record((macd, signal, macd - signal))
+
+if __name__ == "__main__":
+    # 테스트 코드
+    logger.info("스트리밍 지표 모듈 테스트")
+
+    prices = [100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110,
+              111, 112, 113, 114, 115, 116, 117, 118, 119, 120]
+
+    sma = StreamingSMA(5)
+    rsi = StreamingRSI(14)
+    bb = StreamingBollingerBands(20, 2.0)
+    for price in prices:
+        sma.update(price)
+        rsi.update(price)
+        bb.update(price)
+
+    logger.info(f"SMA(5): {sma.value}")
+    logger.info(f"RSI(14): {rsi.value}")
+    logger.info(f"볼린저 밴드: {bb.value}")
+    logger.info("스트리밍 지표 모듈 테스트 완료")
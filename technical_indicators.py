@@ -7,190 +7,152 @@
 
 import numpy as np
 import pandas as pd
-from typing import List, Dict, Optional, Tuple
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import List, Dict, Optional, Tuple, Union
 from loguru import logger
 
-def calculate_sma(prices: List[float], period: int) -> List[float]:
+# 리스트, ndarray, pandas Series 모두 입력으로 허용
+ArrayLike = Union[List[float], np.ndarray, pd.Series]
+
+def _as_float_array(values: ArrayLike) -> np.ndarray:
+    """입력을 1차원 float64 배열로 변환"""
+    return np.asarray(values, dtype=np.float64).reshape(-1)
+
+def _recursive_ema(values: np.ndarray, seed: float, alpha: float) -> np.ndarray:
     """
-    단순 이동평균 (Simple Moving Average) 계산
+    재귀 필터 y[t] = alpha * x[t] + (1 - alpha) * y[t-1] 계산 (y[0] = seed)
+    
+    pandas의 ewm(adjust=False)는 첫 값을 초기값으로 사용하므로
+    seed를 앞에 붙여 동일한 점화식을 C 레벨에서 계산합니다.
+    """
+    series = np.concatenate(([seed], values))
+    return pd.Series(series).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+
+def calculate_sma_array(prices: ArrayLike, period: int) -> np.ndarray:
+    """
+    단순 이동평균 (벡터화 버전)
     
     Args:
-        prices: 가격 리스트
+        prices: 가격 배열 (리스트, ndarray, Series)
         period: 이동평균 기간
         
     Returns:
-        이동평균 리스트
+        이동평균 배열 (길이: len(prices) - period + 1)
     """
-    if len(prices) < period:
-        return []
-    
-    sma_values = []
-    for i in range(period - 1, len(prices)):
-        sma = np.mean(prices[i - period + 1:i + 1])
-        sma_values.append(sma)
+    values = _as_float_array(prices)
+    if len(values) < period:
+        return np.array([], dtype=np.float64)
     
-    return sma_values
+    return sliding_window_view(values, period).mean(axis=1)
 
-def calculate_ema(prices: List[float], period: int) -> List[float]:
+def calculate_ema_array(prices: ArrayLike, period: int) -> np.ndarray:
     """
-    지수 이동평균 (Exponential Moving Average) 계산
+    지수 이동평균 (벡터화 버전, 첫 값은 SMA)
     
     Args:
-        prices: 가격 리스트
+        prices: 가격 배열 (리스트, ndarray, Series)
         period: 이동평균 기간
         
     Returns:
-        지수 이동평균 리스트
+        지수 이동평균 배열 (길이: len(prices) - period + 1)
     """
-    if len(prices) < period:
-        return []
+    values = _as_float_array(prices)
+    if len(values) < period:
+        return np.array([], dtype=np.float64)
     
-    # 가중치 계산
     alpha = 2.0 / (period + 1)
-    
-    ema_values = []
-    # 첫 번째 EMA는 SMA로 계산
-    first_ema = np.mean(prices[:period])
-    ema_values.append(first_ema)
-    
-    # 나머지 EMA 계산
-    for i in range(period, len(prices)):
-        ema = alpha * prices[i] + (1 - alpha) * ema_values[-1]
-        ema_values.append(ema)
-    
-    return ema_values
+    return _recursive_ema(values[period:], np.mean(values[:period]), alpha)
 
-def calculate_rsi(prices: List[float], period: int = 14) -> List[float]:
+def calculate_rsi_array(prices: ArrayLike, period: int = 14) -> np.ndarray:
     """
-    상대강도지수 (Relative Strength Index) 계산
+    상대강도지수 (벡터화 버전, Wilder 평활)
     
     Args:
-        prices: 가격 리스트
+        prices: 가격 배열 (리스트, ndarray, Series)
         period: RSI 계산 기간 (기본값: 14)
         
     Returns:
-        RSI 값 리스트
+        RSI 배열 (길이: len(prices) - period)
     """
-    if len(prices) < period + 1:
-        return []
+    values = _as_float_array(prices)
+    if len(values) < period + 1:
+        return np.array([], dtype=np.float64)
     
-    # 가격 변화 계산
-    deltas = np.diff(prices)
+    deltas = np.diff(values)
+    gains = np.where(deltas > 0, deltas, 0.0)
+    losses = np.where(deltas < 0, -deltas, 0.0)
     
-    # 상승/하락 분리
-    gains = np.where(deltas > 0, deltas, 0)
-    losses = np.where(deltas < 0, -deltas, 0)
+    # Wilder 평활: avg = (avg * (period - 1) + x) / period
+    alpha = 1.0 / period
+    avg_gain = _recursive_ema(gains[period:], np.mean(gains[:period]), alpha)
+    avg_loss = _recursive_ema(losses[period:], np.mean(losses[:period]), alpha)
     
-    rsi_values = []
-    
-    # 첫 번째 평균 계산
-    avg_gain = np.mean(gains[:period])
-    avg_loss = np.mean(losses[:period])
-    
-    if avg_loss == 0:
-        rsi_values.append(100.0)
-    else:
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        rsi_values.append(rsi)
-    
-    # 나머지 RSI 계산 (지수 이동평균 방식)
-    for i in range(period, len(deltas)):
-        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
-        
-        if avg_loss == 0:
-            rsi_values.append(100.0)
-        else:
-            rs = avg_gain / avg_loss
-            rsi = 100 - (100 / (1 + rs))
-            rsi_values.append(rsi)
+    rsi_values = np.full(len(avg_gain), 100.0)
+    nonzero = avg_loss != 0
+    rs = avg_gain[nonzero] / avg_loss[nonzero]
+    rsi_values[nonzero] = 100 - (100 / (1 + rs))
     
     return rsi_values
 
-def calculate_bollinger_bands(prices: List[float], period: int = 20, std_dev: float = 2.0) -> Dict[str, List[float]]:
+def calculate_bollinger_bands_array(prices: ArrayLike, period: int = 20, std_dev: float = 2.0) -> Dict[str, np.ndarray]:
     """
-    볼린저 밴드 계산
+    볼린저 밴드 (벡터화 버전)
     
     Args:
-        prices: 가격 리스트
+        prices: 가격 배열 (리스트, ndarray, Series)
         period: 이동평균 기간 (기본값: 20)
         std_dev: 표준편차 배수 (기본값: 2.0)
         
     Returns:
-        볼린저 밴드 데이터 (상단, 중간, 하단)
+        볼린저 밴드 배열 (상단, 중간, 하단)
     """
-    if len(prices) < period:
+    values = _as_float_array(prices)
+    if len(values) < period:
         return {}
     
-    # 중간선 (SMA)
-    middle = calculate_sma(prices, period)
-    
-    if not middle:
-        return {}
-    
-    # 표준편차 계산
-    upper = []
-    lower = []
-    
-    for i in range(period - 1, len(prices)):
-        window = prices[i - period + 1:i + 1]
-        std = np.std(window)
-        sma = np.mean(window)
-        
-        upper.append(sma + (std_dev * std))
-        lower.append(sma - (std_dev * std))
+    windows = sliding_window_view(values, period)
+    middle = windows.mean(axis=1)
+    std = windows.std(axis=1)
     
     return {
-        'upper': upper,
+        'upper': middle + std_dev * std,
         'middle': middle,
-        'lower': lower
+        'lower': middle - std_dev * std
     }
 
-def calculate_macd(prices: List[float], fast_period: int = 12, slow_period: int = 26, signal_period: int = 9) -> Dict[str, List[float]]:
+def calculate_macd_array(prices: ArrayLike, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9) -> Dict[str, np.ndarray]:
     """
-    MACD (Moving Average Convergence Divergence) 계산
+    MACD (벡터화 버전)
     
     Args:
-        prices: 가격 리스트
+        prices: 가격 배열 (리스트, ndarray, Series)
         fast_period: 빠른 EMA 기간 (기본값: 12)
         slow_period: 느린 EMA 기간 (기본값: 26)
         signal_period: 시그널선 기간 (기본값: 9)
         
     Returns:
-        MACD 데이터 (MACD, 시그널, 히스토그램)
+        MACD 배열 (MACD, 시그널, 히스토그램)
     """
-    if len(prices) < slow_period + signal_period:
+    values = _as_float_array(prices)
+    if len(values) < slow_period + signal_period:
         return {}
     
-    # EMA 계산
-    fast_ema = calculate_ema(prices, fast_period)
-    slow_ema = calculate_ema(prices, slow_period)
+    fast_ema = calculate_ema_array(values, fast_period)
+    slow_ema = calculate_ema_array(values, slow_period)
     
-    if not fast_ema or not slow_ema:
+    if len(fast_ema) == 0 or len(slow_ema) == 0:
         return {}
     
-    # MACD 라인 계산 (빠른 EMA - 느린 EMA)
-    macd_line = []
+    # MACD 라인 (기존 리스트 구현과 동일하게 앞쪽부터 정렬)
     min_length = min(len(fast_ema), len(slow_ema))
+    macd_line = fast_ema[:min_length] - slow_ema[:min_length]
     
-    for i in range(min_length):
-        macd = fast_ema[i] - slow_ema[i]
-        macd_line.append(macd)
-    
-    # 시그널 라인 계산 (MACD의 EMA)
-    signal_line = calculate_ema(macd_line, signal_period)
-    
-    if not signal_line:
+    signal_line = calculate_ema_array(macd_line, signal_period)
+    if len(signal_line) == 0:
         return {}
     
-    # 히스토그램 계산 (MACD - 시그널)
-    histogram = []
     min_length = min(len(macd_line), len(signal_line))
-    
-    for i in range(min_length):
-        hist = macd_line[i] - signal_line[i]
-        histogram.append(hist)
+    histogram = macd_line[:min_length] - signal_line[:min_length]
     
     return {
         'macd': macd_line,
@@ -198,46 +160,263 @@ def calculate_macd(prices: List[float], fast_period: int = 12, slow_period: int
         'histogram': histogram
     }
 
-def calculate_stochastic(prices: List[float], high_prices: List[float], low_prices: List[float], 
-                        k_period: int = 14, d_period: int = 3) -> Dict[str, List[float]]:
+def calculate_stochastic_array(prices: ArrayLike, high_prices: ArrayLike, low_prices: ArrayLike,
+                               k_period: int = 14, d_period: int = 3) -> Dict[str, np.ndarray]:
     """
-    스토캐스틱 계산
+    스토캐스틱 (벡터화 버전)
     
     Args:
-        prices: 종가 리스트
-        high_prices: 고가 리스트
-        low_prices: 저가 리스트
+        prices: 종가 배열
+        high_prices: 고가 배열
+        low_prices: 저가 배열
         k_period: %K 계산 기간 (기본값: 14)
         d_period: %D 계산 기간 (기본값: 3)
         
     Returns:
-        스토캐스틱 데이터 (%K, %D)
+        스토캐스틱 배열 (%K, %D)
     """
-    if len(prices) < k_period or len(high_prices) < k_period or len(low_prices) < k_period:
+    closes = _as_float_array(prices)
+    highs = _as_float_array(high_prices)
+    lows = _as_float_array(low_prices)
+    if len(closes) < k_period or len(highs) < k_period or len(lows) < k_period:
         return {}
     
-    k_values = []
+    highest_high = sliding_window_view(highs, k_period).max(axis=1)
+    lowest_low = sliding_window_view(lows, k_period).min(axis=1)
+    
+    count = len(closes) - k_period + 1
+    highest_high = highest_high[:count]
+    lowest_low = lowest_low[:count]
+    current_close = closes[k_period - 1:]
+    
+    price_range = highest_high - lowest_low
+    k_values = np.full(count, 50.0)
+    nonzero = price_range != 0
+    k_values[nonzero] = ((current_close[nonzero] - lowest_low[nonzero]) / price_range[nonzero]) * 100
+    
+    return {
+        'k': k_values,
+        'd': calculate_sma_array(k_values, d_period)
+    }
+
+def calculate_atr_array(high_prices: ArrayLike, low_prices: ArrayLike, close_prices: ArrayLike,
+                        period: int = 14) -> np.ndarray:
+    """
+    평균진폭 (벡터화 버전)
     
-    for i in range(k_period - 1, len(prices)):
-        highest_high = max(high_prices[i - k_period + 1:i + 1])
-        lowest_low = min(low_prices[i - k_period + 1:i + 1])
-        current_close = prices[i]
+    Args:
+        high_prices: 고가 배열
+        low_prices: 저가 배열
+        close_prices: 종가 배열
+        period: ATR 계산 기간 (기본값: 14)
         
-        if highest_high == lowest_low:
-            k = 50.0
-        else:
-            k = ((current_close - lowest_low) / (highest_high - lowest_low)) * 100
+    Returns:
+        ATR 배열
+    """
+    highs = _as_float_array(high_prices)
+    lows = _as_float_array(low_prices)
+    closes = _as_float_array(close_prices)
+    if len(highs) < period + 1 or len(lows) < period + 1 or len(closes) < period + 1:
+        return np.array([], dtype=np.float64)
+    
+    n = len(highs)
+    high = highs[1:]
+    low = lows[1:n]
+    prev_close = closes[:n - 1]
+    
+    true_ranges = np.maximum.reduce([
+        high - low,
+        np.abs(high - prev_close),
+        np.abs(low - prev_close)
+    ])
+    
+    return calculate_ema_array(true_ranges, period)
+
+def calculate_cci_array(high_prices: ArrayLike, low_prices: ArrayLike, close_prices: ArrayLike,
+                        period: int = 20) -> np.ndarray:
+    """
+    CCI (벡터화 버전)
+    
+    Args:
+        high_prices: 고가 배열
+        low_prices: 저가 배열
+        close_prices: 종가 배열
+        period: 계산 기간 (기본값: 20)
+        
+    Returns:
+        CCI 배열
+    """
+    highs = _as_float_array(high_prices)
+    lows = _as_float_array(low_prices)
+    closes = _as_float_array(close_prices)
+    if len(highs) < period or len(lows) < period or len(closes) < period:
+        return np.array([], dtype=np.float64)
+    
+    n = len(closes)
+    typical_prices = (highs[:n] + lows[:n] + closes) / 3
+    
+    windows = sliding_window_view(typical_prices, period)
+    sma = windows.mean(axis=1)
+    mean_deviation = np.abs(windows - sma[:, None]).mean(axis=1)
+    
+    cci_values = np.zeros(len(sma))
+    nonzero = mean_deviation != 0
+    cci_values[nonzero] = (typical_prices[period - 1:][nonzero] - sma[nonzero]) / (0.015 * mean_deviation[nonzero])
+    
+    return cci_values
+
+def calculate_adx_array(high_prices: ArrayLike, low_prices: ArrayLike, close_prices: ArrayLike,
+                        period: int = 14) -> Dict[str, np.ndarray]:
+    """
+    ADX (벡터화 버전)
+    
+    Args:
+        high_prices: 고가 배열
+        low_prices: 저가 배열
+        close_prices: 종가 배열
+        period: 계산 기간 (기본값: 14)
         
-        k_values.append(k)
+    Returns:
+        ADX 배열 (ADX, +DI, -DI)
+    """
+    highs = _as_float_array(high_prices)
+    lows = _as_float_array(low_prices)
+    closes = _as_float_array(close_prices)
+    if len(highs) < period + 1 or len(lows) < period + 1 or len(closes) < period + 1:
+        return {}
+    
+    n = len(highs)
+    high, low = highs[1:], lows[1:n]
+    prev_high, prev_low = highs[:n - 1], lows[:n - 1]
+    
+    # True Range (기존 구현과 동일하게 전일 고가/저가 기준)
+    tr_values = np.maximum.reduce([
+        high - low,
+        np.abs(high - prev_high),
+        np.abs(low - prev_low)
+    ])
     
-    # %D 계산 (%K의 이동평균)
-    d_values = calculate_sma(k_values, d_period)
+    # Directional Movement
+    up_move = high - prev_high
+    down_move = prev_low - low
+    dm_plus = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+    dm_minus = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+    
+    tr_smoothed = calculate_ema_array(tr_values, period)
+    dm_plus_smoothed = calculate_ema_array(dm_plus, period)
+    dm_minus_smoothed = calculate_ema_array(dm_minus, period)
+    
+    if len(tr_smoothed) == 0 or len(dm_plus_smoothed) == 0 or len(dm_minus_smoothed) == 0:
+        return {}
+    
+    # +DI, -DI
+    nonzero = tr_smoothed != 0
+    di_plus = np.zeros(len(tr_smoothed))
+    di_minus = np.zeros(len(tr_smoothed))
+    di_plus[nonzero] = dm_plus_smoothed[nonzero] / tr_smoothed[nonzero] * 100
+    di_minus[nonzero] = dm_minus_smoothed[nonzero] / tr_smoothed[nonzero] * 100
+    
+    # DX
+    di_sum = di_plus + di_minus
+    dx_values = np.zeros(len(di_sum))
+    nonzero = di_sum != 0
+    dx_values[nonzero] = np.abs(di_plus[nonzero] - di_minus[nonzero]) / di_sum[nonzero] * 100
     
     return {
-        'k': k_values,
-        'd': d_values
+        'adx': calculate_sma_array(dx_values, period),
+        'di_plus': di_plus,
+        'di_minus': di_minus
     }
 
+def calculate_sma(prices: List[float], period: int) -> List[float]:
+    """
+    단순 이동평균 (Simple Moving Average) 계산
+    
+    Args:
+        prices: 가격 리스트
+        period: 이동평균 기간
+        
+    Returns:
+        이동평균 리스트
+    """
+    return calculate_sma_array(prices, period).tolist()
+
+def calculate_ema(prices: List[float], period: int) -> List[float]:
+    """
+    지수 이동평균 (Exponential Moving Average) 계산
+    
+    Args:
+        prices: 가격 리스트
+        period: 이동평균 기간
+        
+    Returns:
+        지수 이동평균 리스트
+    """
+    return calculate_ema_array(prices, period).tolist()
+
+def calculate_rsi(prices: List[float], period: int = 14) -> List[float]:
+    """
+    상대강도지수 (Relative Strength Index) 계산
+    
+    Args:
+        prices: 가격 리스트
+        period: RSI 계산 기간 (기본값: 14)
+        
+    Returns:
+        RSI 값 리스트
+    """
+    return calculate_rsi_array(prices, period).tolist()
+
+def _arrays_to_lists(data: Dict[str, np.ndarray]) -> Dict[str, List[float]]:
+    """배열 딕셔너리를 리스트 딕셔너리로 변환"""
+    return {key: values.tolist() for key, values in data.items()}
+
+def calculate_bollinger_bands(prices: List[float], period: int = 20, std_dev: float = 2.0) -> Dict[str, List[float]]:
+    """
+    볼린저 밴드 계산
+    
+    Args:
+        prices: 가격 리스트
+        period: 이동평균 기간 (기본값: 20)
+        std_dev: 표준편차 배수 (기본값: 2.0)
+        
+    Returns:
+        볼린저 밴드 데이터 (상단, 중간, 하단)
+    """
+    return _arrays_to_lists(calculate_bollinger_bands_array(prices, period, std_dev))
+
+def calculate_macd(prices: List[float], fast_period: int = 12, slow_period: int = 26, signal_period: int = 9) -> Dict[str, List[float]]:
+    """
+    MACD (Moving Average Convergence Divergence) 계산
+    
+    Args:
+        prices: 가격 리스트
+        fast_period: 빠른 EMA 기간 (기본값: 12)
+        slow_period: 느린 EMA 기간 (기본값: 26)
+        signal_period: 시그널선 기간 (기본값: 9)
+        
+    Returns:
+        MACD 데이터 (MACD, 시그널, 히스토그램)
+    """
+    return _arrays_to_lists(calculate_macd_array(prices, fast_period, slow_period, signal_period))
+
+def calculate_stochastic(prices: List[float], high_prices: List[float], low_prices: List[float], 
+                        k_period: int = 14, d_period: int = 3) -> Dict[str, List[float]]:
+    """
+    스토캐스틱 계산
+    
+    Args:
+        prices: 종가 리스트
+        high_prices: 고가 리스트
+        low_prices: 저가 리스트
+        k_period: %K 계산 기간 (기본값: 14)
+        d_period: %D 계산 기간 (기본값: 3)
+        
+    Returns:
+        스토캐스틱 데이터 (%K, %D)
+    """
+    return _arrays_to_lists(calculate_stochastic_array(prices, high_prices, low_prices, k_period, d_period))
+
 def calculate_atr(high_prices: List[float], low_prices: List[float], close_prices: List[float], 
                  period: int = 14) -> List[float]:
     """
@@ -252,28 +431,7 @@ def calculate_atr(high_prices: List[float], low_prices: List[float], close_price
     Returns:
         ATR 값 리스트
     """
-    if len(high_prices) < period + 1 or len(low_prices) < period + 1 or len(close_prices) < period + 1:
-        return []
-    
-    true_ranges = []
-    
-    for i in range(1, len(high_prices)):
-        high = high_prices[i]
-        low = low_prices[i]
-        prev_close = close_prices[i - 1]
-        
-        # True Range 계산
-        tr1 = high - low
-        tr2 = abs(high - prev_close)
-        tr3 = abs(low - prev_close)
-        
-        true_range = max(tr1, tr2, tr3)
-        true_ranges.append(true_range)
-    
-    # ATR 계산 (지수 이동평균 사용)
-    atr_values = calculate_ema(true_ranges, period)
-    
-    return atr_values
+    return calculate_atr_array(high_prices, low_prices, close_prices, period).tolist()
 
 def calculate_momentum(prices: List[float], period: int = 10) -> List[float]:
     """
@@ -369,30 +527,7 @@ def calculate_cci(high_prices: List[float], low_prices: List[float], close_price
     Returns:
         CCI 값 리스트
     """
-    if len(high_prices) < period or len(low_prices) < period or len(close_prices) < period:
-        return []
-    
-    # 전형적 가격 계산
-    typical_prices = []
-    for i in range(len(close_prices)):
-        tp = (high_prices[i] + low_prices[i] + close_prices[i]) / 3
-        typical_prices.append(tp)
-    
-    cci_values = []
-    
-    for i in range(period - 1, len(typical_prices)):
-        window = typical_prices[i - period + 1:i + 1]
-        sma = np.mean(window)
-        mean_deviation = np.mean([abs(tp - sma) for tp in window])
-        
-        if mean_deviation == 0:
-            cci = 0.0
-        else:
-            cci = (typical_prices[i] - sma) / (0.015 * mean_deviation)
-        
-        cci_values.append(cci)
-    
-    return cci_values
+    return calculate_cci_array(high_prices, low_prices, close_prices, period).tolist()
 
 def calculate_adx(high_prices: List[float], low_prices: List[float], close_prices: List[float], 
                  period: int = 14) -> Dict[str, List[float]]:
@@ -408,80 +543,7 @@ def calculate_adx(high_prices: List[float], low_prices: List[float], close_price
     Returns:
         ADX 데이터 (ADX, +DI, -DI)
     """
-    if len(high_prices) < period + 1 or len(low_prices) < period + 1 or len(close_prices) < period + 1:
-        return {}
-    
-    # True Range 계산
-    tr_values = []
-    dm_plus = []
-    dm_minus = []
-    
-    for i in range(1, len(high_prices)):
-        high = high_prices[i]
-        low = low_prices[i]
-        prev_high = high_prices[i - 1]
-        prev_low = low_prices[i - 1]
-        
-        # True Range
-        tr1 = high - low
-        tr2 = abs(high - prev_high)
-        tr3 = abs(low - prev_low)
-        tr = max(tr1, tr2, tr3)
-        tr_values.append(tr)
-        
-        # Directional Movement
-        up_move = high - prev_high
-        down_move = prev_low - low
-        
-        if up_move > down_move and up_move > 0:
-            dm_plus.append(up_move)
-        else:
-            dm_plus.append(0)
-        
-        if down_move > up_move and down_move > 0:
-            dm_minus.append(down_move)
-        else:
-            dm_minus.append(0)
-    
-    # Smoothed TR, +DM, -DM 계산
-    tr_smoothed = calculate_ema(tr_values, period)
-    dm_plus_smoothed = calculate_ema(dm_plus, period)
-    dm_minus_smoothed = calculate_ema(dm_minus, period)
-    
-    if not tr_smoothed or not dm_plus_smoothed or not dm_minus_smoothed:
-        return {}
-    
-    # +DI, -DI 계산
-    di_plus = []
-    di_minus = []
-    
-    min_length = min(len(tr_smoothed), len(dm_plus_smoothed), len(dm_minus_smoothed))
-    
-    for i in range(min_length):
-        if tr_smoothed[i] == 0:
-            di_plus.append(0)
-            di_minus.append(0)
-        else:
-            di_plus.append((dm_plus_smoothed[i] / tr_smoothed[i]) * 100)
-            di_minus.append((dm_minus_smoothed[i] / tr_smoothed[i]) * 100)
-    
-    # DX 계산
-    dx_values = []
-    for i in range(len(di_plus)):
-        if di_plus[i] + di_minus[i] == 0:
-            dx = 0
-        else:
-            dx = (abs(di_plus[i] - di_minus[i]) / (di_plus[i] + di_minus[i])) * 100
-        dx_values.append(dx)
-    
-    # ADX 계산 (DX의 이동평균)
-    adx_values = calculate_sma(dx_values, period)
-    
-    return {
-        'adx': adx_values,
-        'di_plus': di_plus,
-        'di_minus': di_minus
-    }
+    return _arrays_to_lists(calculate_adx_array(high_prices, low_prices, close_prices, period))
 
 def calculate_obv(prices: List[float], volumes: List[float]) -> List[float]:
     """
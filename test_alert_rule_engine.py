@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+선언형 알림 규칙 일괄 평가 테스트
+ThresholdCondition의 스칼라/배열 평가 일치, 틱 묶음에서 조건을 만족한 행만 알림 생성,
+행 목록/컬럼형 입력 결과 일치를 확인합니다.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from notification_system import (
+    NotificationSystem, NotificationType, AlertRule, AlertLevel, ThresholdCondition,
+    create_default_alert_rules
+)
+
+logger.remove()
+logger.add(sys.stderr, level="WARNING")
+
+def _ticks(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    return [
+        {
+            'code': f"{rng.integers(0, 50):06d}",
+            'name': "종목",
+            'change_rate': float(rng.normal(0, 2.5)),
+            'volume_ratio': float(rng.lognormal(0, 0.6)),
+        }
+        for _ in range(n)
+    ]
+
+def _system(cooldown: float = 0) -> NotificationSystem:
+    system = NotificationSystem(max_queue_size=100000)
+    for rule in create_default_alert_rules():
+        rule.cooldown = cooldown
+        system.add_alert_rule(rule)
+    return system
+
+def _queued(system: NotificationSystem):
+    return [(alert.rule_name, alert.message, alert.level)
+            for level in AlertLevel for alert in system.alert_queues[level]]
+
+def test_condition_scalar_matches_array():
+    """호출형 평가와 배열 평가 결과가 같고 기존 람다 조건과도 같음"""
+    ticks = _ticks(2000)
+    volatility = ThresholdCondition('change_rate', '>', 5.0, absolute=True)
+    surge = ThresholdCondition('volume_ratio', '>', 3.0, default=1.0)
+
+    for condition, legacy in ((volatility, lambda data: abs(data.get('change_rate', 0)) > 5.0),
+                              (surge, lambda data: data.get('volume_ratio', 1.0) > 3.0)):
+        scalar = [condition(tick) for tick in ticks]
+        vector = condition.evaluate(np.array([tick[condition.field] for tick in ticks])).tolist()
+        assert scalar == vector == [legacy(tick) for tick in ticks]
+        assert 0 < sum(scalar) < len(ticks)
+
+    # 필드가 없거나 None인 경우
+    assert not surge({}) and not volatility({'change_rate': None})
+    assert not volatility.evaluate(np.array([np.nan])).any()
+    try:
+        ThresholdCondition('change_rate', '==', 1.0)
+        assert False, "지원하지 않는 연산자"
+    except ValueError:
+        pass
+
+def test_batch_matches_per_tick_checks():
+    """틱 묶음 평가는 틱마다 check_alerts를 호출한 결과와 같은 알림 생성"""
+    ticks = _ticks(3000, seed=1)
+
+    per_tick = _system()
+    for tick in ticks:
+        per_tick.check_alerts(tick)
+
+    batched = _system()
+    batched.check_alerts_batch(ticks)
+
+    # 큐 순서는 규칙 단위 평가로 달라질 수 있으므로 내용만 비교
+    assert sorted(_queued(batched), key=str) == sorted(_queued(per_tick), key=str)
+    assert 0 < batched.stats['queued'] < len(ticks)
+
+def test_batch_respects_cooldown_and_skips_formatting():
+    """같은 규칙/종목은 묶음 안에서도 한 번만 알림, 쿨다운 중인 행은 메시지를 만들지 않음"""
+    formatted = []
+
+    class CountingTemplate(str):
+        def format(self, *args, **kwargs):
+            formatted.append(kwargs['code'])
+            return str.format(self, *args, **kwargs)
+
+    system = NotificationSystem()
+    system.add_alert_rule(AlertRule(
+        name="급등", condition=ThresholdCondition('change_rate', '>', 5.0),
+        message_template=CountingTemplate("{code} {change_rate:+.1f}%"),
+        level=AlertLevel.WARNING, channels=[NotificationType.CONSOLE], cooldown=60
+    ))
+
+    ticks = [{'code': 'A', 'change_rate': 6.0}] * 500 + [{'code': 'B', 'change_rate': 7.0}] \
+        + [{'code': 'C', 'change_rate': 1.0}] * 500
+    system.check_alerts_batch(ticks)
+
+    assert formatted == ['A', 'B']
+    assert system.stats['suppressed'] == 499
+    assert [alert.message for alert in system.alert_queues[AlertLevel.WARNING]] == ["A +6.0%", "B +7.0%"]
+
+def test_columnar_batch_and_callable_rules():
+    """컬럼형(딕셔너리 배열, DataFrame) 입력도 같은 알림, 호출형 규칙은 행마다 평가"""
+    ticks = _ticks(1000, seed=2)
+    frame = pd.DataFrame(ticks)
+
+    expected = _system()
+    expected.check_alerts_batch(ticks)
+
+    for columns in ({field: frame[field].to_numpy() for field in frame.columns}, frame):
+        system = _system()
+        system.check_alerts_batch(columns)
+        assert _queued(system) == _queued(expected)
+
+    # 람다 조건 규칙과 선언형 규칙 혼용
+    system = NotificationSystem()
+    system.add_alert_rule(AlertRule(
+        name="하락", condition=lambda data: data['change_rate'] < -5.0,
+        message_template="{code}", level=AlertLevel.INFO, channels=[], cooldown=0
+    ))
+    system.check_alerts_batch({'code': np.array(['X', 'Y']), 'change_rate': np.array([-6.0, 2.0])})
+    queued = list(system.alert_queues[AlertLevel.INFO])
+    assert [alert.message for alert in queued] == ['X']
+    assert queued[0].data == {'code': 'X', 'change_rate': -6.0} and type(queued[0].data['change_rate']) is float
+
+    system.check_alerts_batch([])  # 빈 묶음
+
+if __name__ == "__main__":
+    test_condition_scalar_matches_array()
+    test_batch_matches_per_tick_checks()
+    test_batch_respects_cooldown_and_skips_formatting()
+    test_columnar_batch_and_callable_rules()
+    print("✅ 선언형 알림 규칙 일괄 평가 테스트 통과")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+공통 캘린더 정렬 배열 테스트
+종목별 거래일이 다르거나 시간대 정보가 있는 데이터도 일별 루프에서 올바르게 조회되는지 확인합니다.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from backtesting_system import AlignedMarketData, BacktestingEngine, BacktestConfig
+
+logger.remove()
+logger.add(sys.stderr, level="WARNING")
+
+def _frame(dates, closes, tz=None):
+    index = pd.DatetimeIndex(dates)
+    if tz:
+        index = index.tz_localize(tz)
+    closes = np.asarray(closes, dtype=float)
+    return pd.DataFrame({'open': closes, 'high': closes, 'low': closes,
+                         'close': closes, 'volume': 1000}, index=index)
+
+def test_calendar_alignment():
+    """거래일이 다른 종목을 공통 캘린더에 정렬"""
+    data = {
+        'A': _frame(['2023-01-02', '2023-01-03', '2023-01-05'], [10, 11, 12]),
+        'B': _frame(['2023-01-03', '2023-01-04'], [20, 21], tz='Asia/Seoul'),
+    }
+    market = AlignedMarketData(data)
+    
+    assert list(market.calendar.strftime('%Y-%m-%d')) == [
+        '2023-01-02', '2023-01-03', '2023-01-04', '2023-01-05'
+    ]
+    np.testing.assert_array_equal(market.valid, [[True, False], [True, True], [False, True], [True, False]])
+    np.testing.assert_array_equal(market.row_count, [[1, 0], [2, 1], [2, 2], [3, 2]])
+    
+    t = market.position(datetime(2023, 1, 4))
+    assert market.price('A', t) is None
+    assert market.price('B', t) == 21.0
+    assert market.position(pd.Timestamp('2023-01-03', tz='Asia/Seoul')) == 1
+    assert market.position(datetime(2023, 1, 6)) is None
+    
+    # df.iloc[:row_count]가 해당 날짜까지의 데이터와 같아야 함
+    for t, date in enumerate(market.calendar):
+        for j, code in enumerate(market.codes):
+            index = market.naive_indexes[code]
+            assert market.row_count[t, j] == int((index <= date).sum())
+
+def test_tz_aware_equity_valuation():
+    """시간대 정보가 있는 데이터도 보유 포지션이 평가되는지 확인"""
+    dates = pd.bdate_range('2023-01-02', periods=5)
+    closes = [100, 101, 102, 103, 104]
+    
+    values = []
+    for tz in (None, 'Asia/Seoul'):
+        engine = BacktestingEngine(BacktestConfig(initial_capital=1000))
+        engine.set_data({'A': _frame(dates, closes, tz=tz)})
+        engine.positions = {'A': type('Pos', (), {'quantity': 3})()}
+        engine._update_equity(datetime(2023, 1, 4))
+        values.append(engine.equity_curve[-1]['capital'])
+    
+    assert values[0] == values[1] == 1000 + 3 * 102
+
+def test_market_data_rebuilt_on_data_change():
+    """engine.data를 직접 교체하면 실행 시 배열을 다시 생성"""
+    engine = BacktestingEngine(BacktestConfig())
+    engine.set_data({'A': _frame(['2023-01-02'], [10])})
+    first = engine.market_data
+    
+    engine._prepare_market_data()
+    assert engine.market_data is first
+    
+    engine.data = {'A': _frame(['2023-01-02', '2023-01-03'], [10, 11])}
+    engine._prepare_market_data()
+    assert engine.market_data is not first
+    assert len(engine.market_data.calendar) == 2
+
+if __name__ == "__main__":
+    test_calendar_alignment()
+    test_tz_aware_equity_valuation()
+    test_market_data_rebuilt_on_data_change()
+    print("✅ 공통 캘린더 정렬 배열 테스트 통과")
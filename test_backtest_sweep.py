@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+병렬 백테스트 스윕 테스트
+프로세스 풀 실행 결과가 단일 실행과 같고, 체크포인트로 이어서 실행되는지 확인합니다.
+"""
+
+import sys
+import os
+import json
+import random
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from loguru import logger
+
+from backtesting_system import BacktestingEngine, BacktestConfig, BacktestMode
+from backtest_sweep import BacktestSweepRunner, build_sweep_tasks, code_fingerprint, _init_worker, _run_sweep_task
+import technical_indicators
+from trading_strategy import StrategyConfig, StrategyType
+
+logger.remove()
+logger.add(sys.stderr, level="WARNING")
+
+def _sample_data():
+    random.seed(11)
+    engine = BacktestingEngine(BacktestConfig(start_date="2023-01-01", end_date="2023-03-31"))
+    engine.load_data(data_source="sample")
+    return engine.data
+
+def _tasks():
+    config = BacktestConfig(mode=BacktestMode.SINGLE_STOCK, start_date="2023-01-01", end_date="2023-03-31")
+    strategy_grid = [
+        {'MA': StrategyConfig(StrategyType.MOVING_AVERAGE_CROSSOVER,
+                              {'short_period': short, 'long_period': 5, 'min_cross_threshold': 0.0001})}
+        for short in (1, 2)
+    ]
+    return build_sweep_tasks([config], strategy_grid, codes_grid=[['005930'], ['000660', '035420']])
+
+def test_sweep_matches_serial_and_resumes():
+    """병렬 결과와 단일 실행 결과 비교, 체크포인트 재개 확인"""
+    data = _sample_data()
+    tasks = _tasks()
+    assert len(tasks) == 4
+    assert len({task.task_id for task in tasks}) == 4
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        checkpoint_path = os.path.join(tmp_dir, "sweep.jsonl")
+        
+        # 첫 작업만 완료된 상태(중단된 스윕)를 만든 뒤 이어서 실행
+        runner = BacktestSweepRunner(data, max_workers=2, checkpoint_path=checkpoint_path)
+        _init_worker(data, "WARNING")
+        first_row = _run_sweep_task(tasks[0])
+        assert first_row['status'] == 'ok'
+        with open(checkpoint_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({**first_row, 'run_key': runner.run_key}) + "\n")
+            f.write('{"task_id": "truncated"')  # 강제 종료로 잘린 줄
+        
+        assert list(runner.load_checkpoint().keys()) == [tasks[0].task_id]
+        
+        # 가격 데이터가 바뀌면 이전 체크포인트 결과를 재사용하지 않음
+        changed = dict(data)
+        changed['005930'] = data['005930'].assign(close=data['005930']['close'] * 1.01)
+        assert BacktestSweepRunner(changed, checkpoint_path=checkpoint_path).load_checkpoint() == {}
+        
+        table = runner.run(tasks)
+        assert len(table) == 4
+        assert set(table['task_id']) == {task.task_id for task in tasks}
+        assert not os.path.exists(checkpoint_path)  # 모두 완료되면 체크포인트 삭제
+        
+        # 병렬 실행 결과가 단일 프로세스 실행과 동일한지 확인
+        for task in tasks[1:]:
+            expected = _run_sweep_task(task)
+            row = table[table['task_id'] == task.task_id].iloc[0]
+            assert abs(row['final_capital'] - expected['final_capital']) < 1e-6
+            assert row['total_trades'] == expected['total_trades']
+        
+        # 다음 실행은 처음부터 다시 계산 (keep_checkpoint면 완료 후에도 유지)
+        rerun_runner = BacktestSweepRunner(data, max_workers=2, checkpoint_path=checkpoint_path,
+                                           keep_checkpoint=True)
+        rerun = rerun_runner.run(tasks)
+        assert sorted(rerun['task_id']) == sorted(table['task_id'])
+        assert len(rerun_runner.load_checkpoint()) == 4
+
+def test_code_fingerprint_covers_indicators():
+    """지표 모듈 소스가 바뀌면 코드 지문도 바뀜 (이전 체크포인트 무효화)"""
+    before = code_fingerprint()
+    original = technical_indicators.__file__
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        edited = os.path.join(tmp_dir, "technical_indicators.py")
+        with open(original, 'r', encoding='utf-8') as src, open(edited, 'w', encoding='utf-8') as dst:
+            dst.write(src.read() + "\n# edited\n")
+        technical_indicators.__file__ = edited
+        try:
+            assert code_fingerprint() != before
+        finally:
+            technical_indicators.__file__ = original
+
+if __name__ == "__main__":
+    test_sweep_matches_serial_and_resumes()
+    test_code_fingerprint_covers_indicators()
+    print("✅ 병렬 백테스트 스윕 테스트 통과")
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+실시간 시세 브로드캐스트 허브 테스트
+종목 구독자 인덱스, 프레임 단위 틱 합침과 1회 직렬화, 느린 클라이언트 백프레셔를 확인합니다.
+"""
+
+import sys
+import os
+import json
+import time
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from loguru import logger
+
+from broadcast_hub import BroadcastHub
+
+logger.remove()
+logger.add(sys.stderr, level="WARNING")
+
+class RecordingEmitter:
+    """전송한 프레임을 기록 (auto_ack이면 바로 확인 응답)"""
+
+    def __init__(self, auto_ack: bool = True):
+        self.auto_ack = auto_ack
+        self.frames = []
+        self.lock = threading.Lock()
+
+    def __call__(self, event, frame, sid, callback=None):
+        with self.lock:
+            self.frames.append((event, sid, frame))
+        if self.auto_ack and callback:
+            callback()
+
+    def updates(self, sid: str):
+        """클라이언트가 받은 프레임별 {code: data}"""
+        return [{update['code']: update['data'] for update in json.loads(frame)['updates']}
+                for _, target, frame in self.frames if target == sid]
+
+def test_subscriber_index():
+    """구독 종목 구독자에게만 전송, 마지막 구독자가 빠지면 종목 반환"""
+    emitter = RecordingEmitter()
+    hub = BroadcastHub(emitter)
+    for sid in ('a', 'b', 'c'):
+        hub.add_client(sid)
+    hub.set_subscriptions('a', ['005930', '000660'])
+    hub.set_subscriptions('b', ['005930'])
+
+    hub.publish('005930', {'current_price': 61000})
+    hub.publish('035420', {'current_price': 200000})  # 구독자 없음
+    hub.flush()
+
+    assert sorted(sid for _, sid, _ in emitter.frames) == ['a', 'b']
+    assert emitter.updates('a') == [{'005930': {'current_price': 61000}}]
+    assert emitter.frames[0][0] == 'stock_updates'
+    assert hub.stats['published'] == 1
+
+    assert hub.unsubscribe('a', ['005930', '999999']) == []
+    assert hub.set_subscriptions('a', ['035420']) == ['000660']
+    assert hub.remove_client('b') == ['005930']
+    assert hub.subscribers == {'035420': {'a'}}
+    assert hub.remove_client('unknown') == []
+
+def test_frame_coalesces_and_serializes_once():
+    """프레임 사이의 틱은 최신 값으로 합쳐지고 종목 페이로드는 한 번만 직렬화"""
+    emitter = RecordingEmitter()
+    hub = BroadcastHub(emitter)
+    clients = [f"sid{i}" for i in range(1000)]
+    for i, sid in enumerate(clients):
+        hub.add_client(sid)
+        hub.set_subscriptions(sid, ['005930'] if i % 2 else ['005930', '000660'])
+
+    for price in range(61000, 61100):
+        hub.publish('005930', {'current_price': price})
+    hub.publish('000660', {'current_price': 118500})
+    hub.flush()
+
+    assert hub.stats['serialized'] == 2
+    assert len(emitter.frames) == len(clients)
+    assert emitter.updates('sid0') == [{'005930': {'current_price': 61099}, '000660': {'current_price': 118500}}]
+    assert emitter.updates('sid1') == [{'005930': {'current_price': 61099}}]
+
+    # 같은 종목 페이로드는 모든 프레임에서 같은 문자열
+    fragment = hub.fragments['005930']
+    assert all(fragment in frame for _, _, frame in emitter.frames)
+
+    hub.flush()  # 변경 없음
+    assert len(emitter.frames) == len(clients)
+
+def test_slow_client_backpressure():
+    """확인 응답이 없는 클라이언트는 프레임을 건너뛰고, 확인 후 변경분을 최신 값으로 한 번에 받음"""
+    emitter = RecordingEmitter(auto_ack=False)
+    hub = BroadcastHub(emitter, max_inflight=1, ack_timeout=0.2)
+    hub.add_client('slow')
+    hub.set_subscriptions('slow', ['A', 'B'])
+
+    hub.publish('A', {'price': 1})
+    hub.flush()
+    for price in range(2, 6):
+        hub.publish('A', {'price': price})
+        hub.flush()
+    hub.publish('B', {'price': 10})
+    hub.flush()
+
+    assert emitter.updates('slow') == [{'A': {'price': 1}}]
+    assert hub.clients['slow'].skipped == 5 and hub.get_stats()['backlogged_clients'] == 1
+
+    hub.acknowledge('slow')
+    hub.flush()
+    assert emitter.updates('slow')[-1] == {'A': {'price': 5}, 'B': {'price': 10}}
+
+    # 확인 응답이 끝내 오지 않으면 시간 초과 후 다시 전송
+    hub.publish('A', {'price': 6})
+    hub.flush()
+    assert len(emitter.frames) == 2
+    time.sleep(0.25)
+    hub.flush()
+    assert emitter.updates('slow')[-1] == {'A': {'price': 6}}
+    assert hub.stats['ack_timeouts'] == 1
+
+def test_frame_thread_delivers_updates():
+    """프레임 스레드가 주기적으로 전송, 전송 오류는 다음 프레임에 영향 없음"""
+    emitter = RecordingEmitter()
+    failures = []
+
+    def emit(event, frame, sid, callback=None):
+        if sid == 'broken':
+            failures.append(sid)
+            raise ConnectionError("연결 끊김")
+        emitter(event, frame, sid, callback)
+
+    hub = BroadcastHub(emit, flush_interval=0.01)
+    for sid in ('ok', 'broken'):
+        hub.add_client(sid)
+        hub.set_subscriptions(sid, ['005930'])
+
+    hub.start()
+    try:
+        for price in range(5):
+            hub.publish('005930', {'current_price': price})
+            time.sleep(0.03)
+    finally:
+        hub.stop()
+
+    received = [update['005930']['current_price'] for update in emitter.updates('ok')]
+    assert received == sorted(received) and received[-1] == 4
+    assert len(failures) >= 1 and hub.clients['broken'].inflight == 0
+
+if __name__ == "__main__":
+    test_subscriber_index()
+    test_frame_coalesces_and_serializes_once()
+    test_slow_client_backpressure()
+    test_frame_thread_delivers_updates()
+    print("✅ 실시간 시세 브로드캐스트 허브 테스트 통과")
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+대량 가격 로더 테스트
+로컬 가짜 가격 서버로 동시 요청 수/속도 제한, 재시도, 종목별 디스크 캐시 증분 조회를 확인합니다.
+"""
+
+import sys
+import os
+import json
+import time
+import tempfile
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from bulk_price_loader import BulkPriceLoader, HTTPTransport, PriceTransport, TokenBucket
+from real_stock_data_api import StockDataAPI, DataManager
+
+logger.remove()
+logger.add(sys.stderr, level="WARNING")
+
+class _FakePriceServer:
+    """가짜 가격 서버 (요청 기록, 동시 처리 수 측정, 지정 종목 실패 응답)"""
+    
+    def __init__(self, latency: float = 0.0, failures: dict = None):
+        self.latency = latency
+        self.failures = dict(failures or {})  # {code: 남은 503 응답 수}
+        self.requests = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+            
+            def do_GET(self):
+                url = urlparse(self.path)
+                code = url.path.strip('/')
+                query = {key: values[0] for key, values in parse_qs(url.query).items()}
+                status, body = server.handle(code, query)
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+        
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+    
+    def handle(self, code: str, query: dict):
+        with self.lock:
+            self.requests.append((code, query['start'], query['end']))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.latency)
+            with self.lock:
+                if self.failures.get(code, 0) > 0:
+                    self.failures[code] -= 1
+                    return 503, {'error': 'busy'}
+            if code == 'MISSING':
+                return 404, {'error': 'not found'}
+            
+            dates = pd.bdate_range(query['start'], query['end'], inclusive='left')
+            closes = 100 + np.arange(len(dates), dtype=float) + int(code) % 7
+            return 200, {'data': [{'date': date.strftime('%Y-%m-%d'), 'open': close, 'high': close + 1,
+                                   'low': close - 1, 'close': close, 'volume': 1000}
+                                  for date, close in zip(dates, closes)]}
+        finally:
+            with self.lock:
+                self.active -= 1
+    
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+def _codes(n: int):
+    return [f"{i:06d}" for i in range(n)]
+
+def test_concurrent_fetch_is_bounded():
+    """동시 요청 수는 max_workers 이하, 순차보다 빠름"""
+    server = _FakePriceServer(latency=0.05)
+    try:
+        loader = BulkPriceLoader(HTTPTransport(server.url), max_workers=4, requests_per_second=None)
+        started = time.perf_counter()
+        data = loader.load(_codes(20), '2023-01-02', '2023-02-01')
+        elapsed = time.perf_counter() - started
+    
+        assert sorted(data) == _codes(20)
+        assert len(data['000003']) == 22
+        assert 1 < server.max_active <= 4
+        assert elapsed < 20 * 0.05 * 0.6
+    finally:
+        server.close()
+
+def test_retry_and_missing_codes():
+    """일시적 오류는 재시도, 없는 종목/재시도 초과 종목은 제외"""
+    server = _FakePriceServer(failures={'000001': 2, '000002': 10})
+    try:
+        loader = BulkPriceLoader(HTTPTransport(server.url), max_workers=2, requests_per_second=None,
+                                 max_retries=3, backoff=0.001)
+        data = loader.load(['000000', '000001', '000002', 'MISSING'], '2023-01-02', '2023-01-13')
+    
+        assert sorted(data) == ['000000', '000001']
+        assert loader.last_report.failed == ['000002']
+        assert loader.last_report.fetched == 2
+        assert loader.last_report.retries == 2 + 3
+        assert sum(1 for code, _, _ in server.requests if code == '000002') == 4
+    finally:
+        server.close()
+
+def test_token_bucket():
+    """토큰 버킷: 순간 허용량 이후에는 초당 rate개"""
+    now = [0.0]
+    sleeps = []
+    
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+    
+    bucket = TokenBucket(rate=5, capacity=2, clock=lambda: now[0], sleep=sleep)
+    for _ in range(7):
+        bucket.acquire()
+    
+    assert sleeps[:1] == [0.2]
+    assert abs(now[0] - 1.0) < 1e-9  # 2개 즉시 + 5개 x 0.2초
+    
+    TokenBucket(rate=None).acquire()  # 제한 없음
+
+def test_rate_limit_with_server():
+    """초당 요청 수 제한이 실제 요청 간격에 반영"""
+    server = _FakePriceServer()
+    try:
+        loader = BulkPriceLoader(HTTPTransport(server.url), max_workers=8, requests_per_second=40, burst=1)
+        started = time.perf_counter()
+        loader.load(_codes(12), '2023-01-02', '2023-01-13')
+        assert time.perf_counter() - started >= 11 / 40 * 0.9
+    finally:
+        server.close()
+
+def test_disk_cache_fetches_only_missing_ranges():
+    """두 번째 로드는 조회 없음, 기간을 늘리면 뒤쪽 구간만 조회"""
+    server = _FakePriceServer()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        try:
+            loader = BulkPriceLoader(HTTPTransport(server.url), requests_per_second=None, cache_dir=cache_dir)
+            first = loader.load(_codes(3), '2023-01-01', '2023-03-31')
+            assert len(server.requests) == 3
+    
+            second = loader.load(_codes(3), '2023-01-01', '2023-03-31')
+            assert len(server.requests) == 3
+            assert loader.last_report.cached == 3
+            pd.testing.assert_frame_equal(first['000001'], second['000001'])
+    
+            extended = loader.load(_codes(3), '2023-01-01', '2023-04-30')
+            assert sorted(server.requests[3:]) == [(code, '2023-03-31', '2023-04-30') for code in _codes(3)]
+            assert extended['000000'].index[-1] == pd.Timestamp('2023-04-28')
+        finally:
+            server.close()
+
+def test_stock_data_api_uses_bulk_loader():
+    """get_multiple_stocks / DataManager가 교체한 전송 방식으로 동시 조회"""
+    server = _FakePriceServer(latency=0.02)
+    try:
+        api = StockDataAPI(transport=HTTPTransport(server.url), max_workers=4, requests_per_second=None)
+        codes = _codes(8) + ['MISSING']
+        data = api.get_multiple_stocks(codes, '2023-01-02', '2023-02-28')
+    
+        assert list(data) == _codes(8)
+        assert data['000005'].name == '종목000005'
+        assert list(data['000005'].data.columns) == ['open', 'high', 'low', 'close', 'volume']
+        assert server.max_active > 1
+    
+        # 같은 요청은 메모리 캐시 사용
+        api.get_multiple_stocks(_codes(8), '2023-01-02', '2023-02-28')
+        assert len(server.requests) == 9
+    
+        backtest_data = DataManager(api).get_backtest_data(_codes(8), '2023-01-02', '2023-03-31')
+        assert len(backtest_data) == 8
+    finally:
+        server.close()
+
+class _IntervalTransport(PriceTransport):
+    """봉 간격에 따라 다른 종가를 돌려주는 전송 (요청이 겹치도록 지연)"""
+    
+    CLOSES = {'1d': 100.0, '1wk': 700.0}
+    
+    def fetch(self, code, start_date, end_date, interval="1d"):
+        time.sleep(0.01)
+        return pd.DataFrame({'open': 1.0, 'high': 1.0, 'low': 1.0, 'close': self.CLOSES[interval], 'volume': 1.0},
+                            index=pd.bdate_range(start_date, end_date, inclusive='left'))
+
+def test_concurrent_calls_with_different_intervals():
+    """봉 간격이 다른 동시 호출은 각자 요청한 간격으로 조회/캐시 (공유 로더 설정을 바꾸지 않음)"""
+    api = StockDataAPI(transport=_IntervalTransport(), max_workers=4, requests_per_second=None)
+    results = {}
+    
+    def load(interval):
+        results[interval] = api.get_multiple_stocks(_codes(6), '2023-01-02', '2023-01-31', interval=interval)
+    
+    threads = [threading.Thread(target=load, args=(interval,)) for interval in ('1d', '1wk') * 3]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    for interval, close in _IntervalTransport.CLOSES.items():
+        assert all((data.data['close'] == close).all() for data in results[interval].values())
+        assert all((api.cache[f"{code}_2023-01-02_2023-01-31_{interval}"].data['close'] == close).all()
+                   for code in _codes(6))
+    assert api.bulk_loader.interval == '1d'
+
+class _FakeKiwoom:
+    """호출 스레드/동시 호출 수를 기록하는 키움 API 대역 (지정 종목은 처음 한 번 실패)"""
+    
+    def __init__(self, flaky: str):
+        self.flaky = flaky
+        self.threads = set()
+        self.active = 0
+        self.max_active = 0
+        self.calls = []
+        self.lock = threading.Lock()
+    
+    def get_daily_data(self, code, start_date, end_date):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.threads.add(threading.get_ident())
+            self.calls.append(code)
+        try:
+            time.sleep(0.01)
+            if code == self.flaky and self.calls.count(code) == 1:
+                raise ConnectionError("TR 조회 실패")
+            return [{'date': day, 'open': 1.0, 'high': 1.0, 'low': 1.0, 'close': 1.0, 'volume': 1.0}
+                    for day in pd.bdate_range(start_date, end_date).strftime('%Y-%m-%d')]
+        finally:
+            with self.lock:
+                self.active -= 1
+
+def test_kiwoom_fetches_serially_with_retry():
+    """키움 원본은 호출 스레드에서 한 종목씩 조회하고 오류는 재시도"""
+    api = StockDataAPI(data_source="kiwoom", max_workers=8, requests_per_second=None)
+    api.kiwoom_api = _FakeKiwoom(flaky='000002')
+    api.bulk_loader.backoff = 0.01
+    
+    data = api.get_multiple_stocks(_codes(5), '2023-01-02', '2023-01-31')
+    
+    assert list(data) == _codes(5)
+    assert api.kiwoom_api.max_active == 1
+    assert api.kiwoom_api.threads == {threading.get_ident()}
+    assert api.bulk_loader.last_report.retries == 1
+
+if __name__ == "__main__":
+    test_concurrent_fetch_is_bounded()
+    test_retry_and_missing_codes()
+    test_token_bucket()
+    test_rate_limit_with_server()
+    test_disk_cache_fetches_only_missing_ranges()
+    test_stock_data_api_uses_bulk_loader()
+    test_concurrent_calls_with_different_intervals()
+    test_kiwoom_fetches_serially_with_retry()
+    print("✅ 대량 가격 로더 테스트 통과")
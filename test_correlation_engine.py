@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+벡터화 상관관계 엔진 테스트
+상관/시차 상관/방향 일치도 행렬이 쌍별 계산과 같은지, 이동 창 갱신이 일괄 계산과 같은지,
+트렌드 분석기의 일괄 분석이 키워드별 분석과 같은지 확인합니다.
+"""
+
+import sys
+import os
+import tempfile
+from datetime import datetime, timedelta
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from loguru import logger
+
+from correlation_engine import (
+    tail_align, correlation_matrix, lagged_correlation, best_lag, direction_agreement, RollingCorrelation
+)
+from naver_trend_analyzer import NaverTrendAnalyzer, TrendData, TrendType
+
+logger.remove()
+logger.add(sys.stderr, level="WARNING")
+
+def _loop_accuracy(trend, prices):
+    """끝에 맞춘 최근 구간끼리 변화율 방향이 같은 비율 (반복문 기준 구현)"""
+    n = min(len(trend), len(prices))
+    trend, prices = list(trend[-n:]), list(prices[-n:])
+    correct = 0
+    for i in range(1, n):
+        trend_change = (trend[i] - trend[i - 1]) / trend[i - 1]
+        stock_change = (prices[i] - prices[i - 1]) / prices[i - 1]
+        if (trend_change > 0 and stock_change > 0) or (trend_change < 0 and stock_change < 0):
+            correct += 1
+    return correct / (n - 1)
+
+def test_correlation_matches_corrcoef():
+    """길이가 다른 계열 쌍별 상관 = 최근 공통 구간 np.corrcoef"""
+    rng = np.random.default_rng(0)
+    trends = [100 + rng.normal(0, 10, n).cumsum() for n in (40, 25, 12)]
+    prices = [50000 + rng.normal(0, 500, n).cumsum() for n in (30, 40)]
+    prices.append(np.full(20, 1000.0))  # 상수 계열
+
+    length = 40
+    matrix = correlation_matrix(tail_align(trends, length), tail_align(prices, length))
+    assert matrix.shape == (3, 3)
+    for i, trend in enumerate(trends):
+        for j, price in enumerate(prices):
+            n = min(len(trend), len(price))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                expected = np.corrcoef(trend[-n:], price[-n:])[0, 1]
+            expected = 0.0 if np.isnan(expected) else expected
+            assert abs(matrix[i, j] - expected) < 1e-10, (i, j)
+
+    # 대칭 (종목끼리)
+    symmetric = correlation_matrix(tail_align(trends))
+    np.testing.assert_allclose(symmetric, symmetric.T, atol=1e-12)
+    np.testing.assert_allclose(np.diag(symmetric), 1.0)
+
+def test_lagged_correlation():
+    """시차별 상관 = 밀어서 맞춘 계열의 상관, 심어 둔 선행 시차 검출"""
+    rng = np.random.default_rng(1)
+    lead = rng.normal(0, 1, 200)
+    follower = np.concatenate([rng.normal(0, 1, 3), lead[:-3]]) + rng.normal(0, 0.1, 200)
+    X = np.column_stack([lead, rng.normal(0, 1, 200)])
+    Y = follower.reshape(-1, 1)
+
+    lagged = lagged_correlation(X, Y, max_lag=5)
+    assert lagged.shape == (11, 2, 1)
+    for lag in range(-5, 6):
+        x, y = (lead[:200 - lag], follower[lag:]) if lag >= 0 else (lead[-lag:], follower[:200 + lag])
+        assert abs(lagged[lag + 5, 0, 0] - np.corrcoef(x, y)[0, 1]) < 1e-10
+
+    lags, corr = best_lag(lagged)
+    assert lags[0, 0] == 3 and corr[0, 0] > 0.9
+
+def test_direction_agreement_matches_loop():
+    """방향 일치도 행렬 = 쌍별 반복 계산"""
+    rng = np.random.default_rng(2)
+    trends = [100 + rng.normal(0, 5, n).cumsum() for n in (30, 15)]
+    trends.append(np.array([50.0, 50.0, 51.0, 51.0, 49.0, 49.0, 52.0, 52.0, 50.0, 50.0, 51.0]))  # 변화 없음 포함
+    prices = [1000 + rng.normal(0, 20, n).cumsum() for n in (30, 22)]
+
+    agreement = direction_agreement(tail_align(trends, 30), tail_align(prices, 30))
+    for i, trend in enumerate(trends):
+        for j, price in enumerate(prices):
+            assert abs(agreement[i, j] - _loop_accuracy(trend, price)) < 1e-12, (i, j)
+
+def test_rolling_matches_batch():
+    """이동 창 증분 갱신 = 창 전체 일괄 계산 (결측 포함)"""
+    rng = np.random.default_rng(3)
+    X = 100 + rng.normal(0, 1, (150, 4)).cumsum(axis=0)
+    Y = 20000 + rng.normal(0, 100, (150, 3)).cumsum(axis=0)
+    X[rng.random(X.shape) < 0.1] = np.nan
+    X[:40, 3] = np.nan  # 늦게 관측되는 열
+
+    rolling = RollingCorrelation(4, 3, window=25, recompute_every=1000)
+    for t in range(150):
+        rolling.update(X[t], Y[t])
+        if t in (10, 24, 77, 149):
+            lo = max(0, t + 1 - 25)
+            np.testing.assert_allclose(rolling.correlation(), correlation_matrix(X[lo:t + 1], Y[lo:t + 1]), atol=1e-8)
+            np.testing.assert_allclose(rolling.agreement(), direction_agreement(X[lo:t + 1], Y[lo:t + 1]), atol=1e-12)
+
+    assert len(rolling) == 25
+
+    # 대칭 모드
+    symmetric = RollingCorrelation(3, window=20)
+    for t in range(60):
+        symmetric.update(Y[t])
+    np.testing.assert_allclose(symmetric.correlation(), correlation_matrix(Y[40:60]), atol=1e-8)
+
+def _filled_analyzer(temp_dir, keywords):
+    analyzer = NaverTrendAnalyzer(db_path=os.path.join(temp_dir, "trend.db"))
+    rng = np.random.default_rng(4)
+    now = datetime.now()
+    for n, keyword in zip((30, 20, 12, 5), keywords):
+        values = 100 + rng.normal(0, 5, n).cumsum()
+        analyzer.trend_data.reset(keyword, [
+            TrendData(keyword=keyword, trend_type=TrendType.SEARCH, value=float(value),
+                      timestamp=now - timedelta(hours=n - i)) for i, value in enumerate(values)
+        ])
+    return analyzer
+
+def test_batch_matches_single_keyword():
+    """일괄 분석 결과 = 키워드별 analyze_trend_correlation"""
+    keywords = ['반도체', '배터리', '금리', '백신']
+    with tempfile.TemporaryDirectory() as temp_dir:
+        analyzer = _filled_analyzer(temp_dir, keywords)
+        try:
+            rng = np.random.default_rng(5)
+            prices = {'A': list(1000 + rng.normal(0, 10, 30).cumsum()), 'B': list(1000 + rng.normal(0, 10, 15).cumsum())}
+            batch = analyzer.analyze_correlation_batch({keyword: ['A', 'B'] for keyword in keywords}, prices)
+            assert {(c.keyword, c.stock_code) for c in batch} == {(k, s) for k in keywords[:3] for s in 'AB'}
+
+            for result in batch:
+                analyzer.keyword_stock_mapping[result.keyword] = [result.stock_code]
+                single = analyzer.analyze_trend_correlation(result.keyword, {'prices': prices[result.stock_code]})
+                assert abs(single.correlation_score - result.correlation_score) < 1e-12
+                assert single.trend_direction == result.trend_direction
+                assert abs(single.impact_score - result.impact_score) < 1e-12
+                assert abs(single.prediction_accuracy - result.prediction_accuracy) < 1e-12
+
+                trend = analyzer.trend_data[result.keyword].window()['value']
+                n = min(len(trend), len(prices[result.stock_code]))
+                assert abs(result.correlation_score -
+                           np.corrcoef(trend[-n:], prices[result.stock_code][-n:])[0, 1]) < 1e-10
+                assert abs(result.prediction_accuracy - _loop_accuracy(trend, prices[result.stock_code])) < 1e-12
+
+                lags, corr = best_lag(lagged_correlation(tail_align([trend, prices[result.stock_code]]))[:, :1, 1:])
+                assert result.best_lag == lags[0, 0] and abs(result.lag_correlation - corr[0, 0]) < 1e-10
+
+            # 데이터가 부족한 키워드는 분석하지 않음
+            assert analyzer.analyze_trend_correlation('백신', {'prices': prices['A']}) is None
+        finally:
+            analyzer.close()
+
+def test_batch_reports_leading_lag():
+    """주가보다 앞서는 트렌드는 일괄 분석 결과에 선행 시차로 표시"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        analyzer = NaverTrendAnalyzer(db_path=os.path.join(temp_dir, "trend.db"))
+        try:
+            rng = np.random.default_rng(6)
+            trend = 100 + rng.normal(0, 5, 40).cumsum()
+            now = datetime.now()
+            analyzer.trend_data.reset('반도체', [
+                TrendData(keyword='반도체', trend_type=TrendType.SEARCH, value=float(value),
+                          timestamp=now - timedelta(hours=40 - i)) for i, value in enumerate(trend)
+            ])
+            prices = list(np.concatenate([trend[:2], trend[:-2]]) * 100 + rng.normal(0, 1, 40))
+
+            result, = analyzer.analyze_correlation_batch({'반도체': ['A']}, {'A': prices}, max_lag=4)
+            assert result.best_lag == 2 and result.lag_correlation > 0.99
+        finally:
+            analyzer.close()
+
+def test_update_covers_full_mapping():
+    """주기 업데이트가 매핑 전체 키워드-주식 쌍을 한 번에 저장"""
+    keywords = ['반도체', '전기차', '금리', '백신']
+    with tempfile.TemporaryDirectory() as temp_dir:
+        analyzer = _filled_analyzer(temp_dir, keywords)
+        try:
+            mapping = analyzer._load_keyword_mapping()
+            analyzer._update_correlations()
+
+            expected = {f"{code}_{keyword}" for keyword in keywords[:3] for code in mapping[keyword]}
+            assert expected <= set(analyzer.correlation_data)
+
+            rows = analyzer.storage.query('SELECT COUNT(*) FROM correlation_data')
+            assert rows[0][0] == len(expected)
+        finally:
+            analyzer.close()
+
+if __name__ == "__main__":
+    test_correlation_matches_corrcoef()
+    test_lagged_correlation()
+    test_direction_agreement_matches_loop()
+    test_rolling_matches_batch()
+    test_batch_matches_single_keyword()
+    test_batch_reports_leading_lag()
+    test_update_covers_full_mapping()
+    print("✅ 벡터화 상관관계 엔진 테스트 통과")
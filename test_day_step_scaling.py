@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+일별 처리 스케일링 테스트
+하루에 종목당 신호가 한 번씩만 생성되고, 종목 수에 대해 실행 시간이 선형으로 늘어나는지 확인합니다.
+"""
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from backtesting_system import BacktestingEngine, BacktestConfig, BacktestMode
+from trading_strategy import create_default_strategies
+
+logger.remove()
+logger.add(sys.stderr, level="WARNING")
+
+START_DATE = "2023-01-02"
+END_DATE = "2023-04-28"
+
+def _make_data(num_codes: int, seed: int = 0):
+    """종목 수만 다른 합성 가격 데이터"""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(START_DATE, END_DATE)
+    data = {}
+    for i in range(num_codes):
+        closes = 10000 * np.cumprod(1 + rng.normal(0.0005, 0.02, len(dates)))
+        data[f"{i:06d}"] = pd.DataFrame({
+            'open': closes, 'high': closes * 1.01, 'low': closes * 0.99,
+            'close': closes, 'volume': rng.integers(1000, 10000, len(dates))
+        }, index=dates)
+    return data
+
+def _run(num_codes: int, mode: BacktestMode = BacktestMode.SINGLE_STOCK):
+    """엔진 실행 후 (결과, 전략별 신호 생성 호출 수, 소요 시간) 반환"""
+    config = BacktestConfig(mode=mode, start_date=START_DATE, end_date=END_DATE, max_positions=num_codes)
+    engine = BacktestingEngine(config)
+    engine.set_data(_make_data(num_codes))
+    
+    manager = create_default_strategies()
+    calls = {name: 0 for name in manager.strategies}
+    for name, strategy in manager.strategies.items():
+        original = strategy.generate_signal
+    
+        def counted(original=original, name=name):
+            calls[name] += 1
+            return original()
+    
+        strategy.generate_signal = counted
+    engine.add_strategy(manager)
+    
+    started = time.perf_counter()
+    result = engine.run_backtest()
+    return engine, result, calls, time.perf_counter() - started
+
+def test_signals_generated_once_per_code_per_bar():
+    """전략별 신호 생성 호출 수 = 거래일 x 종목 수 (워밍업 구간 제외)"""
+    num_codes = 6
+    engine, result, calls, _ = _run(num_codes)
+    
+    assert result is not None
+    num_days = len(engine.market_data.calendar)
+    expected = (num_days - 9) * num_codes  # 10번째 봉부터 신호 생성
+    assert set(calls.values()) == {expected}
+
+def test_portfolio_mode_signals_once_per_code_per_bar():
+    """포트폴리오 모드도 동일한 일별 처리 사용"""
+    num_codes = 4
+    engine, result, calls, _ = _run(num_codes, mode=BacktestMode.PORTFOLIO)
+    
+    num_days = len(engine.market_data.calendar)
+    assert set(calls.values()) == {(num_days - 9) * num_codes}
+
+def test_trades_executed_once_per_signal():
+    """하루에 같은 종목이 같은 방향으로 두 번 체결되지 않음"""
+    _, result, _, _ = _run(8)
+    
+    keys = [(trade.timestamp, trade.code, trade.action) for trade in result.trades]
+    assert len(keys) == len(set(keys))
+
+def test_day_step_scales_linearly():
+    """종목 수를 8배로 늘려도 실행 시간은 대략 8배 (이전 구현은 약 64배)"""
+    _run(2)  # 워밍업
+    _, _, _, small = _run(5)
+    _, _, _, large = _run(40)
+    
+    ratio = large / small
+    logger.warning(f"5종목 {small:.2f}초, 40종목 {large:.2f}초 (비율 {ratio:.1f}배)")
+    assert ratio < 20
+
+if __name__ == "__main__":
+    logger.remove()
+    logger.add(sys.stderr, level="INFO")
+    
+    test_signals_generated_once_per_code_per_bar()
+    test_portfolio_mode_signals_once_per_code_per_bar()
+    test_trades_executed_once_per_signal()
+    
+    # 벤치마크: 종목 수별 실행 시간
+    for num_codes in (5, 10, 20, 40, 80):
+        _, _, _, elapsed = _run(num_codes)
+        logger.info(f"{num_codes:3d}종목: {elapsed:.2f}초 (종목당 {elapsed / num_codes * 1000:.1f}ms)")
+    
+    print("✅ 일별 처리 스케일링 테스트 통과")
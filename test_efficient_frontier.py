@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+효율적 프론티어 병렬 계산/캐시 테스트
+프로세스 병렬 결과가 순차 결과와 같고, 같은 수익률 구간은 캐시에서 바로 반환되는지 확인합니다.
+"""
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+import advanced_analytics_system
+from advanced_analytics_system import PortfolioOptimizer
+
+logger.remove()
+logger.add(sys.stderr, level="WARNING")
+
+def _returns(num_days: int = 500, n_assets: int = 12, seed: int = 1) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    market = rng.normal(0, 0.01, (num_days, 1))
+    dates = pd.bdate_range('2022-01-03', periods=num_days)
+    return pd.DataFrame(rng.normal(0.0005, 0.02, (num_days, n_assets)) + market, index=dates,
+                        columns=[f"{i:06d}" for i in range(n_assets)])
+
+def test_parallel_matches_serial():
+    """프로세스 병렬 프론티어 = 순차 프론티어"""
+    returns = _returns()
+    serial = PortfolioOptimizer().efficient_frontier(returns, n_portfolios=40, max_workers=1)
+    parallel = PortfolioOptimizer().efficient_frontier(returns, n_portfolios=40, max_workers=3)
+    
+    assert len(serial) == len(parallel) == 40
+    np.testing.assert_allclose(parallel['target_return'], serial['target_return'])
+    np.testing.assert_allclose(parallel['volatility'], serial['volatility'], rtol=1e-5)
+    assert parallel['target_return'].is_monotonic_increasing
+
+def test_cache_hit_skips_computation():
+    """같은 수익률 구간은 다시 계산하지 않음"""
+    returns = _returns()
+    optimizer = PortfolioOptimizer()
+    
+    factorizations = []
+    original = advanced_analytics_system.cho_factor
+    advanced_analytics_system.cho_factor = lambda *args, **kwargs: factorizations.append(1) or original(*args, **kwargs)
+    try:
+        first = optimizer.efficient_frontier(returns, n_portfolios=20)
+        second = optimizer.efficient_frontier(returns.copy(), n_portfolios=20)
+        assert len(factorizations) == 1
+        pd.testing.assert_frame_equal(first[['target_return', 'volatility']], second[['target_return', 'volatility']])
+    
+        # 반환값(가중치 배열 포함)을 수정해도 캐시에는 영향 없음
+        expected_weights = first['weights'].iloc[0].copy()
+        second['weights'].iloc[0][:] = 0.0
+        second.drop(second.index, inplace=True)
+        third = optimizer.efficient_frontier(returns, n_portfolios=20)
+        assert len(third) == 20
+        np.testing.assert_array_equal(third['weights'].iloc[0], expected_weights)
+        assert not np.shares_memory(third['weights'].iloc[0], first['weights'].iloc[0])
+    
+        # 구간/설정이 다르면 새로 계산
+        optimizer.efficient_frontier(returns.iloc[1:], n_portfolios=20)
+        optimizer.efficient_frontier(returns, n_portfolios=30)
+        assert len(factorizations) == 3
+    
+        optimizer.clear_frontier_cache()
+        optimizer.efficient_frontier(returns, n_portfolios=20)
+        assert len(factorizations) == 4
+    finally:
+        advanced_analytics_system.cho_factor = original
+
+def test_cache_evicts_oldest():
+    """캐시 크기를 넘으면 가장 오래 사용하지 않은 항목부터 제거"""
+    optimizer = PortfolioOptimizer(frontier_cache_size=2)
+    windows = [_returns(seed=seed) for seed in range(3)]
+    
+    optimizer.efficient_frontier(windows[0], n_portfolios=10)
+    optimizer.efficient_frontier(windows[1], n_portfolios=10)
+    optimizer.efficient_frontier(windows[0], n_portfolios=10)  # 최근 사용으로 갱신
+    optimizer.efficient_frontier(windows[2], n_portfolios=10)
+    
+    keys = list(optimizer._frontier_cache)
+    assert keys == [optimizer._frontier_key(windows[0], 10), optimizer._frontier_key(windows[2], 10)]
+
+def test_large_universe():
+    """100종목 프론티어"""
+    returns = _returns(n_assets=100, seed=7)
+    optimizer = PortfolioOptimizer()
+    
+    started = time.perf_counter()
+    frontier = optimizer.efficient_frontier(returns)
+    elapsed = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    optimizer.efficient_frontier(returns)
+    cached = time.perf_counter() - started
+    
+    logger.warning(f"100종목 프론티어 {elapsed:.2f}초, 캐시 {cached * 1000:.1f}ms")
+    assert len(frontier) == 100
+    np.testing.assert_allclose(frontier['actual_return'], frontier['target_return'], atol=1e-5)
+    assert cached < 0.1
+
+if __name__ == "__main__":
+    test_parallel_matches_serial()
+    test_cache_hit_skips_computation()
+    test_cache_evicts_oldest()
+    test_large_universe()
+    print("✅ 효율적 프론티어 병렬 계산/캐시 테스트 통과")
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+증분 EWMA 공분산 추정기 테스트
+pandas ewm(halflife=60) 결과와의 일치, 포트폴리오 백테스트 결과 동일성을 확인합니다.
+"""
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from portfolio_optimizer import PortfolioOptimizer, EWMACovarianceEstimator, OptimizationMethod
+
+logger.remove()
+logger.add(sys.stderr, level="WARNING")
+
+def _returns(num_days: int = 300, num_assets: int = 5, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range('2022-01-03', periods=num_days)
+    return pd.DataFrame(rng.normal(0.0005, 0.02, (num_days, num_assets)), index=dates,
+                        columns=[f"{i:06d}" for i in range(num_assets)])
+
+def _pandas_cov(returns: pd.DataFrame) -> np.ndarray:
+    n = len(returns.columns)
+    return returns.ewm(halflife=60).cov().iloc[-n:, -n:].values
+
+def test_matches_pandas_at_every_prefix():
+    """모든 시점에서 pandas ewm 공분산/평균과 일치"""
+    returns = _returns(150)
+    estimator = EWMACovarianceEstimator(len(returns.columns), halflife=60)
+    
+    for i, row in enumerate(returns.to_numpy()):
+        estimator.update(row)
+        if i == 0:
+            assert np.isnan(estimator.covariance()).all()
+            continue
+        if i % 7 == 0 or i == len(returns) - 1:
+            prefix = returns.iloc[:i + 1]
+            np.testing.assert_allclose(estimator.covariance(), _pandas_cov(prefix), rtol=1e-9, atol=1e-15)
+            np.testing.assert_allclose(estimator.mean(), prefix.ewm(halflife=60).mean().iloc[-1].values,
+                                       rtol=1e-9)
+            np.testing.assert_allclose(estimator.historical_mean(), prefix.mean().values, rtol=1e-9)
+
+def test_optimizer_uses_estimator():
+    """calculate_covariance_matrix / estimate_expected_returns가 추정기 값을 사용"""
+    returns = _returns(120)
+    optimizer = PortfolioOptimizer()
+    estimator = EWMACovarianceEstimator.from_returns(returns, halflife=60)
+    
+    np.testing.assert_allclose(optimizer.calculate_covariance_matrix(returns), _pandas_cov(returns), rtol=1e-9)
+    np.testing.assert_allclose(optimizer.calculate_covariance_matrix(returns, estimator), _pandas_cov(returns),
+                               rtol=1e-9)
+    np.testing.assert_allclose(optimizer.estimate_expected_returns(returns, estimator=estimator),
+                               returns.mean().values * 252, rtol=1e-9)
+    np.testing.assert_allclose(optimizer.estimate_expected_returns(returns, method="ewma"),
+                               returns.ewm(halflife=60).mean().iloc[-1].values * 252, rtol=1e-9)
+    
+    # 결측값이 있으면 pandas 방식 그대로
+    missing = returns.copy()
+    missing.iloc[5, 1] = np.nan
+    np.testing.assert_allclose(optimizer.calculate_covariance_matrix(missing), _pandas_cov(missing), rtol=1e-12)
+    
+    portfolio = optimizer.optimize_portfolio(returns, OptimizationMethod.MIN_VARIANCE, estimator=estimator)
+    assert abs(portfolio.weights.sum() - 1) < 1e-6
+
+def test_backtest_matches_full_recompute():
+    """리밸런싱마다 전체 재계산한 결과와 같은 가중치 이력"""
+    returns = _returns(240)
+    optimizer = PortfolioOptimizer()
+    result = optimizer.backtest_portfolio(returns, rebalance_frequency=20)
+    assert result
+    
+    # 결측값이 있는 행을 마지막에 넣으면 추정기를 쓰지 않는 경로 (pandas 전체 재계산)
+    reference_returns = returns.copy()
+    reference_returns.loc[reference_returns.index[-1] + pd.offsets.BDay()] = np.nan
+    reference = optimizer.backtest_portfolio(reference_returns, rebalance_frequency=20)
+    
+    assert len(result['weights_history']) == len(reference['weights_history']) - 1
+    for weights, expected in zip(result['weights_history'], reference['weights_history']):
+        np.testing.assert_allclose(weights, expected, atol=1e-5)
+
+def test_update_is_fast():
+    """100종목 x 1000일 증분 갱신이 pandas 전체 공분산 패널보다 빠름"""
+    returns = _returns(1000, 100, seed=1)
+    
+    started = time.perf_counter()
+    estimator = EWMACovarianceEstimator.from_returns(returns, halflife=60)
+    incremental = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    expected = _pandas_cov(returns)
+    full = time.perf_counter() - started
+    
+    logger.warning(f"증분 {incremental:.2f}초, pandas 전체 {full:.2f}초")
+    np.testing.assert_allclose(estimator.covariance(), expected, rtol=1e-8, atol=1e-15)
+    assert incremental < full
+
+if __name__ == "__main__":
+    test_matches_pandas_at_every_prefix()
+    test_optimizer_uses_estimator()
+    test_backtest_matches_full_recompute()
+    test_update_is_fast()
+    print("✅ 증분 EWMA 공분산 추정기 테스트 통과")
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+증분 신호 생성 모드 테스트
+증분(INCREMENTAL) 모드가 전체재생(REPLAY) 모드와 동일한 거래를 만드는지 확인합니다.
+"""
+
+import sys
+import os
+import random
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from loguru import logger
+
+from backtesting_system import BacktestingEngine, BacktestConfig, BacktestMode, SignalFeedMode
+
+logger.remove()
+logger.add(sys.stderr, level="WARNING")
+
+def _run_backtest(feed_mode: SignalFeedMode, seed: int = 42, mode: BacktestMode = BacktestMode.SINGLE_STOCK):
+    """동일한 샘플 데이터로 백테스트 실행"""
+    random.seed(seed)
+    config = BacktestConfig(
+        mode=mode,
+        start_date="2023-01-01",
+        end_date="2023-03-15",
+        signal_feed_mode=feed_mode,
+        walk_forward_train_bars=20,
+        walk_forward_test_bars=10
+    )
+    engine = BacktestingEngine(config)
+    engine.load_data(data_source="sample")
+    return engine.run_backtest()
+
+def _trade_keys(result):
+    return [(t.timestamp, t.code, t.action, t.quantity, round(t.price, 6)) for t in result.trades]
+
+def test_incremental_matches_replay():
+    """단일 종목 모드에서 두 방식의 거래 기록 일치 확인"""
+    replay = _run_backtest(SignalFeedMode.REPLAY)
+    incremental = _run_backtest(SignalFeedMode.INCREMENTAL)
+    
+    assert replay is not None and incremental is not None
+    assert replay.total_trades > 0
+    assert _trade_keys(incremental) == _trade_keys(replay)
+    assert abs(incremental.final_capital - replay.final_capital) < 1e-6
+
+def test_incremental_matches_replay_walk_forward():
+    """구간이 재시작되는 Walk Forward 모드에서도 일치 확인"""
+    replay = _run_backtest(SignalFeedMode.REPLAY, seed=7, mode=BacktestMode.WALK_FORWARD)
+    incremental = _run_backtest(SignalFeedMode.INCREMENTAL, seed=7, mode=BacktestMode.WALK_FORWARD)
+    
+    assert incremental.total_trades > 0
+    assert _trade_keys(incremental) == _trade_keys(replay)
+
+if __name__ == "__main__":
+    test_incremental_matches_replay()
+    test_incremental_matches_replay_walk_forward()
+    print("✅ 증분 신호 생성 테스트 통과")
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+벡터화 Monte Carlo 시뮬레이터 테스트
+행렬 기반 경로 계산이 경로별 루프 계산과 같고, seed로 재현되는지 확인합니다.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+import numpy as np
+
+from backtesting_system import MonteCarloSimulator, ResamplingMethod, Trade
+
+def _backtest_result(trade_returns, initial_capital=10000000):
+    """매수/매도 쌍으로 구성된 최소 백테스트 결과"""
+    trades = []
+    start = datetime(2023, 1, 2)
+    for i, trade_return in enumerate(trade_returns):
+        buy_price = 10000.0
+        for action, price, offset in (('BUY', buy_price, 0), ('SELL', buy_price * (1 + trade_return), 1)):
+            trades.append(Trade(
+                timestamp=start + timedelta(days=2 * i + offset), code=f"C{i}", action=action,
+                quantity=10, price=price, commission=0.0, slippage=0.0, total_cost=price * 10
+            ))
+    return SimpleNamespace(initial_capital=initial_capital, trades=trades)
+
+def _reference_path(returns, initial_capital):
+    """기존 단일 시뮬레이션 루프와 동일한 계산"""
+    capital = max_capital = initial_capital
+    max_drawdown = 0.0
+    for r in returns:
+        capital *= (1 + r)
+        max_capital = max(max_capital, capital)
+        max_drawdown = max(max_drawdown, (max_capital - capital) / max_capital)
+    return capital, max_drawdown
+
+TRADE_RETURNS = [0.05, -0.03, 0.02, -0.08, 0.04, 0.01, -0.02, 0.06, -0.05, 0.03]
+
+def test_paths_match_reference_loop():
+    """행렬 계산과 경로별 루프 계산 비교"""
+    for method in ResamplingMethod:
+        simulator = MonteCarloSimulator(_backtest_result(TRADE_RETURNS), num_simulations=50, method=method)
+        sampled = simulator._sample_returns(np.array(TRADE_RETURNS), 50, np.random.default_rng(0))
+        evaluated = simulator._evaluate_paths(sampled)
+        
+        for path, final_capital, max_drawdown in zip(sampled, evaluated['final_capital'], evaluated['max_drawdown']):
+            expected_capital, expected_drawdown = _reference_path(path, 10000000)
+            assert abs(final_capital - expected_capital) < 1e-4
+            assert abs(max_drawdown - expected_drawdown) < 1e-12
+
+def test_permutation_keeps_final_return():
+    """순열 방식은 순서만 바뀌므로 최종 수익률이 모든 경로에서 동일"""
+    simulator = MonteCarloSimulator(_backtest_result(TRADE_RETURNS), num_simulations=200, seed=1)
+    results = simulator.run_simulations()
+    expected = np.prod(1 + np.array(TRADE_RETURNS)) - 1
+    np.testing.assert_allclose(results['total_return'], expected, rtol=1e-12)
+    assert results['max_drawdown'].std() > 0
+
+def test_block_bootstrap_uses_contiguous_blocks():
+    """블록 부트스트랩이 연속 구간을 유지하는지 확인"""
+    returns = np.arange(20) / 1000.0
+    simulator = MonteCarloSimulator(_backtest_result(returns), num_simulations=30,
+                                    method=ResamplingMethod.BLOCK_BOOTSTRAP, block_size=4)
+    sampled = simulator._sample_returns(returns, 30, np.random.default_rng(2))
+    indices = np.rint(sampled * 1000).astype(int)
+    assert indices.shape == (30, 20)
+    for block in range(5):
+        assert np.all(np.diff(indices[:, block * 4:(block + 1) * 4], axis=1) == 1)
+
+def test_seed_reproducibility_and_chunking():
+    """seed 재현성 및 청크 처리 확인"""
+    result = _backtest_result(TRADE_RETURNS)
+    kwargs = dict(num_simulations=100_000, method=ResamplingMethod.BOOTSTRAP, seed=42, max_chunk_elements=100_000)
+    
+    first = MonteCarloSimulator(result, **kwargs)
+    second = MonteCarloSimulator(result, **kwargs)
+    first.run_simulations()
+    second.run_simulations()
+    
+    assert len(first.simulation_results['total_return']) == 100_000
+    np.testing.assert_array_equal(first.simulation_results['total_return'], second.simulation_results['total_return'])
+    
+    stats = first.get_statistics()
+    assert stats['cvar_95'] <= stats['var_95'] <= stats['mean_return']
+    assert 0 <= stats['win_rate'] <= 100
+
+if __name__ == "__main__":
+    test_paths_match_reference_loop()
+    test_permutation_keeps_final_return()
+    test_block_bootstrap_uses_contiguous_blocks()
+    test_seed_reproducibility_and_chunking()
+    print("✅ Monte Carlo 시뮬레이터 테스트 통과")
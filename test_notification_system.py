@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+알림 시스템 디스패치 테스트
+레벨 우선순위 큐, (규칙, 종목) 쿨다운과 만료 정리, 요약 알림, 알림기별 동시 전송을 확인합니다.
+"""
+
+import sys
+import os
+import time
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from datetime import datetime
+from loguru import logger
+
+from notification_system import (
+    NotificationSystem, NotificationType, AlertRule, AlertLevel, Alert
+)
+
+logger.remove()
+logger.add(sys.stderr, level="WARNING")
+
+class RecordingNotifier:
+    """전송한 알림을 기록하는 알림기"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.sent = []
+        self.lock = threading.Lock()
+
+    def send(self, alert: Alert) -> bool:
+        time.sleep(self.delay)
+        with self.lock:
+            self.sent.append(alert)
+        return True
+
+def _system(**kwargs) -> NotificationSystem:
+    system = NotificationSystem(**kwargs)
+    system.notifiers[NotificationType.CONSOLE] = RecordingNotifier()
+    system.rate_limits[NotificationType.CONSOLE] = 10000
+    return system
+
+def _alert(level: AlertLevel, i: int) -> Alert:
+    return Alert(id=f"a{i}", rule_name="테스트", message=f"알림 {i}", level=level, timestamp=datetime.now())
+
+def test_cooldown_per_rule_and_code():
+    """같은 규칙/종목은 쿨다운 동안 한 번만, 다른 종목은 별도, 만료된 키는 정리"""
+    system = _system()
+    system.add_alert_rule(AlertRule(
+        name="급등", condition=lambda data: data['change_rate'] > 5,
+        message_template="{code} {change_rate:+.1f}%", level=AlertLevel.WARNING,
+        channels=[NotificationType.CONSOLE], cooldown=0.2
+    ))
+
+    for _ in range(100):
+        system.check_alerts({'code': '005930', 'change_rate': 7.0})
+    system.check_alerts({'code': '000660', 'change_rate': 6.0})
+    system.check_alerts({'code': '035420', 'change_rate': 1.0})  # 조건 불충족
+
+    assert system.pending_count() == 2
+    assert system.stats['suppressed'] == 99
+    assert set(system.cooldowns) == {('급등', '005930'), ('급등', '000660')}
+
+    time.sleep(0.25)
+    system.check_alerts({'code': '005930', 'change_rate': 7.0})
+    assert system.pending_count() == 3
+
+    with system.queue_lock:
+        system._evict_cooldowns(time.monotonic())
+    assert set(system.cooldowns) == {('급등', '005930')}
+    assert len({alert.id for queue in system.alert_queues.values() for alert in queue}) == 3
+
+def test_critical_first_and_burst_digest():
+    """CRITICAL은 먼저 단독 전송, 나머지 레벨은 몰린 알림을 요약으로 묶음"""
+    system = _system(max_digest_size=50)
+    for i in range(120):
+        system.submit_alert(_alert(AlertLevel.INFO, i))
+    system.submit_alert(_alert(AlertLevel.WARNING, 1000))
+    system.submit_alert(_alert(AlertLevel.CRITICAL, 2000))
+
+    system.start()
+    try:
+        assert system.flush(5)
+    finally:
+        system.stop()
+
+    sent = system.notifiers[NotificationType.CONSOLE].sent
+    assert [alert.level for alert in sent] == [AlertLevel.CRITICAL, AlertLevel.WARNING] + [AlertLevel.INFO] * 3
+    assert sent[0].id == "a2000" and sent[1].id == "a1000"  # 한 건이면 요약하지 않음
+    assert [len(alert.data['alert_ids']) for alert in sent[2:]] == [50, 50, 20]
+    assert sent[2].rule_name == "알림 요약 (50건)" and "- 외 40건" in sent[2].message
+    assert system.stats['digests'] == 3 and system.stats['sent'] == 5
+    assert len(system.sent_alerts) == 5
+
+def test_queue_is_bounded_per_level():
+    """레벨별 큐가 가득 차면 가장 오래된 알림을 버리고 다른 레벨은 영향 없음"""
+    system = _system(max_queue_size=10)
+    for i in range(25):
+        system.submit_alert(_alert(AlertLevel.INFO, i))
+    system.submit_alert(_alert(AlertLevel.CRITICAL, 100))
+
+    assert len(system.alert_queues[AlertLevel.INFO]) == 10
+    assert system.alert_queues[AlertLevel.INFO][0].id == "a15"
+    assert len(system.alert_queues[AlertLevel.CRITICAL]) == 1
+    assert system.stats['dropped'] == 15
+
+def test_notifiers_send_concurrently():
+    """알림기별 전송은 동시에 수행 (가장 느린 알림기 시간만큼 소요)"""
+    system = NotificationSystem()
+    for notifier_type in (NotificationType.EMAIL, NotificationType.SLACK, NotificationType.WEBHOOK):
+        system.notifiers[notifier_type] = RecordingNotifier(delay=0.2)
+
+    system.start()
+    try:
+        started = time.perf_counter()
+        system.submit_alert(_alert(AlertLevel.ERROR, 1))
+        assert system.flush(5)
+        elapsed = time.perf_counter() - started
+    finally:
+        system.stop()
+
+    assert all(len(notifier.sent) == 1 for notifier in system.notifiers.values())
+    assert elapsed < 0.5
+
+def test_critical_bypasses_rate_limit():
+    """레이트 리밋에 걸려도 CRITICAL 알림은 전송"""
+    system = _system()
+    system.rate_limits[NotificationType.CONSOLE] = 2
+    system.start()
+    try:
+        for i in range(5):
+            system.submit_alert(_alert(AlertLevel.WARNING, i))
+            assert system.flush(5)
+        system.submit_alert(_alert(AlertLevel.CRITICAL, 99))
+        assert system.flush(5)
+    finally:
+        system.stop()
+
+    sent = system.notifiers[NotificationType.CONSOLE].sent
+    assert [alert.id for alert in sent] == ["a0", "a1", "a99"]
+    assert system.stats['rate_limited'] == 3
+
+if __name__ == "__main__":
+    test_cooldown_per_rule_and_code()
+    test_critical_first_and_burst_digest()
+    test_queue_is_bounded_per_level()
+    test_notifiers_send_concurrently()
+    test_critical_bypasses_rate_limit()
+    print("✅ 알림 시스템 디스패치 테스트 통과")
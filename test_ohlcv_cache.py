@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+컬럼형 OHLCV 캐시 테스트
+증분 추가, 구간 조회, 메모리 맵 공유, 엔진 연동(캐시 적중 시 원본 미조회)을 확인합니다.
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from ohlcv_cache import OHLCVCache, CachedDataSpec
+from backtesting_system import BacktestingEngine, BacktestConfig
+from backtest_sweep import BacktestSweepRunner, build_sweep_tasks, _init_worker, _run_sweep_task
+import backtest_sweep
+
+logger.remove()
+logger.add(sys.stderr, level="WARNING")
+
+def _bars(start: str, periods: int, tz: str = None, offset: float = 0.0):
+    dates = pd.bdate_range(start, periods=periods)
+    if tz:
+        dates = dates.tz_localize(tz)
+    closes = 100 + offset + np.arange(periods, dtype=float)
+    return pd.DataFrame({'Open': closes, 'High': closes + 1, 'Low': closes - 1,
+                         'Close': closes, 'Volume': 1000}, index=dates)
+
+def test_append_and_read():
+    """증분 추가 시 겹치는 봉은 무시하고 새 봉만 이어 씀"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = OHLCVCache(cache_dir)
+        assert cache.read('A') is None
+    
+        assert cache.append('A', _bars('2023-01-02', 5, tz='Asia/Seoul'),
+                            covered_from='2023-01-01', covered_to='2023-01-07') == 5
+        # 앞 3개 봉이 겹치는 데이터 (겹치는 값은 기존 값 유지)
+        assert cache.append('A', _bars('2023-01-05', 6, offset=1000), covered_to='2023-01-14') == 4
+    
+        df = cache.read('A')
+        assert list(df.columns) == ['open', 'high', 'low', 'close', 'volume']
+        assert len(df) == 9 and df.index.tz is None
+        assert df.index.is_monotonic_increasing
+        np.testing.assert_array_equal(df['close'].to_numpy()[:5], 100 + np.arange(5))
+        np.testing.assert_array_equal(df['close'].to_numpy()[5:], 1102 + np.arange(4))
+    
+        # 종료일 포함 구간 조회
+        window = cache.read('A', '2023-01-04', '2023-01-10')
+        assert list(window.index.strftime('%Y-%m-%d')) == [
+            '2023-01-04', '2023-01-05', '2023-01-06', '2023-01-09', '2023-01-10'
+        ]
+    
+        # 수정주가 여부/주기는 별도 항목
+        assert cache.read('A', adjusted=False) is None
+        assert cache.read('A', interval='1wk') is None
+
+def test_read_is_zero_copy_memmap():
+    """조회 결과가 파일 메모리 맵을 그대로 사용"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = OHLCVCache(cache_dir)
+        cache.append('A', _bars('2023-01-02', 50))
+    
+        df = cache.read('A', '2023-01-10')
+        maps = cache._maps[('A', '1d', True)][1]
+        assert np.shares_memory(df['close'].to_numpy(), maps['close'])
+    
+        # 같은 행 수면 맵을 다시 열지 않음
+        cache.read('A')
+        assert cache._maps[('A', '1d', True)][1] is maps
+
+def test_missing_range():
+    """캐시된 요청 구간을 기준으로 다시 받을 구간 결정"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = OHLCVCache(cache_dir)
+        assert cache.missing_range('A', '2023-01-01', '2023-03-31') == ('2023-01-01', '2023-03-31', True)
+    
+        cache.append('A', _bars('2023-01-02', 60), covered_from='2023-01-01', covered_to='2023-03-31')
+        assert cache.missing_range('A', '2023-02-01', '2023-03-31') is None
+        assert cache.missing_range('A', '2023-02-01', '2023-04-30') == ('2023-03-31', '2023-04-30', False)
+        assert cache.missing_range('A', '2022-12-01', '2023-01-31') == ('2022-12-01', '2023-03-31', True)
+
+def test_append_recovers_from_partial_write():
+    """중단된 쓰기로 남은 잔여 바이트는 다음 추가 시 잘라냄"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = OHLCVCache(cache_dir)
+        cache.append('A', _bars('2023-01-02', 3))
+        with open(cache._column_path('A', '1d', True, 'close'), 'ab') as f:
+            f.write(b'\x00' * 5)
+    
+        cache.append('A', _bars('2023-01-02', 5))
+        np.testing.assert_array_equal(cache.read('A')['close'].to_numpy(), 100 + np.arange(5))
+
+class _CountingManager:
+    """원본 조회 횟수를 세는 DataManager 대역"""
+    
+    def __init__(self):
+        self.requests = []
+        self.intervals = []
+    
+    def get_backtest_data(self, codes, start_date, end_date, validate=True, clean=True, interval="1d"):
+        self.requests.append((tuple(codes), start_date, end_date, validate))
+        self.intervals.append(interval)
+        freq = 'h' if interval == '1h' else 'B'
+        dates = pd.date_range(start_date, end_date, freq=freq)
+        closes = 100 + np.arange(len(dates), dtype=float)
+        df = pd.DataFrame({'open': closes, 'high': closes, 'low': closes,
+                           'close': closes, 'volume': 1000.0}, index=dates)
+        return {code: type('StockData', (), {'data': df})() for code in codes}
+
+def test_engine_uses_cache():
+    """두 번째 실행부터는 원본 조회 없이 캐시에서 로드"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        manager = _CountingManager()
+        config = BacktestConfig(start_date="2023-01-01", end_date="2023-03-31", data_cache_dir=cache_dir)
+    
+        engine = BacktestingEngine(config)
+        engine._load_cached_data(['A', 'B'], "yahoo", manager)
+        # 구간이 같은 종목은 한 번에 요청
+        assert manager.requests == [(('A', 'B'), '2023-01-01', '2023-03-31', True)]
+        first = engine.data['A']
+    
+        engine = BacktestingEngine(config)
+        engine._load_cached_data(['A', 'B'], "yahoo", manager)
+        assert len(manager.requests) == 1
+        pd.testing.assert_frame_equal(engine.data['A'], first)
+    
+        # 기간을 늘리면 뒤쪽 구간만 이어 받음 (검증 생략)
+        config = BacktestConfig(start_date="2023-01-01", end_date="2023-04-30", data_cache_dir=cache_dir)
+        engine = BacktestingEngine(config)
+        engine._load_cached_data(['A'], "yahoo", manager)
+        assert manager.requests[-1] == (('A',), '2023-03-31', '2023-04-30', False)
+        assert engine.data['A'].index[-1] == pd.Timestamp('2023-04-28')
+
+def test_engine_cache_respects_interval():
+    """봉 주기가 원본 조회까지 전달되고 주기별로 따로 캐시됨"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        manager = _CountingManager()
+        config = BacktestConfig(start_date="2023-01-02", end_date="2023-01-04",
+                                data_cache_dir=cache_dir, data_interval="1h")
+    
+        engine = BacktestingEngine(config)
+        engine._load_cached_data(['A'], "yahoo", manager)
+        assert manager.intervals == ['1h']
+        hourly = engine.data['A']
+        assert (hourly.index[1] - hourly.index[0]) == pd.Timedelta(hours=1)
+    
+        # 일봉 요청은 시간봉 캐시를 재사용하지 않음
+        config = BacktestConfig(start_date="2023-01-02", end_date="2023-01-04", data_cache_dir=cache_dir)
+        engine = BacktestingEngine(config)
+        engine._load_cached_data(['A'], "yahoo", manager)
+        assert manager.intervals == ['1h', '1d']
+        assert len(engine.data['A']) < len(hourly)
+        assert OHLCVCache(cache_dir).read('A', interval='1h') is not None
+
+def test_sweep_workers_load_from_cache():
+    """워커가 CachedDataSpec으로 캐시를 직접 열어 같은 결과를 냄"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = OHLCVCache(cache_dir)
+        rng = np.random.default_rng(3)
+        for code in ('A', 'B'):
+            dates = pd.bdate_range('2023-01-02', '2023-03-31')
+            closes = 10000 * np.cumprod(1 + rng.normal(0, 0.02, len(dates)))
+            cache.append(code, pd.DataFrame({'open': closes, 'high': closes, 'low': closes,
+                                             'close': closes, 'volume': 1000.0}, index=dates))
+    
+        spec = CachedDataSpec(cache_dir, ['A', 'B'], '2023-01-01', '2023-03-31')
+        tasks = build_sweep_tasks([BacktestConfig(start_date="2023-01-01", end_date="2023-03-31")])
+    
+        table = BacktestSweepRunner(spec, max_workers=1).run(tasks)
+    
+        _init_worker(spec, "WARNING")
+        assert sorted(backtest_sweep._WORKER_DATA) == ['A', 'B']
+        expected = _run_sweep_task(tasks[0])
+        assert abs(table.iloc[0]['final_capital'] - expected['final_capital']) < 1e-6
+
+if __name__ == "__main__":
+    test_append_and_read()
+    test_read_is_zero_copy_memmap()
+    test_missing_range()
+    test_append_recovers_from_partial_write()
+    test_engine_uses_cache()
+    test_sweep_workers_load_from_cache()
+    print("✅ OHLCV 캐시 테스트 통과")
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+포트폴리오 최적화 솔버 테스트
+해석적 기울기, 닫힌 해, 직전 가중치 시작점, 효율적 프론티어의 분해 재사용을 확인합니다.
+"""
+
+import sys
+import os
+import time
+from contextlib import contextmanager
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+from scipy.optimize import minimize, check_grad
+from loguru import logger
+
+import portfolio_optimizer
+import advanced_analytics_system
+from portfolio_optimizer import PortfolioOptimizer, Portfolio
+
+logger.remove()
+logger.add(sys.stderr, level="WARNING")
+
+def _market(n_assets: int = 8, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    loadings = rng.normal(size=(n_assets, n_assets))
+    cov_matrix = loadings @ loadings.T / 50 + np.eye(n_assets) * 0.01
+    expected_returns = rng.normal(0.08, 0.05, n_assets)
+    return expected_returns, cov_matrix
+
+def _returns(num_days: int = 500, n_assets: int = 6, seed: int = 1) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    market = rng.normal(0, 0.01, (num_days, 1))
+    return pd.DataFrame(rng.normal(0.0005, 0.02, (num_days, n_assets)) + market,
+                        columns=[f"{i:06d}" for i in range(n_assets)])
+
+@contextmanager
+def _capture_minimize():
+    """portfolio_optimizer의 minimize 호출 인자 기록"""
+    calls = []
+    
+    def spy(fun, x0, jac=None, **kwargs):
+        calls.append({'fun': fun, 'x0': np.array(x0), 'jac': jac})
+        return minimize(fun, x0, jac=jac, **kwargs)
+    
+    portfolio_optimizer.minimize = spy
+    try:
+        yield calls
+    finally:
+        portfolio_optimizer.minimize = minimize
+
+def test_analytic_gradients():
+    """목적 함수별 해석적 기울기 = 수치 기울기"""
+    expected_returns, cov_matrix = _market()
+    optimizer = PortfolioOptimizer()
+    
+    with _capture_minimize() as calls:
+        optimizer._markowitz_optimization(expected_returns, cov_matrix, {})
+        optimizer._max_sharpe_optimization(expected_returns, cov_matrix, {})
+        optimizer._min_variance_optimization(cov_matrix, {})
+        optimizer._risk_parity_optimization(cov_matrix, {})
+    assert len(calls) == 4
+    
+    rng = np.random.default_rng(2)
+    for call in calls:
+        assert call['jac'] is not None
+        weights = rng.dirichlet(np.ones(len(expected_returns)))
+        assert check_grad(call['fun'], call['jac'], weights) < 1e-6
+
+def test_closed_form_when_bounds_inactive():
+    """경계 제약이 걸리지 않으면 수치 최적화 없이 닫힌 해"""
+    expected_returns, cov_matrix = _market(5)
+    optimizer = PortfolioOptimizer()
+    optimizer.min_weight, optimizer.max_weight = -10.0, 10.0
+    inverse = np.linalg.inv(cov_matrix)
+    ones = np.ones(5)
+    
+    with _capture_minimize() as calls:
+        min_variance = optimizer._min_variance_optimization(cov_matrix, {})
+        max_sharpe = optimizer._max_sharpe_optimization(expected_returns, cov_matrix, {})
+        markowitz = optimizer._markowitz_optimization(expected_returns, cov_matrix, {})
+    
+    np.testing.assert_allclose(min_variance, inverse @ ones / (ones @ inverse @ ones), rtol=1e-10)
+    
+    tangency = inverse @ (expected_returns - optimizer.risk_free_rate)
+    np.testing.assert_allclose(max_sharpe, tangency / tangency.sum(), rtol=1e-10)
+    
+    assert abs(markowitz.sum() - 1) < 1e-10
+    assert abs(markowitz @ expected_returns - optimizer.target_return) < 1e-10
+    assert not calls
+
+def test_bounded_solution_matches_numeric_gradient():
+    """경계가 걸리는 경우 기존 수치 기울기 SLSQP와 같은 해"""
+    expected_returns, cov_matrix = _market()
+    optimizer = PortfolioOptimizer()
+    n_assets = len(expected_returns)
+    bounds = [(optimizer.min_weight, optimizer.max_weight)] * n_assets
+    budget = [{'type': 'eq', 'fun': lambda x: np.sum(x) - 1}]
+    
+    def reference(objective):
+        return minimize(objective, np.ones(n_assets) / n_assets, method='SLSQP',
+                        bounds=bounds, constraints=budget).x
+    
+    def variance(w):
+        return w @ cov_matrix @ w
+    
+    def negative_sharpe(w):
+        return -(w @ expected_returns - optimizer.risk_free_rate) / np.sqrt(variance(w))
+    
+    weights = optimizer._min_variance_optimization(cov_matrix, {})
+    assert variance(weights) <= variance(reference(variance)) * (1 + 1e-4)
+    
+    weights = optimizer._max_sharpe_optimization(expected_returns, cov_matrix, {})
+    assert negative_sharpe(weights) <= negative_sharpe(reference(negative_sharpe)) + 1e-4
+    assert weights.max() <= optimizer.max_weight + 1e-8
+
+def test_rebalance_warm_starts_from_current_weights():
+    """리밸런싱은 직전 포트폴리오 가중치에서 시작"""
+    returns = _returns()
+    optimizer = PortfolioOptimizer()
+    current = optimizer.optimize_portfolio(returns.iloc[:250])
+    
+    with _capture_minimize() as calls:
+        rebalanced = optimizer.rebalance_portfolio(current, {}, returns)
+    assert isinstance(rebalanced, Portfolio)
+    if calls:  # 닫힌 해가 경계 안이면 수치 최적화 생략
+        np.testing.assert_allclose(calls[0]['x0'], current.weights / current.weights.sum())
+    
+    # 경계 밖 시작점은 경계 안으로 맞춤
+    start = optimizer._initial_weights(6, np.array([0.9, 0.1, 0.0, 0.0, 0.0, 0.0]))
+    assert abs(start.sum() - 1) < 1e-12
+    assert start.min() > 0
+
+def test_efficient_frontier_reuses_factorization():
+    """효율적 프론티어는 공분산 분해 1회, 점별 결과는 개별 최적화 이상"""
+    returns = _returns(n_assets=10)
+    optimizer = advanced_analytics_system.PortfolioOptimizer()
+    
+    factorizations = []
+    original = advanced_analytics_system.cho_factor
+    advanced_analytics_system.cho_factor = lambda *args, **kwargs: factorizations.append(1) or original(*args, **kwargs)
+    try:
+        started = time.perf_counter()
+        frontier = optimizer.efficient_frontier(returns, n_portfolios=100)
+        elapsed = time.perf_counter() - started
+    finally:
+        advanced_analytics_system.cho_factor = original
+    
+    assert len(factorizations) == 1
+    assert len(frontier) == 100
+    assert elapsed < 2.0
+    np.testing.assert_allclose(frontier['actual_return'], frontier['target_return'], atol=1e-6)
+    
+    for _, point in frontier.iloc[::20].iterrows():
+        single = optimizer.optimize_portfolio(returns, method='min_variance', constraints={
+            'target_return': point['target_return'], 'min_weight': 0.0, 'max_weight': 1.0
+        })
+        assert single['optimization_success']
+        assert point['volatility'] <= single['metrics']['volatility'] + 1e-6
+
+if __name__ == "__main__":
+    test_analytic_gradients()
+    test_closed_form_when_bounds_inactive()
+    test_bounded_solution_matches_numeric_gradient()
+    test_rebalance_warm_starts_from_current_weights()
+    test_efficient_frontier_reuses_factorization()
+    print("✅ 포트폴리오 최적화 솔버 테스트 통과")
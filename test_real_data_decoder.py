@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+키움 실시간 데이터 디코더 테스트
+기록된 real_data 문자열 일괄 디코딩이 FID별 GetCommRealData 조회(MockQAxWidget)와 같은지 확인합니다.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from loguru import logger
+
+from real_data_decoder import (
+    RealDataDecoder, StockTick, REAL_DATA_LAYOUTS, fid_offsets, parse_fid_list, encode_real_data
+)
+from cross_platform_trader import MockQAxWidget
+
+logger.remove()
+logger.add(sys.stderr, level="WARNING")
+
+# 기록된 주식체결 데이터 (가격/체결량의 부호는 방향/매수·매도 구분)
+RECORDED = [
+    ("005930", "주식체결", encode_real_data("주식체결", {
+        20: "090001", 10: "+61200", 11: "+300", 12: "+0.49", 27: "+61300", 28: "+61200",
+        15: "+152", 13: "1234567", 14: "75512", 16: "+61000", 17: "+61500", 18: "-60800", 25: "2",
+    })),
+    ("000660", "주식체결", encode_real_data("주식체결", {
+        20: "090002", 10: "-118500", 11: "-1500", 12: "-1.25", 15: "-37", 13: "402113",
+        16: "+120500", 17: "+121000", 18: "-118000", 25: "5",
+    })),
+    ("005930", "주식체결", encode_real_data("주식체결", {
+        20: "090003", 10: "+61300", 11: "+400", 12: "+0.66", 15: "+10", 13: "1234577",
+        16: "+61000", 17: "+61500", 18: "-60800",
+    })),
+]
+
+def _get_comm_real_data(widget, code):
+    return lambda fid: widget.dynamicCall("GetCommRealData(QString, int)", code, fid)
+
+def test_decode_recorded_payload():
+    """real_data 한 번 분리로 체결 레코드 생성"""
+    decoder = RealDataDecoder()
+    tick = decoder.decode_stock_tick("005930", RECORDED[0][2])
+    assert tick == StockTick(code="005930", current_price=61200, volume=152, change=300, change_rate=0.49,
+                             open_price=61000, high_price=61500, low_price=60800, total_volume=1234567,
+                             trade_time="090001")
+
+    down = decoder.decode_stock_tick("000660", RECORDED[1][2])
+    assert down.current_price == 118500 and down.change == -1500 and down.change_rate == -1.25
+    assert down.volume == 37
+
+def test_matches_get_comm_real_data():
+    """일괄 디코딩 = MockQAxWidget의 FID별 GetCommRealData 조회"""
+    decoder = RealDataDecoder()
+    widget = MockQAxWidget()
+    decoded = []
+    widget.real_data_handlers.append(lambda code, real_type, real_data: decoded.append(
+        (decoder.decode_stock_tick(code, real_data), decoder.decode_stock_tick_from(code, _get_comm_real_data(widget, code)))
+    ))
+
+    widget.replay_real_data(RECORDED)
+    assert len(decoded) == len(RECORDED)
+    for batched, per_fid in decoded:
+        assert batched is not None and batched == per_fid
+
+    # 리스트 인자 호출 방식도 유지
+    assert widget.dynamicCall("GetCommRealData(QString, int)", ["005930", 10]) == "+61300"
+
+def test_fid_offsets_and_split():
+    """FID 목록 → 오프셋 조회표"""
+    layout = REAL_DATA_LAYOUTS["주식체결"]
+    fids = parse_fid_list("10;15;12;13;16;17;18;20")
+    assert fids == (10, 15, 12, 13, 16, 17, 18, 20)
+    assert fid_offsets("주식체결", fids) == tuple(layout.index(fid) for fid in fids)
+    assert fid_offsets("주식체결", fids) is fid_offsets("주식체결", fids)  # 캐시 재사용
+    assert fid_offsets("주식체결", (10, 99999)) is None
+    assert fid_offsets("알수없음", (10,)) is None
+
+    decoder = RealDataDecoder()
+    assert decoder.split("주식체결", RECORDED[0][2], (10, 20)) == ["+61200", "090001"]
+    assert decoder.split("주식체결", "1\t2", (10, 13)) is None
+
+def test_malformed_payload_falls_back():
+    """형식이 맞지 않는 real_data는 None (호출 측에서 FID별 조회로 대체)"""
+    decoder = RealDataDecoder()
+    assert decoder.decode_stock_tick("005930", None) is None
+    assert decoder.decode_stock_tick("005930", "") is None
+    assert decoder.decode_stock_tick("005930", "090001\t+61200") is None
+
+    broken = RECORDED[0][2].split('\t')
+    broken[1] = ""
+    assert decoder.decode_stock_tick("005930", '\t'.join(broken)) is None
+
+if __name__ == "__main__":
+    test_decode_recorded_payload()
+    test_matches_get_comm_real_data()
+    test_fid_offsets_and_split()
+    test_malformed_payload_falls_back()
+    print("✅ 키움 실시간 데이터 디코더 테스트 통과")
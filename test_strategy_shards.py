@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+종목별 전략 상태 샤딩 테스트
+가격 링 버퍼, 종목 간 가격 이력 분리, 코드 해시 샤딩과 프로세스 분할 신호 병합을 확인합니다.
+"""
+
+import sys
+import os
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from datetime import datetime, timedelta
+from loguru import logger
+
+from trading_strategy import (
+    PriceRingBuffer, StrategyConfig, StrategyType, MovingAverageCrossoverStrategy, create_default_strategies
+)
+from integrated_auto_trader import IntegratedAutoTrader, TradeConfig
+from integrated_backtesting_interface import IntegratedBacktestingInterface, OptimizationResult
+from strategy_shards import (
+    ShardedStrategyManager, shard_index, partition_ticks, generate_signals_by_shard
+)
+
+logger.remove()
+logger.add(sys.stderr, level="WARNING")
+
+START = datetime(2024, 1, 2, 9, 0)
+
+def _prices(seed: int, n: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return np.round(10000 * np.exp(np.cumsum(rng.normal(0, 0.01, n))))
+
+def _signal_keys(signals):
+    return [(s.code, s.strategy, s.signal_type, round(s.confidence, 9), s.price) for s in signals]
+
+def test_price_ring_buffer_wraps():
+    """용량을 넘으면 가장 오래된 가격부터 덮어쓰고 최근 가격은 연속 뷰"""
+    history = PriceRingBuffer(capacity=5)
+    assert len(history) == 0 and history.prices().size == 0
+
+    for i in range(12):
+        history.append(100 + i, START + timedelta(minutes=i))
+
+    assert len(history) == 5 and history.count == 12
+    prices = history.prices()
+    np.testing.assert_array_equal(prices, 100 + np.arange(7, 12))
+    assert np.shares_memory(prices, history._prices) and not prices.flags.writeable
+    np.testing.assert_array_equal(history.prices(2), [110, 111])
+
+    # 기존 리스트 형식 접근
+    assert history[-1] == {'price': 111.0, 'timestamp': START + timedelta(minutes=11)}
+    assert history[0]['price'] == 107 and history.price(-2) == 110
+    assert [item['price'] for item in history] == [107, 108, 109, 110, 111]
+    assert [item['price'] for item in history[-2:]] == [110, 111]
+    try:
+        history[5]
+        assert False, "범위 밖 인덱스"
+    except IndexError:
+        pass
+
+def test_strategy_history_is_bounded():
+    """전략 가격 이력은 설정한 용량까지만 유지"""
+    config = StrategyConfig(strategy_type=StrategyType.MOVING_AVERAGE_CROSSOVER,
+                            parameters={'short_period': 3, 'long_period': 5, 'history_capacity': 50})
+    strategy = MovingAverageCrossoverStrategy(config)
+    for price in _prices(1, 200):
+        strategy.add_price_data(price)
+
+    assert len(strategy.price_history) == 50 and strategy.price_history.capacity == 50
+
+def test_codes_do_not_share_history():
+    """여러 종목 틱이 섞여 들어와도 종목별 신호는 해당 종목만 받은 매니저와 같음"""
+    prices = {'005930': _prices(2, 120), '000660': _prices(3, 120), '035420': _prices(4, 120)}
+    sharded = ShardedStrategyManager(num_shards=2)
+    single = {code: create_default_strategies() for code in prices}
+
+    interleaved, expected = [], []
+    for i in range(120):
+        for code, series in prices.items():
+            sharded.update_price(code, series[i])
+            interleaved.extend(sharded.generate_signals(code))
+
+            single[code].update_price(series[i])
+            for signal in single[code].generate_signals():
+                signal.code = code
+                expected.append(signal)
+
+    assert len(expected) > 0
+    assert _signal_keys(interleaved) == _signal_keys(expected)
+    assert sorted(sharded.codes) == sorted(prices)
+    assert all(len(sharded.shard_for(code).manager(code).strategies['MACD'].price_history) == 120
+               for code in prices)
+    assert list(sharded.signal_history) == interleaved
+
+def test_shard_assignment_and_fan_in():
+    """샤드 번호는 코드 해시로 고정, 신호는 fan-in 핸들러로 하나씩 전달"""
+    codes = [f"{i:06d}" for i in range(200)]
+    assert [shard_index(code, 4) for code in codes] == [shard_index(code, 4) for code in codes]
+    assert {shard_index(code, 4) for code in codes} == {0, 1, 2, 3}
+
+    ticks = [(code, 1000.0, None) for code in codes[:20]] * 3
+    partitions = partition_ticks(ticks, 4)
+    assert sum(len(partition) for partition in partitions) == len(ticks)
+    for index, partition in enumerate(partitions):
+        assert all(shard_index(code, 4) == index for _, code, _, _ in partition)
+        assert [seq for seq, _, _, _ in partition] == sorted(seq for seq, _, _, _ in partition)
+
+    # 워커 스레드별로 다른 종목을 동시에 처리
+    manager = ShardedStrategyManager(num_shards=4)
+    received = []
+    active = []
+    overlaps = []
+
+    def handler(signal):
+        active.append(signal)
+        if len(active) > 1:
+            overlaps.append(signal.code)
+        received.append(signal.code)
+        active.pop()
+
+    manager.add_signal_handler(handler)
+    series = {code: _prices(i, 80) for i, code in enumerate(codes[:8])}
+
+    def worker(worker_codes):
+        for i in range(80):
+            for code in worker_codes:
+                manager.update_price(code, series[code][i])
+                manager.generate_signals(code)
+
+    threads = [threading.Thread(target=worker, args=(codes[i:8:4],)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not overlaps and len(received) > 0
+    assert len(manager.signal_history) == min(len(received), manager.signal_history.maxlen)
+    assert sorted(manager.codes) == sorted(series)
+
+def test_process_shards_match_single_process():
+    """샤드별 프로세스 처리 결과를 틱 순서로 병합하면 한 프로세스 처리와 같음"""
+    series = {code: _prices(10 + i, 60) for i, code in enumerate(['005930', '000660', '035420', '051910'])}
+    ticks = [(code, series[code][i], START + timedelta(minutes=i)) for i in range(60) for code in series]
+
+    sequential = generate_signals_by_shard(ticks, num_shards=1, max_workers=1)
+    parallel = generate_signals_by_shard(ticks, num_shards=3, max_workers=2)
+
+    assert len(sequential) > 0
+    assert _signal_keys(parallel) == _signal_keys(sequential)
+
+def test_optimized_strategy_applied_per_code():
+    """최적화 전략 적용 시 기존 StrategyManager 구성을 원본으로 종목별 상태를 만듦"""
+    interface = IntegratedBacktestingInterface()
+    interface.auto_trader = IntegratedAutoTrader(TradeConfig(tick_workers=2))
+    result = OptimizationResult(strategy_name="이동평균크로스오버", parameters={'short_period': 3, 'long_period': 8},
+                                backtest_result=None, performance_score=0.0, risk_score=0.0, combined_score=0.0)
+    assert interface.apply_optimized_strategy(result)
+
+    trader = interface.auto_trader
+    manager = trader.strategy_manager
+    assert isinstance(manager, ShardedStrategyManager) and manager.num_shards == 2
+    assert list(manager.strategies) == ['optimized']
+
+    prices = {'005930': _prices(20, 100), '000660': _prices(21, 100)}
+    signals = []
+    for i in range(100):
+        for code, series in prices.items():
+            trader._update_price_data(code, series[i])
+            signals.extend(trader._generate_signals(code, series[i]))
+
+    assert len(signals) > 0 and {signal.code for signal in signals} <= set(prices)
+    for code, series in prices.items():
+        history = manager.shard_for(code).manager(code).strategies['optimized'].price_history
+        np.testing.assert_array_equal(history.prices(), series)
+
+if __name__ == "__main__":
+    test_price_ring_buffer_wraps()
+    test_strategy_history_is_bounded()
+    test_codes_do_not_share_history()
+    test_shard_assignment_and_fan_in()
+    test_process_shards_match_single_process()
+    test_optimized_strategy_applied_per_code()
+    print("✅ 종목별 전략 상태 샤딩 테스트 통과")
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스트리밍 지표 테스트
+O(1) 갱신 지표가 배치 계산 결과와 같고, 전략의 스트리밍 모드가 동일한 신호를 내는지 확인합니다.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from datetime import datetime, timedelta
+import numpy as np
+
+from technical_indicators import (
+    calculate_sma, calculate_ema, calculate_rsi, calculate_bollinger_bands, calculate_macd
+)
+from streaming_indicators import (
+    StreamingSMA, StreamingEMA, StreamingRSI, StreamingBollingerBands, StreamingMACD
+)
+from trading_strategy import (
+    StrategyConfig, StrategyType, MovingAverageCrossoverStrategy, RSIStrategy,
+    BollingerBandsStrategy, MACDStrategy
+)
+
+TOLERANCE = 1e-7
+
+def _sample_prices(n=400, seed=3):
+    rng = np.random.default_rng(seed)
+    prices = 50000 * np.cumprod(1 + rng.normal(0, 0.02, n))
+    if n > 215:
+        prices[200:215] = prices[200]  # 횡보 구간
+    return prices.tolist()
+
+def _stream(indicator, prices):
+    values = []
+    for price in prices:
+        value = indicator.update(price)
+        if value is not None:
+            values.append(value)
+    return values
+
+def test_streaming_matches_batch():
+    """스트리밍 지표와 배치 지표 값 비교"""
+    prices = _sample_prices()
+    
+    np.testing.assert_allclose(_stream(StreamingSMA(20), prices), calculate_sma(prices, 20), rtol=TOLERANCE)
+    np.testing.assert_allclose(_stream(StreamingEMA(12), prices), calculate_ema(prices, 12), rtol=TOLERANCE)
+    np.testing.assert_allclose(_stream(StreamingRSI(14), prices), calculate_rsi(prices, 14), rtol=TOLERANCE)
+    
+    bands = _stream(StreamingBollingerBands(20, 2.0), prices)
+    expected = calculate_bollinger_bands(prices, 20, 2.0)
+    np.testing.assert_allclose([b[0] for b in bands], expected['upper'], rtol=TOLERANCE)
+    np.testing.assert_allclose([b[2] for b in bands], expected['lower'], rtol=TOLERANCE)
+    
+    macd = _stream(StreamingMACD(12, 26, 9), prices)
+    expected = calculate_macd(prices, 12, 26, 9)
+    np.testing.assert_allclose([m[1] for m in macd], expected['signal'], rtol=TOLERANCE, atol=TOLERANCE)
+    np.testing.assert_allclose([m[0] for m in macd], expected['macd'][-len(macd):], rtol=TOLERANCE, atol=TOLERANCE)
+
+def test_streaming_state_is_bounded():
+    """지표 상태가 입력 길이와 무관하게 고정 크기인지 확인"""
+    sma = StreamingSMA(5)
+    bb = StreamingBollingerBands(5, 2.0)
+    for price in _sample_prices(2000):
+        sma.update(price)
+        bb.update(price)
+    assert len(sma.window) == 5 and len(sma.history) == 2
+    assert len(bb.window) == 5 and len(bb.history) == 2
+
+def _strategy_pairs():
+    specs = [
+        (MovingAverageCrossoverStrategy, StrategyType.MOVING_AVERAGE_CROSSOVER,
+         {'short_period': 3, 'long_period': 8, 'min_cross_threshold': 0.0001}),
+        (RSIStrategy, StrategyType.RSI_STRATEGY,
+         {'rsi_period': 5, 'oversold_threshold': 40, 'overbought_threshold': 60, 'confirmation_period': 3}),
+        (BollingerBandsStrategy, StrategyType.BOLLINGER_BANDS,
+         {'period': 5, 'std_dev': 0.5, 'min_touch_threshold': 0.0001}),
+        (MACDStrategy, StrategyType.MACD_STRATEGY,
+         {'fast_period': 3, 'slow_period': 6, 'signal_period': 3, 'min_cross_threshold': 0.0})
+    ]
+    for strategy_class, strategy_type, parameters in specs:
+        batch = strategy_class(StrategyConfig(strategy_type=strategy_type, parameters=dict(parameters)))
+        streaming = strategy_class(StrategyConfig(strategy_type=strategy_type,
+                                                  parameters=dict(parameters, streaming=True)))
+        yield batch, streaming
+
+def test_strategy_streaming_signals_match_batch():
+    """전략별 스트리밍 모드와 배치 모드의 신호 일치 확인"""
+    prices = _sample_prices(300)
+    start = datetime(2024, 1, 2, 9, 0)
+    
+    for batch, streaming in _strategy_pairs():
+        signal_count = 0
+        for i, price in enumerate(prices):
+            timestamp = start + timedelta(seconds=i)
+            batch.add_price_data(price, timestamp)
+            streaming.add_price_data(price, timestamp)
+            
+            expected = batch.generate_signal()
+            actual = streaming.generate_signal()
+            assert (expected is None) == (actual is None), f"{batch.strategy_type} @ {i}"
+            if expected:
+                signal_count += 1
+                assert expected.signal_type == actual.signal_type
+                assert abs(expected.confidence - actual.confidence) < 1e-6
+        
+        assert signal_count > 0, f"{batch.strategy_type} 신호 없음"
+
+def test_strategy_data_state_roundtrip():
+    """종목별 데이터 상태 교체 후에도 지표 상태가 유지되는지 확인"""
+    _, strategy = next(_strategy_pairs())
+    for price in _sample_prices(20):
+        strategy.add_price_data(price)
+    state = strategy.get_data_state()
+    
+    strategy.reset_data()
+    assert len(strategy.price_history) == 0 and strategy.indicators == {}
+    
+    strategy.set_data_state(state)
+    assert len(strategy.price_history) == 20
+    assert strategy.indicators['long_ma'].is_ready
+
+if __name__ == "__main__":
+    test_streaming_matches_batch()
+    test_streaming_state_is_bounded()
+    test_strategy_streaming_signals_match_batch()
+    test_strategy_data_state_roundtrip()
+    print("✅ 스트리밍 지표 테스트 통과")
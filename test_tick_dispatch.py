@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+이벤트 기반 틱 디스패치 테스트
+종목별 제한 큐의 틱 합침/순서 보장, 지연 시간 히스토그램,
+모의 틱 피드로 구동한 IntegratedAutoTrader의 신호 → 페이퍼 주문 경로를 확인합니다.
+"""
+
+import sys
+import os
+import time
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from datetime import datetime
+from loguru import logger
+
+from tick_dispatcher import TickDispatcher, LatencyHistogram
+from integrated_auto_trader import IntegratedAutoTrader, TradeConfig
+from kiwoom_mac_compatible import KiwoomMacAPI
+from trading_strategy import TradingSignal, SignalType, StrategyType
+
+logger.remove()
+logger.add(sys.stderr, level="WARNING")
+
+def test_coalesces_stale_ticks():
+    """처리가 밀리면 대기 틱은 최신 틱 하나로 합쳐짐"""
+    gate = threading.Event()
+    handled = []
+
+    def handler(event):
+        gate.wait(5)
+        handled.append((event.price, event.coalesced))
+
+    dispatcher = TickDispatcher(handler, max_pending_per_code=1)
+    dispatcher.start()
+    try:
+        dispatcher.submit('005930', 100)
+        while dispatcher.pending_count():  # 첫 틱이 핸들러에 들어갈 때까지
+            time.sleep(0.001)
+        for price in range(101, 111):
+            dispatcher.submit('005930', price)
+        assert dispatcher.pending_count() == 1
+
+        gate.set()
+        assert dispatcher.wait_idle(5)
+    finally:
+        dispatcher.stop()
+
+    assert handled == [(100, 0), (110, 9)]
+    assert dispatcher.stats['received'] == 11 and dispatcher.stats['dispatched'] == 2
+    assert dispatcher.stats['coalesced'] == 9
+    assert dispatcher.queue_latency.count == 2
+
+def test_per_code_order_with_workers():
+    """워커가 여러 개여도 종목 내 틱은 순서대로 한 번에 하나씩 처리"""
+    lock = threading.Lock()
+    active = set()
+    seen = {}
+    overlaps = []
+
+    def handler(event):
+        with lock:
+            if event.code in active:
+                overlaps.append(event.code)
+            active.add(event.code)
+        time.sleep(0.0005)
+        with lock:
+            active.discard(event.code)
+            seen.setdefault(event.code, []).append(event.price)
+
+    dispatcher = TickDispatcher(handler, max_pending_per_code=1000, workers=4)
+    dispatcher.start()
+    try:
+        for i in range(50):
+            for code in ('A', 'B', 'C'):
+                dispatcher.submit(code, i)
+        assert dispatcher.wait_idle(10)
+    finally:
+        dispatcher.stop()
+
+    assert not overlaps
+    assert all(seen[code] == list(range(50)) for code in ('A', 'B', 'C'))
+    assert dispatcher.stats['coalesced'] == 0
+
+def test_handler_error_does_not_stop_worker():
+    """핸들러 예외는 기록만 하고 다음 틱 처리"""
+    handled = []
+
+    def handler(event):
+        if event.price < 0:
+            raise ValueError("잘못된 가격")
+        handled.append(event.price)
+
+    dispatcher = TickDispatcher(handler, max_pending_per_code=10)
+    dispatcher.start()
+    try:
+        dispatcher.submit('A', -1)
+        dispatcher.submit('A', 1)
+        assert dispatcher.wait_idle(5)
+    finally:
+        dispatcher.stop()
+
+    assert handled == [1] and dispatcher.stats['errors'] == 1
+
+def test_latency_histogram_percentiles():
+    """로그 구간 히스토그램 백분위 (구간 상한, 최댓값 이하)"""
+    histogram = LatencyHistogram()
+    assert histogram.percentile(99) == 0.0
+
+    for _ in range(90):
+        histogram.record(0.001)
+    for _ in range(10):
+        histogram.record(0.1)
+
+    assert 0.001 <= histogram.percentile(50) < 0.0014
+    assert 0.001 <= histogram.percentile(90) < 0.0014
+    assert histogram.percentile(99) == 0.1  # 최댓값으로 제한
+    summary = histogram.summary()
+    assert summary['count'] == 100 and summary['max_ms'] == 100.0
+    assert abs(summary['mean_ms'] - 10.9) < 1e-9
+
+    histogram.record(100.0)  # 10초 초과 구간
+    assert histogram.percentile(100) == 100.0
+
+class StubStrategyManager:
+    """가격이 기준가 이하면 매수, 이상이면 매도 신호"""
+
+    def __init__(self, buy_below: float, sell_above: float):
+        self.buy_below = buy_below
+        self.sell_above = sell_above
+        self.last_price = None
+
+    def update_price(self, code: str, price: float):
+        self.last_price = price
+
+    def generate_signals(self, code: str):
+        if self.last_price <= self.buy_below:
+            signal_type = SignalType.BUY
+        elif self.last_price >= self.sell_above:
+            signal_type = SignalType.SELL
+        else:
+            return []
+        return [TradingSignal(strategy=StrategyType.MOVING_AVERAGE_CROSSOVER, signal_type=signal_type,
+                              confidence=0.9, price=self.last_price, timestamp=datetime.now())]
+
+class FeedTrader(IntegratedAutoTrader):
+    """거래 시간과 관계없이 틱을 처리하는 모의 피드용 트레이더"""
+
+    def _is_trading_time(self) -> bool:
+        return True
+
+def test_trader_driven_by_simulated_feed():
+    """모의 틱 피드 → 디스패처 → 신호 → 페이퍼 주문, 지연 시간 기록"""
+    trader = FeedTrader(TradeConfig(max_position_size=100000))
+    trader.strategy_manager = StubStrategyManager(buy_below=1000, sell_above=1100)
+    trader.is_running = True
+    trader.trading_enabled = True
+    trader.tick_dispatcher.start()
+
+    prices = [1050, 1000, 1020, 1080, 1100, 1060, 990]
+
+    def feed():
+        for i, price in enumerate(prices):
+            # KiwoomAPI 배치 콜백과 같은 (종목, 틱 데이터) 호출, 부호는 등락 방향
+            trader._on_real_data('005930', {'code': '005930', 'current_price': -price if i % 2 else price,
+                                            'volume': 100, 'real_type': "주식체결"})
+            trader.tick_dispatcher.wait_idle(5)
+        trader.on_tick('000660', 1200)  # 보유하지 않은 종목 매도 신호는 무시
+
+    try:
+        thread = threading.Thread(target=feed)
+        thread.start()
+        thread.join(10)
+        assert trader.tick_dispatcher.wait_idle(5)
+    finally:
+        trader.is_running = False
+        trader.tick_dispatcher.stop()
+
+    assert [(t['type'], t['price']) for t in trader.trades] == [('매수', 1000), ('매도', 1100), ('매수', 990)]
+    assert trader.stats['total_trades'] == 1 and trader.stats['total_profit'] == 100 * 100
+    assert '005930' in trader.positions and '000660' not in trader.positions
+
+    stats = trader.get_latency_stats()
+    assert stats['feed'] == {'mode': 'stream', 'poll_interval_ms': 500.0}
+    assert stats['dispatcher']['received'] == len(prices) + 1
+    assert stats['queue']['count'] == len(prices) + 1
+    assert stats['signal']['count'] == len(prices) + 1
+    assert stats['order']['count'] == 3
+    assert 0 < stats['order']['p99_ms'] < 1000
+
+class CacheStubMacAPI(KiwoomMacAPI):
+    """서버 /real-data-cache 응답을 미리 정한 값으로 대신하는 Mac API"""
+
+    def __init__(self, snapshots):
+        super().__init__("http://localhost:0")
+        self.snapshots = list(snapshots)
+
+    def get_real_data_cache(self, code: str = None):
+        return self.snapshots.pop(0) if self.snapshots else {}
+
+def test_mac_api_pushes_ticks_and_polling_fallback():
+    """Mac API는 서버 캐시에서 바뀐 틱만 콜백으로 전달, 폴링 모드도 같은 형식을 읽음"""
+    snapshots = [
+        {'005930': {'code': '005930', 'price': 1000, 'volume': 10, 'timestamp': 't1'}},
+        {'005930': {'code': '005930', 'price': 1000, 'volume': 10, 'timestamp': 't1'},  # 변화 없음
+         '000660': {}},
+        {'005930': {'code': '005930', 'price': 1100, 'volume': 20, 'timestamp': 't2'}},
+    ]
+
+    trader = FeedTrader(TradeConfig())
+    trader.strategy_manager = StubStrategyManager(buy_below=1000, sell_above=1100)
+    trader.kiwoom_api = CacheStubMacAPI(snapshots)
+    trader.kiwoom_api.set_real_data_callback(trader._on_real_data)
+    trader.is_running = True
+    trader.trading_enabled = True
+    trader.tick_dispatcher.start()
+    try:
+        trader.kiwoom_api.start_real_data_stream(interval=0.01)
+        deadline = time.monotonic() + 5
+        while trader.kiwoom_api.snapshots and time.monotonic() < deadline:
+            time.sleep(0.01)
+        trader.kiwoom_api.stop_real_data_stream()
+        assert trader.tick_dispatcher.wait_idle(5)
+
+        # 폴링 모드: Windows 서버 캐시 형식 {code: {'price': ...}}
+        trader.kiwoom_api.snapshots = [{'035420': {'code': '035420', 'price': 900, 'timestamp': 't3'}}] * 2
+        trader._poll_real_data_cache()
+        trader._poll_real_data_cache()  # 같은 가격은 다시 공급하지 않음
+        assert trader.tick_dispatcher.wait_idle(5)
+        # KiwoomAPI 전체 캐시 형식 {code: {'data': {'current_price': ...}, 'timestamp': ...}}
+        trader.kiwoom_api.snapshots = [{'035420': {'data': {'code': '035420', 'current_price': 1100},
+                                                   'timestamp': 't4'}}]
+        trader._poll_real_data_cache()
+        assert trader.tick_dispatcher.wait_idle(5)
+    finally:
+        trader.is_running = False
+        trader.tick_dispatcher.stop()
+
+    assert [(t['code'], t['type'], t['price']) for t in trader.trades] == \
+        [('005930', '매수', 1000), ('005930', '매도', 1100), ('035420', '매수', 900), ('035420', '매도', 1100)]
+    assert trader.tick_dispatcher.stats['received'] == 4
+
+def test_trader_ignores_ticks_when_disabled():
+    """거래 불가(시간 외/손실 한도) 상태에서는 틱을 받아도 신호를 만들지 않음"""
+    trader = FeedTrader(TradeConfig())
+    trader.strategy_manager = StubStrategyManager(buy_below=1000, sell_above=1100)
+    trader.is_running = True
+    trader.trading_enabled = False
+    trader.tick_dispatcher.start()
+    try:
+        trader.on_tick('005930', 900)
+        trader.on_tick('005930', 0)  # 가격 없는 틱은 제출하지 않음
+        assert trader.tick_dispatcher.wait_idle(5)
+    finally:
+        trader.is_running = False
+        trader.tick_dispatcher.stop()
+
+    assert trader.tick_dispatcher.stats['received'] == 1
+    assert not trader.trades and trader.latency['signal'].count == 0
+
+if __name__ == "__main__":
+    test_coalesces_stale_ticks()
+    test_per_code_order_with_workers()
+    test_handler_error_does_not_stop_worker()
+    test_latency_histogram_percentiles()
+    test_trader_driven_by_simulated_feed()
+    test_mac_api_pushes_ticks_and_polling_fallback()
+    test_trader_ignores_ticks_when_disabled()
+    print("✅ 이벤트 기반 틱 디스패치 테스트 통과")
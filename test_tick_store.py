@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+실시간 체결 틱 저장소 테스트
+링 경계를 넘는 기록, 제로 카피 뷰, 잠금 없는 스냅샷 일관성, 기존 딕셔너리 형식 변환을 확인합니다.
+"""
+
+import sys
+import os
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from loguru import logger
+
+from tick_store import TickRingBuffer, TickStore, TICK_FIELDS
+
+logger.remove()
+logger.add(sys.stderr, level="WARNING")
+
+def _append(buffer: TickRingBuffer, i: int):
+    """i번째 틱 (모든 필드가 i로부터 결정됨)"""
+    buffer.append(1000 + i, i, i % 7 - 3, (i % 7 - 3) / 10, 990, 1000 + i, 990, 10 * i, 1_700_000_000.0 + i)
+
+def test_wraparound_keeps_latest():
+    """용량을 넘으면 가장 오래된 틱부터 덮어씀"""
+    buffer = TickRingBuffer('005930', capacity=8)
+    assert len(buffer) == 0 and buffer.latest() is None
+    assert buffer.snapshot()['current_price'].size == 0
+
+    for i in range(21):
+        _append(buffer, i)
+
+    assert len(buffer) == 8 and buffer.count == 21
+    np.testing.assert_array_equal(buffer.snapshot()['volume'], np.arange(13, 21))
+    np.testing.assert_array_equal(buffer.snapshot(3)['current_price'], 1000 + np.arange(18, 21))
+    assert buffer.last_price == 1020
+
+def test_view_is_zero_copy_and_contiguous():
+    """최근 n개 뷰는 링 경계와 관계없이 연속 구간이며 버퍼를 직접 가리킴"""
+    buffer = TickRingBuffer('005930', capacity=8)
+    for i in range(13):  # 링 시작 위치가 중간
+        _append(buffer, i)
+
+    prices = buffer.view('current_price', 6)
+    assert np.shares_memory(prices, buffer._data)
+    assert prices.flags.c_contiguous and not prices.flags.writeable
+    np.testing.assert_array_equal(prices, 1000 + np.arange(7, 13))
+
+    block = buffer.view()
+    assert block.shape == (len(TICK_FIELDS), 8)
+    np.testing.assert_array_equal(block[TICK_FIELDS.index('volume')], np.arange(5, 13))
+
+def test_records_match_dict_format():
+    """딕셔너리 변환은 기존 히스토리 형식과 같음"""
+    buffer = TickRingBuffer('005930', capacity=4)
+    for i in range(6):
+        _append(buffer, i)
+
+    records = buffer.records(2)
+    assert [r['volume'] for r in records] == [4, 5]
+    latest = buffer.latest()
+    assert latest == records[-1]
+    assert latest['code'] == '005930' and latest['real_type'] == "주식체결"
+    assert isinstance(latest['current_price'], int) and latest['change'] == 5 % 7 - 3
+    assert latest['timestamp'].timestamp() == 1_700_000_005.0
+
+    # 순번 조회: 덮어쓴 틱과 아직 없는 틱은 None
+    assert buffer.record(5)['volume'] == 5
+    assert buffer.record(2)['volume'] == 2
+    assert buffer.record(1) is None and buffer.record(6) is None
+
+def test_snapshot_without_lock_is_consistent():
+    """쓰기 스레드가 기록하는 동안 잠금 없이 읽은 스냅샷도 행이 섞이지 않음"""
+    buffer = TickRingBuffer('005930', capacity=64)
+    total = 50_000
+    done = threading.Event()
+
+    def writer():
+        for i in range(total):
+            _append(buffer, i)
+        done.set()
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    checked = 0
+    while not done.is_set() or checked == 0:
+        snapshot = buffer.snapshot(48)
+        volume = snapshot['volume']
+        if volume.size:
+            # 연속된 틱이고 모든 필드가 같은 틱에서 온 값
+            np.testing.assert_array_equal(np.diff(volume), 1)
+            np.testing.assert_array_equal(snapshot['current_price'], 1000 + volume)
+            np.testing.assert_array_equal(snapshot['total_volume'], 10 * volume)
+            checked += 1
+    thread.join()
+
+    assert checked > 0
+    assert buffer.snapshot(1)['volume'][0] == total - 1
+
+def test_store_creates_buffers_per_code():
+    """종목별 버퍼 생성"""
+    store = TickStore(capacity=16)
+    store.append('A', 100, 1, 0, 0.0, 100, 100, 100, 1)
+    store.append('B', 200, 2, 0, 0.0, 200, 200, 200, 2)
+    store.append('A', 101, 3, 1, 1.0, 100, 101, 100, 4)
+
+    assert sorted(store) == ['A', 'B']
+    assert len(store['A']) == 2 and store['A'].capacity == 16
+    assert store.buffer('A') is store['A']
+    np.testing.assert_array_equal(store['A'].view('current_price'), [100, 101])
+
+def test_clear_hides_earlier_ticks():
+    """정리 이후에는 이전 틱을 조회하지 않고 새 틱부터 다시 쌓임"""
+    store = TickStore(capacity=8)
+    for i in range(5):
+        _append(store.buffer('A'), i)
+        _append(store.buffer('B'), i)
+
+    store.clear_ticks('A')
+    buffer = store['A']
+    assert len(buffer) == 0 and buffer.latest() is None and buffer.record(4) is None
+    assert buffer.last_price == 0 and buffer.last_timestamp is None
+    assert buffer.snapshot()['volume'].size == 0 and buffer.view('volume').size == 0
+    assert len(store['B']) == 5  # 다른 종목은 영향 없음
+
+    for i in range(5, 7):
+        _append(buffer, i)
+    np.testing.assert_array_equal(buffer.snapshot()['volume'], [5, 6])
+    assert buffer.latest()['volume'] == 6 and buffer.record(4) is None
+
+    store.clear_ticks()
+    assert all(len(b) == 0 for b in store.values()) and sorted(store) == ['A', 'B']
+
+if __name__ == "__main__":
+    test_wraparound_keeps_latest()
+    test_view_is_zero_copy_and_contiguous()
+    test_records_match_dict_format()
+    test_snapshot_without_lock_is_consistent()
+    test_store_creates_buffers_per_code()
+    test_clear_hides_earlier_ticks()
+    print("✅ 실시간 체결 틱 저장소 테스트 통과")
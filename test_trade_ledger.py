@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+왕복 거래 원장 테스트
+FIFO/LIFO 로트 대응, 부분 청산, 대량 거래 처리 시간을 확인합니다.
+"""
+
+import sys
+import os
+import time
+import random
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+import numpy as np
+from loguru import logger
+
+from backtesting_system import (
+    Trade, TradeLedger, LotMatching, BacktestingEngine, BacktestConfig, BacktestMode,
+    MonteCarloSimulator
+)
+
+logger.remove()
+logger.add(sys.stderr, level="WARNING")
+
+START = datetime(2023, 1, 2)
+
+def _trade(day, code, action, quantity, price):
+    return Trade(timestamp=START + timedelta(days=day), code=code, action=action, quantity=quantity,
+                 price=price, commission=0.0, slippage=0.0, total_cost=price * quantity)
+
+def test_fifo_and_lifo_matching():
+    """부분 청산 시 FIFO/LIFO 대응 결과 확인"""
+    trades = [
+        _trade(0, 'A', 'BUY', 10, 100.0),
+        _trade(1, 'B', 'BUY', 5, 50.0),
+        _trade(2, 'A', 'BUY', 10, 120.0),
+        _trade(3, 'A', 'SELL', 15, 110.0),
+        _trade(4, 'B', 'SELL', 5, 40.0),
+        _trade(5, 'C', 'SELL', 1, 10.0),  # 대응되는 매수 없음
+    ]
+    
+    fifo = TradeLedger(trades, LotMatching.FIFO)
+    assert [(rt.code, rt.quantity, rt.entry_price) for rt in fifo.round_trips] == [
+        ('A', 10, 100.0), ('A', 5, 120.0), ('B', 5, 50.0)
+    ]
+    np.testing.assert_allclose(fifo.pnl, [100.0, -50.0, -50.0])
+    np.testing.assert_allclose(fifo.holding_days, [3.0, 1.0, 3.0])
+    assert fifo.unmatched_sells == 1
+    assert fifo.summary() == {'winning_trades': 1, 'total_profit': 100.0, 'total_loss': 100.0}
+    
+    lifo = TradeLedger(trades, LotMatching.LIFO)
+    assert [(rt.code, rt.quantity, rt.entry_price) for rt in lifo.round_trips] == [
+        ('A', 10, 120.0), ('A', 5, 100.0), ('B', 5, 50.0)
+    ]
+    np.testing.assert_allclose(lifo.returns, [-10 / 120, 0.1, -0.2])
+
+def test_ledger_scales_linearly():
+    """수만 건 거래도 한 번의 순회로 처리"""
+    trades = []
+    for i in range(20000):
+        code = f"{i % 50:06d}"
+        trades.append(_trade(i, code, 'BUY', 10, 100.0 + i % 7))
+        trades.append(_trade(i, code, 'SELL', 10, 101.0 + i % 5))
+    
+    started = time.perf_counter()
+    ledger = TradeLedger(trades)
+    elapsed = time.perf_counter() - started
+    
+    assert len(ledger.round_trips) == 20000
+    assert elapsed < 2.0
+
+def test_backtest_result_carries_ledger():
+    """백테스트 결과와 Monte Carlo가 같은 원장을 사용"""
+    random.seed(5)
+    engine = BacktestingEngine(BacktestConfig(mode=BacktestMode.SINGLE_STOCK,
+                                              start_date="2023-01-01", end_date="2023-02-28"))
+    engine.load_data(data_source="sample")
+    result = engine.run_backtest()
+    
+    ledger = result.trade_ledger
+    assert ledger is not None
+    assert result.winning_trades == int(np.count_nonzero(ledger.pnl > 0))
+    assert abs(result.net_profit - ledger.pnl.sum()) < 1e-6
+
+def test_monte_carlo_fallback_uses_configured_matching():
+    """원장이 없는 결과도 설정된 로트 대응 방식으로 왕복 거래 구성"""
+    trades = [
+        _trade(0, 'A', 'BUY', 10, 100.0),
+        _trade(1, 'A', 'BUY', 10, 120.0),
+        _trade(2, 'A', 'SELL', 15, 110.0),
+    ]
+    result = SimpleNamespace(trades=trades, trade_ledger=None,
+                             config=BacktestConfig(lot_matching=LotMatching.LIFO))
+    
+    returns = MonteCarloSimulator(result)._extract_returns()
+    np.testing.assert_allclose(returns, TradeLedger(trades, LotMatching.LIFO).returns)
+
+if __name__ == "__main__":
+    test_fifo_and_lifo_matching()
+    test_ledger_scales_linearly()
+    test_backtest_result_carries_ledger()
+    test_monte_carlo_fallback_uses_configured_matching()
+    print("✅ 왕복 거래 원장 테스트 통과")
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+트렌드 링 버퍼 테스트
+고정 크기 유지, 최신 값/시간 구간 조회, 분석기가 최신 트렌드와 메모리 버퍼를 사용하는지 확인합니다.
+"""
+
+import sys
+import os
+import tempfile
+from datetime import datetime, timedelta
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from loguru import logger
+
+from naver_trend_analyzer import NaverTrendAnalyzer, TrendData, TrendType, TrendRingBuffer, TrendStore
+
+logger.remove()
+logger.add(sys.stderr, level="WARNING")
+
+BASE_TIME = datetime(2024, 1, 2, 9, 0)
+
+def _trend(value: float, minutes: int, keyword: str = '반도체', **fields) -> TrendData:
+    return TrendData(keyword=keyword, trend_type=TrendType.SEARCH, value=value,
+                     timestamp=BASE_TIME + timedelta(minutes=minutes), **fields)
+
+def test_ring_buffer_wraps_and_keeps_order():
+    """용량을 넘으면 가장 오래된 항목부터 덮어쓰고 시간순 유지"""
+    buffer = TrendRingBuffer('반도체', capacity=5)
+    assert not buffer and buffer.latest() is None
+    
+    for i in range(12):
+        buffer.append(_trend(float(i), i, sentiment_score=i / 10))
+    
+    assert len(buffer) == 5
+    assert [trend.value for trend in buffer] == [7.0, 8.0, 9.0, 10.0, 11.0]
+    assert buffer[0].value == 7.0 and buffer[-1].value == 11.0
+    assert buffer.latest().value == 11.0
+    assert buffer.latest().timestamp == BASE_TIME + timedelta(minutes=11)
+    assert abs(buffer.latest().sentiment_score - 1.1) < 1e-12
+    assert buffer.latest().trend_type == TrendType.SEARCH
+    assert [trend.value for trend in buffer[1:3]] == [8.0, 9.0]
+    assert buffer.columns['value'].shape == (5,)
+
+def test_window_matches_brute_force():
+    """시간 구간 조회 = 전체 필터링 결과 (링 경계를 넘는 구간 포함)"""
+    rng = np.random.default_rng(0)
+    buffer = TrendRingBuffer('AI', capacity=64)
+    minutes = np.cumsum(rng.integers(0, 3, 150))  # 같은 시각 포함
+    values = rng.normal(100, 10, 150)
+    for minute, value in zip(minutes, values):
+        buffer.append(_trend(value, int(minute), keyword='AI'))
+    
+    kept_minutes, kept_values = minutes[-64:], values[-64:]
+    for _ in range(50):
+        start, end = sorted(rng.integers(minutes[0] - 5, minutes[-1] + 5, 2))
+        window = buffer.window(BASE_TIME + timedelta(minutes=int(start)), BASE_TIME + timedelta(minutes=int(end)))
+        mask = (kept_minutes >= start) & (kept_minutes <= end)
+        np.testing.assert_array_equal(window['value'], kept_values[mask])
+        assert len(window['timestamp']) == mask.sum()
+    
+    np.testing.assert_array_equal(buffer.window()['value'], kept_values)
+
+def test_out_of_order_timestamp_is_clamped():
+    """이전 시각이 들어와도 시간순 유지"""
+    buffer = TrendRingBuffer('AI', capacity=4)
+    buffer.append(_trend(1.0, 10))
+    buffer.append(_trend(2.0, 5))
+    assert buffer[-1].timestamp == BASE_TIME + timedelta(minutes=10)
+    assert len(buffer.window(start=BASE_TIME + timedelta(minutes=10))['value']) == 2
+
+def test_store_memory_is_bounded():
+    """키워드별 버퍼 크기는 추가 건수와 무관"""
+    store = TrendStore(capacity=100)
+    for i in range(10000):
+        store.append(_trend(float(i), i, keyword=f"키워드{i % 3}"))
+    
+    assert sorted(store) == ['키워드0', '키워드1', '키워드2']
+    assert all(len(buffer) == 100 for buffer in store.values())
+    assert store['키워드0'].latest().value == 9999.0
+
+def test_analyzer_uses_latest_trend():
+    """투자 신호/요약은 가장 오래된 항목이 아니라 최신 트렌드 기준"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        analyzer = NaverTrendAnalyzer(db_path=os.path.join(temp_dir, "trend.db"))
+        try:
+            analyzer.trend_data.reset('삼성전자', [
+                _trend(100.0, 0, keyword='삼성전자', sentiment_score=-1.0, momentum_score=-1.0, volume_change=-1.0),
+                _trend(120.0, 1, keyword='삼성전자', sentiment_score=1.0, momentum_score=1.0, volume_change=1.0),
+            ])
+            for keyword in ('반도체', 'AI'):
+                analyzer.trend_data.reset(keyword)
+    
+            signals = analyzer.get_investment_signals('005930')
+            assert signals['overall_signal'] == 'BUY'
+            assert signals['signals'][0]['sentiment_score'] == 1.0
+        finally:
+            analyzer.close()
+
+def test_correlation_reads_memory_buffer():
+    """상관관계 분석은 SQLite를 다시 조회하지 않고 메모리 버퍼 사용"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        analyzer = NaverTrendAnalyzer(db_path=os.path.join(temp_dir, "trend.db"))
+        try:
+            def no_query(*args, **kwargs):
+                raise AssertionError("SQLite 조회 발생")
+    
+            analyzer.storage.query = no_query
+            now = datetime.now()
+            analyzer.trend_data.reset('반도체', [
+                TrendData(keyword='반도체', trend_type=TrendType.SEARCH, value=100.0 + i,
+                          timestamp=now - timedelta(hours=30 - i)) for i in range(30)
+            ])
+    
+            correlation = analyzer.analyze_trend_correlation('반도체', {'prices': [1000 + 5 * i for i in range(30)]})
+            assert correlation is not None
+            assert correlation.correlation_score > 0.99
+            assert correlation.trend_direction == 'positive'
+        finally:
+            analyzer.close()
+
+def test_momentum_matches_polyfit():
+    """모멘텀 닫힌 해 = np.polyfit 기울기"""
+    analyzer = NaverTrendAnalyzer.__new__(NaverTrendAnalyzer)
+    values = [100, 103, 101, 108, 110, 107, 115]
+    slope = np.polyfit(np.arange(len(values)), values, 1)[0]
+    assert abs(analyzer._calculate_momentum(np.array(values)) - slope / max(values)) < 1e-12
+    assert analyzer._calculate_momentum([5.0]) == 0.0
+
+if __name__ == "__main__":
+    test_ring_buffer_wraps_and_keeps_order()
+    test_window_matches_brute_force()
+    test_out_of_order_timestamp_is_clamped()
+    test_store_memory_is_bounded()
+    test_analyzer_uses_latest_trend()
+    test_correlation_reads_memory_buffer()
+    test_momentum_matches_polyfit()
+    print("✅ 트렌드 링 버퍼 테스트 통과")
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+트렌드 저장소 테스트
+WAL 모드/인덱스, 수집 주기별 일괄 저장, 상관관계 교체 저장, 분석기 조회 연동을 확인합니다.
+"""
+
+import sys
+import os
+import time
+import asyncio
+import tempfile
+from datetime import datetime, timedelta
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from loguru import logger
+
+from trend_storage import TrendStorage
+from naver_trend_analyzer import NaverTrendAnalyzer, TrendData, TrendType, StockTrendCorrelation
+
+logger.remove()
+logger.add(sys.stderr, level="WARNING")
+
+def _trend(keyword: str, value: float, minutes_ago: int = 0) -> TrendData:
+    return TrendData(keyword=keyword, trend_type=TrendType.SEARCH, value=value,
+                     timestamp=datetime.now() - timedelta(minutes=minutes_ago), sentiment_score=0.1)
+
+def test_schema_and_pragmas():
+    """WAL 모드, (keyword, timestamp) 인덱스, (stock_code, keyword) 기본 키"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = TrendStorage(os.path.join(temp_dir, "trend.db"))
+        try:
+            assert storage.query('PRAGMA journal_mode')[0][0] == 'wal'
+            indexes = {row[1] for row in storage.query('PRAGMA index_list(trend_data)')}
+            assert 'idx_trend_data_keyword_timestamp' in indexes
+            columns = [row[2] for row in storage.query('PRAGMA index_info(idx_trend_data_keyword_timestamp)')]
+            assert columns == ['keyword', 'timestamp']
+            primary_key = sorted((row[5], row[1]) for row in storage.query('PRAGMA table_info(correlation_data)') if row[5])
+            assert [name for _, name in primary_key] == ['stock_code', 'keyword']
+    
+            plan = ' '.join(str(row) for row in storage.query(
+                'EXPLAIN QUERY PLAN SELECT * FROM trend_data WHERE keyword = ? AND timestamp >= ?', ('a', 'b')))
+            assert 'idx_trend_data_keyword_timestamp' in plan
+        finally:
+            storage.close()
+
+def test_collection_cycle_is_one_batch():
+    """수집 주기 결과는 한 트랜잭션으로 저장되고 조회에 반영"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        analyzer = NaverTrendAnalyzer(db_path=os.path.join(temp_dir, "trend.db"))
+        try:
+            async def search(session, keyword):
+                return _trend(keyword, 100.0)
+    
+            async def news(session, keyword):
+                return None if keyword == 'AI' else _trend(keyword, 0.5, minutes_ago=1)
+    
+            analyzer._collect_search_trend_async = search
+            analyzer._collect_news_sentiment_async = news
+            asyncio.run(analyzer.collect_real_time_data())
+            analyzer.storage.flush()
+    
+            assert analyzer.storage.batches_written == 1
+            count = analyzer.storage.query('SELECT COUNT(*) FROM trend_data')[0][0]
+            assert count == 2 * len(analyzer.monitoring_keywords) - 1
+    
+            history = analyzer.get_historical_trend_data('반도체')
+            assert [trend.value for trend in history] == [100.0, 0.5]  # 최신순
+            assert history[0].trend_type == TrendType.SEARCH
+        finally:
+            analyzer.close()
+
+def test_writes_do_not_block():
+    """개별 저장 요청은 큐에만 쌓이고 백그라운드에서 묶여서 커밋"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        analyzer = NaverTrendAnalyzer(db_path=os.path.join(temp_dir, "trend.db"))
+        try:
+            started = time.perf_counter()
+            for i in range(2000):
+                analyzer._save_trend_data(_trend(f"키워드{i % 20}", float(i)))
+            enqueue_time = time.perf_counter() - started
+            analyzer.storage.flush()
+    
+            assert analyzer.storage.query('SELECT COUNT(*) FROM trend_data')[0][0] == 2000
+            assert analyzer.storage.batches_written < 2000
+            assert enqueue_time < 1.0
+        finally:
+            analyzer.close()
+
+def test_correlation_upsert():
+    """(종목코드, 키워드)가 같은 상관관계는 교체"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "trend.db")
+        analyzer = NaverTrendAnalyzer(db_path=db_path)
+        try:
+            for score in (0.2, 0.7):
+                analyzer._save_correlation_data(StockTrendCorrelation(
+                    stock_code='005930', stock_name='삼성전자', keyword='반도체', correlation_score=score,
+                    trend_direction='positive', confidence_level=score, last_updated=datetime.now()))
+            rows = analyzer.storage.query('SELECT stock_code, keyword, correlation_score FROM correlation_data')
+            assert rows == [('005930', '반도체', 0.7)]
+        finally:
+            analyzer.close()
+    
+        # 종료 후 다시 열어도 유지
+        reopened = TrendStorage(db_path)
+        try:
+            assert reopened.query('SELECT COUNT(*) FROM correlation_data')[0][0] == 1
+        finally:
+            reopened.close()
+
+def test_use_after_close_does_not_block():
+    """종료 후 저장 요청은 버려지고 조회는 대기 없이 반환"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        analyzer = NaverTrendAnalyzer(db_path=os.path.join(temp_dir, "trend.db"))
+        analyzer._save_trend_data(_trend('반도체', 1.0))
+        analyzer.close()
+    
+        analyzer._save_trend_data(_trend('반도체', 2.0))
+        analyzer.storage.flush()
+        assert analyzer.storage._queue.unfinished_tasks == 0
+        assert analyzer.get_historical_trend_data('반도체') == []
+        analyzer.close()
+
+if __name__ == "__main__":
+    test_schema_and_pragmas()
+    test_collection_cycle_is_one_batch()
+    test_writes_do_not_block()
+    test_correlation_upsert()
+    test_use_after_close_does_not_block()
+    print("✅ 트렌드 저장소 테스트 통과")
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+벡터화 기술적 지표 테스트
+기존 루프 방식 계산 결과와 벡터화 계산 결과가 허용 오차 내에서 일치하는지 확인합니다.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+
+from technical_indicators import (
+    calculate_sma, calculate_ema, calculate_rsi, calculate_bollinger_bands,
+    calculate_macd, calculate_stochastic, calculate_atr, calculate_cci, calculate_adx,
+    calculate_sma_array, calculate_rsi_array, calculate_bollinger_bands_array
+)
+
+TOLERANCE = 1e-8
+
+# === 기존 루프 방식 기준 구현 ===
+
+def reference_sma(prices, period):
+    if len(prices) < period:
+        return []
+    return [np.mean(prices[i - period + 1:i + 1]) for i in range(period - 1, len(prices))]
+
+def reference_ema(prices, period):
+    if len(prices) < period:
+        return []
+    alpha = 2.0 / (period + 1)
+    ema_values = [np.mean(prices[:period])]
+    for i in range(period, len(prices)):
+        ema_values.append(alpha * prices[i] + (1 - alpha) * ema_values[-1])
+    return ema_values
+
+def reference_rsi(prices, period):
+    if len(prices) < period + 1:
+        return []
+    deltas = np.diff(prices)
+    gains = np.where(deltas > 0, deltas, 0)
+    losses = np.where(deltas < 0, -deltas, 0)
+    avg_gain = np.mean(gains[:period])
+    avg_loss = np.mean(losses[:period])
+    rsi_values = [100.0 if avg_loss == 0 else 100 - 100 / (1 + avg_gain / avg_loss)]
+    for i in range(period, len(deltas)):
+        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
+        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+        rsi_values.append(100.0 if avg_loss == 0 else 100 - 100 / (1 + avg_gain / avg_loss))
+    return rsi_values
+
+def reference_bollinger(prices, period, std_dev):
+    upper, lower = [], []
+    for i in range(period - 1, len(prices)):
+        window = prices[i - period + 1:i + 1]
+        upper.append(np.mean(window) + std_dev * np.std(window))
+        lower.append(np.mean(window) - std_dev * np.std(window))
+    return {'upper': upper, 'middle': reference_sma(prices, period), 'lower': lower}
+
+def reference_stochastic_k(closes, highs, lows, k_period):
+    k_values = []
+    for i in range(k_period - 1, len(closes)):
+        hh = max(highs[i - k_period + 1:i + 1])
+        ll = min(lows[i - k_period + 1:i + 1])
+        k_values.append(50.0 if hh == ll else (closes[i] - ll) / (hh - ll) * 100)
+    return k_values
+
+def reference_atr(highs, lows, closes, period):
+    true_ranges = [max(highs[i] - lows[i], abs(highs[i] - closes[i - 1]), abs(lows[i] - closes[i - 1]))
+                   for i in range(1, len(highs))]
+    return reference_ema(true_ranges, period)
+
+def reference_cci(highs, lows, closes, period):
+    tps = [(h + l + c) / 3 for h, l, c in zip(highs, lows, closes)]
+    values = []
+    for i in range(period - 1, len(tps)):
+        window = tps[i - period + 1:i + 1]
+        sma = np.mean(window)
+        md = np.mean([abs(tp - sma) for tp in window])
+        values.append(0.0 if md == 0 else (tps[i] - sma) / (0.015 * md))
+    return values
+
+def reference_adx(highs, lows, period):
+    tr, dmp, dmm = [], [], []
+    for i in range(1, len(highs)):
+        up, down = highs[i] - highs[i - 1], lows[i - 1] - lows[i]
+        tr.append(max(highs[i] - lows[i], abs(up), abs(lows[i] - lows[i - 1])))
+        dmp.append(up if up > down and up > 0 else 0)
+        dmm.append(down if down > up and down > 0 else 0)
+    trs, ps, ms = reference_ema(tr, period), reference_ema(dmp, period), reference_ema(dmm, period)
+    di_plus = [0 if t == 0 else p / t * 100 for t, p in zip(trs, ps)]
+    di_minus = [0 if t == 0 else m / t * 100 for t, m in zip(trs, ms)]
+    dx = [0 if p + m == 0 else abs(p - m) / (p + m) * 100 for p, m in zip(di_plus, di_minus)]
+    return {'adx': reference_sma(dx, period), 'di_plus': di_plus, 'di_minus': di_minus}
+
+# === 테스트 ===
+
+def _sample_ohlc(n=300, seed=0):
+    rng = np.random.default_rng(seed)
+    closes = 50000 * np.cumprod(1 + rng.normal(0, 0.02, n))
+    highs = closes * rng.uniform(1.0, 1.03, n)
+    lows = closes * rng.uniform(0.97, 1.0, n)
+    return closes.tolist(), highs.tolist(), lows.tolist()
+
+def _assert_close(actual, expected):
+    assert len(actual) == len(expected)
+    if expected:
+        np.testing.assert_allclose(actual, expected, rtol=TOLERANCE, atol=TOLERANCE)
+
+def test_moving_averages_match_reference():
+    """SMA / EMA 일치 확인"""
+    closes, _, _ = _sample_ohlc()
+    for period in (1, 2, 5, 20, 60):
+        _assert_close(calculate_sma(closes, period), reference_sma(closes, period))
+        _assert_close(calculate_ema(closes, period), reference_ema(closes, period))
+    assert calculate_sma(closes[:3], 5) == []
+    assert calculate_ema(closes[:3], 5) == []
+
+def test_rsi_and_bollinger_match_reference():
+    """RSI / 볼린저 밴드 일치 확인 (횡보 구간 포함)"""
+    closes, _, _ = _sample_ohlc()
+    closes[100:120] = [closes[100]] * 20  # 손실 0 구간
+    for period in (2, 14):
+        _assert_close(calculate_rsi(closes, period), reference_rsi(closes, period))
+    bb = calculate_bollinger_bands(closes, 20, 2.0)
+    expected = reference_bollinger(closes, 20, 2.0)
+    for key in ('upper', 'middle', 'lower'):
+        _assert_close(bb[key], expected[key])
+    assert calculate_bollinger_bands(closes[:5], 20) == {}
+
+def test_macd_matches_reference():
+    """MACD 일치 확인"""
+    closes, _, _ = _sample_ohlc()
+    macd = calculate_macd(closes, 12, 26, 9)
+    fast, slow = reference_ema(closes, 12), reference_ema(closes, 26)
+    macd_line = [f - s for f, s in zip(fast, slow)]
+    _assert_close(macd['macd'], macd_line)
+    _assert_close(macd['signal'], reference_ema(macd_line, 9))
+
+def test_ohlc_indicators_match_reference():
+    """스토캐스틱 / ATR / CCI / ADX 일치 확인"""
+    closes, highs, lows = _sample_ohlc()
+    k_values = reference_stochastic_k(closes, highs, lows, 14)
+    stochastic = calculate_stochastic(closes, highs, lows, 14, 3)
+    _assert_close(stochastic['k'], k_values)
+    _assert_close(stochastic['d'], reference_sma(k_values, 3))
+    _assert_close(calculate_atr(highs, lows, closes, 14), reference_atr(highs, lows, closes, 14))
+    _assert_close(calculate_cci(highs, lows, closes, 20), reference_cci(highs, lows, closes, 20))
+    adx = calculate_adx(highs, lows, closes, 14)
+    expected = reference_adx(highs, lows, 14)
+    for key in ('adx', 'di_plus', 'di_minus'):
+        _assert_close(adx[key], expected[key])
+
+def test_array_inputs():
+    """ndarray / Series 입력 지원 확인"""
+    closes, _, _ = _sample_ohlc()
+    expected = reference_sma(closes, 10)
+    _assert_close(calculate_sma_array(np.array(closes), 10).tolist(), expected)
+    _assert_close(calculate_sma_array(pd.Series(closes), 10).tolist(), expected)
+    _assert_close(calculate_rsi_array(pd.Series(closes), 14).tolist(), reference_rsi(closes, 14))
+    assert isinstance(calculate_bollinger_bands_array(np.array(closes), 20)['upper'], np.ndarray)
+
+if __name__ == "__main__":
+    test_moving_averages_match_reference()
+    test_rsi_and_bollinger_match_reference()
+    test_macd_matches_reference()
+    test_ohlc_indicators_match_reference()
+    test_array_inputs()
+    print("✅ 벡터화 기술적 지표 테스트 통과")
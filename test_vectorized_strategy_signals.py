@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+벡터화 전략 신호 테스트
+calculate_signal_series / 합의 신호 행렬이 시점별 calculate_signals 반복 결과와 같은지 확인합니다.
+"""
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from trading_strategies import (
+    MovingAverageStrategy, RSIStrategy, BollingerBandsStrategy, MomentumStrategy, BaseStrategy,
+    create_sample_strategies, backtest_signal_matrix, SIGNAL_BUY, SIGNAL_SELL, SIGNAL_HOLD, SIGNAL_VALUES
+)
+
+logger.remove()
+logger.add(sys.stderr, level="WARNING")
+
+def _prices(n: int = 160, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    closes = 10000 * np.cumprod(1 + rng.normal(0, 0.03, n))
+    if n > 75:
+        closes[60:75] = closes[59]  # 횡보 구간 (RSI 0/0, 밴드 폭 0)
+    dates = pd.bdate_range('2023-01-02', periods=n)
+    return pd.DataFrame({'open': closes, 'high': closes, 'low': closes,
+                         'close': closes, 'volume': 1000}, index=dates)
+
+def _loop_signals(strategy: BaseStrategy, data: pd.DataFrame) -> list:
+    """시점마다 calculate_signals를 호출하는 기존 방식"""
+    return [SIGNAL_VALUES.get(strategy.calculate_signals(data.iloc[:i + 1].copy()).get('action'), SIGNAL_HOLD)
+            for i in range(len(data))]
+
+def _strategies():
+    return [
+        MovingAverageStrategy(short_period=3, long_period=8),
+        RSIStrategy(period=6, oversold=35, overbought=65),
+        BollingerBandsStrategy(period=10, std_dev=1.5),
+        MomentumStrategy(period=5, threshold=0.04),
+    ]
+
+def test_series_matches_loop():
+    """전략별 벡터화 신호 = 시점별 반복 신호"""
+    data = _prices()
+    for strategy in _strategies():
+        series = strategy.calculate_signal_series(data)
+        expected = _loop_signals(strategy, data)
+    
+        assert series.dtype == np.int8
+        assert list(series) == expected, strategy.name
+        assert (series == SIGNAL_BUY).any() and (series == SIGNAL_SELL).any(), strategy.name
+
+def test_base_strategy_fallback():
+    """벡터화하지 않은 하위 클래스는 기본 구현(반복)으로 동작"""
+    class LastUpStrategy(BaseStrategy):
+        def calculate_signals(self, data):
+            if len(data) >= 2 and data['close'].iloc[-1] > data['close'].iloc[-2]:
+                return {'action': 'BUY'}
+            return {}
+    
+    data = _prices(30)
+    strategy = LastUpStrategy("상승", "직전 대비 상승")
+    assert list(strategy.calculate_signal_series(data)) == _loop_signals(strategy, data)
+
+def test_panel_matches_series():
+    """종가 DataFrame/딕셔너리 패널이 종목별 시계열과 일치"""
+    frames = {f"{i:06d}": _prices(seed=i) for i in range(5)}
+    frames['000004'] = frames['000004'].iloc[20:]  # 거래일이 다른 종목
+    close = pd.DataFrame({code: df['close'] for code, df in frames.items() if code != '000004'})
+    
+    for strategy in _strategies():
+        panel = strategy.calculate_signal_panel(close)
+        for code in close.columns:
+            pd.testing.assert_series_equal(panel[code], strategy.calculate_signal_series(frames[code]),
+                                           check_names=False)
+    
+        dict_panel = strategy.calculate_signal_panel(frames)
+        short = strategy.calculate_signal_series(frames['000004'])
+        assert (dict_panel['000004'].loc[short.index] == short).all()
+        assert (dict_panel['000004'].iloc[:20] == SIGNAL_HOLD).all()
+
+def test_consensus_series_matches_loop():
+    """합의 신호 시계열 = 시점별 get_consensus_signal"""
+    manager = create_sample_strategies()
+    for strategy in manager.strategies.values():
+        manager.activate_strategy(strategy.name)
+    
+    data = _prices(120, seed=3)
+    series = manager.get_consensus_series(data)
+    
+    expected = []
+    for i in range(len(data)):
+        window = data.iloc[:i + 1].copy()
+        signal = manager.get_consensus_signal('000000', window['close'].iloc[-1], window)
+        expected.append(SIGNAL_VALUES[signal['action']] if signal else SIGNAL_HOLD)
+    
+    assert list(series) == expected
+    assert list(manager.get_signal_matrix(data).columns) == list(manager.active_strategies)
+    
+    panel = manager.get_consensus_panel({'A': data, 'B': _prices(120, seed=4)})
+    assert (panel['A'] == series).all()
+
+def test_backtest_signal_matrix():
+    """신호 다음 봉부터 보유/청산"""
+    dates = pd.bdate_range('2023-01-02', periods=6)
+    close = pd.DataFrame({'A': [100.0, 110.0, 121.0, 121.0, 60.5, 60.5]}, index=dates)
+    signals = pd.DataFrame({'A': [SIGNAL_BUY, 0, SIGNAL_BUY, 0, SIGNAL_SELL, 0]}, index=dates, dtype=np.int8)
+    
+    returns = backtest_signal_matrix(close, signals)
+    np.testing.assert_allclose(returns['A'].to_numpy(), [0.0, 0.1, 0.1, 0.0, -0.5, 0.0])
+    
+    with_cost = backtest_signal_matrix(close, signals, commission_rate=0.01)
+    np.testing.assert_allclose(with_cost['A'].to_numpy(), [0.0, 0.09, 0.1, 0.0, -0.5, -0.01])
+
+def test_panel_is_fast():
+    """500종목 x 500일 신호 행렬을 한 번에 계산"""
+    rng = np.random.default_rng(9)
+    dates = pd.bdate_range('2021-01-04', periods=500)
+    close = pd.DataFrame(10000 * np.cumprod(1 + rng.normal(0, 0.02, (500, 500)), axis=0),
+                         index=dates, columns=[f"{i:06d}" for i in range(500)])
+    
+    manager = create_sample_strategies()
+    for strategy in list(manager.strategies.values()):
+        manager.activate_strategy(strategy.name)
+    
+    started = time.perf_counter()
+    panel = manager.get_consensus_panel(close)
+    elapsed = time.perf_counter() - started
+    
+    assert panel.shape == (500, 500)
+    assert elapsed < 5.0
+
+if __name__ == "__main__":
+    test_series_matches_loop()
+    test_base_strategy_fallback()
+    test_panel_matches_series()
+    test_consensus_series_matches_loop()
+    test_backtest_signal_matrix()
+    test_panel_is_fast()
+    print("✅ 벡터화 전략 신호 테스트 통과")
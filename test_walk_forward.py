@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Walk Forward 백테스트 테스트
+롤링/앵커드 구간 생성, 학습 구간 최적화 선택, 검증 구간 간 자본/전략 상태 유지를 확인합니다.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from backtesting_system import (
+    BacktestingEngine, BacktestConfig, BacktestMode, WalkForwardScheme, SignalFeedMode, build_walk_forward_windows
+)
+from trading_strategy import StrategyConfig, StrategyType, create_strategy_manager
+
+logger.remove()
+logger.add(sys.stderr, level="WARNING")
+
+START_DATE = "2023-01-02"
+END_DATE = "2023-06-30"
+
+def _data(num_codes: int = 3, seed: int = 5):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(START_DATE, END_DATE)
+    data = {}
+    for i in range(num_codes):
+        closes = 10000 * np.cumprod(1 + rng.normal(0.0003, 0.025, len(dates)))
+        data[f"{i:06d}"] = pd.DataFrame({'open': closes, 'high': closes * 1.01, 'low': closes * 0.99,
+                                         'close': closes, 'volume': 1000.0}, index=dates)
+    return data
+
+def _grid():
+    return [
+        {'MA': StrategyConfig(StrategyType.MOVING_AVERAGE_CROSSOVER,
+                              {'short_period': short, 'long_period': long, 'min_cross_threshold': 0.0001})}
+        for short, long in ((1, 3), (2, 8), (3, 15))
+    ]
+
+def _engine(**overrides):
+    config = BacktestConfig(mode=BacktestMode.WALK_FORWARD, start_date=START_DATE, end_date=END_DATE,
+                            walk_forward_train_bars=40, walk_forward_test_bars=15,
+                            walk_forward_workers=1, data_cache_dir=None)
+    for key, value in overrides.items():
+        setattr(config, key, value)
+    engine = BacktestingEngine(config)
+    engine.set_data(_data())
+    return engine
+
+def _trade_keys(result):
+    return [(t.timestamp, t.code, t.action, t.quantity) for t in result.trades]
+
+def test_window_layout():
+    """롤링/앵커드 구간 위치"""
+    assert build_walk_forward_windows(10, 4, 3) == [(0, 4, 4, 7), (3, 7, 7, 10)]
+    assert build_walk_forward_windows(11, 4, 3, WalkForwardScheme.ANCHORED) == [
+        (0, 4, 4, 7), (0, 7, 7, 10), (0, 10, 10, 11)
+    ]
+    assert build_walk_forward_windows(4, 4, 3) == []
+    
+    # 10년 x 월 단위 이동: 검증 구간이 겹치지 않고 끝까지 이어짐
+    windows = build_walk_forward_windows(2520, 252, 21)
+    assert len(windows) == 108
+    assert all(prev[3] == nxt[2] for prev, nxt in zip(windows, windows[1:]))
+    assert windows[-1][3] == 2520
+
+def test_without_grid_is_one_continuous_run():
+    """후보가 없으면 검증 구간 전체를 한 번에 실행한 결과와 동일 (구간 경계에서 초기화 없음)"""
+    engine = _engine()
+    result = engine.run_backtest()
+    assert result is not None
+    
+    windows = result.walk_forward_windows
+    assert len(windows) == len(build_walk_forward_windows(len(engine._trading_dates(
+        pd.Timestamp(START_DATE), pd.Timestamp(END_DATE))), 40, 15))
+    assert all(window.strategy_configs is None for window in windows)
+    
+    reference = _engine(mode=BacktestMode.SINGLE_STOCK)
+    reference.run_backtest()
+    single = reference._run_single_stock_backtest(windows[0].test_start, windows[-1].test_end)
+    
+    assert _trade_keys(result) == _trade_keys(single)
+    assert abs(result.final_capital - single.final_capital) < 1e-6
+    
+    # 구간별 검증 수익률을 이으면 전체 수익률
+    compounded = np.prod([1 + window.out_of_sample_return for window in windows]) - 1
+    assert abs(compounded - result.total_return) < 1e-9
+
+def test_grid_selects_best_in_sample_candidate():
+    """학습 구간별 최고 점수 후보 선택"""
+    engine = _engine(walk_forward_scheme=WalkForwardScheme.ANCHORED)
+    engine.set_walk_forward_grid(_grid())
+    result = engine.run_backtest()
+    assert result is not None
+    
+    for window in result.walk_forward_windows[:2]:
+        scores = []
+        for candidate in _grid():
+            check = _engine(mode=BacktestMode.SINGLE_STOCK,
+                            start_date=window.train_start.strftime("%Y-%m-%d"),
+                            end_date=window.train_end.strftime("%Y-%m-%d"))
+            check.add_strategy(create_strategy_manager(candidate))
+            scores.append(check.run_backtest().sharpe_ratio)
+    
+        best = int(np.argmax(scores))
+        assert window.strategy_configs == _grid()[best]
+        assert abs(window.in_sample_score - scores[best]) < 1e-9
+        assert window.train_start == result.walk_forward_windows[0].train_start  # 앵커드
+    
+    # 선택이 바뀌어도 검증 구간 전체가 하나의 자본금 곡선
+    dates = [point['date'] for point in result.equity_curve]
+    assert dates[0] == result.walk_forward_windows[0].test_start
+    assert dates[-1] == result.walk_forward_windows[-1].test_end
+    assert len(dates) == len(set(dates))
+
+def test_parallel_matches_serial():
+    """학습 구간 최적화 병렬 실행 결과가 순차 실행과 같음"""
+    serial = _engine()
+    serial.set_walk_forward_grid(_grid())
+    serial_result = serial.run_backtest()
+    
+    parallel = _engine(walk_forward_workers=2)
+    parallel.set_walk_forward_grid(_grid())
+    parallel_result = parallel.run_backtest()
+    
+    assert ([w.strategy_configs for w in serial_result.walk_forward_windows] ==
+            [w.strategy_configs for w in parallel_result.walk_forward_windows])
+    assert abs(serial_result.final_capital - parallel_result.final_capital) < 1e-6
+
+def test_strategy_state_carry_over_matches_replay():
+    """후보가 바뀌며 보관된 전략 상태를 이어 써도 전체 재생 결과와 같음"""
+    results = []
+    for feed_mode in (SignalFeedMode.INCREMENTAL, SignalFeedMode.REPLAY):
+        engine = _engine(walk_forward_train_bars=20, walk_forward_test_bars=10, signal_feed_mode=feed_mode)
+        engine.set_walk_forward_grid(_grid())
+        results.append(engine.run_backtest())
+    
+    incremental, replay = results
+    choices = [w.strategy_configs['MA'].parameters['short_period'] for w in incremental.walk_forward_windows]
+    assert len(set(choices)) > 1
+    assert _trade_keys(incremental) == _trade_keys(replay)
+    assert abs(incremental.final_capital - replay.final_capital) < 1e-6
+
+if __name__ == "__main__":
+    test_window_layout()
+    test_without_grid_is_one_continuous_run()
+    test_grid_selects_best_in_sample_candidate()
+    test_parallel_matches_serial()
+    test_strategy_state_carry_over_matches_replay()
+    print("✅ Walk Forward 백테스트 테스트 통과")
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+이벤트 기반 틱 디스패처
+실시간 틱을 받는 즉시 종목별 제한 큐를 거쳐 신호 생성 핸들러로 전달합니다.
+
+- 종목별 대기 큐는 크기 제한 (가득 차면 가장 오래된 틱을 버리고 최신 틱으로 합침)
+  → 처리보다 틱이 빨리 들어오면 오래된 가격으로 신호를 만들지 않음
+- 준비된 종목은 도착 순서대로 처리하고 한 종목은 한 번에 하나의 워커만 처리 (종목 내 순서 보장)
+- 틱 수신 시각(perf_counter)을 이벤트에 담아 단계별 지연 시간 히스토그램 기록
+"""
+
+import time
+import threading
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List
+from loguru import logger
+
+def _latency_bounds() -> List[float]:
+    """지연 시간 구간 경계 (1µs ~ 10초, 10배마다 8구간 로그 간격)"""
+    return [10 ** (exponent / 8) * 1e-6 for exponent in range(0, 7 * 8 + 1)]
+
+class LatencyHistogram:
+    """지연 시간 히스토그램 (로그 간격 구간, 스레드 안전)"""
+
+    BOUNDS = _latency_bounds()
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.counts = [0] * (len(self.BOUNDS) + 1)  # 마지막 칸은 10초 초과
+            self.count = 0
+            self.total = 0.0
+            self.max = 0.0
+
+    def record(self, seconds: float):
+        """지연 시간(초) 기록"""
+        seconds = max(seconds, 0.0)
+        index = bisect_left(self.BOUNDS, seconds)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.total += seconds
+            self.max = max(self.max, seconds)
+
+    def percentile(self, p: float) -> float:
+        """p 백분위 지연 시간(초) - 해당 구간의 상한 (최댓값을 넘지 않음)"""
+        with self._lock:
+            if self.count == 0:
+                return 0.0
+            target = max(1, int(round(self.count * p / 100)))
+            cumulative = 0
+            for index, bucket in enumerate(self.counts):
+                cumulative += bucket
+                if cumulative >= target:
+                    upper = self.BOUNDS[index] if index < len(self.BOUNDS) else self.max
+                    return min(upper, self.max)
+            return self.max
+
+    def summary(self) -> Dict:
+        """요약 (밀리초)"""
+        return {
+            'count': self.count,
+            'mean_ms': self.total / self.count * 1000 if self.count else 0.0,
+            'p50_ms': self.percentile(50) * 1000,
+            'p90_ms': self.percentile(90) * 1000,
+            'p99_ms': self.percentile(99) * 1000,
+            'max_ms': self.max * 1000
+        }
+
+@dataclass
+class TickEvent:
+    """디스패처로 전달되는 틱"""
+    code: str
+    price: float
+    received_at: float                        # 수신 시각 (time.perf_counter)
+    data: Dict = field(default_factory=dict)  # 원본 실시간 데이터
+    coalesced: int = 0                        # 이 틱에 합쳐진(건너뛴) 이전 틱 수
+
+class TickDispatcher:
+    """종목별 제한 큐 + 워커 스레드 틱 디스패처
+
+    handler(event)는 워커 스레드에서 호출됩니다.
+    max_pending_per_code=1이면 처리 대기 중인 틱은 항상 종목별 최신 틱 하나입니다.
+    """
+
+    def __init__(self, handler: Callable[[TickEvent], None], max_pending_per_code: int = 1,
+                 workers: int = 1, name: str = "TickDispatcher"):
+        self.handler = handler
+        self.max_pending_per_code = max(1, max_pending_per_code)
+        self.workers = max(1, workers)
+        self.name = name
+
+        self._pending: Dict[str, deque] = {}
+        self._ready = deque()    # 처리할 틱이 있는 종목 (종목당 한 번)
+        self._scheduled = set()  # 준비 큐에 있거나 처리 중인 종목
+        self._busy = 0
+        self._cond = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self.running = False
+
+        self.queue_latency = LatencyHistogram()  # 수신 → 핸들러 시작
+        self.stats = {'received': 0, 'dispatched': 0, 'coalesced': 0, 'errors': 0}
+
+    def start(self):
+        """워커 시작"""
+        with self._cond:
+            if self.running:
+                return
+            self.running = True
+        self._threads = [threading.Thread(target=self._worker, name=f"{self.name}-{i}", daemon=True)
+                         for i in range(self.workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """워커 중지 (대기 중인 틱은 버림)"""
+        with self._cond:
+            self.running = False
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        self._threads = []
+        with self._cond:
+            self._pending.clear()
+            self._ready.clear()
+            self._scheduled.clear()
+
+    def submit(self, code: str, price: float, data: Dict = None, received_at: float = None) -> TickEvent:
+        """틱 제출 (수신 스레드에서 호출, 대기 큐가 가득 차면 가장 오래된 틱과 합침)"""
+        event = TickEvent(code=code, price=price, data=data or {},
+                          received_at=time.perf_counter() if received_at is None else received_at)
+        with self._cond:
+            self.stats['received'] += 1
+            queue = self._pending.get(code)
+            if queue is None:
+                queue = self._pending[code] = deque()
+            if len(queue) >= self.max_pending_per_code:
+                dropped = queue.popleft()
+                event.coalesced = dropped.coalesced + 1
+                self.stats['coalesced'] += 1
+            queue.append(event)
+
+            if code not in self._scheduled:
+                self._scheduled.add(code)
+                self._ready.append(code)
+                self._cond.notify()
+        return event
+
+    def pending_count(self) -> int:
+        """처리 대기 중인 틱 수"""
+        with self._cond:
+            return sum(len(queue) for queue in self._pending.values())
+
+    def wait_idle(self, timeout: float = None) -> bool:
+        """대기 틱과 처리 중인 틱이 모두 없어질 때까지 대기"""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._ready and self._busy == 0, timeout)
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._ready or not self.running)
+                if not self.running:
+                    return
+                code = self._ready.popleft()
+                event = self._pending[code].popleft()
+                self._busy += 1
+
+            self.queue_latency.record(time.perf_counter() - event.received_at)
+            failed = False
+            try:
+                self.handler(event)
+            except Exception as e:
+                failed = True
+                logger.error(f"틱 처리 오류 ({code}): {e}")
+
+            with self._cond:
+                self._busy -= 1
+                self.stats['dispatched'] += 1
+                self.stats['errors'] += failed
+                if self._pending.get(code):
+                    self._ready.append(code)  # 종목 내 순서 유지
+                else:
+                    self._scheduled.discard(code)
+                self._cond.notify_all()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+실시간 체결 틱 저장소
+종목별로 미리 할당한 컬럼형 NumPy 링 버퍼에 체결 틱을 기록합니다.
+
+- 틱마다 딕셔너리/리스트를 만들지 않고 고정 배열의 한 칸에 기록 (GC 부담 없음)
+- 쓰기는 실시간 이벤트 스레드 하나만 수행 (single writer), 읽기는 잠금 없이 스냅샷
+  → 복사 전후 기록 수를 비교해 복사 도중 덮어쓴 행만 버림
+- 버퍼를 두 벌 이어 붙여(미러링) 같은 행을 두 곳에 기록하므로
+  최근 n개 틱은 링 경계와 관계없이 항상 연속 구간 → 지표/전략 계산용 제로 카피 뷰 제공
+- 캐시 정리는 배열을 지우지 않고 정리 시점의 기록 수(cleared)만 남김
+  → 다른 스레드가 정리해도 쓰기 스레드는 하나, 읽기는 그 이후 틱만 반환
+"""
+
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+# 컬럼 순서 (timestamp는 epoch 초)
+TICK_FIELDS = ('current_price', 'volume', 'change', 'change_rate', 'open_price',
+               'high_price', 'low_price', 'total_volume', 'timestamp')
+INTEGER_FIELDS = ('current_price', 'volume', 'change', 'open_price', 'high_price', 'low_price', 'total_volume')
+FIELD_INDEX = {field: i for i, field in enumerate(TICK_FIELDS)}
+
+DEFAULT_TICK_CAPACITY = 1000
+
+class TickRingBuffer:
+    """종목 하나의 체결 틱 링 버퍼 (단일 쓰기 스레드, 잠금 없는 읽기)"""
+
+    def __init__(self, code: str, capacity: int = DEFAULT_TICK_CAPACITY):
+        self.code = code
+        self.capacity = capacity
+        # (필드 x 2배 용량): 행 j는 j % capacity와 j % capacity + capacity 두 곳에 기록
+        self._data = np.zeros((len(TICK_FIELDS), 2 * capacity), dtype=np.float64)
+        self.count = 0     # 기록을 마친 총 틱 수 (쓰기 스레드만 증가)
+        self._started = 0  # 기록을 시작한 총 틱 수 (기록 중이면 count + 1)
+        self.cleared = 0   # 마지막 정리 시점의 기록 수 (이전 틱은 조회하지 않음)
+
+    def __len__(self) -> int:
+        return self._available(self.count)
+
+    def _available(self, count: int) -> int:
+        """기록 수가 count일 때 조회 가능한 틱 수 (정리 이후, 최대 capacity)"""
+        return max(0, min(count - self.cleared, self.capacity))
+
+    def clear(self):
+        """지금까지의 틱 무효화 (어느 스레드에서나 호출 가능, 배열은 그대로 둠)"""
+        self.cleared = self.count
+
+    def append(self, current_price, volume, change, change_rate, open_price,
+               high_price, low_price, total_volume, timestamp: float = None):
+        """틱 기록 (쓰기 스레드 전용, timestamp는 epoch 초)"""
+        row = (current_price, volume, change, change_rate, open_price,
+               high_price, low_price, total_volume, time.time() if timestamp is None else timestamp)
+        slot = self.count % self.capacity
+        self._started = self.count + 1
+        self._data[:, slot] = row
+        self._data[:, slot + self.capacity] = row
+        # 두 곳 모두 기록한 뒤 공개
+        self.count += 1
+
+    def _span(self, count: int, n: Optional[int]) -> Tuple[int, int]:
+        """기록 수가 count일 때 최근 n개 틱의 미러 배열 구간 [start, end)"""
+        size = self._available(count)
+        n = size if n is None else max(0, min(n, size))
+        end = count % self.capacity + self.capacity
+        return end - n, end
+
+    def view(self, field: str = None, n: int = None) -> np.ndarray:
+        """최근 n개 틱의 읽기 전용 제로 카피 뷰 (field가 없으면 필드 x n 행렬)
+
+        뷰는 버퍼를 직접 가리키므로 이후 capacity - n개 틱이 더 들어오면 값이 바뀝니다.
+        값을 보관하거나 다른 스레드에서 읽을 때는 snapshot()을 사용합니다.
+        """
+        start, end = self._span(self.count, n)
+        view = self._data[:, start:end] if field is None else self._data[FIELD_INDEX[field], start:end]
+        view.flags.writeable = False
+        return view
+
+    def snapshot(self, n: int = None) -> Dict[str, np.ndarray]:
+        """최근 n개 틱의 필드별 복사본 (잠금 없이 일관된 시점, 복사 중 덮어쓴 앞쪽 행은 제외)"""
+        count = self.count
+        start, end = self._span(count, n)
+        block = self._data[:, start:end].copy()
+
+        # 복사하는 동안 기록했거나 기록 중인 행이 덮어쓴 가장 오래된 행 제외
+        first_valid = self._started - self.capacity
+        drop = max(0, first_valid - (count - (end - start)))
+        block = block[:, drop:]
+        return {field: block[i] for i, field in enumerate(TICK_FIELDS)}
+
+    def latest(self) -> Optional[Dict]:
+        """최신 틱 딕셔너리 (없으면 None)"""
+        return self.record(self.count - 1)
+
+    def record(self, seq: int) -> Optional[Dict]:
+        """seq번째(0부터) 틱 딕셔너리 (아직 없거나 이미 덮어써졌으면 None)"""
+        if seq < max(self.cleared, self.count - self.capacity) or seq >= self.count:
+            return None
+        row = self._data[:, seq % self.capacity].copy()
+        if seq < self._started - self.capacity:  # 복사 중 덮어써짐
+            return None
+        return self._to_records(row[:, np.newaxis])[0]
+
+    def records(self, n: int = None) -> List[Dict]:
+        """최근 n개 틱을 기존 형식의 딕셔너리 목록으로 변환 (시간순)"""
+        snapshot = self.snapshot(n)
+        return self._to_records(np.array([snapshot[field] for field in TICK_FIELDS]))
+
+    def _to_records(self, block: np.ndarray) -> List[Dict]:
+        """(필드 x 틱) 행렬을 딕셔너리 목록으로 변환"""
+        columns = {field: (block[i].astype(np.int64) if field in INTEGER_FIELDS else block[i]).tolist()
+                   for i, field in enumerate(TICK_FIELDS)}
+        return [
+            {
+                'code': self.code,
+                'current_price': columns['current_price'][i],
+                'volume': columns['volume'][i],
+                'change': columns['change'][i],
+                'change_rate': columns['change_rate'][i],
+                'open_price': columns['open_price'][i],
+                'high_price': columns['high_price'][i],
+                'low_price': columns['low_price'][i],
+                'total_volume': columns['total_volume'][i],
+                'timestamp': datetime.fromtimestamp(columns['timestamp'][i]),
+                'real_type': "주식체결"
+            }
+            for i in range(block.shape[1])
+        ]
+
+    @property
+    def last_price(self) -> float:
+        """최신 체결가 (없거나 정리된 뒤면 0)"""
+        count = self.count
+        return self._data[0, (count - 1) % self.capacity] if self._available(count) else 0.0
+
+    @property
+    def last_timestamp(self) -> Optional[float]:
+        """최신 틱 시각 (epoch 초, 없거나 정리된 뒤면 None)"""
+        count = self.count
+        return self._data[FIELD_INDEX['timestamp'], (count - 1) % self.capacity] if self._available(count) else None
+
+class TickStore(dict):
+    """종목별 틱 링 버퍼 모음 {code: TickRingBuffer} (버퍼 생성/기록은 쓰기 스레드에서만)"""
+
+    def __init__(self, capacity: int = DEFAULT_TICK_CAPACITY):
+        super().__init__()
+        self.capacity = capacity
+
+    def buffer(self, code: str) -> TickRingBuffer:
+        """종목 버퍼 (없으면 생성)"""
+        buffer = self.get(code)
+        if buffer is None:
+            buffer = self[code] = TickRingBuffer(code, self.capacity)
+        return buffer
+
+    def append(self, code: str, *values, **kwargs):
+        self.buffer(code).append(*values, **kwargs)
+
+    def clear_ticks(self, code: str = None):
+        """종목(없으면 전체) 틱 무효화 (버퍼는 유지하므로 쓰기 스레드와 경합 없음)"""
+        buffers = [self.get(code)] if code else list(self.values())
+        for buffer in buffers:
+            if buffer is not None:
+                buffer.clear()
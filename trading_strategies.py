@@ -11,6 +11,21 @@ from typing import Dict, List, Optional, Tuple
 import config
 from loguru import logger
 
+# 벡터화 신호 값 (calculate_signal_series / calculate_signal_panel)
+SIGNAL_BUY = 1
+SIGNAL_SELL = -1
+SIGNAL_HOLD = 0
+SIGNAL_VALUES = {'BUY': SIGNAL_BUY, 'SELL': SIGNAL_SELL}
+
+def _row_positions(close: pd.DataFrame) -> np.ndarray:
+    """행 위치 (T, 1) 배열 - 각 시점까지의 데이터 수는 위치 + 1"""
+    return np.arange(len(close))[:, None]
+
+def _combine_signals(buy: np.ndarray, sell: np.ndarray, like: pd.DataFrame) -> pd.DataFrame:
+    """매수/매도 조건 행렬 -> 신호 행렬 (calculate_signals와 같이 매수 조건 우선)"""
+    values = np.where(buy, SIGNAL_BUY, np.where(sell, SIGNAL_SELL, SIGNAL_HOLD)).astype(np.int8)
+    return pd.DataFrame(values, index=like.index, columns=like.columns)
+
 class BaseStrategy:
     """기본 전략 클래스"""
     
@@ -36,6 +51,38 @@ class BaseStrategy:
     def get_position_size(self, stock_code: str, current_price: float, available_cash: float) -> int:
         """포지션 크기 계산"""
         raise NotImplementedError
+        
+    def calculate_signal_series(self, data: pd.DataFrame) -> pd.Series:
+        """전체 기간 신호 시계열 (한 번의 벡터 연산)
+        
+        각 시점까지의 데이터로 calculate_signals를 호출한 결과와 같습니다.
+        값: SIGNAL_BUY(1), SIGNAL_SELL(-1), SIGNAL_HOLD(0)
+        """
+        return self._signal_matrix(data[['close']]).iloc[:, 0].rename(self.name)
+        
+    def calculate_signal_panel(self, prices) -> pd.DataFrame:
+        """여러 종목 신호 행렬 (행: 날짜, 열: 종목)
+        
+        prices: 종가 DataFrame (열: 종목, 공통 거래일) 또는 {종목코드: OHLCV DataFrame}
+        거래일이 다른 종목은 딕셔너리로 넘기면 종목별 거래일 기준으로 계산합니다.
+        """
+        if isinstance(prices, dict):
+            panel = pd.DataFrame({code: self.calculate_signal_series(df) for code, df in prices.items()})
+            return panel.fillna(SIGNAL_HOLD).astype(np.int8)
+        return self._signal_matrix(prices)
+        
+    def _signal_matrix(self, close: pd.DataFrame) -> pd.DataFrame:
+        """종가 행렬 -> 신호 행렬
+        
+        기본 구현은 시점마다 calculate_signals를 호출하므로 느립니다. 하위 클래스에서 벡터화합니다.
+        """
+        result = pd.DataFrame(SIGNAL_HOLD, index=close.index, columns=close.columns, dtype=np.int8)
+        for j, column in enumerate(close.columns):
+            frame = close[[column]].set_axis(['close'], axis=1)
+            for i in range(len(frame)):
+                action = self.calculate_signals(frame.iloc[:i + 1].copy()).get('action')
+                result.iloc[i, j] = SIGNAL_VALUES.get(action, SIGNAL_HOLD)
+        return result
 
 class MovingAverageStrategy(BaseStrategy):
     """이동평균 크로스오버 전략"""
@@ -78,6 +125,21 @@ class MovingAverageStrategy(BaseStrategy):
                 
         return signals
         
+    def _signal_matrix(self, close: pd.DataFrame) -> pd.DataFrame:
+        """종가 행렬 -> 골든/데드 크로스 신호 행렬"""
+        ma_short = close.rolling(window=self.short_period).mean()
+        ma_long = close.rolling(window=self.long_period).mean()
+        
+        curr_short, curr_long = ma_short.to_numpy(), ma_long.to_numpy()
+        prev_short, prev_long = ma_short.shift(1).to_numpy(), ma_long.shift(1).to_numpy()
+        
+        # len(data) >= long_period 및 직전 값 존재
+        enough = _row_positions(close) + 1 >= max(self.long_period, 2)
+        
+        buy = enough & (prev_short <= prev_long) & (curr_short > curr_long)
+        sell = enough & (prev_short >= prev_long) & (curr_short < curr_long)
+        return _combine_signals(buy, sell, close)
+        
     def should_buy(self, stock_code: str, current_price: float, data: pd.DataFrame) -> bool:
         """매수 조건 확인"""
         signals = self.calculate_signals(data)
@@ -134,6 +196,20 @@ class RSIStrategy(BaseStrategy):
             
         return signals
         
+    def _signal_matrix(self, close: pd.DataFrame) -> pd.DataFrame:
+        """종가 행렬 -> RSI 과매수/과매도 신호 행렬"""
+        delta = close.diff()
+        gain = (delta.where(delta > 0, 0)).rolling(window=self.period).mean()
+        loss = (-delta.where(delta < 0, 0)).rolling(window=self.period).mean()
+        
+        rs = gain / loss
+        rsi = (100 - (100 / (1 + rs))).to_numpy()
+        
+        # 데이터가 부족한 구간은 calculate_rsi와 같이 50으로 간주
+        rsi = np.where(_row_positions(close) + 1 < self.period + 1, 50.0, rsi)
+        
+        return _combine_signals(rsi <= self.oversold, rsi >= self.overbought, close)
+        
     def should_buy(self, stock_code: str, current_price: float, data: pd.DataFrame) -> bool:
         """매수 조건 확인"""
         signals = self.calculate_signals(data)
@@ -192,6 +268,18 @@ class BollingerBandsStrategy(BaseStrategy):
             
         return signals
         
+    def _signal_matrix(self, close: pd.DataFrame) -> pd.DataFrame:
+        """종가 행렬 -> 볼린저 밴드 터치 신호 행렬"""
+        sma = close.rolling(window=self.period).mean()
+        std = close.rolling(window=self.period).std()
+        
+        upper_band = (sma + (std * self.std_dev)).to_numpy()
+        lower_band = (sma - (std * self.std_dev)).to_numpy()
+        price = close.to_numpy()
+        
+        enough = _row_positions(close) + 1 >= self.period
+        return _combine_signals(enough & (price <= lower_band), enough & (price >= upper_band), close)
+        
     def should_buy(self, stock_code: str, current_price: float, data: pd.DataFrame) -> bool:
         """매수 조건 확인"""
         signals = self.calculate_signals(data)
@@ -243,6 +331,16 @@ class MomentumStrategy(BaseStrategy):
             
         return signals
         
+    def _signal_matrix(self, close: pd.DataFrame) -> pd.DataFrame:
+        """종가 행렬 -> 모멘텀 신호 행렬"""
+        past_price = close.shift(self.period)
+        momentum = ((close - past_price) / past_price).to_numpy()
+        
+        # 데이터가 부족한 구간은 calculate_momentum과 같이 0으로 간주
+        momentum = np.where(_row_positions(close) + 1 < self.period + 1, 0.0, momentum)
+        
+        return _combine_signals(momentum >= self.threshold, momentum <= -self.threshold, close)
+        
     def should_buy(self, stock_code: str, current_price: float, data: pd.DataFrame) -> bool:
         """매수 조건 확인"""
         signals = self.calculate_signals(data)
@@ -334,6 +432,74 @@ class StrategyManager:
             }
             
         return None
+        
+    def get_signal_matrix(self, data: pd.DataFrame) -> pd.DataFrame:
+        """활성 전략별 전체 기간 신호 (행: 날짜, 열: 전략)"""
+        columns = {
+            strategy_name: strategy.calculate_signal_series(data)
+            for strategy_name, strategy in self.active_strategies.items()
+            if strategy.is_active
+        }
+        return pd.DataFrame(columns, index=data.index, dtype=np.int8)
+        
+    def get_consensus_series(self, data: pd.DataFrame) -> pd.Series:
+        """전체 기간 합의 신호 (각 시점에서 get_consensus_signal과 같은 기준)"""
+        matrix = self.get_signal_matrix(data)
+        buy_count = (matrix == SIGNAL_BUY).sum(axis=1).to_numpy()
+        sell_count = (matrix == SIGNAL_SELL).sum(axis=1).to_numpy()
+        
+        consensus = self._consensus(buy_count, sell_count)
+        return pd.Series(consensus, index=data.index, name='consensus')
+        
+    def get_consensus_panel(self, prices) -> pd.DataFrame:
+        """여러 종목 합의 신호 행렬 (행: 날짜, 열: 종목) - 종목 스크리닝용
+        
+        prices: 종가 DataFrame (열: 종목) 또는 {종목코드: OHLCV DataFrame}
+        """
+        buy_count = None
+        sell_count = None
+        
+        for strategy in self.active_strategies.values():
+            if not strategy.is_active:
+                continue
+            panel = strategy.calculate_signal_panel(prices)
+            if buy_count is None:
+                buy_count = pd.DataFrame(0, index=panel.index, columns=panel.columns)
+                sell_count = pd.DataFrame(0, index=panel.index, columns=panel.columns)
+            buy_count += (panel == SIGNAL_BUY)
+            sell_count += (panel == SIGNAL_SELL)
+        
+        if buy_count is None:
+            return pd.DataFrame(dtype=np.int8)
+        
+        consensus = self._consensus(buy_count.to_numpy(), sell_count.to_numpy())
+        return pd.DataFrame(consensus, index=buy_count.index, columns=buy_count.columns)
+        
+    def _consensus(self, buy_count: np.ndarray, sell_count: np.ndarray) -> np.ndarray:
+        """매수/매도 신호 수 -> 합의 신호 (50% 이상 동의, 매수 우선)"""
+        total_strategies = len(self.active_strategies)
+        has_signal = (buy_count + sell_count) > 0
+        
+        buy = has_signal & (buy_count >= total_strategies * 0.5)
+        sell = has_signal & (sell_count >= total_strategies * 0.5)
+        return np.where(buy, SIGNAL_BUY, np.where(sell, SIGNAL_SELL, SIGNAL_HOLD)).astype(np.int8)
+
+def backtest_signal_matrix(close: pd.DataFrame, signals: pd.DataFrame,
+                           commission_rate: float = 0.0) -> pd.DataFrame:
+    """신호 행렬 기반 간이 백테스트 (종목별 롱 전용)
+    
+    매수 신호 다음 봉부터 보유하고 매도 신호 다음 봉부터 청산합니다.
+    반환값: 종목별 일별 수익률 행렬 (수수료 차감)
+    """
+    signals = signals.reindex(index=close.index, columns=close.columns).fillna(SIGNAL_HOLD)
+    
+    # 마지막 매수/매도 신호 상태 유지 (1: 보유, 0: 미보유)
+    state = signals.astype(float).replace(float(SIGNAL_HOLD), np.nan).ffill().fillna(0).clip(lower=0)
+    position = state.shift(1).fillna(0)
+    
+    returns = close.pct_change(fill_method=None).fillna(0) * position
+    turnover = position.diff().abs().fillna(position.abs())
+    return returns - turnover * commission_rate
 
 def create_sample_strategies() -> StrategyManager:
     """샘플 전략들 생성"""
@@ -24,6 +24,66 @@ from technical_indicators import (
     calculate_bollinger_bands, calculate_macd,
     calculate_stochastic, calculate_atr
 )
+from streaming_indicators import (
+    StreamingIndicator, StreamingSMA, StreamingRSI,
+    StreamingBollingerBands, StreamingMACD
+)
+
+DEFAULT_PRICE_CAPACITY = 1000  # 전략별 가격 이력 최대 보관 수
+
+class PriceRingBuffer:
+    """고정 용량 가격 이력 링 버퍼 (가득 차면 가장 오래된 가격부터 덮어씀)
+
+    기존 price_history 리스트처럼 len/인덱싱/반복 시 {'price', 'timestamp'} 딕셔너리를 반환합니다.
+    가격은 두 벌 이어 붙인 배열에 기록하므로 prices()는 링 경계와 관계없이 연속된 제로 카피 뷰입니다.
+    """
+    
+    def __init__(self, capacity: int = DEFAULT_PRICE_CAPACITY):
+        self.capacity = max(1, capacity)
+        self._prices = np.zeros(2 * self.capacity, dtype=np.float64)
+        self._timestamps: List[Optional[datetime]] = [None] * self.capacity
+        self.count = 0  # 추가된 총 가격 수
+    
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+    
+    def append(self, price: float, timestamp: datetime = None):
+        """가격 추가 (O(1), 메모리 할당 없음)"""
+        slot = self.count % self.capacity
+        self._prices[slot] = self._prices[slot + self.capacity] = price
+        self._timestamps[slot] = timestamp
+        self.count += 1
+    
+    def prices(self, n: int = None) -> np.ndarray:
+        """최근 n개 가격 (시간순, 읽기 전용 뷰 - 이후 추가되는 가격이 덮어쓸 수 있음)"""
+        size = len(self)
+        n = size if n is None else max(0, min(n, size))
+        end = self.count % self.capacity + self.capacity
+        view = self._prices[end - n:end]
+        view.flags.writeable = False
+        return view
+    
+    def price(self, index: int = -1) -> float:
+        """index번째 가격 (음수는 최신부터)"""
+        return float(self._prices[self._slot(index)])
+    
+    def _slot(self, index: int) -> int:
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("가격 이력 인덱스 범위 초과")
+        return (self.count - size + index) % self.capacity
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        slot = self._slot(index)
+        return {'price': float(self._prices[slot]), 'timestamp': self._timestamps[slot]}
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
 
 class SignalType(Enum):
     """신호 타입"""
@@ -74,8 +134,13 @@ class TradingStrategy:
         self.enabled = config.enabled
         self.weight = config.weight
         
-        # 데이터 저장소
-        self.price_history = []
+        # 스트리밍 지표 사용 여부 (틱마다 전체 재계산 대신 O(1) 갱신)
+        self.use_streaming = self.parameters.get('streaming', False)
+        
+        # 데이터 저장소 (가격 이력은 고정 용량 링 버퍼)
+        self.history_capacity = self.parameters.get('history_capacity', DEFAULT_PRICE_CAPACITY)
+        self.price_history = PriceRingBuffer(self.history_capacity)
+        self.indicators: Dict[str, StreamingIndicator] = {}
         self.signal_history = []
         self.performance_history = []
         
@@ -88,15 +153,45 @@ class TradingStrategy:
         """가격 데이터 추가"""
         if timestamp is None:
             timestamp = datetime.now()
-            
-        self.price_history.append({
-            'price': price,
-            'timestamp': timestamp
-        })
         
-        # 최대 1000개 데이터만 유지
-        if len(self.price_history) > 1000:
-            self.price_history = self.price_history[-1000:]
+        # 용량을 넘으면 가장 오래된 가격을 덮어씀 (이력 복사 없음)
+        self.price_history.append(price, timestamp)
+        
+        if self.use_streaming:
+            self._update_indicators(price)
+    
+    def _create_indicators(self) -> Dict[str, StreamingIndicator]:
+        """스트리밍 지표 생성 (하위 클래스에서 구현)"""
+        return {}
+    
+    def _update_indicators(self, price: float):
+        """스트리밍 지표 갱신"""
+        if not self.indicators:
+            self.indicators = self._create_indicators()
+        
+        for indicator in self.indicators.values():
+            indicator.update(price)
+    
+    def reset_data(self):
+        """가격 이력 및 지표 상태 초기화"""
+        self.price_history = PriceRingBuffer(self.history_capacity)
+        self.indicators = {}
+    
+    def get_data_state(self) -> Dict:
+        """종목별로 보관할 수 있는 데이터 상태 반환"""
+        return {
+            'price_history': self.price_history,
+            'indicators': self.indicators
+        }
+    
+    def set_data_state(self, state: Optional[Dict]):
+        """get_data_state로 보관한 데이터 상태 복원 (None이면 초기화)"""
+        if state is None:
+            self.reset_data()
+            return
+        
+        self.price_history = state['price_history']
+        self.indicators = state['indicators']
     
     def add_data(self, date: datetime, row: pd.Series):
         """데이터 추가 (DataFrame 행 형태)"""
@@ -157,17 +252,26 @@ class MovingAverageCrossoverStrategy(TradingStrategy):
         self.short_period = self.parameters.get('short_period', 5)
         self.long_period = self.parameters.get('long_period', 20)
         self.min_cross_threshold = self.parameters.get('min_cross_threshold', 0.01)
+    
+    def _create_indicators(self) -> Dict[str, StreamingIndicator]:
+        return {
+            'short_ma': StreamingSMA(self.short_period),
+            'long_ma': StreamingSMA(self.long_period)
+        }
         
     def generate_signal(self) -> Optional[TradingSignal]:
         """이동평균 크로스오버 신호 생성"""
         if len(self.price_history) < self.long_period:
             return None
         
-        prices = [data['price'] for data in self.price_history]
-        
         # 이동평균 계산
-        short_ma = calculate_sma(prices, self.short_period)
-        long_ma = calculate_sma(prices, self.long_period)
+        if self.use_streaming:
+            short_ma = list(self.indicators['short_ma'].history)
+            long_ma = list(self.indicators['long_ma'].history)
+        else:
+            prices = self.price_history.prices()
+            short_ma = calculate_sma(prices, self.short_period)
+            long_ma = calculate_sma(prices, self.long_period)
         
         if len(short_ma) < 2 or len(long_ma) < 2:
             return None
@@ -177,7 +281,7 @@ class MovingAverageCrossoverStrategy(TradingStrategy):
         prev_short = short_ma[-2]
         prev_long = long_ma[-2]
         
-        current_price = prices[-1]
+        current_price = self.price_history.price(-1)
         
         # 골든 크로스 (단기선이 장기선을 상향 돌파)
         if (prev_short <= prev_long and current_short > current_long and 
@@ -226,20 +330,28 @@ class RSIStrategy(TradingStrategy):
         self.oversold_threshold = self.parameters.get('oversold_threshold', 30)
         self.overbought_threshold = self.parameters.get('overbought_threshold', 70)
         self.confirmation_period = self.parameters.get('confirmation_period', 2)
+    
+    def _create_indicators(self) -> Dict[str, StreamingIndicator]:
+        return {
+            'rsi': StreamingRSI(self.rsi_period, history_size=max(2, self.confirmation_period))
+        }
         
     def generate_signal(self) -> Optional[TradingSignal]:
         """RSI 신호 생성"""
         if len(self.price_history) < self.rsi_period + self.confirmation_period:
             return None
         
-        prices = [data['price'] for data in self.price_history]
-        rsi_values = calculate_rsi(prices, self.rsi_period)
+        if self.use_streaming:
+            rsi_values = list(self.indicators['rsi'].history)
+        else:
+            prices = self.price_history.prices()
+            rsi_values = calculate_rsi(prices, self.rsi_period)
         
         if len(rsi_values) < self.confirmation_period:
             return None
         
         current_rsi = rsi_values[-1]
-        current_price = prices[-1]
+        current_price = self.price_history.price(-1)
         
         # 과매도 구간에서 반등 신호
         if current_rsi < self.oversold_threshold:
@@ -287,19 +399,32 @@ class BollingerBandsStrategy(TradingStrategy):
         self.period = self.parameters.get('period', 20)
         self.std_dev = self.parameters.get('std_dev', 2.0)
         self.min_touch_threshold = self.parameters.get('min_touch_threshold', 0.02)
+    
+    def _create_indicators(self) -> Dict[str, StreamingIndicator]:
+        return {
+            'bollinger': StreamingBollingerBands(self.period, self.std_dev)
+        }
         
     def generate_signal(self) -> Optional[TradingSignal]:
         """볼린저 밴드 신호 생성"""
         if len(self.price_history) < self.period:
             return None
         
-        prices = [data['price'] for data in self.price_history]
-        bb_data = calculate_bollinger_bands(prices, self.period, self.std_dev)
+        if self.use_streaming:
+            bands = self.indicators['bollinger'].history
+            bb_data = {
+                'upper': [band[0] for band in bands],
+                'middle': [band[1] for band in bands],
+                'lower': [band[2] for band in bands]
+            }
+        else:
+            prices = self.price_history.prices()
+            bb_data = calculate_bollinger_bands(prices, self.period, self.std_dev)
         
         if not bb_data or len(bb_data['upper']) < 2:
             return None
         
-        current_price = prices[-1]
+        current_price = self.price_history.price(-1)
         current_upper = bb_data['upper'][-1]
         current_lower = bb_data['lower'][-1]
         current_middle = bb_data['middle'][-1]
@@ -307,7 +432,7 @@ class BollingerBandsStrategy(TradingStrategy):
         # 하단 밴드 터치 후 반등
         if current_price <= current_lower * (1 + self.min_touch_threshold):
             # 이전 가격이 하단 밴드 아래에 있었는지 확인
-            prev_price = prices[-2]
+            prev_price = self.price_history.price(-2)
             prev_lower = bb_data['lower'][-2]
             
             if prev_price <= prev_lower:
@@ -329,7 +454,7 @@ class BollingerBandsStrategy(TradingStrategy):
         # 상단 밴드 터치 후 하락
         elif current_price >= current_upper * (1 - self.min_touch_threshold):
             # 이전 가격이 상단 밴드 위에 있었는지 확인
-            prev_price = prices[-2]
+            prev_price = self.price_history.price(-2)
             prev_upper = bb_data['upper'][-2]
             
             if prev_price >= prev_upper:
@@ -359,14 +484,26 @@ class MACDStrategy(TradingStrategy):
         self.slow_period = self.parameters.get('slow_period', 26)
         self.signal_period = self.parameters.get('signal_period', 9)
         self.min_cross_threshold = self.parameters.get('min_cross_threshold', 0.001)
+    
+    def _create_indicators(self) -> Dict[str, StreamingIndicator]:
+        return {
+            'macd': StreamingMACD(self.fast_period, self.slow_period, self.signal_period)
+        }
         
     def generate_signal(self) -> Optional[TradingSignal]:
         """MACD 신호 생성"""
         if len(self.price_history) < self.slow_period + self.signal_period:
             return None
         
-        prices = [data['price'] for data in self.price_history]
-        macd_data = calculate_macd(prices, self.fast_period, self.slow_period, self.signal_period)
+        if self.use_streaming:
+            values = self.indicators['macd'].history
+            macd_data = {
+                'macd': [value[0] for value in values],
+                'signal': [value[1] for value in values]
+            }
+        else:
+            prices = self.price_history.prices()
+            macd_data = calculate_macd(prices, self.fast_period, self.slow_period, self.signal_period)
         
         if not macd_data or len(macd_data['macd']) < 2:
             return None
@@ -376,7 +513,7 @@ class MACDStrategy(TradingStrategy):
         prev_macd = macd_data['macd'][-2]
         prev_signal = macd_data['signal'][-2]
         
-        current_price = prices[-1]
+        current_price = self.price_history.price(-1)
         
         # MACD가 시그널선을 상향 돌파
         if (prev_macd <= prev_signal and current_macd > current_signal and 
@@ -452,7 +589,7 @@ class CombinedStrategy(TradingStrategy):
         if not signals:
             return None
         
-        current_price = self.price_history[-1]['price'] if self.price_history else 0
+        current_price = self.price_history.price(-1) if self.price_history else 0
         
         # 매수 신호가 더 많고 강한 경우
         if len(buy_signals) >= self.min_strategy_agreement and len(buy_signals) > len(sell_signals):
@@ -516,6 +653,13 @@ class StrategyManager:
         
         self.combined_strategy.add_strategy(strategy)
     
+    def spawn(self) -> 'StrategyManager':
+        """같은 전략 설정으로 데이터 상태가 비어 있는 새 매니저 생성 (종목별 전략 상태용)"""
+        manager = StrategyManager()
+        for name, strategy in self.strategies.items():
+            manager.add_strategy(name, type(strategy)(strategy.config))
+        return manager
+    
     def update_price(self, price: float, timestamp: datetime = None):
         """가격 데이터 업데이트"""
         for strategy in self.strategies.values():
@@ -557,6 +701,26 @@ class StrategyManager:
         
         return summary
 
+# 전략 타입별 구현 클래스
+STRATEGY_CLASSES = {
+    StrategyType.MOVING_AVERAGE_CROSSOVER: MovingAverageCrossoverStrategy,
+    StrategyType.RSI_STRATEGY: RSIStrategy,
+    StrategyType.BOLLINGER_BANDS: BollingerBandsStrategy,
+    StrategyType.MACD_STRATEGY: MACDStrategy
+}
+
+def create_strategy_manager(strategy_configs: Dict[str, StrategyConfig]) -> StrategyManager:
+    """전략 이름 -> 설정 딕셔너리로 전략 매니저 생성"""
+    manager = StrategyManager()
+    
+    for name, config in strategy_configs.items():
+        strategy_class = STRATEGY_CLASSES.get(config.strategy_type)
+        if strategy_class is None:
+            raise ValueError(f"지원하지 않는 전략 타입: {config.strategy_type}")
+        manager.add_strategy(name, strategy_class(config))
+    
+    return manager
+
 def create_default_strategies() -> StrategyManager:
     """기본 전략들 생성 - 실제 데이터에 맞게 매우 관대한 설정"""
     manager = StrategyManager()
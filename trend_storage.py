@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+트렌드 데이터 SQLite 저장소
+네이버 트렌드 분석기의 트렌드/상관관계 데이터를 저장합니다.
+
+- WAL 모드 + synchronous=NORMAL: 커밋마다 fsync하지 않고 체크포인트 때만 동기화
+- 쓰기는 백그라운드 스레드가 큐에 쌓인 행을 모아 한 트랜잭션에서 executemany로 처리
+  (asyncio 루프/분석 스레드는 디스크를 기다리지 않음)
+- 읽기는 별도의 장기 연결 하나를 잠금으로 공유
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+from loguru import logger
+
+DEFAULT_TREND_DB_PATH = "naver_trend_data.db"
+
+SCHEMA = [
+    '''
+    CREATE TABLE IF NOT EXISTS trend_data (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        keyword TEXT NOT NULL,
+        trend_type TEXT NOT NULL,
+        value REAL,
+        timestamp TEXT NOT NULL,
+        sentiment_score REAL,
+        volume_change REAL,
+        momentum_score REAL,
+        volatility REAL
+    )
+    ''',
+    'CREATE INDEX IF NOT EXISTS idx_trend_data_keyword_timestamp ON trend_data (keyword, timestamp)',
+    '''
+    CREATE TABLE IF NOT EXISTS correlation_data (
+        stock_code TEXT NOT NULL,
+        stock_name TEXT,
+        keyword TEXT NOT NULL,
+        correlation_score REAL,
+        trend_direction TEXT,
+        confidence_level REAL,
+        impact_score REAL,
+        prediction_accuracy REAL,
+        last_updated TEXT,
+        PRIMARY KEY (stock_code, keyword)
+    )
+    ''',
+]
+
+INSERT_TREND_SQL = '''
+    INSERT INTO trend_data
+    (keyword, trend_type, value, timestamp, sentiment_score, volume_change, momentum_score, volatility)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+UPSERT_CORRELATION_SQL = '''
+    INSERT OR REPLACE INTO correlation_data
+    (stock_code, stock_name, keyword, correlation_score, trend_direction,
+     confidence_level, impact_score, prediction_accuracy, last_updated)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+class TrendStorage:
+    """트렌드 데이터 저장소 (장기 WAL 연결 + 백그라운드 일괄 쓰기)"""
+
+    def __init__(self, db_path: str = DEFAULT_TREND_DB_PATH, max_batch_rows: int = 5000):
+        self.db_path = db_path
+        self.max_batch_rows = max_batch_rows
+        self.batches_written = 0  # 커밋한 트랜잭션 수
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._read_conn = self._connect()
+        with self._read_conn:
+            for statement in SCHEMA:
+                self._read_conn.execute(statement)
+        self._read_lock = threading.Lock()
+
+        # 쓰기 큐 항목: (SQL, 행 목록), 종료 시 None
+        self._queue: "queue.Queue[Optional[Tuple[str, List[Sequence]]]]" = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="TrendStorageWriter", daemon=True)
+        self._closed = False
+        self._close_lock = threading.Lock()  # 종료 표시 이후에는 큐에 넣지 않도록 보호
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
+    def insert_trends(self, rows: List[Sequence]):
+        """트렌드 행 저장 예약 (INSERT_TREND_SQL 컬럼 순서)"""
+        if rows:
+            self._enqueue(INSERT_TREND_SQL, rows)
+
+    def upsert_correlations(self, rows: List[Sequence]):
+        """상관관계 행 저장 예약 ((stock_code, keyword)가 같으면 교체)"""
+        if rows:
+            self._enqueue(UPSERT_CORRELATION_SQL, rows)
+
+    def _enqueue(self, sql: str, rows: List[Sequence]):
+        """쓰기 큐에 추가 (종료 후에는 쓰기 스레드가 없으므로 버림)"""
+        with self._close_lock:
+            if self._closed:
+                logger.warning(f"종료된 트렌드 저장소에 대한 쓰기 무시 ({len(rows)}행)")
+                return
+            self._queue.put((sql, list(rows)))
+
+    def _write_loop(self):
+        """큐에 쌓인 쓰기를 모아 한 트랜잭션으로 처리"""
+        conn = self._connect()
+        running = True
+        while running:
+            items = [self._queue.get()]
+            rows = len(items[0][1]) if items[0] else 0
+            while rows < self.max_batch_rows:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                items.append(item)
+                rows += len(item[1]) if item else 0
+
+            # SQL별로 행을 모아 executemany (같은 SQL 안에서는 요청 순서 유지)
+            grouped: Dict[str, List[Sequence]] = {}
+            for item in items:
+                if item is None:
+                    running = False
+                    continue
+                grouped.setdefault(item[0], []).extend(item[1])
+
+            if grouped:
+                try:
+                    with conn:
+                        for sql, batch in grouped.items():
+                            conn.executemany(sql, batch)
+                    self.batches_written += 1
+                except Exception as e:
+                    logger.error(f"트렌드 데이터 일괄 저장 실패 ({rows}행): {e}")
+
+            for _ in items:
+                self._queue.task_done()
+
+        conn.close()
+
+    def flush(self):
+        """예약된 쓰기가 모두 커밋될 때까지 대기 (종료 후에는 close가 이미 반영)"""
+        if self._closed:
+            return
+        self._queue.join()
+
+    def query(self, sql: str, params: Sequence = ()) -> List[tuple]:
+        """조회 (예약된 쓰기를 먼저 반영, 종료 후에는 빈 결과)"""
+        self.flush()
+        with self._read_lock:
+            if self._closed:
+                logger.warning("종료된 트렌드 저장소 조회 무시")
+                return []
+            return self._read_conn.execute(sql, params).fetchall()
+
+    def close(self):
+        """남은 쓰기를 반영하고 연결 종료"""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._writer.join()
+        with self._read_lock:
+            self._read_conn.close()
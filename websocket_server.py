@@ -19,33 +19,38 @@ from loguru import logger
 # 프로젝트 모듈 import
 from real_time_data_collector import RealTimeDataCollector, RealTimeData
 from error_handler import ErrorType, ErrorLevel, handle_error
+from broadcast_hub import BroadcastHub
 
 class WebSocketServer:
     """WebSocket 실시간 통신 서버"""
     
-    def __init__(self, port: int = 8084):
+    def __init__(self, port: int = 8084, frame_interval_ms: int = 100, max_inflight_frames: int = 2):
         self.port = port
         self.app = Flask(__name__)
         self.app.config['SECRET_KEY'] = 'kiwoom_trading_websocket_secret'
         CORS(self.app)
         
-        # SocketIO 초기화
+        # SocketIO 초기화 (메시지마다 로그를 남기면 연결 수가 많을 때 처리 시간 대부분을 차지)
         self.socketio = SocketIO(
             self.app,
             cors_allowed_origins="*",
             async_mode='threading',
-            logger=True,
-            engineio_logger=True
+            logger=False,
+            engineio_logger=False
         )
         
         # 데이터 수집기
         self.collector = None
         self.running = False
         
-        # 클라이언트 관리
-        self.clients = {}  # {client_id: {'room': room, 'subscriptions': []}}
+        # 클라이언트 관리 (종목 구독은 브로드캐스트 허브가 관리)
+        self.clients = {}  # {client_id: {'room': room, 'connected_at': datetime}}
         self.rooms = {}    # {room: [client_ids]}
         
+        # 종목 시세 브로드캐스트 허브 (frame_interval_ms마다 구독자별 프레임 전송)
+        self.hub = BroadcastHub(self._emit_frame, flush_interval=frame_interval_ms / 1000,
+                                max_inflight=max_inflight_frames)
+        
         # 라우트 및 이벤트 핸들러 설정
         self._setup_routes()
         self._setup_socket_events()
@@ -63,6 +68,7 @@ class WebSocketServer:
                 'status': 'healthy',
                 'clients_count': len(self.clients),
                 'rooms_count': len(self.rooms),
+                'broadcast': self.hub.get_stats(),
                 'collector_running': self.collector.running if self.collector else False,
                 'timestamp': datetime.now().isoformat()
             }
@@ -79,9 +85,9 @@ class WebSocketServer:
             # 클라이언트 정보 초기화
             self.clients[client_id] = {
                 'room': None,
-                'subscriptions': [],
                 'connected_at': datetime.now()
             }
+            self.hub.add_client(client_id)
             
             # 연결 확인 메시지 전송
             emit('connected', {
@@ -108,6 +114,11 @@ class WebSocketServer:
                 
                 # 클라이언트 정보 삭제
                 del self.clients[client_id]
+            
+            # 마지막 구독자가 나간 종목은 수집 중지
+            released = self.hub.remove_client(client_id)
+            if self.collector and released:
+                self.collector.unsubscribe(released)
         
         @self.socketio.on('join_room')
         def handle_join_room(data):
@@ -173,12 +184,14 @@ class WebSocketServer:
             
             logger.info(f"클라이언트 {client_id}가 종목 {stocks} 구독")
             
-            if client_id in self.clients:
-                self.clients[client_id]['subscriptions'] = stocks
+            # 기존 구독 목록을 교체 (더 이상 구독자가 없는 종목은 수집 중지)
+            released = self.hub.set_subscriptions(client_id, stocks)
             
             # 데이터 수집기에 구독 요청
             if self.collector and stocks:
                 self.collector.subscribe(stocks)
+            if self.collector and released:
+                self.collector.unsubscribe(released)
             
             emit('stocks_subscribed', {
                 'stocks': stocks,
@@ -194,15 +207,11 @@ class WebSocketServer:
             
             logger.info(f"클라이언트 {client_id}가 종목 {stocks} 구독 해제")
             
-            if client_id in self.clients:
-                current_subscriptions = self.clients[client_id].get('subscriptions', [])
-                self.clients[client_id]['subscriptions'] = [
-                    s for s in current_subscriptions if s not in stocks
-                ]
+            released = self.hub.unsubscribe(client_id, stocks)
             
-            # 데이터 수집기에서 구독 해제
-            if self.collector and stocks:
-                self.collector.unsubscribe(stocks)
+            # 다른 클라이언트가 구독하지 않는 종목만 데이터 수집기에서 구독 해제
+            if self.collector and released:
+                self.collector.unsubscribe(released)
             
             emit('stocks_unsubscribed', {
                 'stocks': stocks,
@@ -276,31 +285,16 @@ class WebSocketServer:
             logger.error(f"데이터 브로드캐스트 오류: {e}")
     
     def broadcast_to_subscribers(self, stock_code: str, data: Dict):
-        """특정 종목 구독자에게 데이터 전송"""
+        """특정 종목 구독자에게 데이터 전송 (다음 프레임에 구독자별로 모아서 전송)"""
         try:
-            subscribers = []
-            for client_id, client_info in self.clients.items():
-                if stock_code in client_info.get('subscriptions', []):
-                    subscribers.append(client_id)
-            
-            if subscribers:
-                self.socketio.emit('stock_update', {
-                    'code': stock_code,
-                    'data': data,
-                    'timestamp': datetime.now().isoformat()
-                }, room=None, include_self=False)
-                
-                # 구독자들에게만 전송
-                for client_id in subscribers:
-                    self.socketio.emit('stock_update', {
-                        'code': stock_code,
-                        'data': data,
-                        'timestamp': datetime.now().isoformat()
-                    }, room=client_id)
-                    
+            self.hub.publish(stock_code, data)
         except Exception as e:
             logger.error(f"구독자 데이터 전송 오류: {e}")
     
+    def _emit_frame(self, event: str, frame: str, client_id: str, callback=None):
+        """구독자 프레임 전송 (JSON 문자열, 클라이언트 확인 응답 시 callback 호출)"""
+        self.socketio.emit(event, frame, room=client_id, callback=callback)
+    
     def set_collector(self, collector: RealTimeDataCollector):
         """데이터 수집기 설정"""
         self.collector = collector
@@ -338,6 +332,7 @@ class WebSocketServer:
         try:
             logger.info(f"WebSocket 서버 시작: http://localhost:{self.port}")
             self.running = True
+            self.hub.start()
             self.socketio.run(self.app, host='0.0.0.0', port=self.port, debug=False)
         except Exception as e:
             handle_error(
@@ -352,6 +347,7 @@ class WebSocketServer:
         """서버 중지"""
         try:
             self.running = False
+            self.hub.stop()
             logger.info("WebSocket 서버 중지")
         except Exception as e:
             logger.error(f"WebSocket 서버 중지 오류: {e}")